@@ -1,144 +1,322 @@
 import pandas as pd
 import numpy as np
-from sklearn.neural_network import MLPRegressor
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import mean_absolute_error, r2_score
+from numpy.lib.stride_tricks import sliding_window_view
 import os
+import sys
+import time
+import random
+import argparse
+import itertools
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'gateway'))
+from model_file import MODEL_ARRAYS, write_model_file, read_model_file, write_c_header
+from gateway_MLP_Logic import GatewayMLP
+from quantized_mlp import QuantizedMLP, calibrate, quantized_c_lines
+from edge_twin import twin_c_lines
+from weight_delta import delta_c_lines
+from mlp_trainer import PARAM_NAMES, MLPTrainer, create_model, fit_scaler
 
 FILE_NAME = './dataset/Pre_train_Dataset.csv'
 COL_TIME = 'timestamp'
 COL_TEMP = 'temperature'
 COL_HUM = 'humidity'
 
+# 학습 결과: 게이트웨이용 바이너리 모델 파일 + 엣지 스케치용 C 헤더
+MODEL_FILE = './gateway/mlp_model.bin'
+C_HEADER_FILE = './edge_node/mlp_model.h'
+
 WINDOW_SIZE = 4
 N_FEATURES = 3   # temp, hum, time_n
 N_IN = WINDOW_SIZE * N_FEATURES  # 12
 H1_SIZE = 64
 H2_SIZE = 32
 
+# 학습기: 'sklearn' (MLPRegressor) 또는 'numpy' (mlp_trainer, sklearn 불필요)
+TRAINER = 'sklearn'
+# --online-epochs: 사전학습 후 엣지/게이트웨이와 같은 lr로 온라인 SGD를 데이터셋 위에서 재현
+ONLINE_LR = 0.01
+# int8 활성값 scale 보정 범위: 학습 윈도우 활성값 |a|의 이 분위수 (100 = 최댓값, 포화 없음)
+QUANT_PERCENTILE = 100.0
 
-def train_offline_mlp(file_path):
-    if not os.path.exists(file_path):
-        print(f"Error: File not found at {file_path}")
-        return
 
-    df = pd.read_csv(file_path)
+def frame_to_features(df):
+    """CSV DataFrame → (n, 3) [temp, hum, time_n] 배열 (결측 행 제거)."""
     df = df.dropna()
+    ts = pd.to_datetime(df[COL_TIME].str.replace('T', ' '))
+    time_n = (ts.dt.hour * 3600 + ts.dt.minute * 60 + ts.dt.second) / 86400.0
+    features = np.empty((len(df), N_FEATURES))
+    features[:, 0] = df[COL_TEMP].values
+    features[:, 1] = df[COL_HUM].values
+    features[:, 2] = time_n.values
+    return features
 
-    df[COL_TIME] = pd.to_datetime(df[COL_TIME].str.replace('T', ' '))
-    df['time_n'] = (df[COL_TIME].dt.hour * 3600 + df[COL_TIME].dt.minute * 60 + df[COL_TIME].dt.second) / 86400.0
 
-    features = df[[COL_TEMP, COL_HUM, 'time_n']].values
+def make_windows(features, window_size=WINDOW_SIZE):
+    """Rolling window 데이터셋 (stride trick, 복사 없음).
 
-    X, y = [], []
-    for i in range(WINDOW_SIZE, len(features)):
-        window = features[i - WINDOW_SIZE:i].flatten()
-        X.append(window)
-        y.append(features[i, :2])
+    X[i] = features[i:i + window_size].flatten(), y[i] = features[i + window_size, :2].
+    X는 features를 가리키는 읽기 전용 view, y는 slice. window_size·feature 수 무관.
+    """
+    features = np.ascontiguousarray(features)
+    n, n_feat = features.shape
+    n_rows = max(n - window_size, 0)
+    if n_rows == 0:
+        return np.empty((0, window_size * n_feat), dtype=features.dtype), features[:0, :2]
+    # 평탄화된 시계열 위에서 길이 window*n_feat 창을 n_feat 간격으로 잘라내면 행 단위 윈도우
+    X = sliding_window_view(features.reshape(-1), window_size * n_feat)[::n_feat][:n_rows]
+    y = features[window_size:, :2]
+    return X, y
 
-    X = np.array(X)
-    y = np.array(y)
 
-    print(f"Dataset: {len(X)} samples, Input dim: {N_IN}, Output dim: 2")
+def iter_window_chunks(file_path, window_size=WINDOW_SIZE, chunksize=1_000_000):
+    """CSV를 chunksize 행씩 읽으며 (X, y) 윈도우 청크를 생성 (메모리 사용량 = 청크 크기에 비례).
 
-    scaler_X = StandardScaler()
-    scaler_y = StandardScaler()
-    X_scaled = scaler_X.fit_transform(X)
-    y_scaled = scaler_y.fit_transform(y)
+    청크 경계는 직전 청크의 마지막 window_size 행을 이어 붙여 처리하므로,
+    모든 청크를 이어 붙이면 전체 파일에 make_windows()를 적용한 것과 같다.
+    """
+    tail = None
+    for chunk in pd.read_csv(file_path, chunksize=chunksize):
+        features = frame_to_features(chunk)
+        if tail is not None:
+            features = np.concatenate([tail, features])
+        X, y = make_windows(features, window_size)
+        if len(X):
+            yield X, y
+        tail = features[-window_size:]
 
-    mlp = MLPRegressor(
-        hidden_layer_sizes=(H1_SIZE, H2_SIZE),
+
+def build_mlp(h1_size, h2_size, learning_rate=0.001, max_iter=10000):
+    from sklearn.neural_network import MLPRegressor  # sklearn 학습기에서만 필요
+    return MLPRegressor(
+        hidden_layer_sizes=(h1_size, h2_size),
         activation='relu',
         solver='adam',
-        learning_rate_init=0.001,
-        max_iter=10000,
+        learning_rate_init=learning_rate,
+        max_iter=max_iter,
         early_stopping=True,
         validation_fraction=0.1,
         n_iter_no_change=50,
         random_state=42,
     )
 
-    print(f"Training Rolling Window MLP ({N_IN}-{H1_SIZE}-{H2_SIZE}-2, ReLU, window={WINDOW_SIZE})...")
-    mlp.fit(X_scaled, y_scaled)
-    print(f"Converged at iteration: {mlp.n_iter_}")
 
-    W1 = mlp.coefs_[0]       # 12 x 64
-    B1 = mlp.intercepts_[0]  # 64
-    W2 = mlp.coefs_[1]       # 64 x 32
-    B2 = mlp.intercepts_[1]  # 32
-    W3 = mlp.coefs_[2]       # 32 x 2
-    B3 = mlp.intercepts_[2]  # 2
+def fit_weights(X, y, h1_size, h2_size, learning_rate=0.001, max_iter=10000, trainer=TRAINER, online_epochs=0):
+    """원 단위 (X, y)로 학습 → (arrays, n_iter). arrays는 model_file 배열 dict (스케일러 + W1..B3)."""
+    x_mean, x_std = fit_scaler(X)
+    y_mean, y_std = fit_scaler(y)
+    arrays = {"x_mean": x_mean, "x_std": x_std, "y_mean": y_mean, "y_std": y_std}
+
+    if trainer == 'sklearn':
+        mlp = build_mlp(h1_size, h2_size, learning_rate, max_iter)
+        mlp.fit((X - x_mean) / x_std, (y - y_mean) / y_std)
+        arrays.update(zip(PARAM_NAMES, [p for layer in zip(mlp.coefs_, mlp.intercepts_) for p in layer]))
+        n_iter = mlp.n_iter_
+    elif trainer == 'numpy':
+        model = create_model(X, y, h1_size, h2_size)
+        n_iter = MLPTrainer(model, learning_rate=learning_rate, max_epochs=max_iter).fit(X, y).n_iter_
+        arrays.update((name, getattr(model, name)) for name in PARAM_NAMES)
+    else:
+        raise ValueError(f"unknown trainer: {trainer}")
+
+    if online_epochs:
+        model = GatewayMLP(**arrays, verbose=False)
+        online = MLPTrainer(model)
+        for _ in range(online_epochs):
+            online.simulate_online(X, y, lr=ONLINE_LR)
+        arrays.update((name, getattr(model, name)) for name in PARAM_NAMES)
+    return arrays, n_iter
+
+
+def regression_metrics(y, y_pred):
+    """(R2 — 출력별 평균, MAE temp, MAE hum)."""
+    ss_res = ((y - y_pred) ** 2).sum(axis=0)
+    ss_tot = ((y - y.mean(axis=0)) ** 2).sum(axis=0)
+    mae = np.abs(y - y_pred).mean(axis=0)
+    return float(np.mean(1 - ss_res / ss_tot)), float(mae[0]), float(mae[1])
+
 
-    total_params = W1.size + B1.size + W2.size + B2.size + W3.size + B3.size
+def train_offline_mlp(file_path, trainer=TRAINER, online_epochs=0):
+    if not os.path.exists(file_path):
+        print(f"Error: File not found at {file_path}")
+        return
+
+    features = frame_to_features(pd.read_csv(file_path))
+    X, y = make_windows(features, WINDOW_SIZE)
+
+    print(f"Dataset: {len(X)} samples, Input dim: {N_IN}, Output dim: 2")
+
+    print(f"Training Rolling Window MLP ({N_IN}-{H1_SIZE}-{H2_SIZE}-2, ReLU, window={WINDOW_SIZE}, "
+          f"trainer={trainer})...")
+    arrays, n_iter = fit_weights(X, y, H1_SIZE, H2_SIZE, trainer=trainer, online_epochs=online_epochs)
+    print(f"Converged at iteration: {n_iter}")
+    if online_epochs:
+        print(f"Online SGD replay: {online_epochs} epoch(s), lr={ONLINE_LR}")
+
+    total_params = sum(arrays[name].size for name in PARAM_NAMES)
     print(f"Total parameters: {total_params} ({total_params * 4 / 1024:.1f} KB)")
 
-    # ===================== ESP32 코드 출력 =====================
-    print("\n" + "=" * 60)
-    print(f"   ESP32 Code for {N_IN}-{H1_SIZE}-{H2_SIZE}-2 ReLU Model")
-    print("=" * 60)
-
-    print("// Scalers")
-    print(f"float x_mean[{N_IN}] = {{{', '.join([f'{v:.6f}f' for v in scaler_X.mean_])}}};")
-    print(f"float x_std[{N_IN}]  = {{{', '.join([f'{v:.6f}f' for v in np.sqrt(scaler_X.var_)])}}};")
-    print(f"float y_mean[2] = {{{', '.join([f'{v:.6f}f' for v in scaler_y.mean_])}}};")
-    print(f"float y_std[2]  = {{{', '.join([f'{v:.6f}f' for v in np.sqrt(scaler_y.var_)])}}};")
-
-    print(f"\nfloat W1[{N_IN}][{H1_SIZE}] = {{")
-    for i in range(N_IN):
-        row = ", ".join([f"{val:.6f}f" for val in W1[i]])
-        print(f"  {{{row}}}" + ("," if i < N_IN - 1 else ""))
-    print("};")
-
-    print(f"\nfloat B1[{H1_SIZE}] = {{")
-    for i in range(0, H1_SIZE, 4):
-        row = ", ".join([f"{val:.6f}f" for val in B1[i:i + 4]])
-        print(f"  {row}" + ("," if i + 4 < H1_SIZE else ""))
-    print("};")
-
-    print(f"\nfloat W2[{H1_SIZE}][{H2_SIZE}] = {{")
-    for i in range(H1_SIZE):
-        row = ", ".join([f"{val:.6f}f" for val in W2[i]])
-        print(f"  {{{row}}}" + ("," if i < H1_SIZE - 1 else ""))
-    print("};")
-
-    print(f"\nfloat B2[{H2_SIZE}] = {{")
-    for i in range(0, H2_SIZE, 4):
-        row = ", ".join([f"{val:.6f}f" for val in B2[i:i + 4]])
-        print(f"  {row}" + ("," if i + 4 < H2_SIZE else ""))
-    print("};")
-
-    print(f"\nfloat W3[{H2_SIZE}][2] = {{")
-    for i in range(H2_SIZE):
-        row = ", ".join([f"{val:.6f}f" for val in W3[i]])
-        print(f"  {{{row}}}" + ("," if i < H2_SIZE - 1 else ""))
-    print("};")
-
-    print(f"\nfloat B3[2] = {{{', '.join([f'{val:.6f}f' for val in B3])}}};")
-
-    # ===================== Gateway Python 코드 출력 =====================
-    print("\n" + "=" * 60)
-    print("   Gateway Python Code")
-    print("=" * 60)
-
-    print(f"X_MEAN = {scaler_X.mean_.tolist()}")
-    print(f"X_STD  = {np.sqrt(scaler_X.var_).tolist()}")
-    print(f"Y_MEAN = {scaler_y.mean_.tolist()}")
-    print(f"Y_STD  = {np.sqrt(scaler_y.var_).tolist()}")
-    print(f"\nW1 = {W1.tolist()}")
-    print(f"B1 = {B1.tolist()}")
-    print(f"W2 = {W2.tolist()}")
-    print(f"B2 = {B2.tolist()}")
-    print(f"W3 = {W3.tolist()}")
-    print(f"B3 = {B3.tolist()}")
-
-    # ===================== 정확도 확인 =====================
-    y_pred = scaler_y.inverse_transform(mlp.predict(X_scaled))
-    r2 = r2_score(y, y_pred)
-    mae_t = mean_absolute_error(y[:, 0], y_pred[:, 0])
-    mae_h = mean_absolute_error(y[:, 1], y_pred[:, 1])
-    print(f"\nModel R2 Score: {r2:.5f}")
-    print(f"MAE Temp: {mae_t:.4f}°C, MAE Hum: {mae_h:.4f}%")
+    save_model(arrays, X)
+    report_accuracy(arrays, X, y)
+
+
+def save_model(arrays, X):
+    """int8 활성값 scale 보정(q_scales) 후 게이트웨이 모델 파일 + 엣지 헤더(float + int8 배열) 저장."""
+    arrays["q_scales"] = calibrate(GatewayMLP(**{k: arrays[k] for k in MODEL_ARRAYS}, verbose=False), X,
+                                   QUANT_PERCENTILE)
+    write_model_file(MODEL_FILE, arrays, WINDOW_SIZE, N_FEATURES)
+    meta, _ = read_model_file(MODEL_FILE)
+    write_c_header(C_HEADER_FILE, arrays, checksum=meta["checksum"],
+                   extra=twin_c_lines() + delta_c_lines() + quantized_c_lines(QuantizedMLP(**arrays, verbose=False)))
+    print(f"\nGateway model file: {MODEL_FILE} (checksum 0x{meta['checksum']:08X})")
+    print(f"ESP32 weight header: {C_HEADER_FILE} (float + int8, q_scales {np.round(arrays['q_scales'], 5)})")
+
+
+def report_accuracy(arrays, X, y):
+    """게이트웨이와 같은 float32 / int8 추론 경로로 정확도 확인."""
+    float_model = GatewayMLP(**{k: arrays[k] for k in MODEL_ARRAYS}, verbose=False)
+    y_float = float_model.predict_batch(X)
+    y_int8 = QuantizedMLP(**arrays, verbose=False).predict_batch(X)
+    for name, y_pred in (("float32", y_float), ("int8", y_int8)):
+        r2, mae_t, mae_h = regression_metrics(y, y_pred)
+        print(f"\n[{name}] Model R2 Score: {r2:.5f}")
+        print(f"[{name}] MAE Temp: {mae_t:.4f}°C, MAE Hum: {mae_h:.4f}%")
+    diff = np.abs(y_int8 - y_float).max(axis=0)
+    print(f"\nint8 vs float32 max |diff|: Temp {diff[0]:.4f}°C, Hum {diff[1]:.4f}%")
+
+
+def quantize_model_file(file_path):
+    """재학습 없이 기존 MODEL_FILE 가중치로 int8 scale만 다시 보정하고 모델 파일·헤더를 다시 씀."""
+    _, stored = read_model_file(MODEL_FILE)
+    arrays = {name: np.array(stored[name]) for name in MODEL_ARRAYS}
+    window_size = len(arrays["x_mean"]) // N_FEATURES
+    X, y = make_windows(frame_to_features(pd.read_csv(file_path)), window_size)
+    print(f"Quantize {MODEL_FILE} on {len(X)} windows from {file_path}")
+    save_model(arrays, X)
+    report_accuracy(arrays, X, y)
+
+
+# ===================== 하이퍼파라미터 스윕 =====================
+# ESP32 추론 시간 추정: edge_log_*.csv SKIP 행(forward + shift) ≈ 87~95µs / 2,880 MAC (12-64-32-2)
+ESP32_US_PER_MAC = 0.031
+# 엣지 RAM 예산: 가중치 + 활성값 + 윈도우 (float32)
+ESP32_RAM_BUDGET_KB = 64
+
+SWEEP_GRID = {
+    'window_size': [2, 4, 6, 8],
+    'h1_size': [16, 32, 64],
+    'h2_size': [8, 16, 32],
+    'learning_rate': [0.001, 0.003],
+}
+
+_shared_features = None
+
+
+def _sweep_worker_init(shm_name, shape, dtype):
+    """워커 프로세스: 공유 메모리의 feature 배열을 복사 없이 attach."""
+    global _shared_features
+    shm = shared_memory.SharedMemory(name=shm_name)
+    _shared_features = (shm, np.ndarray(shape, dtype=dtype, buffer=shm.buf))
+
+
+def _sweep_trial(cfg, max_iter, trainer=TRAINER):
+    features = _shared_features[1]
+    w, h1, h2 = cfg['window_size'], cfg['h1_size'], cfg['h2_size']
+    X, y = make_windows(features, w)
+
+    # 시간 순 분할: 마지막 10%를 검증용
+    n_val = max(len(X) // 10, 1)
+    X_train, y_train, X_val, y_val = X[:-n_val], y[:-n_val], X[-n_val:], y[-n_val:]
+
+    t0 = time.perf_counter()
+    arrays, n_iter = fit_weights(X_train, y_train, h1, h2, cfg['learning_rate'], max_iter, trainer=trainer)
+    train_s = time.perf_counter() - t0
+
+    _, mae_t, mae_h = regression_metrics(y_val, GatewayMLP(**arrays, verbose=False).predict_batch(X_val))
+    n_in = w * N_FEATURES
+    macs = n_in * h1 + h1 * h2 + h2 * 2
+    n_params = macs + h1 + h2 + 2
+    ram_kb = (n_params + 2 * (h1 + h2) + 2 * n_in) * 4 / 1024
+    return {
+        **cfg,
+        'val_mae_temp': mae_t,
+        'val_mae_hum': mae_h,
+        'n_params': n_params,
+        'ram_kb': round(ram_kb, 1),
+        'fits_edge': ram_kb <= ESP32_RAM_BUDGET_KB,
+        'esp32_infer_us': round(macs * ESP32_US_PER_MAC, 1),
+        'n_iter': n_iter,
+        'train_s': round(train_s, 2),
+    }
+
+
+def sweep(file_path, grid=SWEEP_GRID, n_random=None, workers=None, max_iter=2000, out_path='sweep_results.csv',
+          trainer=TRAINER):
+    """grid 전체(또는 n_random개 무작위 표본)를 프로세스 풀(기본: 코어당 1개)로 학습.
+
+    feature 배열은 공유 메모리에 한 번 올리고, 워커가 각자 make_windows() view를 만든다
+    (설정마다 데이터셋을 pickle 하지 않음).
+    """
+    if not os.path.exists(file_path):
+        print(f"Error: File not found at {file_path}")
+        return None
+
+    configs = [dict(zip(grid, values)) for values in itertools.product(*grid.values())]
+    if n_random and n_random < len(configs):
+        configs = random.Random(42).sample(configs, n_random)
+    workers = workers or os.cpu_count()
+
+    features = np.ascontiguousarray(frame_to_features(pd.read_csv(file_path)))
+    shm = shared_memory.SharedMemory(create=True, size=features.nbytes)
+    try:
+        np.ndarray(features.shape, dtype=features.dtype, buffer=shm.buf)[:] = features
+        print(f"Sweep: {len(configs)} configs, {workers} workers, {len(features)} rows (shared memory)")
+        rows = []
+        with ProcessPoolExecutor(max_workers=workers, initializer=_sweep_worker_init,
+                                 initargs=(shm.name, features.shape, features.dtype)) as pool:
+            futures = {pool.submit(_sweep_trial, cfg, max_iter, trainer): cfg for cfg in configs}
+            for i, fut in enumerate(as_completed(futures), 1):
+                r = fut.result()
+                rows.append(r)
+                print(f"  [{i}/{len(configs)}] w={r['window_size']} {r['h1_size']}-{r['h2_size']} "
+                      f"lr={r['learning_rate']}: MAE T={r['val_mae_temp']:.4f} H={r['val_mae_hum']:.4f} "
+                      f"({r['train_s']}s)")
+    finally:
+        shm.close()
+        shm.unlink()
+
+    results = pd.DataFrame(rows).sort_values(['fits_edge', 'val_mae_temp'], ascending=[False, True])
+    print("\n" + results.to_string(index=False))
+    if out_path:
+        results.to_csv(out_path, index=False)
+        print(f"\nSweep results: {out_path}")
+    return results
 
 
 if __name__ == "__main__":
-    train_offline_mlp(FILE_NAME)
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--data', default=FILE_NAME)
+    ap.add_argument('--sweep', action='store_true', help='하이퍼파라미터 스윕 모드')
+    ap.add_argument('--random', type=int, help='grid 대신 무작위 N개 설정만 학습')
+    ap.add_argument('--workers', type=int, help='워커 프로세스 수 (기본: CPU 코어 수)')
+    ap.add_argument('--max-iter', type=int, default=2000)
+    ap.add_argument('--out', default='sweep_results.csv')
+    ap.add_argument('--trainer', choices=['sklearn', 'numpy'], default=TRAINER,
+                    help='sklearn: MLPRegressor, numpy: 순수 NumPy 학습기 (gateway/mlp_trainer.py)')
+    ap.add_argument('--online-epochs', type=int, default=0,
+                    help='사전학습 후 온라인 SGD(online_update) 재현 epoch 수')
+    ap.add_argument('--quantize-only', action='store_true',
+                    help='재학습 없이 기존 모델 파일의 int8 scale 보정 + 모델 파일·헤더 재생성')
+    for key, values in SWEEP_GRID.items():
+        ap.add_argument(f"--{key.replace('_', '-')}", type=type(values[0]), nargs='+', default=values)
+    args = ap.parse_args()
+
+    if args.quantize_only:
+        quantize_model_file(args.data)
+    elif args.sweep:
+        sweep(args.data, {key: getattr(args, key) for key in SWEEP_GRID},
+              n_random=args.random, workers=args.workers, max_iter=args.max_iter, out_path=args.out,
+              trainer=args.trainer)
+    else:
+        train_offline_mlp(args.data, trainer=args.trainer, online_epochs=args.online_epochs)
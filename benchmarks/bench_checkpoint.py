@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+게이트웨이 체크포인트: 이벤트 루프 쪽 비용(capture, 버퍼 복사) vs 동기 저장(write_model_file + fsync),
+그리고 저장 → 재시작(load_model) 후 가중치·윈도우·예측이 그대로인지 확인.
+
+실행:
+  python benchmarks/bench_checkpoint.py [--n 200] [--updates 500]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from checkpoint import Checkpointer, load_model, model_checksum
+from model_file import MODEL_ARRAYS, write_model_file
+
+MODEL_PATH = os.path.join(ROOT, "gateway", "mlp_model.bin")
+
+
+def adapt(model, n, seed=0):
+    """합성 RX 시퀀스로 online_update → 사전학습 가중치에서 벗어난 모델."""
+    rng = np.random.default_rng(seed)
+    for i in range(n):
+        model.predict()
+        t, h = 22 + rng.normal(0, 0.5), 45 + rng.normal(0, 2)
+        model.online_update(t, h, lr=0.01)
+        model.shift_window(t, h, (i % 1440) / 1440)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=200, help="측정 반복 수")
+    ap.add_argument("--updates", type=int, default=500, help="저장 전 online_update 횟수")
+    args = ap.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="aoii_ckpt_")
+    path = os.path.join(tmp, "gateway_checkpoint.bin")
+    model, restored = load_model(MODEL_PATH, path, inplace=True, verbose=False)
+    assert not restored
+    adapt(model, args.updates)
+
+    ckpt = Checkpointer(model, path, model_checksum(MODEL_PATH), interval_s=3600, verbose=False)
+    capture = []
+    for _ in range(args.n):
+        t0 = time.perf_counter()
+        ckpt.capture()
+        capture.append(time.perf_counter() - t0)
+        time.sleep(0.001)
+    ckpt.close()
+
+    sync = []
+    arrays = {name: getattr(model, name) for name in MODEL_ARRAYS + ("window_buf",)}
+    for _ in range(min(args.n, 50)):
+        t0 = time.perf_counter()
+        write_model_file(os.path.join(tmp, "sync.bin"), arrays, model.window_buf.shape[0], 3)
+        sync.append(time.perf_counter() - t0)
+
+    capture = np.array(capture) * 1e6
+    sync = np.array(sync) * 1e6
+    print(f"checkpoint file {os.path.getsize(path):,} bytes, stats {ckpt.stats()}")
+    print(f"  capture (event loop)   : p50 {np.percentile(capture, 50):8.1f} µs   p99 {np.percentile(capture, 99):8.1f} µs")
+    print(f"  sync write + fsync     : p50 {np.percentile(sync, 50):8.1f} µs   p99 {np.percentile(sync, 99):8.1f} µs")
+
+    # 재시작 시뮬레이션
+    before = model.predict().copy()
+    again, restored = load_model(MODEL_PATH, path, inplace=True, verbose=False)
+    same = all(np.array_equal(getattr(model, n), getattr(again, n)) for n in MODEL_ARRAYS + ("window_buf",))
+    print(f"  restore: restored={restored}, weights+window identical={same}, "
+          f"prediction {before} → {again.predict()}")
+
+    # 손상된 체크포인트는 무시하고 사전학습 모델로 시작
+    with open(path, "r+b") as f:
+        f.seek(-8, os.SEEK_END)
+        f.write(b"\xff" * 8)
+    _, restored = load_model(MODEL_PATH, path, inplace=True, verbose=False)
+    print(f"  corrupted checkpoint → restored={restored}")
+
+
+if __name__ == "__main__":
+    main()
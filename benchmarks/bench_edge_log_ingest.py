@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+엣지 시리얼 로그 → MySQL edge_log 적재 비교: 행 단위 vs 일괄 저장.
+
+--nodes개 노드가 보낸 줄(parse_edge_line 결과)을 --seconds 동안 최대 속도로 넣고,
+DB에 실제로 commit된 행 수 / 경과 시간(대기 행 flush 포함)으로 지속 처리량(rows/s)을 잰다.
+
+- fresh  : 예전 insert_edge_log (행마다 pymysql.connect + INSERT 1행 + commit + close)
+- pooled : 현재 insert_edge_log (풀 연결 재사용, 여전히 행마다 commit)
+- batched: edge_db.parsed_row → BatchWriter → insert_edge_logs (EDGE_DB_BATCH_SIZE / EDGE_DB_FLUSH_MS)
+
+MySQL 서버가 필요하다 (.env의 MYSQL_*). --database로 지정한 부하 테스트용 DB(기본 aoii_loadtest)를
+만들어 사용하고 끝나면 삭제한다 (--keep으로 보존).
+--sink null: DB 없이 행 변환·큐·batch 경로만 측정.
+
+실행:
+  python benchmarks/bench_edge_log_ingest.py [--seconds 10] [--nodes 50] [--batch-size 200] [--flush-ms 1000]
+  python benchmarks/bench_edge_log_ingest.py --sink null
+"""
+import argparse
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from server import mqtt_to_mysql  # noqa: F401  (.env MYSQL_* 로드)
+from server import db, edge_db
+from server.batch_writer import BatchWriter
+from common.serial_ingest import parse_edge_line
+
+
+def synthetic_lines(nodes, n=1000):
+    out = []
+    for i in range(n):
+        t, h = 20 + (i % 50) * 0.1, 40 + (i % 30) * 0.2
+        status = "SEND & TRAIN" if i % 7 == 0 else "SKIP"
+        parsed = parse_edge_line(f"{t:.2f},{h:.2f},{t - 0.3:.2f},{h + 1.1:.2f},0.300,1.100,{status},"
+                                 f"{850 + i % 40},250000,327680")
+        out.append((parsed, f"node{i % nodes:02d}", ("0.3", "0.5", "0.7")[i % 3]))
+    return out
+
+
+def fresh_insert_edge_log(parsed):
+    """예전 insert_edge_log: 연결을 새로 열고 1행 INSERT + commit 후 닫음."""
+    import pymysql
+    row = edge_db.parsed_row(parsed, time.time())
+    conn = pymysql.connect(**db._config())
+    try:
+        with conn.cursor() as cur:
+            cur.execute(db._INSERT_EDGE_LOG_SQL, row)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def pooled_insert_edge_log(parsed):
+    (actual_t, actual_h, pred_t, pred_h, error_t, error_h,
+     status, inference_time_us, free_heap, total_heap) = parsed
+    db.insert_edge_log(actual_t, actual_h, pred_t, pred_h, error_t, status != "SKIP", error_h, status,
+                       inference_time_us, free_heap, total_heap)
+
+
+def count_rows():
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) AS n FROM edge_log")
+            return cur.fetchone()["n"]
+
+
+def run_per_row(lines, seconds, fn):
+    start_rows = count_rows()
+    t0 = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - t0 < seconds:
+        fn(lines[sent % len(lines)][0])
+        sent += 1
+    elapsed = time.perf_counter() - t0
+    return sent, count_rows() - start_rows, elapsed
+
+
+def run_batched(lines, seconds, batch_size, flush_ms, write_fn):
+    start_rows = count_rows() if write_fn is db.insert_edge_logs else 0
+    writer = BatchWriter(write_fn, batch_size=batch_size, flush_interval_ms=flush_ms, name="bench", verbose=False)
+    t0 = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - t0 < seconds:
+        parsed, node_id, variant = lines[sent % len(lines)]
+        writer.submit(edge_db.parsed_row(parsed, time.time(), node_id, variant))
+        sent += 1
+        # writer가 따라가지 못하면 producer를 잠깐 멈춰 대기 행이 무한히 쌓이지 않게 함 (지속 처리량 측정)
+        if sent % 1000 == 0:
+            while writer.stats()["pending"] > 10 * batch_size:
+                time.sleep(0.001)
+    writer.close()
+    elapsed = time.perf_counter() - t0
+    stats = writer.stats()
+    written = count_rows() - start_rows if write_fn is db.insert_edge_logs else stats["written"]
+    return sent, written, elapsed, stats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--nodes", type=int, default=50)
+    ap.add_argument("--batch-size", type=int, default=edge_db.EDGE_DB_BATCH_SIZE)
+    ap.add_argument("--flush-ms", type=int, default=edge_db.EDGE_DB_FLUSH_MS)
+    ap.add_argument("--database", default="aoii_loadtest")
+    ap.add_argument("--sink", choices=["mysql", "null"], default="mysql")
+    ap.add_argument("--keep", action="store_true", help="부하 테스트 DB 삭제하지 않음")
+    args = ap.parse_args()
+    lines = synthetic_lines(args.nodes)
+
+    if args.sink == "null":
+        sent, written, elapsed, stats = run_batched(lines, args.seconds, args.batch_size, args.flush_ms,
+                                                    lambda rows: None)
+        print(f"null sink: {written:,} rows in {elapsed:.2f} s → {written / elapsed:,.0f} rows/s "
+              f"(row build + queue + batch overhead only)  {stats}")
+        return
+
+    import pymysql
+    cfg = db._config()
+    cfg.pop("database")
+    admin = pymysql.connect(**cfg)
+    with admin.cursor() as cur:
+        cur.execute(f"CREATE DATABASE IF NOT EXISTS `{args.database}`")
+    os.environ["MYSQL_DATABASE"] = args.database
+    db.init_db()
+    try:
+        print(f"database {args.database}, {args.seconds:.0f} s per mode, "
+              f"batch {args.batch_size} rows / {args.flush_ms} ms")
+        for name, fn in (("fresh ", fresh_insert_edge_log), ("pooled", pooled_insert_edge_log)):
+            sent, written, elapsed = run_per_row(lines, args.seconds, fn)
+            print(f"  {name} : {written:,} rows, {written / elapsed:,.0f} rows/s "
+                  f"(= {written / elapsed * 60 / args.nodes:,.0f}x the load of {args.nodes} nodes at 1 row/min)")
+        sent, written, elapsed, stats = run_batched(lines, args.seconds, args.batch_size, args.flush_ms,
+                                                    db.insert_edge_logs)
+        print(f"  batched: {written:,} rows, {written / elapsed:,.0f} rows/s sustained  {stats}")
+    finally:
+        if not args.keep:
+            with admin.cursor() as cur:
+                cur.execute(f"DROP DATABASE `{args.database}`")
+        admin.close()
+
+
+if __name__ == "__main__":
+    main()
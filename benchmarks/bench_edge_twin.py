@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+"""
+엣지 ↔ 게이트웨이 모델 twin 검증: MLP_edge_sensor.ino의 모델 코드를 gcc로 컴파일해 데이터셋을 엣지 loop()처럼
+재생하면서, 같은 시뮬레이션 시계 위의 GatewayRuntime에 SEND 줄을 넣어 두 쪽의 예측을 스텝별로 비교한다.
+
+- 엣지 (C): MLP_edge_sensor.ino의 '#define WINDOW_SIZE' ~ time_n_of()를 그대로 잘라 mlp_model.h와 함께 컴파일
+  (#pragma fp-contract=off 포함, -O2 -march=native). loop()의 판정·SEND·SKIP 부분과 재부팅(ESP.restart →
+  setup)만 하네스가 같은 순서로 수행. ack가 '<unix>,R'이면 갱신 없이 재부팅하고 부팅 ping을 보낸다.
+  스텝 간격: SKIP 60 s, SEND 60 s + ack 대기 (--send-wait, 엣지 로그 SEND median 1.057 s), 재부팅 + setup 2 s
+- 게이트웨이 (Python): GatewayRuntime._on_line / _on_est를 시뮬레이션 시각 순서대로 호출
+  (EST는 마지막 RX/EST 60 s 뒤, RX는 SEND 스텝 + --rx-latency 초)
+  - twin   : EdgeTwinMLP (--int8: QuantizedMLP) + 'ts,t,h,n_skip,hash' 페이로드
+  - legacy : GatewayMLP + 'ts,t,h' 페이로드, 게이트웨이 시계의 time_n (이 변경 전 동작)
+
+출력 (모드별):
+  - RX에서 게이트웨이가 쓴 예측과 엣지 forward() 예측이 비트 단위로 같은 비율, 최대 차이
+  - 해시 비교 건수 / 불일치 (twin, 불일치 = 엣지 재부팅 수)
+  - SKIP 스텝 추정 오차: 게이트웨이가 그 스텝에 대해 가진 예측과 실제값 차이가 beta 이상인 스텝 수
+    (엣지는 자기 예측이 beta 안이라 보내지 않았는데 게이트웨이 값은 틀린 경우)
+  - 불필요한 SEND: 게이트웨이 예측으로는 엣지 판정 기준(beta - epsilon) 안이었던 RX 수 (HEARTBEAT 제외)
+
+실행:
+  python benchmarks/bench_edge_twin.py [--data 그냥_측정.csv] [--int8] [--no-pragma]
+"""
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+from datetime import datetime
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+sys.path.insert(0, os.path.join(ROOT, "edge_node"))
+
+import gateway_runtime
+from aoii_replay import EDGE_EPSILON, load_series
+from edge_twin import EdgeTwinMLP
+from gateway_MLP_Logic import GatewayMLP
+from gateway_runtime import BETA_HUM, BETA_TEMP, LV_TIMEZONE, GatewayRuntime
+from model_file import read_model_file
+from Pre_train import MODEL_FILE
+from quantized_mlp import QuantizedMLP
+
+MODEL_PATH = os.path.join(ROOT, MODEL_FILE)
+SKETCH = os.path.join(ROOT, "edge_node", "MLP_edge_sensor.ino")
+DEFAULT_DATA = os.path.join(ROOT, "그냥_측정.csv")
+SETUP_S = 2.0  # 부팅 → 첫 loop() (setup의 delay + 시간 동기화)
+
+_local_time_n = gateway_runtime.local_time_n
+
+# 입력 줄: 'BOOT <unix>' (setup: 헤더 가중치 + init_window + 시간 동기화) 또는 '<unix_ms> <t> <h>' (loop 1회)
+# 출력 줄: 'SKIP <pred_t> <pred_h>' 또는 'SEND|HEARTBEAT <pred_t> <pred_h> <페이로드>' 후 ack 줄('<unix>[,R]')을 읽음
+#          ',R'이 아니면 update_model() 뒤 'UPDATED' 또는 'DIVERGED' (가중치 NaN/inf → 재부팅, 다음 줄: BOOT)
+HARNESS_MAIN = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+
+static float W1_0[N_IN][N_H1], B1_0[N_H1], W2_0[N_H1][N_H2], B2_0[N_H2], W3_0[N_H2][N_OUT], B3_0[N_OUT];
+
+int main(void) {
+  unsigned long long now_ms, last_send_ms = 0;
+  char cmd[32], ts[32], hs[32], ack[64];
+  setvbuf(stdout, NULL, _IOLBF, 0);  // 파이프로 한 줄씩 주고받음
+  memcpy(W1_0, W1, sizeof W1); memcpy(B1_0, B1, sizeof B1); memcpy(W2_0, W2, sizeof W2);
+  memcpy(B2_0, B2, sizeof B2); memcpy(W3_0, W3, sizeof W3); memcpy(B3_0, B3, sizeof B3);
+  while (scanf("%31s", cmd) == 1) {
+    if (strcmp(cmd, "BOOT") == 0) {
+      // ESP.restart() → 헤더 초기값으로 다시 시작
+      memcpy(W1, W1_0, sizeof W1); memcpy(B1, B1_0, sizeof B1); memcpy(W2, W2_0, sizeof W2);
+      memcpy(B2, B2_0, sizeof B2); memcpy(W3, W3_0, sizeof W3); memcpy(B3, B3_0, sizeof B3);
+#ifdef MLP_INT8
+      mlp_q_requantize(&W1[0][0], B1, &W2[0][0], B2, &W3[0][0], B3);
+#endif
+      init_window();
+      if (scanf("%lu", &last_sync_unix) != 1) return 1;
+      anchor_unix = last_sync_unix;
+      n_skip = 0;
+      last_send_ms = (unsigned long long)last_sync_unix * 1000ULL;
+      continue;
+    }
+    now_ms = strtoull(cmd, NULL, 10);
+    if (scanf("%31s %31s", ts, hs) != 2) return 1;
+    float cur_t = (float)atof(ts), cur_h = (float)atof(hs);
+    unsigned long loop_unix = (unsigned long)(now_ms / 1000ULL);
+    forward();
+    float pred_t = pred_out[0], pred_h = pred_out[1];
+    float err_t = fabsf(cur_t - pred_t), err_h = fabsf(cur_h - pred_h);
+    int is_heartbeat = now_ms - last_send_ms >= HEARTBEAT_INTERVAL;
+    if ((err_t >= beta_temp - epsilon) || (err_h >= beta_hum - epsilon) || is_heartbeat || isnan(err_t)
+        || isnan(err_h)) {
+      int hb = is_heartbeat && err_t <= beta_temp && err_h <= beta_hum;
+      printf("%s %a %a %llu,%s,%s,%lu,%08lx\n", hb ? "HEARTBEAT" : "SEND", pred_t, pred_h, now_ms, ts, hs,
+             n_skip, (unsigned long)mlp_state_hash(&window_buf[0][0], N_IN));
+      last_send_ms = now_ms;
+      if (scanf("%63s", ack) != 1) return 1;
+      size_t n = strlen(ack);
+      if (n >= 2 && strcmp(ack + n - 2, ",R") == 0) continue;  // 갱신 없이 재부팅 (다음 줄: BOOT)
+      update_model(cur_t, cur_h);
+      if (!weights_finite()) {
+        printf("DIVERGED\n");
+        continue;
+      }
+      printf("UPDATED\n");
+#ifdef MLP_INT8
+      mlp_q_requantize(&W1[0][0], B1, &W2[0][0], B2, &W3[0][0], B3);
+#endif
+      anchor_unix = loop_unix;
+      n_skip = 0;
+      shift_window(pred_t, pred_h, time_n_of(anchor_unix));
+    } else {
+      printf("SKIP %a %a\n", pred_t, pred_h);
+      n_skip++;
+      shift_window(pred_t, pred_h, time_n_of(anchor_unix + STEP_S * n_skip));
+    }
+  }
+  return 0;
+}
+"""
+
+
+def build_edge(workdir, int8, pragma):
+    """스케치의 모델 부분 + HARNESS_MAIN → 실행 파일 경로."""
+    with open(SKETCH, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    start = next(i for i, s in enumerate(lines) if s.startswith("#define WINDOW_SIZE"))
+    end = next(i for i, s in enumerate(lines) if s.startswith("void waitForTimeSync"))
+    body = [s for s in lines[start:end] if pragma or not s.startswith("#pragma GCC optimize")]
+    src = os.path.join(workdir, "edge.cpp")
+    with open(src, "w", encoding="utf-8") as f:
+        f.write("#include <math.h>\n#include <stdint.h>\n" + "\n".join(body) + HARNESS_MAIN)
+    exe = os.path.join(workdir, "edge")
+    cmd = ["g++", "-O2", "-march=native", "-I", os.path.join(ROOT, "edge_node"), src, "-o", exe]
+    if int8:
+        cmd.insert(1, "-DMLP_INT8")
+    subprocess.run(cmd, check=True)
+    return exe
+
+
+class EdgeProcess:
+    """하네스 프로세스와 한 줄씩 주고받는 엣지 노드."""
+
+    def __init__(self, exe):
+        self.proc = subprocess.Popen([exe], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True, bufsize=1)
+
+    def _write(self, line):
+        self.proc.stdin.write(line + "\n")
+        self.proc.stdin.flush()
+
+    def boot(self, sync_unix):
+        self._write(f"BOOT {sync_unix}")
+
+    def step(self, now, t, h):
+        """loop() 1회 → (status, pred_t, pred_h, 페이로드 또는 None). SEND면 ack()로 응답해야 다음 스텝."""
+        self._write(f"{int(now * 1000)} {t} {h}")
+        fields = self.proc.stdout.readline().split()
+        return fields[0], float.fromhex(fields[1]), float.fromhex(fields[2]), (fields[3] if len(fields) > 3 else None)
+
+    def ack(self, line):
+        """ack 전달 → 재부팅 요청(',R')이면 None, 아니면 'UPDATED' 또는 'DIVERGED'."""
+        self._write(line)
+        return None if line.endswith(",R") else self.proc.stdout.readline().strip()
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+class SimGateway:
+    """GatewayRuntime을 시뮬레이션 시계로 구동 (time.time / local_time_n / clock 모두 sim.now)."""
+
+    def __init__(self, model, twin_base, boot_unix):
+        self.now = float(boot_unix)
+        gateway_runtime.time = types.SimpleNamespace(time=lambda: self.now)
+        gateway_runtime.local_time_n = lambda now=None: _local_time_n(datetime.fromtimestamp(self.now, LV_TIMEZONE))
+
+        self.acks = []
+        ser = types.SimpleNamespace(write=lambda b: self.acks.append(b.decode().strip()))
+        self.rt = GatewayRuntime(model, ser, lambda payload, qos=0: None, verbose=False, clock=lambda: self.now,
+                                 twin_base=twin_base)
+        # RX에서 online_update 직전 예측 (twin은 n_skip 재생 뒤) 기록
+        self.rx_pred = None
+        update = model.online_update
+
+        def recording_update(actual_t, actual_h, lr=0.05):
+            self.rx_pred = (model.last_pred_t, model.last_pred_h)
+            return update(actual_t, actual_h, lr)
+        model.online_update = recording_update
+        self.rt._next_est = self.now + self.rt.est_interval
+
+    def ping(self, at):
+        """엣지 부팅 ping ('0.0,0.0') → ack unix 초 (엣지 last_sync_unix)."""
+        self.now = at
+        self.rt._on_line("Received: 0.0,0.0")
+        return int(self.acks[-1].split(",")[0])
+
+    def advance(self, until):
+        """until까지 도래한 EST tick 처리 → 각 EST 뒤 예측 리스트."""
+        preds = []
+        while self.rt._next_est <= until:
+            self.now = self.rt._next_est
+            self.rt._on_est()
+            preds.append(self.next_pred())
+        return preds
+
+    def rx(self, at, payload):
+        """→ (online_update에 쓴 예측 또는 None, ack 줄)."""
+        self.now = at
+        self.rx_pred = None
+        self.rt._on_line(f"Received: {payload}")
+        return self.rx_pred, self.acks[-1]
+
+    def next_pred(self):
+        return self.rt.model.last_pred_t, self.rt.model.last_pred_h
+
+
+def same(a, b):
+    # 비트 비교 대용: float32 → float 변환은 정확하므로 ==, 둘 다 NaN(발산)이면 같은 것으로
+    return a == b or (a != a and b != b)
+
+
+def simulate(edge, gw, temp, hum, boot_unix, legacy, send_wait, rx_latency):
+    """데이터셋 한 샘플 = 엣지 loop() 1회. 시각 순서대로 게이트웨이 EST/RX 처리 → 통계 dict."""
+    s = {"send": 0, "rx": 0, "rx_exact": 0, "rx_max_diff": 0.0, "resync": 0, "diverged": 0, "wasted_send": 0, "skip": 0,
+         "skip_est": 0, "skip_exact": 0, "skip_violation": 0, "skip_max_err": 0.0}
+    edge.boot(gw.ping(boot_unix))
+    now = boot_unix + SETUP_S
+    # SKIP 스텝 추정: 직전 RX(또는 부팅) 직후 예측 = 다음 스텝, EST j 뒤 예측 = 그 다음 j번째 스텝
+    est_queue = [gw.next_pred()]
+    for t, h in zip(temp, hum):
+        ts, hs = f"{t:.2f}", f"{h:.2f}"
+        actual_t, actual_h = float(ts), float(hs)
+        status, pred_t, pred_h, payload = edge.step(now, ts, hs)
+        if payload is None:
+            est_queue += gw.advance(now)
+            s["skip"] += 1
+            if est_queue:
+                g_t, g_h = est_queue.pop(0)
+                s["skip_est"] += 1
+                s["skip_exact"] += (same(g_t, pred_t) and same(g_h, pred_h))
+                err_t, err_h = abs(actual_t - g_t), abs(actual_h - g_h)
+                s["skip_max_err"] = max(s["skip_max_err"], err_t)
+                s["skip_violation"] += (err_t >= BETA_TEMP or err_h >= BETA_HUM)
+            now += 60.0
+            continue
+
+        s["send"] += 1
+        at = now + rx_latency
+        gw.advance(at)
+        rx_pred, ack = gw.rx(at, ",".join(payload.split(",")[:3]) if legacy else payload)
+        updated = edge.ack(ack)
+        if updated != "UPDATED":
+            # 엣지 재부팅 (해시 불일치 또는 update_model 발산) → 부팅 ping (게이트웨이도 사전학습 상태로)
+            s["resync" if updated is None else "diverged"] += 1
+            edge.boot(gw.ping(now + send_wait))
+            now += send_wait + SETUP_S
+            est_queue = [gw.next_pred()]
+            continue
+        s["rx"] += 1
+        s["rx_exact"] += (same(rx_pred[0], pred_t) and same(rx_pred[1], pred_h))
+        s["rx_max_diff"] = max(s["rx_max_diff"], abs(rx_pred[0] - pred_t), abs(rx_pred[1] - pred_h))
+        if status == "SEND":
+            # 엣지 판정과 같은 기준 (beta - epsilon)
+            s["wasted_send"] += (abs(actual_t - rx_pred[0]) < BETA_TEMP - EDGE_EPSILON
+                                 and abs(actual_h - rx_pred[1]) < BETA_HUM - EDGE_EPSILON)
+        est_queue = [gw.next_pred()]
+        now += 60.0 + send_wait
+    return s
+
+
+def report(name, s, gw):
+    print(f"  {name}: {s['send']:,} SEND/HEARTBEAT, {s['skip']:,} SKIP")
+    print(f"    RX updated {s['rx']:,}: gateway pred == edge pred (bit-exact) {s['rx_exact']:,} "
+          f"({100.0 * s['rx_exact'] / max(s['rx'], 1):.1f}%), max |diff| {s['rx_max_diff']:.6f}")
+    if gw.rt.twin_base is not None:
+        c = gw.rt.twin_counters
+        print(f"    twin hash checked {c['checked']:,}, mismatch {c['mismatch']:,} (= edge reboots {s['resync']:,})")
+    print(f"    online SGD diverged: edge {s['diverged']:,}, gateway {gw.rt.model_diverged:,} (both reset to pretrained)")
+    print(f"    SEND where gateway pred was already within beta (wasted): {s['wasted_send']:,}")
+    print(f"    SKIP with an EST {s['skip_est']:,}: bit-exact {s['skip_exact']:,}, "
+          f"gateway estimate off by >= beta {s['skip_violation']:,}, max |err T| {s['skip_max_err']:.3f}°C")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--data", default=DEFAULT_DATA)
+    ap.add_argument("--int8", action="store_true", help="엣지 MLP_INT8 + 게이트웨이 QuantizedMLP")
+    ap.add_argument("--no-pragma", action="store_true", help="fp-contract=off 없이 컴파일 (FMA 허용)")
+    ap.add_argument("--boot-unix", type=int, default=1760000000)
+    ap.add_argument("--send-wait", type=float, default=1.057, help="SEND 스텝의 ack 대기 (s)")
+    ap.add_argument("--rx-latency", type=float, default=0.05, help="SEND → 게이트웨이 RX (s)")
+    args = ap.parse_args()
+    if shutil.which("g++") is None:
+        print("g++ not found")
+        return
+
+    _, _, temp, hum = load_series(args.data)
+    _, twin_base = read_model_file(MODEL_PATH)
+    twin_cls = QuantizedMLP if args.int8 else EdgeTwinMLP
+    print(f"{os.path.relpath(args.data, ROOT)}: {len(temp):,} edge steps "
+          f"({'int8' if args.int8 else 'float32'}, fp-contract={'on' if args.no_pragma else 'off'})")
+    workdir = tempfile.mkdtemp(prefix="edge_twin_")
+    try:
+        exe = build_edge(workdir, args.int8, not args.no_pragma)
+        for name, model, base, legacy in (
+                ("twin", twin_cls.from_file(MODEL_PATH, verbose=False, copy=True), twin_base, False),
+                ("legacy", GatewayMLP.from_file(MODEL_PATH, verbose=False, copy=True), None, True)):
+            edge = EdgeProcess(exe)
+            gw = SimGateway(model, base, args.boot_unix)
+            with np.errstate(all="ignore"):  # 온라인 SGD가 발산하는 스텝의 overflow/NaN 경고 (양쪽 모두 사전학습 상태로 되돌림)
+                stats = simulate(edge, gw, temp, hum, args.boot_unix, legacy, args.send_wait, args.rx_latency)
+            edge.close()
+            report(name, stats, gw)
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+edge_fleet_logger를 pty --nodes개(가짜 ESP32)에 붙여 한 프로세스로 동시 수신·기록하는 부하 시험.
+
+가짜 노드 스레드마다 엣지 10필드 줄을 --interval 간격(+무작위 위상)으로 --lines개 쓰고,
+FleetLogger가 .rec 로그 하나에 묶어 기록한다. 끝나면 로그를 다시 읽어
+  - 노드별 행 수 == --lines (누락·중복 없음), node_id/variant 태그가 포트와 일치하는지
+  - 줄을 쓴 시각 → 로그 버퍼에 들어간 시각 지연 (p50/p99/max)
+  - 처리량, 배치당 평균 행 수
+를 출력한다.
+
+실행 (Linux/macOS):
+  python benchmarks/bench_fleet_logger.py [--nodes 64] [--lines 200] [--interval 0.02]
+"""
+import argparse
+import os
+import pty
+import random
+import sys
+import tempfile
+import threading
+import time
+import tty
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "edge_node"))
+
+from common.log_writer import LogWriter, FLEET_LOG_COLUMNS, read_records
+from edge_fleet_logger import FleetLogger
+
+VARIANTS = ("0.3", "0.5", "0.7")
+
+
+class TimedLog(LogWriter):
+    """extend() 시점에 행별 지연(쓴 시각 → 로그 버퍼) 기록."""
+
+    def __init__(self, path, sent):
+        super().__init__(path, FLEET_LOG_COLUMNS)
+        self.sent = sent
+        self.latency = []
+
+    def extend(self, rows):
+        now = time.perf_counter()
+        for row in rows:
+            # inference_time_us 필드에 노드 안 순번을 실어 보냄
+            self.latency.append(now - self.sent[row[1]][row[10]])
+        super().extend(rows)
+
+
+def fake_node(master, node_id, n, interval, sent, start):
+    start.wait()
+    time.sleep(random.random() * interval)
+    times = sent[node_id]
+    for i in range(n):
+        times[i] = time.perf_counter()
+        os.write(master, f"{20 + i % 50 * 0.1:.2f},45.0,20.1,44.8,0.1,0.2,SKIP,{i},250000,327680\n".encode())
+        time.sleep(interval)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--nodes", type=int, default=64)
+    ap.add_argument("--lines", type=int, default=200)
+    ap.add_argument("--interval", type=float, default=0.02)
+    args = ap.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(prefix="aoii_fleet_"), "fleet.rec")
+    sent = {}
+    log = TimedLog(path, sent)
+    fleet = FleetLogger(log, time_sync=False, verbose=False)
+
+    masters, start = [], threading.Event()
+    for k in range(args.nodes):
+        master, slave = pty.openpty()
+        tty.setraw(slave)
+        node_id = f"node{k:02d}"
+        sent[node_id] = [0.0] * args.lines
+        fleet.add_port(os.ttyname(slave), node_id, VARIANTS[k % len(VARIANTS)])
+        masters.append((master, slave, node_id))
+    print(f"{fleet.connected}/{args.nodes} ports connected")
+
+    writers = [threading.Thread(target=fake_node, args=(m, node_id, args.lines, args.interval, sent, start))
+               for m, _, node_id in masters]
+    for w in writers:
+        w.start()
+    stop = threading.Event()
+    consumer = threading.Thread(target=fleet.run, kwargs={"stop": stop})
+    consumer.start()
+
+    t0 = time.perf_counter()
+    start.set()
+    for w in writers:
+        w.join()
+    expected = args.nodes * args.lines
+    while fleet.counters["rows"] < expected and time.perf_counter() - t0 < 30 + args.lines * args.interval:
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    consumer.join()
+    fleet.close()
+    log.close()
+    for m, s, _ in masters:
+        os.close(m)
+        os.close(s)
+
+    rec = read_records(path)
+    ok = len(rec) == expected
+    for k, (_, _, node_id) in enumerate(masters):
+        mine = rec[rec["node_id"] == node_id.encode()]
+        seq = np.sort(mine["inference_time_us"])
+        if len(mine) != args.lines or not np.array_equal(seq, np.arange(args.lines)) or \
+                not np.all(mine["variant"] == VARIANTS[k % len(VARIANTS)].encode()):
+            ok = False
+            print(f"  {node_id}: {len(mine)} rows (expected {args.lines})")
+
+    lat = np.array(log.latency) * 1e3
+    print(f"{args.nodes} nodes x {args.lines} lines every {args.interval * 1e3:.0f} ms "
+          f"({args.nodes / args.interval:,.0f} lines/s offered)")
+    print(f"rows logged {len(rec):,}/{expected:,} in {elapsed:.2f} s ({len(rec) / elapsed:,.0f} rows/s), "
+          f"{fleet.counters['rows'] / max(fleet.counters['batches'], 1):.1f} rows/batch")
+    print(f"latency ms  p50 {np.percentile(lat, 50):.2f}  p99 {np.percentile(lat, 99):.2f}  max {lat.max():.2f}")
+    print("per-node counts and tags:", "OK" if ok else "MISMATCH")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+여러 스텝 추정 (GatewayMLP.forecast / GatewayMLPPool.forecast) vs EST tick 반복.
+
+- loop    : shift_window(직전 예측, time_n) + predict()를 k번 (기존 EST catch-up 방식)
+- forecast: model.forecast(k, time_n 스케줄) 한 번 (commit=False, 모델 상태 그대로)
+- 모델    : GatewayMLP (inplace 포함), EdgeTwinMLP (엣지 C 순서), QuantizedMLP (int8) — 실제 mlp_model.bin
+- pool    : 노드 N개 GatewayMLPPool.tick() k번 vs pool.forecast(k) 한 번
+값 일치: forecast 결과가 loop 예측과 비트 단위로 같은지, commit=True 뒤 윈도우(twin은 상태 해시)가 같은지.
+
+실행:
+  python benchmarks/bench_forecast.py [--steps 60 1440] [--nodes 100] [--repeat 5]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from edge_twin import EdgeTwinMLP
+from gateway_MLP_Logic import GatewayMLP, GatewayMLPPool
+from quantized_mlp import QuantizedMLP
+
+MODEL_PATH = os.path.join(ROOT, "gateway", "mlp_model.bin")
+VARIANTS = [
+    ("GatewayMLP", GatewayMLP, {}),
+    ("GatewayMLP inplace", GatewayMLP, {"inplace": True}),
+    ("EdgeTwinMLP", EdgeTwinMLP, {}),
+    ("QuantizedMLP", QuantizedMLP, {}),
+]
+
+
+def schedule(k, start_unix=1772142046):
+    # 60초 간격 현지(UTC-8) time_n
+    return (((start_unix - 28800 + 60 * np.arange(1, k + 1)) % 86400) / 86400.0).astype(np.float32)
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        best = min(best, time.perf_counter() - t0)
+    return best, out
+
+
+def bench_model(cls, kwargs, k, repeat):
+    model = cls.from_file(MODEL_PATH, verbose=False, **kwargs)
+    model.predict()
+    tn = schedule(k)
+    window = model.window_buf.copy()
+    pred = (model.last_pred_t, model.last_pred_h)
+
+    def restore():
+        np.copyto(model.window_buf, window)
+        model.last_pred_t, model.last_pred_h = pred
+
+    def loop():
+        restore()
+        out = np.empty((k, 2), dtype=np.float32)
+        for i in range(k):
+            model.shift_window(model.last_pred_t, model.last_pred_h, tn[i])
+            model.predict()
+            out[i] = model.last_pred_t, model.last_pred_h
+        return out
+
+    t_loop, ref = best_of(loop, repeat)
+    end_window = model.window_buf.copy()
+    end_hash = model.state_hash() if hasattr(model, "state_hash") else None
+    restore()
+    t_fc, fc = best_of(lambda: model.forecast(k, tn), repeat)
+    same = np.array_equal(fc, ref, equal_nan=True)
+    model.predict()
+    committed = model.forecast(k, tn, commit=True)
+    same_commit = (np.array_equal(committed, ref, equal_nan=True) and np.array_equal(model.window_buf, end_window)
+                   and (end_hash is None or model.state_hash() == end_hash))
+    return t_loop, t_fc, same, same_commit
+
+
+def bench_pool(n_nodes, k, repeat):
+    pool = GatewayMLPPool.from_model(GatewayMLP.from_file(MODEL_PATH, verbose=False), node_ids=range(n_nodes))
+    rng = np.random.default_rng(0)
+    pool.window_buf[:, :, :2] += rng.normal(0, 2.0, (n_nodes, pool.window_buf.shape[1], 2)).astype(np.float32)
+    pool.predict()
+    tn = schedule(k)
+    window, last_pred = pool.window_buf.copy(), pool.last_pred.copy()
+
+    def loop():
+        pool.window_buf[:] = window
+        pool.last_pred[:] = last_pred
+        return np.stack([pool.tick(tn[i]).copy() for i in range(k)], axis=1)
+
+    t_loop, ref = best_of(loop, repeat)
+    pool.window_buf[:] = window
+    pool.last_pred[:] = last_pred
+    t_fc, fc = best_of(lambda: pool.forecast(k, tn), repeat)
+    return t_loop, t_fc, np.array_equal(fc, ref, equal_nan=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, nargs="+", default=[60, 1440])
+    parser.add_argument("--nodes", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'model':>20} {'k':>5} | {'loop ms':>8} {'forecast ms':>11} {'speedup':>7} | {'same':>4} {'commit':>6}")
+    print("-" * 74)
+    for k in args.steps:
+        for name, cls, kwargs in VARIANTS:
+            t_loop, t_fc, same, same_commit = bench_model(cls, kwargs, k, args.repeat)
+            print(f"{name:>20} {k:>5} | {t_loop * 1e3:>8.2f} {t_fc * 1e3:>11.2f} {t_loop / t_fc:>6.2f}x | "
+                  f"{'OK' if same else 'DIFF':>4} {'OK' if same_commit else 'DIFF':>6}")
+        t_loop, t_fc, same = bench_pool(args.nodes, k, args.repeat)
+        print(f"{f'pool x{args.nodes}':>20} {k:>5} | {t_loop * 1e3:>8.2f} {t_fc * 1e3:>11.2f} {t_loop / t_fc:>6.2f}x | "
+              f"{'OK' if same else 'DIFF':>4} {'—':>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+GatewayMLP 마이크로 벤치마크: 기본 모드 vs inplace(zero-allocation) 모드.
+
+RX 1건 처리 경로(predict → online_update → shift_window → predict)를 반복하며
+- 초당 호출 수 (calls/sec)
+- 호출 1회당 할당 바이트 (tracemalloc peak 기준, 일시 할당 포함)
+를 비교한다.
+
+실행:
+  python benchmarks/bench_gateway_mlp_inplace.py
+"""
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from gateway_MLP_Logic import GatewayMLP
+from bench_gateway_mlp_pool import random_params
+
+
+def make_model(inplace):
+    return GatewayMLP(*random_params(), inplace=inplace, verbose=False)
+
+
+def op_predict(m):
+    m.predict()
+
+
+def op_online_update(m):
+    m.online_update(21.3, 41.7, lr=0.01)
+
+
+def op_shift_window(m):
+    m.shift_window(21.3, 41.7, 0.5)
+
+
+def op_rx_cycle(m):
+    m.predict()
+    m.online_update(21.3, 41.7, lr=0.01)
+    m.shift_window(m.last_pred_t, m.last_pred_h, 0.5)
+    m.predict()
+
+
+def calls_per_sec(fn, m, n=20000):
+    for _ in range(100):
+        fn(m)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn(m)
+    return n / (time.perf_counter() - t0)
+
+
+def bytes_per_call(fn, m):
+    fn(m)
+    fn(m)
+    tracemalloc.start()
+    fn(m)  # numpy 내부 캐시 등 첫 호출 효과 제거
+    current = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    fn(m)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak - current
+
+
+def main():
+    ops = [("predict", op_predict), ("online_update", op_online_update),
+           ("shift_window", op_shift_window), ("rx_cycle", op_rx_cycle)]
+    print(f"{'op':>14} | {'default calls/s':>15} {'bytes':>7} | {'inplace calls/s':>15} {'bytes':>7} | speedup")
+    print("-" * 80)
+    for name, fn in ops:
+        base, fast = make_model(False), make_model(True)
+        # online_update는 직전 predict 활성값이 필요
+        base.predict()
+        fast.predict()
+        base_cps, fast_cps = calls_per_sec(fn, base), calls_per_sec(fn, fast)
+        base_b, fast_b = bytes_per_call(fn, make_model(False)), bytes_per_call(fn, make_model(True))
+        print(f"{name:>14} | {base_cps:>15,.0f} {base_b:>7} | {fast_cps:>15,.0f} {fast_b:>7} | {fast_cps / base_cps:6.2f}x")
+
+    # 두 모드 결과 일치 확인 (float64 target 제거로 인한 미세 차이만 허용)
+    base, fast = make_model(False), make_model(True)
+    for _ in range(50):
+        op_rx_cycle(base)
+        op_rx_cycle(fast)
+    diff = max(abs(base.last_pred_t - fast.last_pred_t), abs(base.last_pred_h - fast.last_pred_h))
+    print(f"\nmax |pred diff| after 50 RX cycles: {diff:.2e}  (W1 max diff {np.max(np.abs(base.w1 - fast.w1)):.2e})")
+
+
+if __name__ == "__main__":
+    main()
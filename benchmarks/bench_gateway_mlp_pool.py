@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+GatewayMLPPool 벤치마크: 60초 EST tick 1회(전체 노드 shift_window + predict) 지연 시간.
+
+- loop : 노드마다 GatewayMLP 객체 하나씩, Python for 루프로 N번 호출 (기존 방식)
+- pool : GatewayMLPPool.tick() 한 번 (batched matmul)
+
+실행:
+  python benchmarks/bench_gateway_mlp_pool.py [노드수 ...]   (기본 1 100 10000)
+"""
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from gateway_MLP_Logic import GatewayMLP, GatewayMLPPool, WINDOW_SIZE, N_FEATURES
+
+N_IN = WINDOW_SIZE * N_FEATURES
+H1_SIZE = 64
+H2_SIZE = 32
+
+
+def random_params(seed=42):
+    """실제 가중치 대신 같은 shape의 난수 파라미터 (지연 시간 측정용)."""
+    rng = np.random.default_rng(seed)
+    return (
+        rng.normal(0, 0.3, (N_IN, H1_SIZE)), rng.normal(0, 0.1, H1_SIZE),
+        rng.normal(0, 0.3, (H1_SIZE, H2_SIZE)), rng.normal(0, 0.1, H2_SIZE),
+        rng.normal(0, 0.3, (H2_SIZE, 2)), rng.normal(0, 0.1, 2),
+        [12.0, 35.0, 0.5] * WINDOW_SIZE, [5.0, 19.0, 0.29] * WINDOW_SIZE,
+        [12.0, 35.0], [5.0, 19.0],
+    )
+
+
+def time_ticks(fn, repeat):
+    fn(0.0)  # warm-up
+    samples = []
+    for r in range(repeat):
+        t0 = time.perf_counter()
+        fn((r + 1) / 1440.0)
+        samples.append(time.perf_counter() - t0)
+    return np.median(samples) * 1e3, np.min(samples) * 1e3
+
+
+def bench(n_nodes, repeat):
+    params = random_params()
+
+    models = [GatewayMLP(*params) for _ in range(n_nodes)]
+
+    def loop_tick(time_n):
+        for m in models:
+            m.shift_window(m.last_pred_t, m.last_pred_h, time_n)
+            m.predict()
+
+    pool = GatewayMLPPool(*params, capacity=n_nodes)
+    for i in range(n_nodes):
+        pool.add_node(f"edge-{i}")
+
+    loop_med, loop_min = time_ticks(loop_tick, repeat)
+    pool_med, pool_min = time_ticks(pool.tick, repeat)
+    return loop_med, loop_min, pool_med, pool_min
+
+
+def main():
+    sizes = [int(a) for a in sys.argv[1:]] or [1, 100, 10000]
+    print(f"{'nodes':>7} | {'loop ms/tick (med/min)':>24} | {'pool ms/tick (med/min)':>24} | speedup")
+    print("-" * 76)
+    for n in sizes:
+        repeat = 50 if n <= 1000 else 10
+        loop_med, loop_min, pool_med, pool_min = bench(n, repeat)
+        print(f"{n:>7} | {loop_med:>11.3f} / {loop_min:>10.3f} | {pool_med:>11.3f} / {pool_min:>10.3f} | "
+              f"{loop_med / pool_med:6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
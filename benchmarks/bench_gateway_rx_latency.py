@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+게이트웨이 RX → ack(타임스탬프 응답) 지연 벤치마크: 기존 폴링 루프 vs GatewayRuntime.
+
+pty 쌍을 만들어 게이트웨이는 slave 쪽을 pyserial로 열고, 이 스크립트가 master 쪽에서
+LoRa 모듈처럼 "Received: ts,t,h" 줄을 무작위 간격으로 쓴 뒤 응답 줄이 돌아올 때까지의
+시간을 잰다. publish는 --publish-ms 만큼 sleep 하는 가짜 MQTT (QoS1 왕복 흉내).
+
+- legacy  : 기존 gateway.py 루프 (in_waiting 폴링 + sleep(1), publish 동기 호출 후 ack)
+- runtime : gateway_runtime.GatewayRuntime (selector, ack 먼저, publish는 MqttPublisher 링 버퍼 → 전송 스레드)
+
+실행:
+  python benchmarks/bench_gateway_rx_latency.py [--n 20] [--publish-ms 20]
+"""
+import argparse
+import os
+import random
+import select
+import sys
+import threading
+import time
+
+import numpy as np
+import serial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from bench_mqtt_publisher import TOPIC, FakeClient
+from gateway_MLP_Logic import GatewayMLP
+from gateway_runtime import GatewayRuntime, parse_rx_line, local_time_n
+from mqtt_publisher import MqttPublisher
+
+MODEL_PATH = os.path.join(ROOT, "gateway", "mlp_model.bin")
+
+
+def legacy_loop(ser, model, publish, stop):
+    """기존 gateway.py while 루프의 RX 경로 (출력 제외)."""
+    pred = model.predict()
+    while not stop.is_set():
+        if ser.in_waiting > 0:
+            line = ser.readline().decode("utf-8", errors="ignore").strip()
+            rx = parse_rx_line(line)
+            if rx is not None:
+                actual_t, actual_h = rx.t, rx.h
+                _, time_n = local_time_n()
+                publish({"event": "RX", "actual_t": actual_t, "actual_h": actual_h}, qos=1)
+                model.online_update(actual_t, actual_h, lr=0.01)
+                model.shift_window(pred[0], pred[1], time_n)
+                pred = model.predict()
+                ser.write(f"{int(time.time())}\n".encode())
+        time.sleep(1)
+
+
+def read_line(fd, timeout=5.0):
+    buf = b""
+    deadline = time.monotonic() + timeout
+    while not buf.endswith(b"\n"):
+        r, _, _ = select.select([fd], [], [], max(deadline - time.monotonic(), 0))
+        if not r:
+            raise TimeoutError("no ack from gateway")
+        buf += os.read(fd, 256)
+    return buf
+
+
+def measure(mode, n, publish_ms, seed=0):
+    master, slave = os.openpty()
+    ser = serial.Serial(os.ttyname(slave), 115200, timeout=0 if mode == "runtime" else 1)
+    model = GatewayMLP.from_file(MODEL_PATH, inplace=True, verbose=False)
+
+    def slow_publish(payload, qos=0):
+        time.sleep(publish_ms / 1000.0)
+
+    stop = threading.Event()
+    if mode == "legacy":
+        worker = threading.Thread(target=legacy_loop, args=(ser, model, slow_publish, stop), daemon=True)
+    else:
+        publisher = MqttPublisher(FakeClient(publish_ms=publish_ms), TOPIC, verbose=False)
+        runtime = GatewayRuntime(model, ser, publisher.publish, verbose=False)
+        worker = threading.Thread(target=runtime.run, daemon=True)
+    worker.start()
+
+    rng = random.Random(seed)
+    latencies = []
+    for i in range(n):
+        time.sleep(rng.uniform(0.05, 1.0))  # 수신 시점이 폴링 주기와 무관하게 흩어지도록
+        frame = f"Received: {int(time.time() * 1000)},{20 + i * 0.1:.2f},{40.0:.2f}\n".encode()
+        t0 = time.perf_counter()
+        os.write(master, frame)
+        read_line(master)
+        latencies.append(time.perf_counter() - t0)
+
+    stop.set()
+    if mode == "runtime":
+        runtime.stop()
+        publisher.close()
+    worker.join(2.0)
+    ser.close()
+    os.close(master)
+    os.close(slave)
+    return np.array(latencies) * 1e3
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=20, help="모드별 RX 프레임 수")
+    ap.add_argument("--publish-ms", type=float, default=20.0, help="가짜 MQTT publish 지연")
+    args = ap.parse_args()
+
+    print(f"RX -> ack latency over pty, {args.n} frames, publish {args.publish_ms:.0f} ms")
+    print(f"{'mode':>8} | {'mean ms':>8} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}")
+    print("-" * 50)
+    for mode in ("legacy", "runtime"):
+        lat = measure(mode, args.n, args.publish_ms)
+        print(f"{mode:>8} | {lat.mean():8.2f} {np.percentile(lat, 50):8.2f} "
+              f"{np.percentile(lat, 95):8.2f} {lat.max():8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+로거 CSV 기록 방식 비교: 기존 행마다 open/append/close vs LogWriter(CSV) vs LogWriter(.rec),
+그리고 분석 시 읽기: pandas.read_csv vs read_records(memory-map).
+
+edge_serial_logger 형식(EDGE_LOG_COLUMNS) 합성 행 --rows개를 임시 디렉터리에 기록한다.
+
+실행:
+  python benchmarks/bench_log_writer.py [--rows 200000]
+"""
+import argparse
+import csv
+import os
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from common.log_writer import LogWriter, EDGE_LOG_COLUMNS, read_records
+
+HEADER = [name for name, _ in EDGE_LOG_COLUMNS]
+
+
+def synthetic_rows(n):
+    rows = []
+    for i in range(n):
+        t, h = 20 + (i % 50) * 0.1, 40 + (i % 30) * 0.2
+        rows.append([f"2026-01-{1 + i // 86400 % 28:02d} {i // 3600 % 24:02d}:{i // 60 % 60:02d}:{i % 60:02d}",
+                     t, h, t - 0.3, h + 1.1, 0.3, 1.1, "SEND" if i % 7 == 0 else "SKIP", 850 + i % 40, 250000, 327680])
+    return rows
+
+
+def per_row_open(path, rows):
+    """기존 edge_serial_logger의 ensure_csv_file + append_csv_row."""
+    if not os.path.exists(path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(HEADER)
+    for row in rows:
+        with open(path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(row)
+
+
+def with_writer(path, rows):
+    log = LogWriter(path, EDGE_LOG_COLUMNS)
+    for row in rows:
+        log.append(row)
+    log.close()
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return time.perf_counter() - t0, out
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=200_000)
+    args = ap.parse_args()
+    rows = synthetic_rows(args.rows)
+    tmp = tempfile.mkdtemp(prefix="aoii_logs_")
+
+    print(f"{args.rows:,} edge log rows")
+    print(f"{'write':<28}{'seconds':>10}{'µs/row':>10}{'MB':>8}")
+    for name, fn, path in (("per-row open/append/close", per_row_open, "old.csv"),
+                           ("LogWriter csv", with_writer, "new.csv"),
+                           ("LogWriter .rec", with_writer, "new.rec")):
+        path = os.path.join(tmp, path)
+        dt, _ = timed(fn, path, rows)
+        print(f"{name:<28}{dt:>10.2f}{dt / args.rows * 1e6:>10.2f}{os.path.getsize(path) / 1e6:>8.1f}")
+
+    print(f"\n{'read':<28}{'seconds':>10}")
+    dt, df = timed(pd.read_csv, os.path.join(tmp, "new.csv"))
+    print(f"{'pandas.read_csv':<28}{dt:>10.3f}  ({len(df):,} rows)")
+    dt, rec = timed(read_records, os.path.join(tmp, "new.rec"))
+    dt_mean, mean_t = timed(lambda: float(rec["actual_t"].mean()))
+    print(f"{'read_records (memmap)':<28}{dt:>10.4f}  ({len(rec):,} rows, actual_t mean {mean_t:.3f} "
+          f"in {dt_mean * 1e3:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+게이트웨이 MQTT 발행 경로 벤치마크: 기존 인라인 _mqtt_publish() vs MqttPublisher.
+
+가짜 paho 클라이언트로 브로커 정상 → 단절(outage) → 재연결을 재현하고,
+- publish() 호출 지연 (= 시리얼 루프가 막히는 시간) p50/p99/max
+- 단절 중 메시지 처리 (legacy: reconnect() 블로킹 후 유실 / publisher: 링 버퍼 → spool)
+- 재연결 후 전달 순서·개수, 카운터
+를 출력한다. 단절 중 reconnect()는 --reconnect-ms 동안 블로킹 (TCP connect timeout 흉내).
+
+실행:
+  python benchmarks/bench_mqtt_publisher.py [--n 3000] [--capacity 256] [--reconnect-ms 200]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from mqtt_publisher import MqttPublisher
+
+TOPIC = "aoii/readings"
+
+
+class _Info:
+    def __init__(self, rc):
+        self.rc = rc
+
+
+class FakeClient:
+    """connected 플래그로 단절을 흉내 내는 paho Client 대역. 전달된 payload를 순서대로 기록.
+
+    publish_ms > 0이면 publish()마다 그만큼 sleep (QoS1 왕복 흉내, 다른 벤치마크에서 사용).
+    """
+
+    def __init__(self, reconnect_ms=0.0, publish_ms=0.0):
+        self.connected = True
+        self.reconnect_ms = reconnect_ms
+        self.publish_ms = publish_ms
+        self.delivered = []
+
+    def is_connected(self):
+        return self.connected
+
+    def publish(self, topic, payload, qos=0):
+        if not self.connected:
+            raise ConnectionError("not connected")
+        if self.publish_ms:
+            time.sleep(self.publish_ms / 1000.0)
+        self.delivered.append(payload)
+        return _Info(0)
+
+    def reconnect(self):
+        time.sleep(self.reconnect_ms / 1000.0)
+        raise ConnectionError("broker unreachable")
+
+
+def legacy_publish(client, payload_dict, qos=0):
+    """기존 gateway.py _mqtt_publish()."""
+    payload = json.dumps(payload_dict)
+    try:
+        client.publish(TOPIC, payload, qos=qos)
+    except Exception:
+        try:
+            client.reconnect()
+            client.publish(TOPIC, payload, qos=qos)
+        except Exception:
+            pass
+
+
+def scenario(publish, client, n, outage):
+    """n개 메시지 발행, outage 구간(인덱스 범위) 동안 브로커 단절. 호출 지연(ms) 배열 반환."""
+    lat = np.empty(n)
+    for i in range(n):
+        client.connected = not (outage[0] <= i < outage[1])
+        payload = {"event": "RX", "seq": i, "actual_t": 21.5, "actual_h": 40.2, "pred_t": 21.4, "pred_h": 40.0}
+        t0 = time.perf_counter()
+        publish(payload, qos=i % 2)
+        lat[i] = (time.perf_counter() - t0) * 1e3
+    client.connected = True
+    return lat
+
+
+def report(name, lat, delivered, n):
+    seqs = [json.loads(p)["seq"] for p in delivered]
+    in_order = seqs == sorted(seqs)
+    print(f"{name:>10} | {np.percentile(lat, 50):8.4f} {np.percentile(lat, 99):8.4f} {lat.max():9.3f} | "
+          f"{len(delivered):>6}/{n} delivered, in order: {in_order}")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--n", type=int, default=3000)
+    ap.add_argument("--capacity", type=int, default=256, help="링 버퍼 크기 (작게 잡아 spool 경로까지 측정)")
+    ap.add_argument("--reconnect-ms", type=float, default=200.0)
+    args = ap.parse_args()
+    n = args.n
+    outage = (n // 3, 2 * n // 3)
+    print(f"{n} messages, broker outage for messages [{outage[0]}, {outage[1]}), "
+          f"reconnect() blocks {args.reconnect_ms:.0f} ms")
+    print(f"{'mode':>10} | {'p50 ms':>8} {'p99 ms':>8} {'max ms':>9} |")
+    print("-" * 80)
+
+    client = FakeClient(args.reconnect_ms)
+    # legacy는 단절 구간 메시지마다 reconnect() 블로킹 → 단절 구간을 줄여 측정 시간 제한
+    legacy_n = min(n, 300)
+    lat = scenario(lambda p, qos=0: legacy_publish(client, p, qos), client, legacy_n,
+                   (legacy_n // 3, legacy_n // 3 + 10))
+    report("legacy", lat, client.delivered, legacy_n)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        client = FakeClient(args.reconnect_ms)
+        pub = MqttPublisher(client, TOPIC, capacity=args.capacity, spool_path=os.path.join(tmp, "spool.jsonl"),
+                            retry_interval=0.05, verbose=False)
+        lat = scenario(pub.publish, client, n, outage)
+        deadline = time.monotonic() + 30
+        while len(client.delivered) < n and time.monotonic() < deadline:
+            time.sleep(0.05)
+        pub.close()
+        report("publisher", lat, client.delivered, n)
+        print(f"\ncounters: {pub.stats()}")
+
+
+if __name__ == "__main__":
+    main()
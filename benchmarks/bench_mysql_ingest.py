@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+MQTT → MySQL 적재 부하 테스트: 기존 행 단위 insert vs BatchWriter (executemany + 연결 풀).
+
+합성 RX 메시지(aoii/readings JSON)를 on_message 경로에 최대 속도로 --seconds 동안 넣고,
+DB에 실제로 commit된 행 수 / 경과 시간(대기 행 flush 포함)으로 지속 처리량(rows/s)을 잰다.
+
+- legacy  : 기존 mqtt_to_mysql.on_message (메시지마다 새 연결 + commit, 같은 행 2회 insert)
+- batched : 현재 on_message → BatchWriter → insert_readings (INGEST_BATCH_SIZE / INGEST_FLUSH_MS)
+
+MySQL 서버가 필요하다 (.env의 MYSQL_*). 실제 readings 테이블 대신 --database로 지정한
+부하 테스트용 DB(기본 aoii_loadtest)를 만들어 사용하고 끝나면 삭제한다 (--keep으로 보존).
+--sink null: DB 없이 파싱·큐·batch 경로만 측정 (write_fn이 아무것도 안 함).
+
+실행:
+  python benchmarks/bench_mysql_ingest.py [--seconds 10] [--batch-size 500] [--flush-ms 200]
+  python benchmarks/bench_mysql_ingest.py --sink null
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from server import mqtt_to_mysql  # .env 로드 포함
+from server import db
+from server.batch_writer import BatchWriter
+
+
+class _Msg:
+    def __init__(self, payload):
+        self.payload = payload
+
+
+def synthetic_payloads(n=1000):
+    out = []
+    for i in range(n):
+        t, h = 20 + (i % 50) * 0.1, 40 + (i % 30) * 0.2
+        out.append(json.dumps({
+            "event": "RX", "timestamp": "2026-01-01 00:00:00", "time_n": 0.5,
+            "actual_t": t, "actual_h": h, "pred_t": t - 0.3, "pred_h": h + 1.1,
+            "error_t": 0.3, "error_h": 1.1, "total_tx": i, "transmission_delay_ms": 120,
+        }).encode())
+    return out
+
+
+def legacy_on_message(payload):
+    """기존 on_message: insert_reading_with_retry + insert_reading (연결 새로 열고 행마다 commit)."""
+    import pymysql
+    data = json.loads(payload.decode("utf-8"))
+    if data.get("event") != "RX":
+        return
+    row = db.reading_row(float(data["actual_t"]), float(data["actual_h"]), float(data["pred_t"]),
+                         float(data["pred_h"]), int(data["transmission_delay_ms"]))
+    for _ in range(2):
+        conn = pymysql.connect(**db._config())
+        try:
+            with conn.cursor() as cur:
+                cur.execute(db._INSERT_READING_SQL, row)
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def count_rows():
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT COUNT(*) AS n FROM readings")
+            return cur.fetchone()["n"]
+
+
+def run_legacy(payloads, seconds):
+    start_rows = count_rows()
+    t0 = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - t0 < seconds:
+        legacy_on_message(payloads[sent % len(payloads)])
+        sent += 1
+    elapsed = time.perf_counter() - t0
+    return sent, count_rows() - start_rows, elapsed
+
+
+def run_batched(payloads, seconds, batch_size, flush_ms, write_fn):
+    start_rows = count_rows() if write_fn is db.insert_readings else 0
+    writer = BatchWriter(write_fn, batch_size=batch_size, flush_interval_ms=flush_ms, name="bench", verbose=False)
+    t0 = time.perf_counter()
+    sent = 0
+    while time.perf_counter() - t0 < seconds:
+        mqtt_to_mysql.on_message(None, writer, _Msg(payloads[sent % len(payloads)]))
+        sent += 1
+        # writer가 따라가지 못하면 producer를 잠깐 멈춰 대기 행이 무한히 쌓이지 않게 함 (지속 처리량 측정)
+        if sent % 1000 == 0:
+            while writer.stats()["pending"] > 10 * batch_size:
+                time.sleep(0.001)
+    writer.close()
+    elapsed = time.perf_counter() - t0
+    stats = writer.stats()
+    written = count_rows() - start_rows if write_fn is db.insert_readings else stats["written"]
+    return sent, written, elapsed, stats
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seconds", type=float, default=10.0)
+    ap.add_argument("--batch-size", type=int, default=mqtt_to_mysql.INGEST_BATCH_SIZE)
+    ap.add_argument("--flush-ms", type=int, default=mqtt_to_mysql.INGEST_FLUSH_MS)
+    ap.add_argument("--database", default="aoii_loadtest")
+    ap.add_argument("--sink", choices=["mysql", "null"], default="mysql")
+    ap.add_argument("--keep", action="store_true", help="부하 테스트 DB 삭제하지 않음")
+    args = ap.parse_args()
+    payloads = synthetic_payloads()
+
+    if args.sink == "null":
+        sent, written, elapsed, stats = run_batched(payloads, args.seconds, args.batch_size, args.flush_ms,
+                                                    lambda rows: None)
+        print(f"null sink: {sent:,} messages, {written:,} rows in {elapsed:.2f} s "
+              f"→ {written / elapsed:,.0f} rows/s (parse + queue + batch overhead only)  {stats}")
+        return
+
+    import pymysql
+    cfg = db._config()
+    cfg.pop("database")
+    admin = pymysql.connect(**cfg)
+    with admin.cursor() as cur:
+        cur.execute(f"CREATE DATABASE IF NOT EXISTS `{args.database}`")
+    os.environ["MYSQL_DATABASE"] = args.database
+    db.init_db()
+    try:
+        print(f"database {args.database}, {args.seconds:.0f} s per mode, "
+              f"batch {args.batch_size} rows / {args.flush_ms} ms")
+        sent, written, elapsed = run_legacy(payloads, args.seconds)
+        print(f"  legacy : {sent:,} messages → {written:,} rows ({written / max(sent, 1):.0f} per message), "
+              f"{sent / elapsed:,.0f} messages/s")
+        sent, written, elapsed, stats = run_batched(payloads, args.seconds, args.batch_size, args.flush_ms,
+                                                    db.insert_readings)
+        print(f"  batched: {sent:,} messages → {written:,} rows ({written / max(sent, 1):.0f} per message), "
+              f"{written / elapsed:,.0f} rows/s sustained  {stats}")
+    finally:
+        if not args.keep:
+            with admin.cursor() as cur:
+                cur.execute(f"DROP DATABASE `{args.database}`")
+        admin.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+QuantizedMLP(int8) vs GatewayMLP(float32): 재생 데이터셋 정확도 + 게이트웨이 호출 속도.
+
+1) 정확도 — 데이터셋마다 (모델 파일 가중치 그대로)
+   - static : 전체 윈도우 predict_batch → R2, MAE (float32 / int8), 두 예측의 최대 차이
+   - online : 윈도우를 시간순으로 재생하며 predict → 오차가 엣지 임계값(beta)을 넘은 스텝(SEND = 게이트웨이 RX)만
+              online_update(lr=--lr). 한 스텝 앞 예측의 MAE와 갱신 횟수. int8은 갱신할 때마다 재양자화.
+              가중치가 발산(NaN/inf)하면 사전학습 가중치로 reset (게이트웨이 런타임과 같음).
+2) 속도 — predict(), online_update(), RX 1건 (predict → online_update → shift_window → predict) calls/s
+   (float 기본 / float inplace / twin = EdgeTwinMLP (엣지 C 루프 순서) / int8)
+3) 엣지 로그(--edge-log)의 inference_time_us를 status별로 요약 (ESP32 실측 루프 시간)
+
+실행:
+  python benchmarks/bench_quantized_mlp.py [--data dataset/Pre_Train_Dataset.csv 그냥_측정.csv] [--lr 0.01]
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+sys.path.insert(0, os.path.join(ROOT, "edge_node"))
+
+from aoii_replay import EDGE_BETA_HUM, EDGE_BETA_TEMP
+from Pre_train import MODEL_FILE, ONLINE_LR, frame_to_features, make_windows, regression_metrics
+from edge_twin import EdgeTwinMLP
+from gateway_MLP_Logic import GatewayMLP
+from quantized_mlp import QuantizedMLP
+
+MODEL_PATH = os.path.join(ROOT, MODEL_FILE)
+DEFAULT_DATA = [os.path.join(ROOT, "dataset", "Pre_Train_Dataset.csv"), os.path.join(ROOT, "그냥_측정.csv")]
+DEFAULT_EDGE_LOG = os.path.join(ROOT, "edge_node", "edge_log_0.3.csv")
+
+
+def load_windows(path, window_size):
+    df = pd.read_csv(path)
+    df.columns = [c.lower() for c in df.columns]  # 그냥_측정.csv: Timestamp/Temperature/Humidity
+    return make_windows(frame_to_features(df), window_size)
+
+
+def replay_online(model, X, y, lr, beta_t=EDGE_BETA_TEMP, beta_h=EDGE_BETA_HUM):
+    """X[i]를 윈도우로 두고 predict → 오차가 beta를 넘으면 실제값 y[i]로 online_update.
+    갱신 후 가중치가 발산(NaN/inf)하면 게이트웨이처럼 사전학습 가중치로 reset.
+
+    반환: (한 스텝 앞 예측 (n, 2), 갱신 횟수, reset 횟수).
+    """
+    base = {name: getattr(model, name).copy() for name in ("w1", "b1", "w2", "b2", "w3", "b3")}
+    window = model.window_buf.shape
+    pred = np.empty(y.shape, dtype=np.float32)
+    n_update = n_reset = 0
+    for i in range(len(X)):
+        np.copyto(model.window_buf, X[i].reshape(window))
+        pred[i] = model.predict()
+        actual_t, actual_h = float(y[i, 0]), float(y[i, 1])
+        # 예측이 NaN이어도 갱신 (엣지 SEND 조건과 같음)
+        if not (abs(actual_t - pred[i, 0]) <= beta_t and abs(actual_h - pred[i, 1]) <= beta_h):
+            model.online_update(actual_t, actual_h, lr)
+            n_update += 1
+            if not model.weights_finite():
+                model.reset(base)
+                n_reset += 1
+    return pred, n_update, n_reset
+
+
+def accuracy(path, lr):
+    float_model = GatewayMLP.from_file(MODEL_PATH, verbose=False, copy=True)
+    int8_model = QuantizedMLP.from_file(MODEL_PATH, verbose=False, copy=True)
+    X, y = load_windows(path, float_model.window_buf.shape[0])
+    print(f"\n{os.path.relpath(path, ROOT)}: {len(X):,} windows")
+
+    y_float, y_int8 = float_model.predict_batch(X), int8_model.predict_batch(X)
+    for name, y_pred in (("float32", y_float), ("int8", y_int8)):
+        r2, mae_t, mae_h = regression_metrics(y, y_pred)
+        print(f"  static  {name:>7}: R2 {r2:.5f}  MAE T {mae_t:.4f}°C  H {mae_h:.4f}%")
+    diff = np.abs(y_int8 - y_float).max(axis=0)
+    print(f"  static  max |int8 - float32|: T {diff[0]:.4f}°C  H {diff[1]:.4f}%")
+
+    for name, model in (("float32", float_model), ("int8", int8_model)):
+        pred, n_update, n_reset = replay_online(model, X, y, lr)
+        r2, mae_t, mae_h = regression_metrics(y, pred)
+        print(f"  online  {name:>7}: R2 {r2:.5f}  MAE T {mae_t:.4f}°C  H {mae_h:.4f}%  "
+              f"({n_update:,} updates, {n_reset} resets after divergence, lr={lr})")
+
+
+def calls_per_sec(fn, model, n):
+    model.predict()
+    for _ in range(100):
+        fn(model)
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn(model)
+    return n / (time.perf_counter() - t0)
+
+
+def speed(n, lr):
+    def op_predict(m):
+        m.predict()
+
+    def op_online_update(m):
+        m.online_update(21.3, 41.7, lr)
+
+    def op_rx_cycle(m):
+        m.predict()
+        m.online_update(21.3, 41.7, lr)
+        m.shift_window(m.last_pred_t, m.last_pred_h, 0.5)
+        m.predict()
+
+    variants = (("float", lambda: GatewayMLP.from_file(MODEL_PATH, verbose=False, copy=True)),
+                ("float inplace", lambda: GatewayMLP.from_file(MODEL_PATH, verbose=False, copy=True, inplace=True)),
+                ("twin", lambda: EdgeTwinMLP.from_file(MODEL_PATH, verbose=False, copy=True)),
+                ("int8", lambda: QuantizedMLP.from_file(MODEL_PATH, verbose=False, copy=True)))
+    print(f"\n{'op':>14} | " + " | ".join(f"{name:>13}" for name, _ in variants) + "   (calls/s)")
+    print("-" * 80)
+    for op_name, fn in (("predict", op_predict), ("online_update", op_online_update), ("rx_cycle", op_rx_cycle)):
+        cps = [calls_per_sec(fn, make(), n) for _, make in variants]
+        print(f"{op_name:>14} | " + " | ".join(f"{c:>13,.0f}" for c in cps))
+
+
+def edge_timing(path):
+    if not os.path.isfile(path):
+        return
+    df = pd.read_csv(path)
+    print(f"\n{os.path.relpath(path, ROOT)}: ESP32 inference_time_us by status")
+    for status, us in df.groupby("status")["inference_time_us"]:
+        print(f"  {status:>14}: n={len(us):>5}  median {us.median():>12,.0f} us  p90 {us.quantile(0.9):>12,.0f} us")
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--data", nargs="+", default=DEFAULT_DATA)
+    ap.add_argument("--lr", type=float, default=ONLINE_LR)
+    ap.add_argument("--n", type=int, default=20000, help="속도 측정 호출 수")
+    ap.add_argument("--edge-log", default=DEFAULT_EDGE_LOG)
+    args = ap.parse_args()
+
+    for path in args.data:
+        accuracy(path, args.lr)
+    speed(args.n, args.lr)
+    edge_timing(args.edge_log)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+시리얼 수신 방식 비교: 기존 로거의 `in_waiting` 폴링 + time.sleep(0.1) vs SerialReader(전용 스레드).
+
+pty 쌍을 만들어 한쪽(가짜 ESP32)에서 엣지 10필드 줄을 --interval 간격으로 쓰고,
+다른 쪽에서 읽어 파싱된 줄이 손에 들어오기까지의 지연(쓴 시각 → 꺼낸 시각)과
+idle 구간 동안의 wakeup(루프 반복) 수를 잰다. 폴링 루프는 0.1초에 한 줄만 꺼내므로
+--interval이 0.1초보다 짧으면(버스트, 여러 노드 중계) 지연이 계속 쌓인다.
+
+실행 (Linux/macOS):
+  python benchmarks/bench_serial_ingest.py [--lines 40] [--interval 0.25]
+"""
+import argparse
+import os
+import pty
+import sys
+import threading
+import time
+import tty
+
+import numpy as np
+import serial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from common.serial_ingest import SerialReader, open_serial, parse_edge_line
+
+IDLE_S = 2.0
+
+
+def make_pty():
+    master, slave = pty.openpty()
+    tty.setraw(slave)
+    return master, os.ttyname(slave)
+
+
+def feed(master, n, interval, sent):
+    """가짜 엣지: 줄 앞에 보낸 순번을 넣어 수신 쪽에서 지연 계산."""
+    for i in range(n):
+        sent[i] = time.perf_counter()
+        os.write(master, f"{20 + i % 50 * 0.1:.2f},45.0,20.1,44.8,0.1,0.2,SEND,{i},250000,327680\n".encode())
+        time.sleep(interval)
+
+
+def poll_loop(port, n, sent):
+    """기존 edge_serial_logger / compare_group 로거 루프."""
+    ser = serial.Serial(port, 115200, timeout=1)
+    lat, got, loops = [], 0, 0
+    while got < n:
+        loops += 1
+        if ser.in_waiting > 0:
+            line = ser.readline().decode("utf-8", errors="ignore").strip()
+            parsed = parse_edge_line(line)
+            if parsed is not None:
+                lat.append(time.perf_counter() - sent[parsed[7]])
+                got += 1
+        time.sleep(0.1)
+    idle_loops = 0
+    t_end = time.perf_counter() + IDLE_S
+    while time.perf_counter() < t_end:
+        idle_loops += 1
+        if ser.in_waiting > 0:
+            ser.readline()
+        time.sleep(0.1)
+    ser.close()
+    return lat, idle_loops
+
+
+def reader_loop(port, n, sent):
+    ser = open_serial(port, reset_input=False)
+    reader = SerialReader(ser, parse_edge_line, skip_unparsed=True)
+    lat = []
+    for item in reader:
+        lat.append(time.perf_counter() - sent[item.parsed[7]])
+        if len(lat) >= n:
+            break
+    # idle 중 reader 스레드는 ser.read()에서 timeout(0.5초)마다 한 번 깨어남
+    idle_loops = round(IDLE_S / ser.timeout)
+    time.sleep(IDLE_S)
+    reader.close()
+    ser.close()
+    return lat, idle_loops
+
+
+def run(fn, n, interval):
+    master, port = make_pty()
+    sent = [0.0] * n
+    out = {}
+    consumer = threading.Thread(target=lambda: out.setdefault("r", fn(port, n, sent)))
+    consumer.start()
+    time.sleep(0.2)  # 포트가 열린 뒤부터 쓰기
+    feed(master, n, interval, sent)
+    consumer.join()
+    os.close(master)
+    return out["r"]
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--lines", type=int, default=40)
+    ap.add_argument("--interval", type=float, default=0.25)
+    args = ap.parse_args()
+
+    print(f"{args.lines} lines every {args.interval * 1e3:.0f} ms over a pty")
+    print(f"{'consumer':<28}{'p50 ms':>10}{'p99 ms':>10}{'max ms':>10}{'idle wakeups/s':>16}")
+    for name, fn in (("in_waiting poll + sleep(0.1)", poll_loop), ("SerialReader", reader_loop)):
+        lat, idle_loops = run(fn, args.lines, args.interval)
+        lat = np.array(lat) * 1e3
+        print(f"{name:<28}{np.percentile(lat, 50):>10.2f}{np.percentile(lat, 99):>10.2f}{lat.max():>10.2f}"
+              f"{idle_loops / IDLE_S:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
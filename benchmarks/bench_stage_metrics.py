@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+게이트웨이 단계별 지연 계측(stage_metrics) 오버헤드 + 실제 RX 경로 분포.
+
+1) span 오버헤드: now_ns() + LatencyHistogram.since() 1회 비용을 빈 루프와 비교 (ns/span)
+2) pty로 GatewayRuntime에 RX 프레임 --n개를 흘려 단계별 p50/p99/max 표와
+   로컬 /metrics 응답(MetricsServer)을 출력
+
+실행:
+  python benchmarks/bench_stage_metrics.py [--spans 1000000] [--n 200]
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+import urllib.request
+
+import serial
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+from bench_mqtt_publisher import TOPIC, FakeClient
+from gateway_MLP_Logic import GatewayMLP
+from gateway_runtime import GatewayRuntime
+from mqtt_publisher import MqttPublisher
+from stage_metrics import StageMetrics, MetricsServer, now_ns
+
+MODEL_PATH = os.path.join(ROOT, "gateway", "mlp_model.bin")
+
+
+def span_overhead(n):
+    h = StageMetrics().histogram("bench")
+    t = time.perf_counter()
+    for _ in range(n):
+        pass
+    empty = time.perf_counter() - t
+    t = time.perf_counter()
+    for _ in range(n):
+        t0 = now_ns()
+        h.since(t0)
+    spans = time.perf_counter() - t
+    return (spans - empty) / n * 1e9, h.snapshot()
+
+
+def run_pty(n):
+    master, slave = os.openpty()
+    ser = serial.Serial(os.ttyname(slave), 115200, timeout=0)
+    model = GatewayMLP.from_file(MODEL_PATH, inplace=True, verbose=False)
+    metrics = StageMetrics()
+    server = MetricsServer(metrics, port=0)
+    publisher = MqttPublisher(FakeClient(), TOPIC, verbose=False, metrics=metrics)
+    runtime = GatewayRuntime(model, ser, publisher.publish, verbose=False, metrics=metrics)
+    worker = threading.Thread(target=runtime.run, daemon=True)
+    worker.start()
+
+    for i in range(n):
+        os.write(master, f"Received: {int(time.time() * 1000)},{20 + (i % 50) * 0.1:.2f},{40.0:.2f}\n".encode())
+        buf = b""
+        while not buf.endswith(b"\n"):
+            buf += os.read(master, 256)
+        time.sleep(0.002)  # 다음 프레임 전에 모델 갱신이 끝나도록
+
+    time.sleep(0.05)
+    host, port = server.address
+    body = urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=2).read().decode()
+    runtime.stop()
+    worker.join(2.0)
+    publisher.close()
+    server.close()
+    ser.close()
+    os.close(master)
+    os.close(slave)
+    return metrics, body
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--spans", type=int, default=1_000_000)
+    ap.add_argument("--n", type=int, default=200, help="pty RX 프레임 수")
+    args = ap.parse_args()
+
+    ns, snap = span_overhead(args.spans)
+    print(f"span overhead: {ns:.0f} ns/span ({args.spans:,} spans; recorded p50 {snap['quantiles'][0.5]} ns)")
+
+    metrics, body = run_pty(args.n)
+    print(f"\nGatewayRuntime over pty, {args.n} RX frames:")
+    print(metrics.dump())
+    print(f"\n/metrics: {len(body.splitlines())} lines, e.g.")
+    print("\n".join(line for line in body.splitlines() if 'stage="predict"' in line))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+가중치 delta push (gateway/weight_delta.py): 재동기화 1회의 LoRa 전송량 vs 전체 가중치 전송.
+
+1) 온라인 학습 상태 만들기: EdgeTwinMLP(모델 파일 가중치)로 데이터셋 앞부분(--split)을 재생하며 오차가 beta를
+   넘은 스텝만 online_update(lr=--lr) (bench_quantized_mlp.replay_online) → 엣지가 재부팅할 때 게이트웨이가 가진 가중치
+2) 방식별 (top-k 항목 수마다 + 전체 int8 delta + 전체 float32 가중치)
+   - blob 크기, 조각(LoRa 패킷) 수, 전송 바이트 (downlink 'D<seq>:<base64>' + uplink 'D,<seq>' 요청·'D,end' 보고
+     + ping ack의 ',D<n>'), LoRa time-on-air (Semtech 공식, SF7/BW125/CR4-5/preamble 8/CRC off = LoRa 라이브러리 기본)
+   - 재부팅 뒤 (데이터셋 나머지를 같은 규칙으로 이어서 재생): SEND(= online_update) 수, 한 스텝 앞 예측 MAE,
+     학습 상태에서 이어간 예측과의 최대 차이. 사전학습 상태(push 없음)도 같이 출력
+3) 검증
+   - 프로토콜: GatewayRuntime(_on_line)에 부팅 ping → 조각 요청 → 보고를 넣고, 응답 줄을 EdgeDeltaSimulator로 적용
+     → 보고 해시가 target과 같은지 (delta_ok)
+   - C: mlp_model.h의 mlp_b64_decode() / mlp_apply_delta()를 gcc로 컴파일해 같은 조각 줄을 적용 → 반환값 0이고
+     mlp_state_hash()가 target과 같은지 (엣지와 비트 단위 동일)
+
+실행:
+  python benchmarks/bench_weight_delta.py [--data 그냥_측정.csv] [--split 0.5] [--lr 0.01] [--topk 64 128 256 512 1024]
+"""
+import argparse
+import base64
+import math
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import types
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+sys.path.insert(0, os.path.join(ROOT, "edge_node"))
+
+from bench_quantized_mlp import load_windows, replay_online
+from checkpoint import model_checksum
+from edge_twin import EdgeTwinMLP
+from gateway_runtime import GatewayRuntime
+from model_file import read_model_file
+from Pre_train import MODEL_FILE, ONLINE_LR, regression_metrics
+from weight_delta import PARAM_ARRAYS, EdgeDeltaSimulator, apply_delta, chunk_lines, flat_params, parse_delta
+
+MODEL_PATH = os.path.join(ROOT, MODEL_FILE)
+HEADER = os.path.join(ROOT, "edge_node", "mlp_model.h")
+DEFAULT_DATA = os.path.join(ROOT, "그냥_측정.csv")
+DEFAULT_TOPK = [64, 128, 256, 512, 1024]
+
+# stdin: 조각 줄 'D<seq>:<base64>' (EOF까지) → stdout: '<mlp_apply_delta 반환값> <mlp_state_hash hex>'
+C_MAIN = r"""
+#include <stdio.h>
+
+#define N_IN 12
+static uint8_t blob[MLP_DELTA_MAX];
+static char line[512];
+
+int main(void) {
+  float window[N_IN];
+  for (int w = 0; w < N_IN / 3; w++) { window[3 * w] = y_mean[0]; window[3 * w + 1] = y_mean[1]; window[3 * w + 2] = 0.5f; }
+  int len = 0;
+  while (fgets(line, sizeof line, stdin)) {
+    line[strcspn(line, "\r\n")] = 0;
+    char *b64 = strchr(line, ':');
+    int m = b64 ? mlp_b64_decode(b64 + 1, blob + len, MLP_DELTA_MAX - len) : -1;
+    if (m < 0) { printf("decode-error 0\n"); return 1; }
+    len += m;
+  }
+  int r = mlp_apply_delta(blob, len, window, N_IN);
+  printf("%d %08lx\n", r, (unsigned long)mlp_state_hash(window, N_IN));
+  return 0;
+}
+"""
+
+
+def lora_airtime_ms(payload, sf=7, bw=125e3, cr=1, preamble=8, crc=False, explicit_header=True):
+    """LoRa 패킷 하나의 time-on-air (Semtech AN1200.13). cr=1 → 4/5."""
+    t_sym = (2 ** sf) / bw * 1000.0
+    de = 1 if t_sym > 16.0 else 0  # low data rate optimize (SF11/12 @ 125 kHz)
+    ih = 0 if explicit_header else 1
+    n = 8 + max(math.ceil((8 * payload - 4 * sf + 28 + 16 * crc - 20 * ih) / (4 * (sf - 2 * de))) * (cr + 4), 0)
+    return (preamble + 4.25) * t_sym + n * t_sym
+
+
+def air_cost(lines):
+    """조각 줄 목록 → (downlink B, uplink B, 패킷 수, time-on-air ms). 요청·보고·ping ack flag 포함."""
+    down = [len(line) for line in lines]
+    up = [len(f"D,{seq}") for seq in range(len(lines))] + [len("D,end,00000000")]
+    flag = len(f",D{len(lines)}")
+    airtime = sum(lora_airtime_ms(n) for n in down + up) + (lora_airtime_ms(10 + flag) - lora_airtime_ms(10))
+    return sum(down) + flag, sum(up), len(down) + len(up), airtime
+
+
+def run_protocol(learned, base, checksum, topk):
+    """GatewayRuntime ↔ EdgeDeltaSimulator로 부팅 push 1회 → (DeltaPush, 게이트웨이 counters, 엣지 보고 줄)."""
+    written = []
+    ser = types.SimpleNamespace(write=lambda b: written.append(b.decode().strip()))
+    gw_model = EdgeTwinMLP.from_file(MODEL_PATH, verbose=False, copy=True)
+    for name in PARAM_ARRAYS:
+        np.copyto(getattr(gw_model, name), learned[name])
+    rt = GatewayRuntime(gw_model, ser, lambda payload, qos=0: None, verbose=False, twin_base=base,
+                        delta_topk=topk, base_checksum=checksum)
+    rt._on_line("Received: 0.0,0.0")
+    push = rt._push
+    n_chunks = int(written[-1].split(",D")[1])
+
+    edge = EdgeDeltaSimulator(EdgeTwinMLP.from_file(MODEL_PATH, verbose=False, copy=True), base, checksum, n_chunks)
+    while edge.request() is not None:
+        rt._on_line(f"Received: {edge.request()}")
+        edge.receive(written[-1])
+    report = edge.finish()
+    rt._on_line(f"Received: {report}")
+    return push, rt.twin_counters, report
+
+
+def c_apply(exe, lines):
+    out = subprocess.run([exe], input="\n".join(lines) + "\n", capture_output=True, text=True).stdout.split()
+    return int(out[0]) if out[0].lstrip("-").isdigit() else None, int(out[1], 16)
+
+
+def build_c(workdir):
+    src = os.path.join(workdir, "delta.cpp")
+    with open(src, "w", encoding="utf-8") as f:
+        f.write(f'#include "{HEADER}"\n' + C_MAIN)
+    exe = os.path.join(workdir, "delta")
+    subprocess.run(["g++", "-O2", "-march=native", src, "-o", exe], check=True)
+    return exe
+
+
+def continue_from(arrays, X, y, lr):
+    """arrays 가중치에서 X, y를 이어서 재생 → (한 스텝 앞 예측, SEND 수)."""
+    model = EdgeTwinMLP.from_file(MODEL_PATH, verbose=False, copy=True)
+    for name in PARAM_ARRAYS:
+        np.copyto(getattr(model, name), arrays[name])
+    pred, n_send, _ = replay_online(model, X, y, lr)
+    return pred, n_send
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", default=DEFAULT_DATA)
+    parser.add_argument("--split", type=float, default=0.5, help="온라인 학습에 쓸 앞부분 비율 (나머지는 재부팅 뒤)")
+    parser.add_argument("--lr", type=float, default=ONLINE_LR)
+    parser.add_argument("--topk", type=int, nargs="+", default=DEFAULT_TOPK)
+    args = parser.parse_args()
+
+    _, base = read_model_file(MODEL_PATH)
+    checksum = model_checksum(MODEL_PATH)
+    model = EdgeTwinMLP.from_file(MODEL_PATH, verbose=False, copy=True)
+    X, y = load_windows(args.data, model.window_buf.shape[0])
+    n_learn = int(len(X) * args.split)
+    _, n_update, n_reset = replay_online(model, X[:n_learn], y[:n_learn], args.lr)
+    learned = {name: getattr(model, name).copy() for name in PARAM_ARRAYS}
+    d = flat_params(learned) - flat_params(base)
+    X, y = X[n_learn:], y[n_learn:]
+    print(f"{os.path.relpath(args.data, ROOT)}: {n_learn:,} windows online ({n_update} updates, {n_reset} resets, lr={args.lr}), "
+          f"then edge reboot + {len(X):,} windows")
+    print(f"  weights changed: {np.count_nonzero(d):,} / {d.size:,}, max |delta| {np.abs(d).max():.5f}")
+
+    y_learned, send_learned = continue_from(learned, X, y, args.lr)
+    y_base, send_base = continue_from(base, X, y, args.lr)
+
+    def row(y_pred, n_send):
+        _, mae_t, mae_h = regression_metrics(y, y_pred)
+        diff = np.abs(y_pred - y_learned).max(axis=0)
+        return f"{n_send:>5} {mae_t:>6.3f} {mae_h:>6.3f} {diff[0]:>8.4f} {diff[1]:>8.4f}"
+
+    have_gcc = shutil.which("g++") is not None
+    workdir = tempfile.mkdtemp(prefix="bench_delta_")
+    exe = build_c(workdir) if have_gcc else None
+
+    print(f"\n{'method':>16} {'entries':>8} {'blob B':>7} {'chunks':>6} {'down B':>7} {'up B':>6} {'packets':>7} "
+          f"{'airtime s':>9} {'SEND':>5} {'MAE T':>6} {'MAE H':>6} {'max |dT|':>8} {'max |dH|':>8} {'sim':>4} {'C':>4}")
+    raw = flat_params(learned).tobytes()
+    raw_lines = chunk_lines(raw)
+    down, up, packets, airtime = air_cost(raw_lines)
+    print(f"{'full float32':>16} {d.size:>8,} {len(raw):>7,} {len(raw_lines):>6} {down:>7,} {up:>6,} "
+          f"{packets:>7} {airtime / 1000:>9.2f} {row(y_learned, send_learned)} {'—':>4} {'—':>4}")
+    for topk in args.topk + [d.size]:
+        push, counters, report = run_protocol(learned, base, checksum, topk)
+        blob = b"".join(base64.b64decode(line.split(":", 1)[1]) for line in push.lines)
+        recon, target_hash = apply_delta(base, blob, checksum)
+        y_recon, send_recon = continue_from(recon, X, y, args.lr)
+        sim_ok = counters["delta_ok"] == 1 and report == f"D,end,{target_hash:08x}"
+        c_ok = "—"
+        if exe is not None:
+            r, h = c_apply(exe, push.lines)
+            c_ok = "ok" if (r == 0 and h == target_hash) else "FAIL"
+        down, up, packets, airtime = air_cost(push.lines)
+        name = "int8 dense" if topk == d.size else f"int8 top-{topk}"
+        print(f"{name:>16} {push.n_entries:>8,} {push.blob_bytes:>7,} {len(push.lines):>6} {down:>7,} {up:>6,} "
+              f"{packets:>7} {airtime / 1000:>9.2f} {row(y_recon, send_recon)} "
+              f"{'ok' if sim_ok else 'FAIL':>4} {c_ok:>4}")
+        assert parse_delta(blob)[0] == push.target_hash
+    print(f"{'no push':>16} {0:>8} {0:>7} {0:>6} {0:>7} {0:>6} {0:>7} {0:>9.2f} {row(y_base, send_base)}")
+    print(f"\n  SEND / MAE: 재부팅 뒤 {len(X):,} 스텝, max |d|: 학습 상태(full float32)에서 이어간 예측과의 차이")
+    print("  airtime: SF7 / 125 kHz / CR 4/5, 패킷별 합 (gateway_edge.ino 응답 대기·50 ms 지연 제외)")
+    if exe is None:
+        print("  g++ 없음: C 적용 검증 생략")
+    shutil.rmtree(workdir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
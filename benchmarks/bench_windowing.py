@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Rolling window 데이터셋 생성 벤치마크 (Pre_train.py).
+
+- loop   : 기존 방식 (features[i-W:i].flatten()을 list에 append 후 np.array)
+- view   : make_windows() — sliding_window_view 기반 zero-copy view
+- stream : iter_window_chunks() — 청크 단위 CSV 읽기 (tracemalloc peak로 메모리 상한 확인)
+
+기본값: 합성 시계열 10M 행 (loop은 시간/메모리 때문에 --loop-rows 행만 측정).
+
+실행:
+  python benchmarks/bench_windowing.py [--rows 10000000] [--loop-rows 1000000] [--csv-rows 2000000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from Pre_train import make_windows, iter_window_chunks, WINDOW_SIZE, COL_TIME, COL_TEMP, COL_HUM
+
+
+def synthetic_series(n_rows, seed=0):
+    """1분 간격 온·습도 + time_n (일주기 + 잡음)."""
+    rng = np.random.default_rng(seed)
+    minutes = np.arange(n_rows)
+    time_n = (minutes % 1440) / 1440.0
+    temp = 15 + 8 * np.sin(2 * np.pi * time_n) + rng.normal(0, 0.3, n_rows)
+    hum = 40 - 15 * np.sin(2 * np.pi * time_n) + rng.normal(0, 1.0, n_rows)
+    return np.column_stack([temp, hum, time_n])
+
+
+def loop_windows(features, window_size):
+    X, y = [], []
+    for i in range(window_size, len(features)):
+        X.append(features[i - window_size:i].flatten())
+        y.append(features[i, :2])
+    return np.array(X), np.array(y)
+
+
+def timed(fn, *args):
+    t0 = time.perf_counter()
+    out = fn(*args)
+    return out, time.perf_counter() - t0
+
+
+def write_csv(path, features):
+    ts = pd.Timestamp("2024-01-01") + pd.to_timedelta(np.arange(len(features)), unit="min")
+    pd.DataFrame({
+        COL_TIME: ts.strftime("%Y-%m-%dT%H:%M:%S"),
+        COL_TEMP: features[:, 0].round(2),
+        COL_HUM: features[:, 1].round(2),
+    }).to_csv(path, index=False)
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=10_000_000)
+    ap.add_argument("--loop-rows", type=int, default=1_000_000)
+    ap.add_argument("--csv-rows", type=int, default=2_000_000)
+    ap.add_argument("--chunksize", type=int, default=250_000)
+    args = ap.parse_args()
+
+    features = synthetic_series(args.rows)
+    print(f"synthetic series: {args.rows:,} rows x {features.shape[1]} features, window={WINDOW_SIZE}")
+
+    sub = features[:args.loop_rows]
+    (X_loop, y_loop), t_loop = timed(loop_windows, sub, WINDOW_SIZE)
+    print(f"  loop   ({args.loop_rows:,} rows): {t_loop:8.3f} s  "
+          f"(~{t_loop * args.rows / args.loop_rows:.1f} s extrapolated to {args.rows:,})")
+
+    (X, y), t_view = timed(make_windows, features, WINDOW_SIZE)
+    print(f"  view   ({args.rows:,} rows): {t_view * 1e3:8.3f} ms  X{X.shape} shares memory: "
+          f"{np.shares_memory(X, features)}")
+    assert np.array_equal(X[:len(X_loop)], X_loop) and np.array_equal(y[:len(y_loop)], y_loop)
+    del X_loop, y_loop
+
+    X32, t_copy = timed(np.asarray, X, np.float32)
+    print(f"  view → float32 copy (학습 입력용): {t_copy:.3f} s, {X32.nbytes / 2**20:.0f} MiB")
+    del X32
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = os.path.join(tmp, "series.csv")
+        write_csv(csv_path, features[:args.csv_rows])
+        tracemalloc.start()
+        t0 = time.perf_counter()
+        n = 0
+        for Xc, yc in iter_window_chunks(csv_path, WINDOW_SIZE, chunksize=args.chunksize):
+            n += len(Xc)
+        t_stream = time.perf_counter() - t0
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"  stream ({args.csv_rows:,} CSV rows, chunksize={args.chunksize:,}): {t_stream:.2f} s, "
+              f"{n:,} windows, peak {peak / 2**20:.0f} MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+"""
+바이너리 프레임 (common/wire_format.py) vs 기존 텍스트 CSV: 메시지 크기 · 파싱 처리량 · 값 일치.
+
+입력: 엣지 로그 CSV(--edge-log) 각 행을 엣지가 보냈을 메시지로 만든다.
+  - READING : 텍스트 'Received: ts,t,h,n_skip,hash' vs 'Received: F:<hex>' → gateway_runtime.parse_rx_line
+  - EDGE_LOG: 텍스트 10필드 줄 vs 'F:<hex>' → serial_ingest.parse_edge_line (로거 5종 공용)
+  - bytes   : 프레임 bytes를 바로 decode_reading / decode_edge_log (hex 변환 없음, LoRa 수신 bytes를 직접 받을 때)
+출력:
+  1) 메시지 크기: LoRa payload 바이트와 time-on-air (SF7/125 kHz/CR 4/5), 시리얼 줄 바이트
+  2) 파싱 처리량 (msgs/s, --repeat회 중 최고)
+  3) 값 일치: 프레임 디코드 결과 == 텍스트 파싱 결과인 메시지 수
+  4) C 인코더: MLP_edge_sensor.ino의 wire_* 함수를 g++로 컴파일해 같은 값으로 만든 프레임이 Python encode_*와
+     바이트 단위로 같은지
+
+실행:
+  python benchmarks/bench_wire_format.py [--edge-log edge_node/edge_log_0.3.csv ...] [--repeat 5]
+"""
+import argparse
+import csv
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from bench_weight_delta import lora_airtime_ms
+from common.serial_ingest import parse_edge_line
+from common.wire_format import (EDGE_LOG_SIZE, READING_SIZE, decode_edge_log, decode_reading, encode_edge_log,
+                                encode_reading, from_line, to_line)
+from gateway_runtime import parse_rx_line
+
+SKETCH = os.path.join(ROOT, "edge_node", "MLP_edge_sensor.ino")
+DEFAULT_LOGS = [os.path.join(ROOT, "edge_node", f"edge_log_{b}.csv") for b in ("0.3", "0.5", "0.7")]
+BASE_UNIX_MS = 1772142046000
+
+# stdin: 'R <seq> <ts_ms> <t> <h> <n_skip> <hash hex>' 또는
+#        'L <seq> <t> <h> <pred_t> <pred_h> <err_t> <err_h> <status> <inference_us> <free_heap> <total_heap>'
+# stdout: 프레임 hex 한 줄씩
+C_MAIN = r"""
+int main(void) {
+  char kind[4];
+  uint8_t b[64];
+  while (scanf("%3s", kind) == 1) {
+    unsigned seq;
+    int n;
+    if (kind[0] == 'R') {
+      unsigned long long ts;
+      float t, h;
+      unsigned n_skip;
+      unsigned long hash;
+      if (scanf("%u %llu %f %f %u %lx", &seq, &ts, &t, &h, &n_skip, &hash) != 6) return 1;
+      int pos = wire_header(b, WIRE_READING, WIRE_FLAG_TWIN, seq);
+      pos = wire_put(b, pos, ts, 8);
+      pos = wire_put(b, pos, (uint16_t)wire_i16(t, 100.0f), 2);
+      pos = wire_put(b, pos, wire_u16(h, 100.0f), 2);
+      pos = wire_put(b, pos, n_skip, 2);
+      pos = wire_put(b, pos, hash, 4);
+      n = wire_seal(b, pos);
+    } else {
+      float t, h, pt, ph, et, eh;
+      unsigned status;
+      unsigned long inf, free_heap, total_heap;
+      if (scanf("%u %f %f %f %f %f %f %u %lu %lu %lu", &seq, &t, &h, &pt, &ph, &et, &eh, &status, &inf,
+                &free_heap, &total_heap) != 11) return 1;
+      int pos = wire_header(b, WIRE_EDGE_LOG, 0, seq);
+      pos = wire_put(b, pos, (uint16_t)wire_i16(t, 100.0f), 2);
+      pos = wire_put(b, pos, wire_u16(h, 100.0f), 2);
+      pos = wire_put(b, pos, (uint16_t)wire_i16(pt, 100.0f), 2);
+      pos = wire_put(b, pos, wire_u16(ph, 100.0f), 2);
+      pos = wire_put(b, pos, wire_u16(et, 1000.0f), 2);
+      pos = wire_put(b, pos, wire_u16(eh, 1000.0f), 2);
+      pos = wire_put(b, pos, status, 1);
+      pos = wire_put(b, pos, inf, 4);
+      pos = wire_put(b, pos, free_heap, 4);
+      pos = wire_put(b, pos, total_heap, 4);
+      n = wire_seal(b, pos);
+    }
+    for (int i = 0; i < n; i++) printf("%02X", b[i]);
+    printf("\n");
+  }
+  return 0;
+}
+"""
+
+
+def load_messages(paths):
+    """엣지 로그 행 → (reading 텍스트 줄, reading 프레임, edge log 텍스트 줄, edge log 프레임, C 입력 줄) 리스트."""
+    rng = random.Random(0)
+    out = []
+    for path in paths:
+        with open(path, newline="", encoding="utf-8") as f:
+            for row in csv.DictReader(f):
+                i = len(out)
+                seq, ts = i & 0xFFFF, BASE_UNIX_MS + i * 60_000 + rng.randrange(1000)
+                n_skip, state_hash = rng.randrange(10), rng.getrandbits(32)
+                t, h = float(row["actual_t"]), float(row["actual_h"])
+                log = (t, h, float(row["pred_t"]), float(row["pred_h"]), float(row["error_t"]), float(row["error_h"]),
+                       row["status"], int(row["inference_time_us"]), int(row["free_heap"]), int(row["total_heap"]))
+                reading_text = f"Received: {ts},{t:.2f},{h:.2f},{n_skip},{state_hash:08x}"
+                log_text = (f"{log[0]:.2f},{log[1]:.2f},{log[2]:.2f},{log[3]:.2f},{log[4]:.3f},{log[5]:.3f},"
+                            f"{log[6]},{log[7]},{log[8]},{log[9]}")
+                status_code = ("SKIP", "SEND & TRAIN", "HEARTBEAT", "RESYNC").index(log[6])
+                c_in = (f"R {seq} {ts} {t:.2f} {h:.2f} {n_skip} {state_hash:x}\n"
+                        f"L {seq} {' '.join(f'{v}' for v in log[:6])} {status_code} {log[7]} {log[8]} {log[9]}")
+                out.append((reading_text, encode_reading(1, seq, ts, t, h, n_skip, state_hash), log_text,
+                            encode_edge_log(1, seq, *log), c_in))
+    return out
+
+
+def throughput(fn, items, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - t0)
+    return len(items) / best
+
+
+def c_frames(workdir, c_inputs):
+    """스케치의 wire_* 함수 + C_MAIN → 입력 줄마다 프레임 bytes."""
+    with open(SKETCH, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    start = next(i for i, s in enumerate(lines) if s.startswith("#define NODE_ID"))
+    end = next(i for i, s in enumerate(lines) if s.startswith("void waitForTimeSync"))
+    src = os.path.join(workdir, "wire.cpp")
+    with open(src, "w", encoding="utf-8") as f:
+        f.write("#include <math.h>\n#include <stdint.h>\n#include <stdio.h>\n" + "\n".join(lines[start:end]) + C_MAIN)
+    exe = os.path.join(workdir, "wire")
+    subprocess.run(["g++", "-O2", src, "-o", exe], check=True)
+    out = subprocess.run([exe], input="\n".join(c_inputs) + "\n", capture_output=True, text=True, check=True).stdout
+    return [bytes.fromhex(line) for line in out.split()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--edge-log", nargs="+", default=DEFAULT_LOGS)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    msgs = load_messages(args.edge_log)
+    reading_text = [m[0] for m in msgs]
+    reading_bytes = [m[1] for m in msgs]
+    reading_line = [f"Received: {to_line(b)}" for b in reading_bytes]
+    log_text = [m[2] for m in msgs]
+    log_bytes = [m[3] for m in msgs]
+    log_line = [to_line(b) for b in log_bytes]
+    print(f"{len(msgs):,} messages from {', '.join(os.path.relpath(p, ROOT) for p in args.edge_log)}")
+
+    avg = lambda xs: sum(len(x) for x in xs) / len(xs)  # noqa: E731
+    text_payload = avg([t.split("Received: ")[1] for t in reading_text])
+    print(f"\n{'message':>10} {'format':>7} {'LoRa B':>7} {'airtime ms':>10} {'serial line B':>13}")
+    print(f"{'READING':>10} {'text':>7} {text_payload:>7.1f} {lora_airtime_ms(round(text_payload)):>10.1f} "
+          f"{avg(reading_text) + 2:>13.1f}")
+    print(f"{'READING':>10} {'frame':>7} {READING_SIZE:>7} {lora_airtime_ms(READING_SIZE):>10.1f} "
+          f"{avg(reading_line) + 2:>13.1f}")
+    print(f"{'EDGE_LOG':>10} {'text':>7} {'—':>7} {'—':>10} {avg(log_text) + 2:>13.1f}")
+    print(f"{'EDGE_LOG':>10} {'frame':>7} {EDGE_LOG_SIZE:>7} {'—':>10} {avg(log_line) + 2:>13.1f}")
+
+    print(f"\n{'parser':>44} {'msgs/s':>12} {'µs/msg':>7}")
+    rows = [
+        ("parse_rx_line  text 'ts,t,h,n_skip,hash'", parse_rx_line, reading_text),
+        ("parse_rx_line  'F:<hex>' READING", parse_rx_line, reading_line),
+        ("decode_reading bytes", decode_reading, reading_bytes),
+        ("parse_edge_line text 10 fields", parse_edge_line, log_text),
+        ("parse_edge_line 'F:<hex>' EDGE_LOG", parse_edge_line, log_line),
+        ("decode_edge_log bytes", decode_edge_log, log_bytes),
+    ]
+    for name, fn, items in rows:
+        rate = throughput(fn, items, args.repeat)
+        print(f"{name:>44} {rate:>12,.0f} {1e6 / rate:>7.2f}")
+
+    same_reading = sum(tuple(parse_rx_line(a))[2:] == tuple(parse_rx_line(b))[2:]
+                       for a, b in zip(reading_text, reading_line))
+    same_log = sum(parse_edge_line(a) == parse_edge_line(b) for a, b in zip(log_text, log_line))
+    print(f"\nframe == text: READING {same_reading:,} / {len(msgs):,}, EDGE_LOG {same_log:,} / {len(msgs):,}")
+    assert decode_reading(from_line(reading_line[0].split("Received: ")[1])) == decode_reading(reading_bytes[0])
+
+    if shutil.which("g++") is None:
+        print("g++ 없음: C 인코더 비교 생략")
+        return
+    workdir = tempfile.mkdtemp(prefix="bench_wire_")
+    try:
+        frames = c_frames(workdir, [m[4] for m in msgs])
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    same_c = sum(frames[2 * i] == m[1] and frames[2 * i + 1] == m[3] for i, m in enumerate(msgs))
+    print(f"C encoder (MLP_edge_sensor.ino wire_*) == Python encode: {same_c:,} / {len(msgs):,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,315 @@
+"""
+로거 공용 로그 writer: 파일 핸들 1개 유지 + 행 버퍼링 + 회전 + (선택) 고정 레코드 바이너리.
+
+기존 로거들은 행마다 CSV를 열고(append) 닫았고, mqtt_to_csv는 메시지마다 파일 존재도 확인했다.
+LogWriter는
+  - 파일을 한 번 열어 두고 append()는 메모리 버퍼에 행만 추가
+  - 버퍼가 max_rows행이 되거나, 백그라운드 스레드가 flush_interval_s마다 OS로 flush
+    → 프로세스가 죽어도 잃는 데이터는 최대 flush_interval_s초 분량 (fsync=True면 전원 차단까지)
+  - rotate_bytes 초과 또는 날짜가 바뀌면 현재 파일을 '<이름>.<열린 시각>.<확장자>'로 옮기고 새 파일 시작
+  - 확장자가 .rec이면 numpy 구조체 배열 그대로 기록 (고정 길이 레코드) → read_records()가
+    memory-map 으로 파싱 없이 읽음. 그 외 확장자는 CSV.
+
+.rec 파일 구조: MAGIC(8B) + 헤더 길이(uint32 LE) + JSON {"columns": [[name, dtype], ...]} (16B 정렬 패딩)
+               + 레코드 * N. 기록 중 죽어 끝 레코드가 잘렸으면 읽을 때 완전한 레코드까지만 사용.
+컬럼이 같고 문자열 폭만 좁은 이전 헤더(예: status S8 → S16)의 파일은 열 때 회전 파일로 옮기고 새 헤더로 시작,
+read_records()는 회전 파일들을 현재 파일의 dtype으로 맞춰 이어 붙인다. 그 외 헤더 불일치는 ValueError.
+
+columns: [(name, numpy dtype 문자열), ...]. CSV는 이름만 헤더로 쓰고 값은 csv.writer 그대로.
+.rec에서 숫자 컬럼의 None/""는 float → NaN, int → -1, 문자열 컬럼('S')은 ASCII bytes.
+"""
+import csv
+import glob
+import json
+import os
+import struct
+import threading
+import time
+
+import numpy as np
+
+REC_MAGIC = b"AOIIREC1"
+REC_EXT = ".rec"
+FLUSH_INTERVAL_S = 1.0
+MAX_BUFFERED_ROWS = 1000
+
+_REC_HEADER = struct.Struct("<8sI")
+
+# 로거별 컬럼 (이름 = 기존 CSV 헤더 그대로, dtype은 .rec일 때만 사용)
+# edge_node/edge_serial_logger_*.py — ESP32 시리얼 10필드 + 수신 시각
+EDGE_LOG_COLUMNS = [
+    ("timestamp", "M8[s]"),
+    ("actual_t", "f4"), ("actual_h", "f4"), ("pred_t", "f4"), ("pred_h", "f4"), ("error_t", "f4"), ("error_h", "f4"),
+    ("status", "S16"), ("inference_time_us", "i4"), ("free_heap", "i4"), ("total_heap", "i4"),
+]
+# edge_node/edge_fleet_logger.py — 여러 엣지 동시 기록: 노드 id + 펌웨어 변형(beta) 컬럼 추가
+FLEET_LOG_COLUMNS = [EDGE_LOG_COLUMNS[0], ("node_id", "S16"), ("variant", "S8")] + EDGE_LOG_COLUMNS[1:]
+# server/mqtt_to_csv.py — 게이트웨이 aoii/readings
+ONLINE_LOG_COLUMNS = [
+    ("Timestamp", "M8[s]"), ("Time_n", "f4"), ("Event", "S4"),
+    ("Actual_T", "f4"), ("Actual_H", "f4"), ("Pred_T", "f4"), ("Pred_H", "f4"), ("Error_T", "f4"), ("Error_H", "f4"),
+    ("Total_TX", "i4"), ("Transmission_Delay_Ms", "i4"),
+]
+# compare_group_logging/threshold_edge_logger.py
+THRESHOLD_LOG_COLUMNS = ONLINE_LOG_COLUMNS[:10]
+# compare_group_logging/normal_edge_logger.py — 사전학습용 원시 측정
+RAW_LOG_COLUMNS = [("Timestamp", "M8[s]"), ("Time_n", "f4"), ("Temperature", "f4"), ("Humidity", "f4")]
+
+
+def _fill_value(dtype):
+    return np.nan if dtype.kind == "f" else -1
+
+
+class LogWriter:
+    """행 단위 로그 writer (스레드 안전). 사용 후 close() — with 문 지원."""
+
+    def __init__(self, path, columns, flush_interval_s=FLUSH_INTERVAL_S, max_rows=MAX_BUFFERED_ROWS,
+                 rotate_bytes=None, rotate_daily=False, fsync=False):
+        self.path = path
+        self.columns = list(columns)
+        self.binary = path.endswith(REC_EXT)
+        self.flush_interval_s = flush_interval_s
+        self.max_rows = max_rows
+        self.rotate_bytes = rotate_bytes
+        self.rotate_daily = rotate_daily
+        self.fsync = fsync
+        self.counters = {"rows": 0, "flushes": 0, "rotations": 0}
+
+        self.dtype = np.dtype([(name, dt) for name, dt in self.columns])
+        # .rec에서 None/"" 치환이 필요한 (숫자) 컬럼
+        self._fills = [(i, _fill_value(self.dtype[i])) for i in range(len(self.columns))
+                       if self.dtype[i].kind in "fiu"]
+
+        self._rows = []
+        self._lock = threading.Lock()
+        self._f = None
+        self._open()
+
+        self._closed = threading.Event()
+        self._thread = None
+        if flush_interval_s:
+            self._thread = threading.Thread(target=self._flush_loop, name="log-writer", daemon=True)
+            self._thread.start()
+
+    # ----------------------------------------------------------- public
+    def append(self, row):
+        """행 1개 (columns 순서의 시퀀스) 추가. 파일 I/O는 버퍼가 max_rows행일 때만."""
+        with self._lock:
+            self._rows.append(row)
+            if len(self._rows) >= self.max_rows:
+                self._flush_locked()
+
+    def extend(self, rows):
+        with self._lock:
+            self._rows.extend(rows)
+            if len(self._rows) >= self.max_rows:
+                self._flush_locked()
+
+    def flush(self):
+        with self._lock:
+            self._flush_locked()
+
+    def stats(self):
+        with self._lock:
+            return dict(self.counters, buffered=len(self._rows))
+
+    def close(self):
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+        with self._lock:
+            self._flush_locked()
+            if self._f is not None:
+                self._f.close()
+                self._f = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # ----------------------------------------------------------- file
+    def _open(self):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        new = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        if self.binary and not new and _check_rec_header(self.path, self.dtype) == "widen":
+            # 이전(좁은 문자열 컬럼) 헤더: 이어 쓰지 않고 그 파일 마지막 기록 시각으로 회전
+            self._move_aside(time.localtime(os.path.getmtime(self.path)))
+            new = True
+        if self.binary:
+            if not new:
+                _truncate_partial_record(self.path)
+            self._f = open(self.path, "ab")
+            if new:
+                self._f.write(_rec_header(self.columns))
+        else:
+            self._f = open(self.path, "a", newline="", encoding="utf-8")
+            self._csv = csv.writer(self._f)
+            if new:
+                self._csv.writerow([name for name, _ in self.columns])
+        self._f.flush()
+        self._opened_at = time.localtime()
+
+    def _should_rotate(self):
+        if self.rotate_bytes and self._f.tell() >= self.rotate_bytes:
+            return True
+        if self.rotate_daily:
+            now = time.localtime()
+            return (now.tm_year, now.tm_yday) != (self._opened_at.tm_year, self._opened_at.tm_yday)
+        return False
+
+    def _rotate(self):
+        self._f.close()
+        self._move_aside(self._opened_at)
+        self._open()
+
+    def _move_aside(self, opened_at):
+        stem, ext = os.path.splitext(self.path)
+        target = f"{stem}.{time.strftime('%Y%m%d-%H%M%S', opened_at)}{ext}"
+        n = 1
+        while os.path.exists(target):
+            target = f"{stem}.{time.strftime('%Y%m%d-%H%M%S', opened_at)}-{n}{ext}"
+            n += 1
+        os.replace(self.path, target)
+        self.counters["rotations"] += 1
+
+    def _flush_locked(self):
+        if not self._rows or self._f is None:
+            return
+        rows, self._rows = self._rows, []
+        if self._should_rotate():
+            self._rotate()
+        if self.binary:
+            if self._fills:
+                rows = [self._fill_row(r) for r in rows]
+            self._f.write(np.array(rows, dtype=self.dtype).tobytes())
+        else:
+            self._csv.writerows(rows)
+        self._f.flush()
+        if self.fsync:
+            os.fsync(self._f.fileno())
+        self.counters["rows"] += len(rows)
+        self.counters["flushes"] += 1
+
+    def _fill_row(self, row):
+        row = list(row)
+        for i, fill in self._fills:
+            if row[i] is None or row[i] == "":
+                row[i] = fill
+        return tuple(row)
+
+    def _flush_loop(self):
+        while not self._closed.wait(self.flush_interval_s):
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"log_writer: flush error ({self.path}): {e}")
+
+
+# ----------------------------------------------------------- .rec 형식
+def _rec_header(columns):
+    meta = json.dumps({"columns": [[name, np.dtype(dt).str] for name, dt in columns]}).encode()
+    size = _REC_HEADER.size + len(meta)
+    pad = (-size) % 16
+    return _REC_HEADER.pack(REC_MAGIC, size + pad) + meta + b" " * pad
+
+
+def _read_rec_header(path):
+    with open(path, "rb") as f:
+        head = f.read(_REC_HEADER.size)
+        if len(head) < _REC_HEADER.size:
+            raise ValueError(f"{path}: not a .rec log (too short)")
+        magic, header_size = _REC_HEADER.unpack(head)
+        if magic != REC_MAGIC:
+            raise ValueError(f"{path}: not a .rec log (magic={magic!r})")
+        meta = json.loads(f.read(header_size - _REC_HEADER.size))
+    dtype = np.dtype([(name, dt) for name, dt in meta["columns"]])
+    return dtype, header_size
+
+
+def _widens(old, new):
+    # 컬럼 이름·종류가 같고 new의 문자열 컬럼이 old보다 넓기만 한지 (old 레코드를 new로 손실 없이 변환 가능)
+    if old.names != new.names:
+        return False
+    for name in old.names:
+        a, b = old[name], new[name]
+        if a != b and not (a.kind == b.kind == "S" and a.itemsize < b.itemsize):
+            return False
+    return True
+
+
+def _check_rec_header(path, dtype):
+    """기존 .rec 헤더가 dtype과 같으면 "same", 문자열 폭만 좁으면 "widen". 그 외는 ValueError."""
+    existing, _ = _read_rec_header(path)
+    if existing == dtype:
+        return "same"
+    if _widens(existing, dtype):
+        return "widen"
+    raise ValueError(f"{path}: existing columns {existing} differ from {dtype}")
+
+
+def _truncate_partial_record(path):
+    # 기록 중 죽어 끝 레코드가 잘린 파일에 이어 쓰면 이후 레코드 경계가 전부 어긋나므로 잘라 냄
+    dtype, offset = _read_rec_header(path)
+    size = os.path.getsize(path)
+    extra = (size - offset) % dtype.itemsize
+    if extra:
+        with open(path, "r+b") as f:
+            f.truncate(size - extra)
+
+
+def log_files(path):
+    """path와 회전된 파일들 ('<이름>.<시각>.<확장자>'), 오래된 순. 현재 파일이 마지막."""
+    stem, ext = os.path.splitext(path)
+
+    def order(p):
+        # '<YYYYmmdd-HHMMSS>' 또는 같은 초에 회전이 겹친 '<YYYYmmdd-HHMMSS>-<n>'
+        tag = p[len(stem) + 1:len(p) - len(ext)]
+        return tag[:15], int(tag[16:]) if tag[16:].isdigit() else 0
+
+    rotated = sorted(glob.glob(glob.escape(stem) + ".[0-9]*" + glob.escape(ext)), key=order)
+    return rotated + ([path] if os.path.exists(path) else [])
+
+
+def read_records(path, rotated=True):
+    """.rec 로그 → numpy 구조체 배열. rotated=True면 회전된 파일까지 시간순으로 이어 붙임.
+
+    파일이 하나면 memory-map view (복사 없음, 읽기 전용). 이전 헤더(좁은 문자열 컬럼) 파일은 마지막 파일의 dtype으로 변환.
+    """
+    paths = log_files(path) if rotated else [path]
+    parts = []
+    for p in paths:
+        dtype, offset = _read_rec_header(p)
+        n = (os.path.getsize(p) - offset) // dtype.itemsize
+        parts.append(np.memmap(p, dtype=dtype, mode="r", offset=offset, shape=(n,)) if n else
+                     np.zeros(0, dtype=dtype))
+    if not parts:
+        raise FileNotFoundError(path)
+    if len(parts) == 1:
+        return parts[0]
+    dtype = parts[-1].dtype
+    for i, part in enumerate(parts):
+        if part.dtype != dtype:
+            if not _widens(part.dtype, dtype):
+                raise ValueError(f"{paths[i]}: columns {part.dtype} differ from {dtype}")
+            parts[i] = part.astype(dtype)
+    return np.concatenate(parts)
+
+
+def read_log(path, rotated=True):
+    """로그(.csv 또는 .rec, 회전 파일 포함) → pandas DataFrame. .rec의 bytes 컬럼은 str로 변환."""
+    import pandas as pd
+    if path.endswith(REC_EXT):
+        rec = read_records(path, rotated)
+        df = pd.DataFrame({name: rec[name] for name in rec.dtype.names})
+        for name in rec.dtype.names:
+            if rec.dtype[name].kind == "S":
+                df[name] = df[name].str.decode("ascii")
+        return df
+    paths = log_files(path) if rotated else [path]
+    if not paths:
+        raise FileNotFoundError(path)
+    if len(paths) == 1:
+        return pd.read_csv(paths[0])
+    return pd.concat([pd.read_csv(p) for p in paths], ignore_index=True)
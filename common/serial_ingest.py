@@ -0,0 +1,219 @@
+"""
+로거 공용 시리얼 수신: 전용 reader 스레드 + 줄 단위 framing + 형식별 parser + TIME 동기화.
+
+기존 로거들은 `if ser.in_waiting: readline()` 후 매번 time.sleep(0.1)로 폴링해서 줄마다 최대 100 ms가
+늦어지고, 아무것도 안 올 때도 초당 10번 깨어났다. SerialReader는
+  - reader 스레드가 ser.read()에서 timeout까지 블로킹 대기 (idle 시 timeout마다 1번만 깨어남)
+  - 바이트가 오면 도착한 만큼(in_waiting) 한 번에 읽어 b"\\n" 기준으로 줄을 잘라냄
+  - 줄마다 parser를 적용해 SerialLine(received_at, line, parsed, tag)을 큐에 넣음
+  - time_sync=True면 엣지의 "TIME?" 요청에 바로 "TIME:<unix초>"로 응답 (큐에는 넣지 않음)
+소비 쪽은 `for item in reader:` (Ctrl+C로 중단 가능) 또는 reader.get(timeout).
+여러 포트의 reader가 하나의 큐(out_queue)를 공유할 수 있고, tag로 포트/노드를 구분한다.
+
+parser (줄 문자열 → 값 또는 None):
+  parse_edge_line     ESP32 엣지 10필드 (actual_t, actual_h, pred_t, pred_h, error_t, error_h, status,
+                      inference_time_us, free_heap, total_heap) — 7필드 구형은 뒤 3개 None,
+                      'F:<hex>' EDGE_LOG 프레임(common/wire_format.py)도 같은 10필드로
+  parse_received_line 게이트웨이 LoRa 모듈 'Received: ts,t,h' (구형 'Received: t,h', READING 프레임
+                      'Received: F:<hex>') → (ts 또는 None, t, h)
+  parse_raw_line      원시 측정 't,h' → (t, h)
+"""
+import collections
+import queue
+import threading
+import time
+
+import serial
+
+from common.wire_format import FRAME_PREFIX, FrameError, decode_edge_log, decode_reading, from_line
+
+BAUD_RATE = 115200
+READ_TIMEOUT_S = 0.5
+MAX_LINE_BYTES = 4096
+
+SerialLine = collections.namedtuple("SerialLine", ["received_at", "line", "parsed", "tag"])
+
+
+# ----------------------------------------------------------- parsers
+def parse_edge_line(line):
+    if line.startswith(FRAME_PREFIX):
+        try:
+            return decode_edge_log(from_line(line))[2:]
+        except FrameError:
+            return None
+    if not line or "," not in line:
+        return None
+    parts = [p.strip() for p in line.split(",")]
+    if len(parts) < 10:
+        if len(parts) >= 7:
+            try:
+                a_t, a_h = float(parts[0]), float(parts[1])
+                p_t, p_h = float(parts[2]), float(parts[3])
+                e_t, e_h = float(parts[4]), float(parts[5])
+                return (a_t, a_h, p_t, p_h, e_t, e_h, parts[6], None, None, None)
+            except ValueError:
+                pass
+        return None
+    try:
+        return (float(parts[0]), float(parts[1]), float(parts[2]), float(parts[3]),
+                float(parts[4]), float(parts[5]), parts[6],
+                int(parts[7]) if parts[7] else None,
+                int(parts[8]) if parts[8] else None,
+                int(parts[9]) if parts[9] else None)
+    except ValueError:
+        return None
+
+
+def parse_received_line(line):
+    # gateway/gateway_runtime.parse_rx_line과 같은 형식 (형식 오류는 예외 대신 None)
+    if "Received:" not in line:
+        return None
+    payload = line.split("Received:", 1)[1].strip()
+    if payload.startswith(FRAME_PREFIX):
+        try:
+            r = decode_reading(from_line(payload))
+        except FrameError:
+            return None
+        return r.timestamp_ms, r.t, r.h
+    parts = [p.strip() for p in payload.split(",")]
+    try:
+        if len(parts) >= 3:
+            return int(parts[0]), float(parts[1]), float(parts[2])
+        return None, float(parts[0]), float(parts[1])
+    except (ValueError, IndexError):
+        return None
+
+
+def parse_raw_line(line):
+    if "," not in line:
+        return None
+    parts = line.split(",")
+    try:
+        return float(parts[0]), float(parts[1])
+    except ValueError:
+        return None
+
+
+def time_sync_message(now=None):
+    return f"TIME:{int(now if now is not None else time.time())}\n".encode("utf-8")
+
+
+# ----------------------------------------------------------- framing
+class LineFramer:
+    """바이트 조각 → 완성된 줄(str) 리스트. 줄 끝(\\n)이 오기 전 조각은 다음 feed()까지 보관."""
+
+    def __init__(self, max_line_bytes=MAX_LINE_BYTES):
+        self._buf = bytearray()
+        self.max_line_bytes = max_line_bytes
+
+    def feed(self, data):
+        self._buf += data
+        end = self._buf.rfind(b"\n")
+        if end < 0:
+            if len(self._buf) > self.max_line_bytes:
+                del self._buf[:]  # 줄바꿈 없는 쓰레기 입력 (baud 불일치 등)
+            return []
+        chunk = self._buf[:end]
+        del self._buf[:end + 1]
+        return [raw.decode("utf-8", errors="ignore").strip() for raw in chunk.split(b"\n")]
+
+
+# ----------------------------------------------------------- reader
+def open_serial(port, baud=BAUD_RATE, timeout=READ_TIMEOUT_S, reset_input=True):
+    ser = serial.Serial(port, baud, timeout=timeout)
+    if reset_input:
+        ser.reset_input_buffer()
+    return ser
+
+
+class SerialReader:
+    """ser(pyserial Serial, timeout 설정 필요)를 전용 스레드에서 읽어 SerialLine을 큐에 넣음.
+
+    parser: 줄 → 값 또는 None (None이면 parsed=None으로 그대로 전달, skip_unparsed=True면 버림).
+    out_queue: 여러 reader가 공유할 큐 (기본: reader별 새 큐). tag: SerialLine.tag (포트/노드 구분).
+    """
+
+    def __init__(self, ser, parser=None, time_sync=False, out_queue=None, tag=None, skip_unparsed=False,
+                 skip_empty=True, verbose=True):
+        self.ser = ser
+        self.parser = parser
+        self.time_sync = time_sync
+        self.queue = out_queue if out_queue is not None else queue.Queue()
+        self.tag = tag
+        self.skip_unparsed = skip_unparsed
+        self.skip_empty = skip_empty
+        self.verbose = verbose
+        self.counters = {"bytes": 0, "lines": 0, "parsed": 0, "unparsed": 0, "time_sync": 0}
+        self.error = None
+
+        self._framer = LineFramer()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"serial-{tag or ser.port}", daemon=True)
+        self._thread.start()
+
+    @property
+    def alive(self):
+        return self._thread.is_alive()
+
+    def send_time(self):
+        """현재 unix 시각을 "TIME:<초>"로 전송 (시작 시 초기 동기화)."""
+        ts = int(time.time())
+        self.ser.write(time_sync_message(ts))
+        self.counters["time_sync"] += 1
+        return ts
+
+    def get(self, timeout=None):
+        """다음 SerialLine. timeout 안에 없으면 queue.Empty."""
+        return self.queue.get(timeout=timeout)
+
+    def __iter__(self):
+        """SerialLine을 계속 yield. reader가 멈추고(close/포트 오류) 큐가 비면 종료."""
+        while True:
+            try:
+                yield self.queue.get(timeout=READ_TIMEOUT_S)
+            except queue.Empty:
+                if not self.alive:
+                    return
+
+    def close(self, timeout=2.0):
+        self._stop.set()
+        self._thread.join(timeout)
+
+    def _run(self):
+        ser = self.ser
+        while not self._stop.is_set():
+            try:
+                # 바이트가 올 때까지 ser.timeout만큼 블로킹 → 온 만큼 한 번에
+                data = ser.read(ser.in_waiting or 1)
+                if not data:
+                    continue
+                waiting = ser.in_waiting
+                if waiting:
+                    data += ser.read(waiting)
+            except (serial.SerialException, OSError) as e:
+                if not self._stop.is_set():
+                    self.error = e
+                    print(f"serial {self.tag or ser.port}: read error: {e}")
+                return
+            self.counters["bytes"] += len(data)
+            received_at = time.time()
+            for line in self._framer.feed(data):
+                self._on_line(line, received_at)
+
+    def _on_line(self, line, received_at):
+        if not line and self.skip_empty:
+            return
+        self.counters["lines"] += 1
+        if self.time_sync and line == "TIME?":
+            ts = self.send_time()
+            if self.verbose:
+                print(f"  [TIME SYNC] 요청 응답: {ts}")
+            return
+        parsed = self.parser(line) if self.parser is not None else line
+        if parsed is None:
+            self.counters["unparsed"] += 1
+            if self.skip_unparsed:
+                return
+        else:
+            self.counters["parsed"] += 1
+        self.queue.put(SerialLine(received_at, line, parsed, self.tag))
@@ -0,0 +1,142 @@
+"""
+엣지 ↔ 게이트웨이/로거 고정 길이 바이너리 프레임 (struct, 미리 컴파일한 Struct).
+
+기존 형식은 ASCII CSV였다: LoRa payload 'ts,t,h,n_skip,hash' (약 40바이트)와 엣지 시리얼 로그 10필드 줄.
+받는 쪽은 split(",")과 float()/int()로 필드마다 파싱했다. 프레임은 필드 위치가 고정이고 CRC가 있으므로
+Struct.unpack 한 번 + crc_hqx로 디코드한다.
+
+공통 헤더: magic 0xA5 | version u8 | type u8 | flags u8 | node id u16 | seq u16   (little-endian)
+  READING  (LoRa uplink, 28 B)   ts_ms u64 | t i16 (x100) | h u16 (x100) | n_skip u16 | state hash u32 | crc u16
+           flags & FLAG_TWIN이 없으면 n_skip/hash는 0이고 디코드 결과는 None
+  EDGE_LOG (엣지 USB 로그, 35 B) t i16 | h u16 | pred_t i16 | pred_h u16 (x100) | err_t u16 | err_h u16 (x1000)
+           | status u8 (STATUS_NAMES 인덱스) | inference_time_us u32 | free_heap u32 | total_heap u32 | crc u16
+  crc: CRC-16/CCITT-FALSE (poly 0x1021, init 0xFFFF) — 앞 바이트 전체, big-endian으로 붙임
+       → 프레임 전체의 crc_hqx(frame, 0xFFFF)가 0이면 정상 (C 호출 한 번, 슬라이스 없음)
+  고정소수점: roundf(v * scale), 범위 밖은 포화, NaN은 i16 -32768 / u16 0xFFFF (디코드 시 NaN)
+
+시리얼 전송: 줄 단위 경로(gateway_edge.ino → 'Received: ...', 엣지 USB 로그)를 그대로 쓰도록
+프레임을 'F:<대문자 hex>' 한 줄로 보낸다 (bytes.fromhex는 C 구현이라 hex 변환 비용은 작음).
+제어 메시지(부팅 ping '0.0,0.0', delta 'D,...')와 구형 스케치의 CSV는 텍스트 그대로다.
+"""
+import binascii
+import math
+import struct
+from collections import namedtuple
+
+MAGIC = 0xA5
+VERSION = 1
+TYPE_READING = 1
+TYPE_EDGE_LOG = 2
+FLAG_TWIN = 0x01
+FRAME_PREFIX = "F:"
+
+STATUS_NAMES = ("SKIP", "SEND & TRAIN", "HEARTBEAT", "RESYNC")
+STATUS_CODES = {name: code for code, name in enumerate(STATUS_NAMES)}
+
+_HEAD = "<BBBBHH"
+_READING_BODY = struct.Struct(_HEAD + "QhHHI")
+_EDGE_LOG_BODY = struct.Struct(_HEAD + "hHhHHHBIII")
+_CRC = struct.Struct(">H")
+READING_SIZE = _READING_BODY.size + _CRC.size  # 28
+EDGE_LOG_SIZE = _EDGE_LOG_BODY.size + _CRC.size  # 35
+# 디코드용: 헤더 3바이트는 prefix 비교로 확인하고 crc는 읽지 않음
+_READING = struct.Struct("<3xBHHQhHHI2x")
+_EDGE_LOG = struct.Struct("<4xHHhHhHHHBIII2x")
+_READING_PREFIX = bytes((MAGIC, VERSION, TYPE_READING))
+_EDGE_LOG_PREFIX = bytes((MAGIC, VERSION, TYPE_EDGE_LOG))
+_NAN = math.nan
+
+I16_NAN = -0x8000
+U16_NAN = 0xFFFF
+
+Reading = namedtuple("Reading", "node seq timestamp_ms t h n_skip state_hash")
+EdgeLog = namedtuple("EdgeLog", "node seq actual_t actual_h pred_t pred_h error_t error_h status "
+                                "inference_time_us free_heap total_heap")
+
+
+class FrameError(ValueError):
+    """프레임 길이·magic·version·type·CRC 오류."""
+
+
+def crc16(data):
+    return binascii.crc_hqx(data, 0xFFFF)
+
+
+def _round(x):
+    # C roundf (0.5는 0에서 먼 쪽) — Python round()는 짝수 쪽
+    return math.copysign(math.floor(abs(x) + 0.5), x)
+
+
+def to_i16(v, scale):
+    if v != v:
+        return I16_NAN
+    return int(min(max(_round(v * scale), -0x7FFF), 0x7FFF))
+
+
+def to_u16(v, scale):
+    if v != v:
+        return U16_NAN
+    return int(min(max(_round(v * scale), 0), U16_NAN - 1))
+
+
+def _seal(body):
+    return body + _CRC.pack(crc16(body))
+
+
+def encode_reading(node, seq, timestamp_ms, t, h, n_skip=None, state_hash=None):
+    twin = n_skip is not None and state_hash is not None
+    return _seal(_READING_BODY.pack(MAGIC, VERSION, TYPE_READING, FLAG_TWIN if twin else 0, node, seq & 0xFFFF,
+                                    timestamp_ms, to_i16(t, 100), to_u16(h, 100), n_skip if twin else 0,
+                                    state_hash if twin else 0))
+
+
+def encode_edge_log(node, seq, actual_t, actual_h, pred_t, pred_h, error_t, error_h, status, inference_time_us,
+                    free_heap, total_heap):
+    return _seal(_EDGE_LOG_BODY.pack(MAGIC, VERSION, TYPE_EDGE_LOG, 0, node, seq & 0xFFFF,
+                                     to_i16(actual_t, 100), to_u16(actual_h, 100), to_i16(pred_t, 100),
+                                     to_u16(pred_h, 100), to_u16(error_t, 1000), to_u16(error_h, 1000),
+                                     STATUS_CODES[status], inference_time_us, free_heap, total_heap))
+
+
+def _check(buf, size, prefix):
+    if len(buf) != size or buf[:3] != prefix:
+        raise FrameError(f"bad frame (length {len(buf)}, header {bytes(buf[:3]).hex()})")
+    if crc16(buf):
+        raise FrameError("frame CRC mismatch")
+
+
+def decode_reading(buf):
+    """28바이트 → Reading. 오류는 FrameError."""
+    _check(buf, READING_SIZE, _READING_PREFIX)
+    flags, node, seq, ts, t, h, n_skip, state_hash = _READING.unpack(buf)
+    if not flags & FLAG_TWIN:
+        n_skip = state_hash = None
+    return Reading(node, seq, ts, _NAN if t == I16_NAN else t / 100, _NAN if h == U16_NAN else h / 100, n_skip,
+                   state_hash)
+
+
+def decode_edge_log(buf):
+    """35바이트 → EdgeLog. 오류는 FrameError."""
+    _check(buf, EDGE_LOG_SIZE, _EDGE_LOG_PREFIX)
+    node, seq, t, h, pt, ph, et, eh, status, inference_us, free_heap, total_heap = _EDGE_LOG.unpack(buf)
+    if status >= len(STATUS_NAMES):
+        raise FrameError(f"unknown status code {status}")
+    return EdgeLog(node, seq, _NAN if t == I16_NAN else t / 100, _NAN if h == U16_NAN else h / 100,
+                   _NAN if pt == I16_NAN else pt / 100, _NAN if ph == U16_NAN else ph / 100,
+                   _NAN if et == U16_NAN else et / 1000, _NAN if eh == U16_NAN else eh / 1000,
+                   STATUS_NAMES[status], inference_us, free_heap, total_heap)
+
+
+def to_line(frame):
+    """프레임 → 시리얼 한 줄 'F:<hex>' (줄바꿈 없음)."""
+    return FRAME_PREFIX + frame.hex().upper()
+
+
+def from_line(text):
+    """'F:<hex>' → 프레임 bytes. 'F:'로 시작하지 않으면 None, hex 오류는 FrameError."""
+    if not text.startswith(FRAME_PREFIX):
+        return None
+    try:
+        return bytes.fromhex(text[2:])
+    except ValueError as e:
+        raise FrameError(f"bad frame hex: {e}") from None
@@ -1,9 +1,12 @@
-import serial
-import time
-import csv
 import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.log_writer import LogWriter, RAW_LOG_COLUMNS
+from common.serial_ingest import SerialReader, open_serial, parse_raw_line
+
 # ==========================================
 # 1. 설정 (포트와 파일명)
 # ==========================================
@@ -12,55 +15,43 @@ BAUD_RATE = 115200
 CSV_FILENAME = 'raw_24h_dataset.csv'
 
 # ==========================================
-# 2. CSV 헤더 초기화
+# 2. CSV 로그 (파일 핸들 1개 유지, 최대 1초 분량만 버퍼 — 새 파일이면 헤더 기록)
 # ==========================================
-if not os.path.exists(CSV_FILENAME):
-    with open(CSV_FILENAME, mode='w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(["Timestamp", "Time_n", "Temperature", "Humidity"])
+log = LogWriter(CSV_FILENAME, RAW_LOG_COLUMNS)
 
 # ==========================================
 # 3. 시리얼 연결 및 수집 루프
 # ==========================================
 try:
-    ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=1)
-    ser.flush()
+    ser = open_serial(SERIAL_PORT, BAUD_RATE)
     print(f"✅ Serial Connected: {SERIAL_PORT}")
     print(f"✅ Logging data to '{CSV_FILENAME}' (Press Ctrl+C to stop)")
 except Exception as e:
     print(f"❌ Serial Port Error: {e}")
+    log.close()
     exit()
 
+# reader 스레드가 줄 단위로 받아 "t,h"만 넘겨줌 (숫자가 아닌 이상한 문자열은 버림)
+reader = SerialReader(ser, parse_raw_line, skip_unparsed=True)
+
 try:
-    while True:
-        if ser.in_waiting > 0:
-            line = ser.readline().decode('utf-8', errors='ignore').strip()
-            
-            # ESP32에서 "20.5,45.2" 형태로 데이터가 온다고 가정
-            if "," in line:
-                try:
-                    parts = line.split(",")
-                    cur_t = float(parts[0])
-                    cur_h = float(parts[1])
-                    
-                    # 현재 라스베이거스 시간 및 time_n 계산
-                    now = datetime.now()
-                    time_n = ((now.hour * 3600) + (now.minute * 60) + now.second) / 86400.0
-                    timestamp_str = now.strftime('%Y-%m-%d %H:%M:%S')
+    # ESP32에서 "20.5,45.2" 형태로 데이터가 온다고 가정
+    for item in reader:
+        cur_t, cur_h = item.parsed
+
+        # 현재 라스베이거스 시간 및 time_n 계산 (줄 수신 시각 기준)
+        now = datetime.fromtimestamp(item.received_at)
+        time_n = ((now.hour * 3600) + (now.minute * 60) + now.second) / 86400.0
+        timestamp_str = now.strftime('%Y-%m-%d %H:%M:%S')
+
+        # CSV 버퍼에 한 줄 추가 (파일 쓰기는 LogWriter가 모아서)
+        log.append([timestamp_str, f"{time_n:.4f}", f"{cur_t:.2f}", f"{cur_h:.2f}"])
 
-                    # CSV 파일에 한 줄 쓰기
-                    with open(CSV_FILENAME, mode='a', newline='') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([timestamp_str, f"{time_n:.4f}", f"{cur_t:.2f}", f"{cur_h:.2f}"])
-                    
-                    print(f"[{timestamp_str}] Logged -> Temp: {cur_t:.2f}C, Hum: {cur_h:.2f}%")
-                    
-                except ValueError:
-                    # 숫자가 아닌 이상한 문자열이 들어오면 무시
-                    pass
-        
-        time.sleep(0.1)
+        print(f"[{timestamp_str}] Logged -> Temp: {cur_t:.2f}C, Hum: {cur_h:.2f}%")
 
 except KeyboardInterrupt:
     print("\n🛑 Data Logging Stopped.")
-    ser.close()
\ No newline at end of file
+finally:
+    reader.close()
+    ser.close()
+    log.close()
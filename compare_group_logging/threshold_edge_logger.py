@@ -1,9 +1,12 @@
-import serial
-import time
-import csv
 import os
+import sys
 from datetime import datetime
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from common.log_writer import LogWriter, THRESHOLD_LOG_COLUMNS
+from common.serial_ingest import SerialReader, open_serial, parse_raw_line
+
 # ==========================================
 # 1. 환경 설정 (임계값 전용)
 # ==========================================
@@ -16,12 +19,9 @@ BETA_HUM = 3.0
 HEARTBEAT_MINS = 10
 
 # ==========================================
-# 2. CSV 헤더 초기화
+# 2. CSV 로그 (파일 핸들 1개 유지, 최대 1초 분량만 버퍼 — 새 파일이면 헤더 기록)
 # ==========================================
-if not os.path.exists(CSV_FILENAME):
-    with open(CSV_FILENAME, mode='w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(["Timestamp", "Time_n", "Event", "Actual_T", "Actual_H", "Pred_T", "Pred_H", "Error_T", "Error_H", "Total_TX"])
+log = LogWriter(CSV_FILENAME, THRESHOLD_LOG_COLUMNS)
 
 # ==========================================
 # 3. 상태 변수
@@ -32,81 +32,73 @@ total_tx = 0
 minute_counter = 0
 
 try:
-    ser = serial.Serial(SERIAL_PORT, BAUD_RATE, timeout=1)
-    ser.flush()
+    ser = open_serial(SERIAL_PORT, BAUD_RATE)
     print(f"✅ [THRESHOLD MODE] Serial Connected: {SERIAL_PORT}")
     print(f"✅ Logging to: {CSV_FILENAME}")
 except Exception as e:
     print(f"❌ Serial Port Error: {e}")
+    log.close()
     exit()
 
+# reader 스레드가 줄 단위로 받아 "t,h"만 넘겨줌
+reader = SerialReader(ser, parse_raw_line, skip_unparsed=True)
+
 try:
-    while True:
-        if ser.in_waiting > 0:
-            line = ser.readline().decode('utf-8', errors='ignore').strip()
-            
-            if "," in line:
-                try:
-                    parts = line.split(",")
-                    cur_t = float(parts[0])
-                    cur_h = float(parts[1])
-                    
-                    now = datetime.now()
-                    time_n = ((now.hour * 3600) + (now.minute * 60) + now.second) / 86400.0
-                    timestamp_str = now.strftime('%Y-%m-%d %H:%M:%S')
-
-                    # 초기값 세팅 (최초 1회)
-                    if pred_t == -100.0:
-                        pred_t, pred_h = cur_t, cur_h
-
-                    # 오차 계산 (마지막 전송값 vs 현재값)
-                    err_t = abs(cur_t - pred_t)
-                    err_h = abs(cur_h - pred_h)
-
-                    # ESP32에서 1분마다 데이터가 들어오므로 카운터 1 증가
-                    minute_counter += 1 
-
-                    # ==========================================
-                    # 4. 임계값 전송 조건 판단
-                    # ==========================================
-                    send_data = False
-                    
-                    if (err_t > BETA_TEMP) or (err_h > BETA_HUM) or (minute_counter >= HEARTBEAT_MINS):
-                        send_data = True
-
-                    # ==========================================
-                    # 5. 이벤트 처리 및 기록
-                    # ==========================================
-                    if send_data:
-                        event = "RX"
-                        total_tx += 1
-                        minute_counter = 0  # 전송했으므로 하트비트 타이머 초기화
-                        pred_t, pred_h = cur_t, cur_h  # 기준값 갱신
-                        print(f"[{timestamp_str}] 🚀 {event} (TX: {total_tx}) | Err_T: {err_t:.1f}, Err_H: {err_h:.1f}")
-                    else:
-                        event = "EST"
-                        print(f"[{timestamp_str}] 💤 {event} (SKIP) | Err_T: {err_t:.1f}, Err_H: {err_h:.1f}")
-
-                    with open(CSV_FILENAME, mode='a', newline='') as f:
-                        writer = csv.writer(f)
-                        writer.writerow([
-                            timestamp_str, 
-                            f"{time_n:.4f}", 
-                            event, 
-                            f"{cur_t:.2f}", 
-                            f"{cur_h:.2f}", 
-                            f"{pred_t:.2f}", 
-                            f"{pred_h:.2f}", 
-                            f"{err_t:.2f}", 
-                            f"{err_h:.2f}", 
-                            total_tx
-                        ])
-                    
-                except ValueError:
-                    pass
+    for item in reader:
+        cur_t, cur_h = item.parsed
+
+        now = datetime.fromtimestamp(item.received_at)
+        time_n = ((now.hour * 3600) + (now.minute * 60) + now.second) / 86400.0
+        timestamp_str = now.strftime('%Y-%m-%d %H:%M:%S')
+
+        # 초기값 세팅 (최초 1회)
+        if pred_t == -100.0:
+            pred_t, pred_h = cur_t, cur_h
+
+        # 오차 계산 (마지막 전송값 vs 현재값)
+        err_t = abs(cur_t - pred_t)
+        err_h = abs(cur_h - pred_h)
+
+        # ESP32에서 1분마다 데이터가 들어오므로 카운터 1 증가
+        minute_counter += 1 
+
+        # ==========================================
+        # 4. 임계값 전송 조건 판단
+        # ==========================================
+        send_data = False
         
-        time.sleep(0.1)
+        if (err_t > BETA_TEMP) or (err_h > BETA_HUM) or (minute_counter >= HEARTBEAT_MINS):
+            send_data = True
+
+        # ==========================================
+        # 5. 이벤트 처리 및 기록
+        # ==========================================
+        if send_data:
+            event = "RX"
+            total_tx += 1
+            minute_counter = 0  # 전송했으므로 하트비트 타이머 초기화
+            pred_t, pred_h = cur_t, cur_h  # 기준값 갱신
+            print(f"[{timestamp_str}] 🚀 {event} (TX: {total_tx}) | Err_T: {err_t:.1f}, Err_H: {err_h:.1f}")
+        else:
+            event = "EST"
+            print(f"[{timestamp_str}] 💤 {event} (SKIP) | Err_T: {err_t:.1f}, Err_H: {err_h:.1f}")
+
+        log.append([
+            timestamp_str, 
+            f"{time_n:.4f}", 
+            event, 
+            f"{cur_t:.2f}", 
+            f"{cur_h:.2f}", 
+            f"{pred_t:.2f}", 
+            f"{pred_h:.2f}", 
+            f"{err_t:.2f}", 
+            f"{err_h:.2f}", 
+            total_tx
+        ])
 
 except KeyboardInterrupt:
     print(f"\n🛑 Logging Stopped. Total TX: {total_tx}")
-    ser.close()
\ No newline at end of file
+finally:
+    reader.close()
+    ser.close()
+    log.close()
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+AoII 전송/스킵 정책 오프라인 리플레이 시뮬레이터.
+
+녹화된 시계열(그냥_측정.csv, dataset/Pre_Train_Dataset.csv, edge_log_*.csv 등)을
+MLP_edge_sensor.ino의 loop()와 같은 순서로 재생한다:
+  forward() → 임계값 판정(beta - epsilon, 부팅 후 첫 시간 동기화, heartbeat) → SEND면 update_model() → shift_window(pred)
+동시에 게이트웨이(GatewayMLP) 쪽도 RX/EST 처리 순서대로 재생해 게이트웨이 추정값 기준으로
+TX 횟수, AoII, MAE를 계산한다.
+엣지·게이트웨이 모두 같은 batched float 연산이므로 두 쪽 예측 차이(연산 순서로 인한 drift)는 여기서 재현되지 않는다.
+실제 게이트웨이는 엣지와 비트 단위로 같은 EdgeTwinMLP를 쓰며, 그 일치는 benchmarks/bench_edge_twin.py로 확인한다.
+
+여러 파라미터 조합(beta_temp, beta_hum, heartbeat, lr)을 GatewayMLPPool의 노드로 두고
+매 스텝을 batched 연산 한 번으로 처리하므로 수일치 데이터를 수 초 안에 재생한다.
+
+실행:
+  python edge_node/aoii_replay.py 그냥_측정.csv --beta-temp 0.3 0.5 0.7 --beta-hum 2 3 4 --lr 0.01 0.05
+"""
+import argparse
+import itertools
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "gateway"))
+
+from common.log_writer import read_log
+from gateway_MLP_Logic import GatewayMLP, GatewayMLPPool
+
+DEFAULT_MODEL_PATH = os.path.join(ROOT, "gateway", "mlp_model.bin")
+
+# MLP_edge_sensor.ino 기본값
+EDGE_LR = 0.01
+EDGE_BETA_TEMP = 0.5
+EDGE_BETA_HUM = 3.0
+EDGE_HEARTBEAT_S = 600
+EDGE_EPSILON = 0.001
+
+# 시계열 CSV 컬럼 후보 (소문자 비교)
+_TIME_COLS = ("timestamp",)
+_TEMP_COLS = ("temperature", "actual_t")
+_HUM_COLS = ("humidity", "actual_h")
+
+
+def _pick(columns, candidates, path):
+    lower = {c.lower(): c for c in columns}
+    for cand in candidates:
+        if cand in lower:
+            return lower[cand]
+    raise ValueError(f"{path}: none of {candidates} in columns {list(columns)}")
+
+
+def load_series(path):
+    """CSV/.rec 로그(회전 파일 포함) → (elapsed_s, time_n, temp, hum). 컬럼명은 데이터셋/측정/엣지 로그 형식 모두 허용."""
+    df = read_log(path)
+    col_time = _pick(df.columns, _TIME_COLS, path)
+    col_temp = _pick(df.columns, _TEMP_COLS, path)
+    col_hum = _pick(df.columns, _HUM_COLS, path)
+    df = df[[col_time, col_temp, col_hum]].dropna()
+    ts = pd.to_datetime(df[col_time].astype(str).str.replace("T", " "))
+    time_n = ((ts.dt.hour * 3600 + ts.dt.minute * 60 + ts.dt.second) / 86400.0).to_numpy(np.float32)
+    elapsed_s = (ts - ts.iloc[0]).dt.total_seconds().to_numpy()
+    return elapsed_s, time_n, df[col_temp].to_numpy(np.float32), df[col_hum].to_numpy(np.float32)
+
+
+def param_grid(beta_temp, beta_hum, heartbeat_s, lr):
+    """파라미터 리스트들의 데카르트 곱 → 조합별 1-D 배열 dict."""
+    combos = list(itertools.product(beta_temp, beta_hum, heartbeat_s, lr))
+    cols = np.array(combos, dtype=np.float64).T
+    return {"beta_temp": cols[0], "beta_hum": cols[1], "heartbeat_s": cols[2], "lr": cols[3]}
+
+
+class EdgeTwin:
+    """MLP_edge_sensor.ino loop()의 Python 쌍둥이. 파라미터 조합마다 독립 모델 상태 (batched)."""
+
+    def __init__(self, model, params, epsilon=EDGE_EPSILON):
+        self.params = params
+        self.n = len(params["lr"])
+        self.epsilon = epsilon
+        self.pool = GatewayMLPPool.from_model(model, node_ids=range(self.n))
+        self.last_send_s = np.zeros(self.n)
+        # last_sync_unix == 0: 부팅 후 첫 루프는 시간 동기화를 위해 무조건 SEND (리플레이에서는 ack가 항상 도착)
+        self.synced = np.zeros(self.n, dtype=bool)
+
+    def step(self, now_s, time_n, cur_t, cur_h):
+        """센서 1회 측정 처리. 반환: (send mask, pred (n, 2))."""
+        pred = self.pool.predict()  # forward()
+        err_t = np.abs(cur_t - pred[:, 0])
+        err_h = np.abs(cur_h - pred[:, 1])
+
+        is_heartbeat = (now_s - self.last_send_s) >= self.params["heartbeat_s"]
+        send = ((err_t >= self.params["beta_temp"] - self.epsilon)
+                | (err_h >= self.params["beta_hum"] - self.epsilon)
+                | ~self.synced
+                | is_heartbeat)
+
+        idx = np.flatnonzero(send)
+        if len(idx):
+            self.last_send_s[idx] = now_s
+            self.synced[idx] = True
+            self.pool.online_update(cur_t, cur_h, lr=self.params["lr"][idx], idx=idx)  # update_model()
+        self.pool.shift_window(pred[:, 0], pred[:, 1], time_n)
+        return send, pred
+
+
+class GatewayTwin:
+    """gateway.py 수신 루프의 쌍둥이: RX면 online_update 후 shift, 아니면 EST tick (shift)."""
+
+    def __init__(self, model, params):
+        self.params = params
+        self.pool = GatewayMLPPool.from_model(model, node_ids=range(len(params["lr"])))
+        self.pred = self.pool.predict().copy()  # 시작 시 pred = model.predict()
+
+    def step(self, time_n, actual_t, actual_h, rx):
+        """1분 처리. 반환: 이번 스텝 게이트웨이 추정값 (RX면 실제값, 아니면 예측값)."""
+        estimate = self.pred.copy()
+        idx = np.flatnonzero(rx)
+        if len(idx):
+            estimate[idx, 0] = actual_t
+            estimate[idx, 1] = actual_h
+            self.pool.online_update(actual_t, actual_h, lr=self.params["lr"][idx], idx=idx)
+        self.pool.shift_window(self.pred[:, 0], self.pred[:, 1], time_n)
+        self.pred = self.pool.predict().copy()
+        return estimate
+
+
+def replay(series, params, model_path=DEFAULT_MODEL_PATH, tol_temp=EDGE_BETA_TEMP, tol_hum=EDGE_BETA_HUM):
+    """시계열을 모든 파라미터 조합에 대해 재생하고 조합별 지표 DataFrame 반환.
+
+    AoII: 게이트웨이 추정값 오차가 tol_temp/tol_hum 이상인 동안 증가하는 '틀린 정보의 나이'(분),
+    전 구간 평균. 조합 간 비교를 위해 허용 오차는 조합의 beta와 무관하게 고정.
+    """
+    elapsed_s, time_n, temp, hum = series
+    model = GatewayMLP.from_file(model_path)
+    edge = EdgeTwin(model, params)
+    gateway = GatewayTwin(model, params)
+    n = edge.n
+
+    tx = np.zeros(n, dtype=np.int64)
+    abs_err = np.zeros((n, 2))
+    age_s = np.zeros(n)
+    aoii_sum = np.zeros(n)
+    prev_s = elapsed_s[0]
+
+    # lr가 큰 조합은 온라인 SGD가 발산할 수 있음 → 경고 대신 diverged 컬럼으로 보고
+    with np.errstate(over="ignore", invalid="ignore"):
+        for k in range(len(temp)):
+            now_s, tn, t, h = elapsed_s[k], time_n[k], temp[k], hum[k]
+            send, _ = edge.step(now_s, tn, t, h)
+            estimate = gateway.step(tn, t, h, send)
+
+            tx += send
+            err = np.abs(estimate - (t, h))
+            abs_err += err
+            # NaN(발산) 추정값도 '틀린 정보'로 취급
+            incorrect = ~((err[:, 0] < tol_temp) & (err[:, 1] < tol_hum))
+            age_s = np.where(incorrect, age_s + (now_s - prev_s), 0.0)
+            aoii_sum += age_s
+            prev_s = now_s
+
+    steps = len(temp)
+    out = pd.DataFrame(params)
+    out["tx_count"] = tx
+    out["tx_ratio"] = tx / steps
+    out["mean_aoii_min"] = aoii_sum / steps / 60.0
+    out["mae_temp"] = abs_err[:, 0] / steps
+    out["mae_humidity"] = abs_err[:, 1] / steps
+    out["diverged"] = ~np.isfinite(edge.pool.w1[:n]).all(axis=(1, 2))
+    return out
+
+
+def main():
+    ap = argparse.ArgumentParser(description="AoII transmit/skip policy replay simulator")
+    ap.add_argument("csv", nargs="+", help="재생할 시계열 CSV (여러 개면 각각 재생)")
+    ap.add_argument("--model", default=DEFAULT_MODEL_PATH)
+    ap.add_argument("--beta-temp", type=float, nargs="+", default=[EDGE_BETA_TEMP])
+    ap.add_argument("--beta-hum", type=float, nargs="+", default=[EDGE_BETA_HUM])
+    ap.add_argument("--heartbeat-min", type=float, nargs="+", default=[EDGE_HEARTBEAT_S / 60])
+    ap.add_argument("--lr", type=float, nargs="+", default=[EDGE_LR])
+    ap.add_argument("--tol-temp", type=float, default=EDGE_BETA_TEMP, help="AoII 판정 온도 허용 오차")
+    ap.add_argument("--tol-hum", type=float, default=EDGE_BETA_HUM, help="AoII 판정 습도 허용 오차")
+    ap.add_argument("--out", help="결과 CSV 저장 경로")
+    args = ap.parse_args()
+
+    params = param_grid(args.beta_temp, args.beta_hum, [m * 60 for m in args.heartbeat_min], args.lr)
+    results = []
+    for path in args.csv:
+        series = load_series(path)
+        t0 = time.perf_counter()
+        res = replay(series, params, args.model, args.tol_temp, args.tol_hum)
+        dt = time.perf_counter() - t0
+        span_h = series[0][-1] / 3600.0
+        print(f"\n=== {path}: {len(series[2]):,} steps ({span_h:.1f} h), "
+              f"{len(res)} combos, {dt:.2f} s ===")
+        res.insert(0, "dataset", os.path.basename(path))
+        print(res.drop(columns="dataset").sort_values(["tx_count", "mean_aoii_min"]).to_string(
+            index=False, float_format=lambda v: f"{v:.4g}"))
+        results.append(res)
+    if args.out:
+        pd.concat(results).to_csv(args.out, index=False)
+        print(f"\n결과 저장: {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+여러 엣지(ESP32)를 USB로 동시에 연결해 한 프로세스에서 기록하는 fleet 로거.
+
+edge_serial_logger_0.3/0.5/0.7은 포트 1개씩이라 beta 변형을 비교하려면 프로세스 3개가 각자 CSV를 썼다.
+여기서는 포트마다 SerialReader(전용 스레드, "TIME?" 응답 포함)를 띄우고 모든 reader가 큐 하나를
+공유한다. 메인 스레드는 큐에서 쌓인 줄을 한 번에 꺼내 node_id·variant를 붙여 로그 하나
+(FLEET_LOG_COLUMNS, CSV 또는 .rec)에 묶어서 추가한다. 끊긴 포트는 EDGE_FLEET_RESCAN초마다 다시 열고,
+glob 탐색 모드면 새로 꽂힌 포트도 추가한다.
+
+포트 지정 (우선순위: 인자 > EDGE_FLEET > EDGE_SERIAL_GLOB 탐색)
+  PORT[=NODE_ID[:VARIANT]]   예) /dev/ttyUSB0=edge-a:0.3   (NODE_ID 생략 시 포트 이름)
+  EDGE_FLEET=/dev/ttyUSB0=edge-a:0.3,/dev/ttyUSB1=edge-b:0.5
+  EDGE_SERIAL_GLOB=/dev/ttyUSB*,/dev/ttyACM*   (탐색한 포트의 variant는 EDGE_FLEET_VARIANT)
+
+실행:
+  python edge_node/edge_fleet_logger.py /dev/ttyUSB0=a:0.3 /dev/ttyUSB1=b:0.5 /dev/ttyUSB2=c:0.7
+  EDGE_FLEET_LOG (기본 ./edge_fleet_log.csv, *.rec면 고정 레코드 바이너리 — read_log()로 읽기)
+  EDGE_DB=1이면 MySQL edge_log(node_id, variant 포함)에도 일괄 저장 (server/edge_db.py)
+"""
+import collections
+import glob
+import os
+import queue
+import sys
+import time
+from datetime import datetime, timezone, timedelta
+
+LV_TIMEZONE = timezone(timedelta(hours=-8))
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+_env_path = os.path.join(ROOT, ".env")
+if os.path.isfile(_env_path):
+    with open(_env_path, "r", encoding="utf-8") as _file:
+        for _line in _file:
+            _line = _line.strip()
+            if _line and not _line.startswith("#") and "=" in _line:
+                _k, _v = _line.split("=", 1)
+                _k, _v = _k.strip(), _v.strip()
+                if _k.startswith("EDGE_") or _k.startswith("MYSQL_"):
+                    os.environ[_k] = _v
+
+from common.log_writer import LogWriter, FLEET_LOG_COLUMNS
+from common.serial_ingest import SerialReader, open_serial, parse_edge_line
+from server import edge_db
+
+DEFAULT_GLOB = "/dev/ttyUSB*,/dev/ttyACM*,/dev/tty.usbserial-*"
+RESCAN_S = 5.0
+MAX_BATCH = 1000
+
+
+def parse_port_spec(spec, default_variant=""):
+    """'PORT[=NODE_ID[:VARIANT]]' → (port, node_id, variant)."""
+    port, _, node = spec.strip().partition("=")
+    node_id, _, variant = node.partition(":")
+    return port, node_id or os.path.basename(port), variant or default_variant
+
+
+class FleetLogger:
+    """포트별 SerialReader → 공유 큐 → 행 묶음을 log(LogWriter)와 db_writer(BatchWriter, 선택)에 기록.
+
+    포트가 열리지 않거나 읽기 중 끊기면 그 노드만 down으로 두고 check()에서 다시 연다.
+    """
+
+    def __init__(self, log, time_sync=True, discover=None, default_variant="", verbose=True, db_writer=None):
+        self.log = log
+        self.db_writer = db_writer
+        self.time_sync = time_sync
+        self.discover = discover  # glob 패턴 리스트 (check()마다 새 포트 추가)
+        self.default_variant = default_variant
+        self.verbose = verbose
+        self.queue = queue.Queue()
+        self.nodes = {}  # port -> {"node_id", "variant", "ser", "reader", "error", "reconnects"}
+        self.counters = {"rows": 0, "unparsed": 0, "batches": 0}
+        self.node_rows = collections.Counter()
+
+    # ----------------------------------------------------------- ports
+    def add_port(self, port, node_id=None, variant=None):
+        node = {"node_id": node_id or os.path.basename(port),
+                "variant": self.default_variant if variant is None else variant,
+                "ser": None, "reader": None, "error": None, "reconnects": -1}
+        self.nodes[port] = node
+        self._open(port, node)
+        return node
+
+    def _open(self, port, node):
+        try:
+            ser = open_serial(port)
+        except Exception as e:
+            if str(e) != node["error"]:  # 재시도마다 같은 오류를 반복 출력하지 않음
+                print(f"fleet: {node['node_id']} ({port}) open failed: {e}")
+            node["error"] = str(e)
+            return False
+        node["ser"], node["error"] = ser, None
+        node["reader"] = SerialReader(ser, parse_edge_line, time_sync=self.time_sync, out_queue=self.queue,
+                                      tag=(node["node_id"], node["variant"]), verbose=False)
+        if self.time_sync:
+            node["reader"].send_time()
+        node["reconnects"] += 1
+        print(f"fleet: {node['node_id']} ({port}, variant {node['variant'] or '-'}) connected")
+        return True
+
+    def _drop(self, port, node):
+        if node["reader"] is not None:
+            node["reader"].close()
+        if node["ser"] is not None:
+            try:
+                node["ser"].close()
+            except Exception:
+                pass
+        node["ser"] = node["reader"] = None
+
+    def check(self):
+        """끊긴(또는 처음에 못 연) 포트 재연결 + glob 탐색으로 새 포트 추가."""
+        for port, node in self.nodes.items():
+            if node["reader"] is None or not node["reader"].alive:
+                self._drop(port, node)
+                self._open(port, node)
+        if self.discover:
+            for port in discover_ports(self.discover):
+                if port not in self.nodes:
+                    self.add_port(port)
+
+    @property
+    def connected(self):
+        return sum(1 for n in self.nodes.values() if n["reader"] is not None and n["reader"].alive)
+
+    # ----------------------------------------------------------- rows
+    def _row(self, item):
+        node_id, variant = item.tag
+        (actual_t, actual_h, pred_t, pred_h, error_t, error_h,
+         status, inference_time_us, free_heap, total_heap) = item.parsed
+        now_lv = datetime.fromtimestamp(item.received_at, LV_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S")
+        return [now_lv, node_id, variant, actual_t, actual_h, pred_t, pred_h, error_t, error_h, status,
+                inference_time_us if inference_time_us is not None else "",
+                free_heap if free_heap is not None else "",
+                total_heap if total_heap is not None else ""]
+
+    def drain(self, timeout=1.0):
+        """큐에 쌓인 줄을 최대 MAX_BATCH개 꺼내 log에 한 번에 추가. 추가한 행 수 반환."""
+        try:
+            items = [self.queue.get(timeout=timeout)]
+        except queue.Empty:
+            return 0
+        while len(items) < MAX_BATCH:
+            try:
+                items.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+
+        rows = []
+        for item in items:
+            if item.parsed is None:
+                self.counters["unparsed"] += 1
+                if self.verbose and "," in item.line:
+                    print(f"  [{item.tag[0]}] skip (parse): {item.line[:70]}...")
+                continue
+            row = self._row(item)
+            rows.append(row)
+            self.node_rows[item.tag[0]] += 1
+            if self.db_writer is not None:
+                self.db_writer.submit(edge_db.parsed_row(item.parsed, item.received_at, *item.tag))
+            if self.verbose:
+                print(f"  [{item.tag[0]}/{item.tag[1] or '-'}] [{row[9]}] T={row[3]:.2f} H={row[4]:.2f}")
+        if rows and self.log is not None:
+            self.log.extend(rows)
+        self.counters["rows"] += len(rows)
+        self.counters["batches"] += 1
+        return len(rows)
+
+    def run(self, rescan_s=RESCAN_S, stop=None):
+        """stop(threading.Event) 또는 Ctrl+C까지 기록."""
+        next_check = time.monotonic() + rescan_s
+        while stop is None or not stop.is_set():
+            self.drain(timeout=min(1.0, rescan_s))
+            if time.monotonic() >= next_check:
+                self.check()
+                next_check = time.monotonic() + rescan_s
+
+    def close(self):
+        for port, node in self.nodes.items():
+            self._drop(port, node)
+        while not self.queue.empty():
+            self.drain(timeout=0)
+
+    def summary(self):
+        lines = [f"{'node':<16}{'variant':<9}{'rows':>8}{'reconnects':>12}  port"]
+        for port, n in sorted(self.nodes.items(), key=lambda kv: kv[1]["node_id"]):
+            lines.append(f"{n['node_id']:<16}{n['variant'] or '-':<9}{self.node_rows[n['node_id']]:>8}"
+                         f"{max(n['reconnects'], 0):>12}  {port}")
+        lines.append(f"total rows {self.counters['rows']}, unparsed {self.counters['unparsed']}, "
+                     f"batches {self.counters['batches']}")
+        return "\n".join(lines)
+
+
+def discover_ports(patterns):
+    ports = set()
+    for pattern in patterns:
+        ports.update(glob.glob(pattern.strip()))
+    return sorted(ports)
+
+
+def main():
+    default_variant = os.environ.get("EDGE_FLEET_VARIANT", "")
+    specs = sys.argv[1:] or [s for s in os.environ.get("EDGE_FLEET", "").split(",") if s.strip()]
+    discover = None
+    if not specs:
+        discover = os.environ.get("EDGE_SERIAL_GLOB", DEFAULT_GLOB).split(",")
+        specs = discover_ports(discover)
+        print(f"포트 탐색 ({', '.join(discover)}): {len(specs)}개")
+
+    log_path = os.environ.get("EDGE_FLEET_LOG", "edge_fleet_log.csv")
+    print(f"로그: {log_path}")
+    log = LogWriter(log_path, FLEET_LOG_COLUMNS)
+
+    db_writer = edge_db.open_writer() if edge_db.enabled() else None
+
+    fleet = FleetLogger(log, discover=discover, default_variant=default_variant, db_writer=db_writer)
+    for spec in specs:
+        port, node_id, variant = parse_port_spec(spec, default_variant)
+        fleet.add_port(port, node_id, variant)
+    print(f"Edge Fleet Logger 시작 ({fleet.connected}/{len(fleet.nodes)} 포트 연결). Ctrl+C 종료.")
+
+    try:
+        fleet.run(float(os.environ.get("EDGE_FLEET_RESCAN", RESCAN_S)))
+    except KeyboardInterrupt:
+        print("\n종료.")
+    finally:
+        fleet.close()
+        log.close()
+        if db_writer is not None:
+            db_writer.close()
+            print(f"edge_db: {db_writer.stats()}")
+        print(fleet.summary())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,538 @@
+// 자동 생성 파일 — Pre_train.py 실행 시 갱신됨. 직접 수정하지 말 것.
+#pragma once
+
+#define MLP_MODEL_CHECKSUM 0xD2885624UL
+
+// Scalers
+float x_mean[12] = {11.950084f, 34.80134f, 0.5186181f, 11.951279f, 34.797153f, 0.5187227f, 11.952606f, 34.791897f, 0.5188226f, 11.953801f, 34.78652f, 0.5189265f};
+float x_std[12]  = {5.1932597f, 19.256054f, 0.28762355f, 5.1930637f, 19.255249f, 0.28760818f, 5.1927056f, 19.253008f, 0.28760117f, 5.192256f, 19.250294f, 0.287602f};
+float y_mean[2] = {11.954996f, 34.779583f};
+float y_std[2]  = {5.191553f, 19.243732f};
+
+float W1[12][64] = {
+  {-0.023120653f, 0.17207986f, 0.1302461f, 0.14911577f, -0.10039047f, -0.16545832f, -0.2158884f, 0.18944941f, 0.10879584f, 0.09439562f, -0.13344228f, 0.23151404f, 0.2454195f, -0.151054f, -0.16474985f, -0.14813285f, -0.09178329f, 0.026499482f, -0.09243907f, -0.0903388f, 0.0512711f, -0.21364023f, -0.15067133f, -0.008120634f, -0.10751684f, 0.232886f, -0.17820424f, 0.05448234f, -0.027933992f, -0.19953671f, 0.02340775f, -0.22074501f, -0.13245438f, 0.28265366f, 0.21721433f, 0.017330905f, -0.033916887f, -0.1860449f, 0.12886888f, -0.0638089f, -0.29545674f, -0.018118419f, -0.16354246f, 0.19910304f, -0.060924947f, 0.13757648f, 0.023872444f, -0.08622729f, 0.062675856f, -0.19443113f, 0.2092804f, 0.25945655f, 0.31542787f, 0.21801445f, 0.115876734f, 0.240923f, -0.24452958f, -0.31038666f, -0.23314832f, -0.025750272f, -0.015924023f, -0.045452233f, 0.2854895f, -0.08437484f},
+  {0.000023140321f, -0.00006464268f, -0.11381107f, 0.06971663f, -0.2834536f, 0.209295f, 0.15527393f, -0.14281397f, -0.36853093f, 0.17870581f, 0.055856925f, 0.13284616f, 0.10675487f, -0.2166366f, -0.15059726f, -0.2922445f, 0.12732708f, 0.064031504f, -0.09182913f, -0.2506036f, -0.07307111f, -0.094313726f, 0.13797085f, 0.08831642f, 0.23970155f, -0.024430966f, -0.16139284f, 0.15986314f, 0.22605352f, -0.013430587f, 0.08105352f, -0.0010136947f, -0.051341087f, -0.030868169f, -0.14187147f, -0.172229f, -0.22102316f, 0.030212022f, -0.10437989f, -0.019284794f, 0.1693952f, -0.059851743f, -0.050596513f, 0.15393178f, -0.15506816f, -0.18503447f, -0.05253788f, -0.123351224f, 0.192466f, 0.16490965f, 0.10850322f, 0.17314316f, 0.13834663f, -0.18248704f, 0.19824116f, -0.044263016f, 0.15148021f, 0.17162348f, -0.14232424f, -0.18771781f, -0.21067709f, -0.05370402f, 0.18566497f, 0.2156066f},
+  {-0.24931264f, -0.054673918f, -0.03401263f, -0.2409535f, -0.16703044f, -0.11350158f, 0.23616345f, -0.11849784f, 0.058127422f, 0.10383252f, -0.120850325f, 0.27024168f, 0.26453376f, -0.10527788f, 0.020667475f, -0.1383455f, -0.10385735f, -0.30098027f, 0.10860443f, 0.016834337f, -0.14123507f, -0.1776778f, 0.18981874f, -0.11223092f, -0.16365272f, 0.047796946f, 0.15546213f, -0.14254163f, 0.091633774f, 0.17389257f, -0.1349613f, 0.17616026f, -0.09577914f, 0.04391604f, 0.014988083f, 0.032312322f, -0.3652978f, 0.16668053f, -0.11388872f, -0.19322634f, -0.33151096f, 0.019069755f, 0.038605344f, -0.28942484f, 0.007303911f, -0.034631044f, 0.056083005f, -0.17990795f, 0.26709014f, -0.06278392f, 0.3361401f, -0.18382885f, -0.08891151f, -0.0952765f, 0.28668612f, 0.18314433f, -0.0810586f, 0.020682238f, 0.1412884f, 0.09519284f, 0.07022935f, -0.2732817f, -0.15847953f, 0.25181183f},
+  {0.20341326f, 0.020727932f, -0.03452893f, -0.10546946f, 0.10228003f, 0.1849839f, 0.23818056f, 0.18396161f, 0.0087316455f, -0.18109821f, -0.1839524f, 0.19198833f, 0.07794797f, -0.19348828f, -0.27249748f, 0.04816926f, -0.20234963f, -0.24309325f, -0.11111871f, 0.10443691f, 0.12619591f, -0.13369739f, 0.13064992f, -0.05785918f, -0.06641802f, 0.21744175f, 0.06489547f, 0.1804022f, 0.059380878f, 0.01956959f, -0.2883627f, -0.07179474f, -0.09356391f, -0.11079307f, 0.27602413f, -0.12631828f, 0.16202258f, 0.03484497f, 0.15103854f, 0.059169374f, 0.08899823f, -0.009437746f, -0.20056948f, -0.0089538805f, -0.06761153f, -0.16158934f, 0.21255104f, -0.18409947f, 0.24302647f, 0.2639991f, 0.15086707f, -0.08172593f, -0.2120264f, 0.14759867f, 0.005285433f, 0.20154238f, 0.2440569f, 0.15719666f, -0.10546301f, -0.02231211f, 0.1617572f, -0.13275397f, -0.12173825f, 0.0038574904f},
+  {0.36304379f, 0.13489996f, 0.093186036f, -0.2521181f, 0.075457335f, 0.30361632f, -0.19825114f, 0.069592744f, 0.23267803f, 0.13499331f, 0.11475825f, 0.14695169f, -0.06680197f, -0.06979383f, 0.1275143f, 0.19818936f, 0.1883307f, 0.21942376f, 0.046655506f, 0.01562064f, 0.09489594f, 0.08367509f, 0.17937164f, 0.18651742f, 0.21290006f, -0.038496025f, -0.020337055f, -0.1813229f, 0.108752936f, -0.3049374f, -0.060909964f, 0.005129079f, -0.15565915f, 0.10632203f, -0.10856371f, -0.16965209f, 0.21141003f, -0.10950129f, -0.20879866f, -0.038332723f, 0.08358826f, -0.23733294f, 0.07810814f, -0.21995188f, -0.23680674f, -0.048775896f, 0.09609924f, 0.08726549f, 0.09077314f, 0.25262287f, 0.06985269f, -0.111004345f, 0.19693853f, -0.037700914f, -0.096784025f, -0.34723413f, -0.25990427f, 0.19375703f, 0.14633715f, 0.11732589f, -0.08946168f, -0.17120712f, -0.14868319f, -0.067254506f},
+  {0.056120515f, 0.08641682f, 0.06714256f, -0.11366992f, 0.20906004f, 0.2260443f, -0.0021349099f, -0.027623886f, 0.058904905f, -0.14552677f, -0.1292881f, 0.12997638f, -0.21162385f, -0.13251093f, -0.16847941f, -0.25193202f, 0.15955661f, 0.084812954f, 0.07806672f, -0.27817425f, 0.060695793f, 0.005383265f, -0.21923126f, -0.008207158f, -0.061646998f, 0.05577317f, 0.040090796f, -0.25478756f, -0.11957301f, 0.110831775f, 0.024164068f, 0.20571572f, 0.0921867f, -0.18642345f, -0.2621729f, 0.08808163f, -0.3552339f, 0.03427761f, 0.21005052f, 0.03385709f, -0.1145219f, 0.062182255f, -0.07635685f, -0.00448802f, 0.25976515f, -0.01728835f, 0.16092938f, 0.23369375f, -0.079612985f, -0.23034404f, -0.17793414f, -0.3103409f, -0.15790913f, 0.21305512f, -0.19997351f, -0.13487695f, 0.21987906f, -0.31199723f, 0.083123684f, -0.011521278f, -0.18643177f, 0.02122862f, 0.13522907f, 0.19129466f},
+  {0.12067443f, 0.17560208f, -0.014112924f, -0.1294913f, 0.09709738f, 0.15491077f, 0.30949172f, 0.0002819039f, -0.14294712f, 0.20456992f, -0.10596894f, 0.27068007f, 0.14470077f, 0.03525469f, 0.07142088f, 0.11133684f, -0.1637711f, 0.12158406f, -0.0614243f, 0.26006407f, -0.11065822f, 0.2502946f, -0.011055794f, -0.15725765f, 0.31213757f, -0.115465075f, -0.12567595f, 0.24481298f, 0.18533832f, -0.0010078095f, 0.080027066f, -0.06764621f, -0.10241078f, -0.088449016f, 0.13274969f, 0.12639555f, 0.06856838f, 0.11356277f, -0.2126384f, 0.07217024f, -0.16482885f, 0.021955801f, -0.093242265f, 0.13874102f, -0.032600183f, -0.1715588f, -0.09920224f, 0.13180505f, 0.07988633f, -0.19327402f, -0.1853505f, 0.077448346f, -0.2502409f, 0.092248596f, 0.07656455f, -0.32085627f, -0.2329208f, 0.24217087f, -0.0551264f, -0.0530956f, 0.15811028f, 0.21879359f, 0.24491636f, 0.10753758f},
+  {0.053846996f, -0.19793385f, 0.16863248f, 0.065894455f, -0.10894089f, 0.21483335f, -0.20331942f, 0.01573121f, -0.263485f, -0.015889673f, -0.2829783f, -0.22373241f, -0.18946968f, 0.12904769f, 0.17152703f, 0.03349513f, 0.24045923f, -0.03959595f, -0.023715802f, 0.15946378f, -0.22020157f, 0.23780525f, -0.2092703f, 0.19195427f, -0.3052157f, 0.26249364f, -0.013490136f, 0.26579523f, -0.156942f, -0.04582462f, 0.2558293f, 0.00017500405f, 0.13327076f, 0.13244414f, -0.006793094f, 0.119932085f, 0.12679192f, 0.16212177f, -0.34104377f, -0.17074613f, 0.18095775f, 0.26091844f, 0.0011303934f, 0.02771115f, -0.08521496f, -0.3145249f, -0.031173503f, -0.0655672f, 0.0073882374f, -0.26940054f, 0.2626121f, 0.25536892f, 0.16205248f, -0.04144979f, -0.10609586f, 0.18726507f, 0.07412435f, -0.19947602f, 0.21417774f, 0.20851894f, 0.21111019f, 0.12734489f, 0.12015226f, -0.037883773f},
+  {0.29884142f, 0.19008616f, -0.31862777f, -0.29700184f, -0.118967526f, 0.1478115f, 0.26386133f, -0.13485304f, -0.000047609814f, -0.080865405f, 0.24788308f, 0.13656504f, 0.17409198f, 0.023224259f, -0.032252047f, -0.11976348f, -0.2601623f, 0.23944154f, 0.21082439f, 0.21905093f, 0.303378f, 0.0010413887f, 0.05242529f, 0.19951992f, 0.13892446f, -0.11660396f, -0.04527747f, -0.19490723f, 0.21990348f, 0.14968105f, -0.12995183f, 0.11463308f, 0.073202096f, -0.09757744f, -0.18314281f, 0.058463763f, 0.028480459f, 0.13623613f, -0.0228153f, 0.20022815f, -0.033203293f, 0.06618482f, 0.20774502f, 0.036344092f, -0.24190971f, -0.22745906f, 0.1885895f, 0.074223086f, 0.1160461f, -0.19738974f, -0.28365228f, -0.29739287f, -0.018656446f, 0.07117429f, 0.02639717f, -0.08418813f, 0.1974522f, -0.12528531f, 0.005120618f, 0.2384366f, -0.11025851f, 0.04888351f, 0.21738106f, 0.20055112f},
+  {-0.12569617f, 0.33173862f, -0.076638564f, -0.2833265f, -0.07228804f, 0.25323933f, 0.051566985f, -0.2070961f, 0.13288379f, -0.33108923f, -0.20714734f, -0.13162392f, -0.2958582f, -0.16193263f, -0.38522968f, 0.11092444f, -0.247364f, -0.05733513f, 0.3087006f, 0.10594521f, -0.060374673f, -0.06109822f, -0.27448887f, -0.39499456f, -0.24700673f, -0.2068177f, -0.24417724f, -0.17175543f, -0.21318509f, -0.13362691f, -0.22756259f, -0.17122114f, 0.09816474f, -0.053378407f, -0.54174083f, 0.013500098f, 0.21391928f, -0.41733778f, 0.2698749f, 0.2843262f, -0.2617672f, -0.2445988f, 0.17391637f, 0.25270325f, -0.14014198f, -0.23856306f, -0.22681415f, -0.08137046f, 0.15270762f, -0.19030522f, 0.17053445f, 0.24622104f, -0.2348083f, -0.31255767f, 0.044461597f, 0.14447488f, -0.0439177f, -0.07471325f, -0.13961308f, -0.059671946f, 0.090760246f, -0.07487227f, -0.20232503f, -0.14448719f},
+  {-0.39184254f, -0.26397988f, -0.15383184f, -0.031678546f, -0.43920496f, 0.24225564f, 0.020921485f, 0.2700247f, -0.09911479f, 0.06070035f, -0.30066946f, -0.05232947f, 0.0936954f, 0.12365637f, -0.02687212f, -0.26590365f, -0.09931372f, -0.056492377f, 0.09381215f, 0.17567527f, -0.06165842f, 0.3174182f, 0.18311742f, -0.14676651f, -0.22273923f, -0.1299722f, -0.17276719f, -0.27501988f, -0.35174382f, -0.21192434f, -0.25172025f, 0.2837359f, -0.3487673f, 0.07293322f, 0.017151896f, 0.45729503f, -0.22485392f, -0.13136713f, 0.39207116f, 0.14341111f, 0.2042244f, -0.18942516f, -0.22105087f, 0.19511357f, 0.18334416f, 0.04653305f, 0.08390284f, -0.11829199f, 0.1741849f, -0.162874f, -0.05466833f, 0.033118017f, 0.07451269f, -0.24281663f, -0.3598704f, 0.039443627f, -0.096874654f, 0.110667765f, -0.24349181f, 0.02075392f, -0.0062914784f, -0.24630797f, -0.074496366f, -0.13822898f},
+  {-0.18994467f, 0.22762161f, -0.22923918f, 0.08560074f, -0.22257794f, 0.06609676f, 0.106448896f, -0.09232061f, -0.006126479f, -0.13164514f, -0.1856021f, 0.1933766f, 0.25778592f, 0.26262847f, -0.21773092f, 0.07710249f, 0.20447138f, -0.14784229f, -0.2346103f, 0.10043934f, 0.06586196f, 0.1368966f, -0.2606096f, 0.15033567f, -0.16030863f, -0.22785144f, -0.17782731f, 0.2242074f, 0.069732524f, 0.086531945f, -0.06829744f, 0.2270773f, -0.035258416f, 0.114217505f, -0.044659544f, -0.16527213f, -0.014970297f, -0.10517043f, 0.14026152f, 0.0074112774f, -0.2534872f, 0.21146245f, -0.028739627f, 0.016483739f, 0.17710349f, 0.07825501f, -0.11035107f, 0.25537884f, 0.18702868f, -0.12700391f, -0.20435736f, 0.06910223f, 0.06934999f, 0.050986465f, 0.26742065f, 0.10745995f, -0.21150446f, -0.15714894f, -0.07164817f, 0.20592673f, -0.30510217f, -0.10574986f, 0.1807902f, 0.10468406f}
+};
+
+float B1[64] = {
+  -0.15761736f, 0.1850801f, -0.37990516f, 0.029979901f,
+  -0.06535471f, -0.1250304f, 0.102090366f, -0.1560177f,
+  -0.17672674f, 0.117828056f, 0.10987076f, 0.05467495f,
+  0.19662243f, 0.06137233f, -0.14856146f, -0.10161546f,
+  -0.09125596f, 0.32561654f, 0.16594622f, -0.055719417f,
+  0.1410118f, 0.25151336f, -0.18124914f, 0.06113465f,
+  -0.05589667f, 0.06375937f, -0.34808412f, 0.17003919f,
+  0.15296774f, 0.08761215f, 0.0863137f, 0.27935624f,
+  0.03742452f, -0.23734039f, 0.1456099f, 0.26763377f,
+  -0.049896833f, 0.23070297f, 0.19365577f, 0.16443111f,
+  0.015623823f, -0.23185799f, 0.29960117f, 0.16561978f,
+  -0.24557081f, 0.2931531f, 0.35554484f, 0.15352589f,
+  0.1078618f, -0.10616588f, -0.2179019f, -0.034699544f,
+  0.3024767f, -0.13129424f, -0.031149885f, -0.069745965f,
+  0.08066431f, 0.19414543f, -0.06430499f, -0.12858208f,
+  0.07307278f, -0.042269f, -0.0015801305f, -0.09013381f
+};
+
+float W2[64][32] = {
+  {-0.24544436f, -0.23544493f, -0.17516884f, 0.21739626f, 0.09308055f, -0.038072202f, 0.054951455f, -0.11273071f, -0.21007743f, -0.1030675f, -0.061620887f, 0.32513157f, -0.25095314f, -0.0038545127f, -0.18114038f, 0.17240857f, 0.092289194f, -0.006577659f, -0.017715318f, 0.03314044f, 0.08789144f, 0.14323038f, -0.12545621f, -0.16635042f, -0.07345051f, -0.07189617f, -0.08055065f, -0.25647676f, 0.10986927f, 0.12613487f, -0.08313172f, 0.15115088f},
+  {-0.059598055f, 0.027470272f, -0.16341634f, -0.14199205f, 0.16660675f, 0.23060966f, -0.024511823f, -0.14089024f, 0.06395258f, -0.0140361395f, -0.28605488f, -0.12028267f, 0.078024715f, 0.100270964f, -0.2166151f, -0.23160018f, -0.11487717f, -0.0109152f, 0.00000000000000000000000000000000000042062133f, -0.28632337f, 0.14452443f, -0.19373529f, 0.056796886f, -0.20274751f, -0.15632726f, -0.26781964f, 0.079746194f, 0.15667738f, 0.18311471f, 0.004682873f, 0.13154803f, -0.14718163f},
+  {-0.04931869f, 0.2889281f, -0.21406686f, -0.030423282f, -0.008690845f, -0.33985075f, -0.28104988f, 0.15680483f, -0.24757269f, 0.081928045f, 0.25168544f, 0.058590997f, -0.5007562f, -0.26234764f, 0.17690895f, 0.0153618995f, -0.042922154f, -0.09012221f, 0.011135931f, -0.19090326f, -0.00803241f, 0.05226408f, 0.17672653f, -0.05472046f, 0.22699745f, 0.21111779f, 0.261944f, -0.0f, -0.19569397f, -0.089522175f, -0.18407695f, 0.035549033f},
+  {0.009799137f, -0.12734474f, -0.23723316f, 0.2778445f, 0.23425683f, 0.032637868f, -0.14861073f, -0.08899607f, -0.20015426f, 0.18179534f, -0.18398954f, -0.08609366f, -0.06997248f, -0.0059173233f, 0.10030512f, 0.1483845f, -0.15831015f, -0.33001652f, -0.13239627f, 0.23364782f, 0.04150554f, 0.035126798f, -0.03535982f, 0.06305562f, -0.14149816f, 0.23919556f, -0.19309518f, -0.06849799f, 0.019660491f, -0.06704f, -0.12985714f, 0.1918186f},
+  {-0.2342376f, -0.04246876f, -0.24549039f, 0.034772888f, -0.07812792f, -0.018506432f, -0.12870695f, -0.1589094f, -0.031063056f, 0.011696573f, 0.11863122f, 0.33795014f, 0.15512179f, -0.08989852f, -0.15952165f, -0.12708186f, 0.0873611f, -0.25381514f, 0.0f, -0.08975886f, 0.12556611f, 0.14900555f, -0.18513186f, -0.19649667f, 0.14406109f, 0.03263316f, 0.10399687f, -0.06933658f, -0.117834404f, 0.3015052f, 0.1544524f, 0.16754767f},
+  {-0.080494456f, 0.051224884f, 0.0006171025f, -0.31443653f, 0.20865735f, -0.18642344f, 0.23966743f, 0.028341534f, -0.14937085f, 0.048646998f, 0.16533895f, 0.110483386f, 0.19465697f, 0.055533864f, 0.078923106f, 0.19037512f, -0.16727427f, 0.031001389f, -0.06031429f, 0.29017395f, 0.2204887f, -0.15048428f, 0.133089f, 0.20578521f, -0.12906985f, -0.02348567f, 0.21493134f, -0.18304347f, 0.10823795f, -0.08407574f, 0.28097442f, 0.21570009f},
+  {0.21808712f, 0.028000468f, 0.18472786f, 0.12627521f, -0.041814473f, 0.1574841f, -0.11754333f, 0.057587568f, -0.11738599f, -0.39668804f, -0.13913211f, 0.09571726f, -0.13510965f, 0.08369909f, -0.15843949f, -0.07396501f, -0.009996257f, -0.04369717f, -0.0f, -0.061130308f, 0.13382632f, 0.100722104f, -0.16222459f, -0.24789414f, 0.22818054f, -0.36989626f, 0.14777267f, -0.021451788f, 0.2122019f, 0.15866159f, 0.2530687f, -0.10964141f},
+  {0.18533882f, -0.029809846f, 0.04757274f, 0.049518194f, 0.25659993f, 0.21118961f, 0.2511727f, 0.02456766f, -0.06726099f, 0.16681638f, -0.11335389f, -0.19071828f, -0.21101648f, -0.2595646f, -0.014208033f, 0.0060871616f, -0.55504495f, -0.40036276f, -0.00000000000000000000000000000000000079905f, -0.18181472f, -0.2332551f, 0.19690152f, -0.08765086f, 0.34712717f, 0.00729241f, -0.06582478f, -0.043345347f, 0.13527024f, 0.17904885f, -0.01928083f, 0.09583126f, -0.06541297f},
+  {0.0950764f, -0.1824682f, 0.23872803f, 0.20574956f, -0.007563935f, 0.07754715f, -0.14771892f, -0.18533646f, -0.22474764f, -0.016874792f, 0.12756209f, 0.008203282f, -0.121785946f, 0.31884307f, 0.27222517f, 0.0884343f, 0.33065253f, -0.28280592f, -0.0f, 0.2235784f, 0.29897118f, -0.0790942f, 0.12328182f, -0.15809852f, -0.16611983f, -0.09727707f, 0.12023022f, 0.037831295f, -0.08662284f, 0.21994744f, 0.06373065f, 0.054560885f},
+  {0.19988379f, 0.24874587f, 0.22881353f, 0.2634422f, 0.099768974f, 0.0018309716f, -0.209652f, -0.021690896f, -0.08732983f, -0.22264397f, 0.13460127f, 0.0023921304f, -0.27684957f, -0.18282677f, 0.14568818f, -0.19159774f, 0.15868253f, 0.0075897384f, -0.015580127f, 0.008797433f, 0.11323537f, -0.072540656f, 0.10108768f, 0.048132457f, -0.08255227f, 0.19747595f, 0.20149362f, 0.04951944f, 0.13303758f, 0.048842296f, 0.13433665f, 0.1639268f},
+  {0.026499225f, 0.103772275f, 0.00007169996f, 0.14896075f, -0.15033722f, 0.19767901f, 0.1603975f, -0.24327095f, 0.15637846f, -0.2055251f, -0.03910561f, 0.116940044f, -0.15089333f, 0.14345677f, 0.18304709f, 0.0012378067f, -0.21947142f, -0.24594015f, 0.03488735f, 0.25221488f, 0.08321527f, -0.08584107f, 0.0016363517f, 0.029423667f, 0.19950914f, -0.15874113f, 0.0988006f, 0.13849564f, 0.204646f, -0.039625645f, 0.067264125f, 0.2877173f},
+  {-0.18457001f, 0.25091475f, 0.09867005f, -0.23217952f, -0.08862911f, 0.05309521f, -0.13852437f, 0.025776058f, -0.14827585f, 0.12799595f, -0.16128543f, 0.18745685f, 0.1635791f, 0.20573254f, 0.15947929f, -0.17930354f, 0.08802868f, -0.30373734f, 0.00000000000000000000000000000000000028330302f, -0.04809977f, -0.0049459767f, 0.059307184f, 0.04499614f, -0.057535917f, -0.06731144f, 0.34917372f, -0.06878649f, -0.04970974f, -0.18816966f, 0.20267712f, 0.0685821f, -0.103353f},
+  {-0.20526922f, 0.15299784f, 0.10065986f, 0.0030941938f, 0.25258794f, -0.23121105f, 0.077009015f, 0.19205771f, -0.061008938f, 0.06974858f, 0.10319853f, -0.14053102f, 0.1319405f, -0.099090695f, 0.27029848f, -0.108620666f, -0.20209134f, -0.12716615f, 0.0f, -0.1020839f, 0.172021f, -0.10538752f, 0.17636155f, -0.112246215f, 0.26902995f, -0.066993065f, 0.10815584f, 0.1297292f, 0.090880945f, 0.08324532f, -0.25062624f, -0.096266374f},
+  {0.12031774f, 0.076516286f, 0.09532612f, -0.015954103f, -0.18211125f, -0.19283858f, 0.1114782f, 0.045861155f, -0.120894305f, -0.1168139f, -0.19169556f, 0.026045619f, 0.0101336f, 0.12823384f, -0.07141403f, -0.002017611f, -0.2895273f, 0.03537998f, -0.05552923f, 0.010820275f, 0.13520476f, -0.050667647f, 0.01574637f, 0.20019376f, 0.16451769f, -0.097313076f, -0.013785112f, -0.1711992f, -0.14485584f, 0.30186838f, -0.0232324f, 0.04774287f},
+  {0.045769498f, 0.1273593f, 0.003601069f, -0.19984768f, -0.050551683f, -0.016663019f, -0.22105493f, -0.029948814f, -0.2485195f, -0.22864987f, -0.015225326f, -0.19813754f, -0.0023026224f, 0.04108747f, 0.20503595f, -0.1290042f, -0.16626637f, -0.2660755f, 0.040745527f, 0.12006047f, -0.34945813f, 0.106953956f, -0.23226823f, 0.044317134f, 0.12921655f, 0.26967236f, 0.0899617f, -0.0f, -0.105876155f, 0.18223742f, -0.19563511f, 0.20856442f},
+  {0.07952823f, 0.13277769f, -0.055564802f, 0.12554808f, 0.017026814f, 0.18365428f, -0.33116728f, -0.15473562f, -0.07474252f, -0.15803377f, 0.21167667f, -0.10684925f, 0.2601097f, -0.04792238f, -0.18406563f, 0.1372589f, 0.17553076f, 0.23017778f, 0.0094038565f, 0.16034953f, -0.11628212f, 0.25041276f, 0.31421605f, 0.095225714f, -0.163761f, 0.2389307f, -0.18039344f, -0.22724189f, -0.11526672f, 0.12392035f, 0.19466673f, 0.1543536f},
+  {0.09926451f, -0.02782529f, -0.08941168f, -0.02493385f, 0.25193596f, -0.23362552f, 0.16487242f, 0.050524015f, -0.048517805f, -0.14994279f, 0.0078526465f, 0.17156312f, 0.19804408f, -0.0622735f, -0.09044704f, 0.038126547f, 0.1788808f, -0.19930917f, 0.03869798f, 0.07097642f, 0.15550256f, -0.086187355f, 0.095745996f, 0.20630209f, -0.096798494f, -0.12713434f, 0.1890323f, -0.14599171f, 0.14068468f, -0.09369674f, -0.084773704f, 0.19504014f},
+  {-0.011144175f, 0.034901667f, 0.008586009f, -0.0155356955f, -0.13487883f, -0.06945349f, 0.26100713f, -0.07300029f, 0.09491573f, -0.08460575f, 0.14184764f, -0.16474317f, 0.27167535f, -0.03466106f, -0.096037686f, -0.19571501f, -0.19259308f, 0.017386107f, -0.080248795f, 0.24446835f, -0.009782168f, -0.13698566f, 0.04231636f, 0.13912745f, -0.09300776f, -0.16172343f, -0.275106f, 0.041278988f, 0.05979493f, -0.122642994f, 0.2440746f, 0.12837926f},
+  {0.19513537f, 0.13625145f, -0.043934442f, -0.30805612f, -0.13128233f, -0.15510295f, 0.066154175f, 0.2828078f, -0.10048714f, -0.107328795f, -0.22341192f, 0.31842726f, -0.01594598f, 0.07465201f, -0.28240278f, -0.3365784f, 0.18605381f, 0.2648694f, -0.0021776268f, 0.41337913f, 0.06319776f, 0.20608595f, -0.073329635f, -0.005696094f, -0.061644275f, -0.014983691f, -0.050907668f, -0.32582152f, -0.042466816f, 0.04586272f, -0.02346851f, 0.013544427f},
+  {0.065141134f, -0.19121346f, 0.13817188f, -0.13218722f, 0.18914205f, -0.22330992f, 0.13112845f, 0.14477499f, 0.14864838f, 0.19507092f, 0.16380256f, 0.081021294f, 0.17789413f, 0.037909754f, -0.28560644f, 0.28331095f, 0.041892182f, -0.23922819f, -0.07006401f, 0.06423026f, 0.002104969f, 0.098441586f, -0.19283597f, 0.15583788f, 0.20790797f, -0.009961079f, 0.29511744f, -0.048962977f, 0.17770734f, 0.0772154f, 0.13677493f, 0.14849113f},
+  {0.23675574f, -0.039899003f, -0.07831346f, 0.020127766f, 0.11227353f, 0.18724099f, 0.20149814f, -0.04676749f, 0.18391374f, -0.2657859f, 0.047539715f, -0.096767314f, -0.15579565f, -0.050909292f, -0.0013932445f, 0.12202678f, -0.033682972f, -0.048510235f, -0.113760956f, -0.042690553f, -0.07037279f, -0.21031749f, 0.01930468f, 0.30827856f, 0.09786424f, -0.10379924f, -0.051749405f, 0.1732566f, -0.008151664f, 0.04414221f, -0.2132754f, 0.105324686f},
+  {-0.043801203f, -0.0058339494f, 0.10082366f, -0.14465398f, 0.093788736f, 0.07659176f, 0.19844379f, 0.16045086f, 0.1882033f, -0.21838492f, -0.11787586f, -0.2551434f, 0.0693005f, 0.15605578f, -0.08633166f, 0.25094616f, -0.25702897f, 0.25028497f, -0.07288508f, -0.15045716f, 0.0062259613f, -0.20873319f, -0.10749866f, -0.056899566f, 0.19133262f, 0.045874584f, -0.12091656f, 0.014512683f, 0.065682404f, -0.19264972f, -0.000057418638f, -0.21930192f},
+  {-0.14114994f, 0.13435665f, -0.10496546f, 0.17874244f, 0.14282168f, -0.23057836f, -0.06251385f, -0.089623f, 0.17248951f, -0.157155f, 0.20566839f, 0.062967986f, -0.41088614f, -0.061361954f, 0.30429012f, 0.102017865f, 0.18930572f, 0.20479618f, -0.0f, -0.3172156f, 0.003762567f, -0.122858375f, 0.20443934f, 0.24782816f, -0.03660929f, -0.07228324f, 0.2358566f, -0.0f, 0.11208671f, -0.10455258f, 0.15255924f, -0.20632789f},
+  {0.034201883f, -0.011350478f, 0.03044074f, -0.11172012f, 0.12299935f, 0.18344358f, -0.1445957f, -0.16647516f, -0.24303862f, 0.05417612f, 0.07070873f, 0.011895063f, -0.10728692f, -0.076288305f, 0.07589197f, -0.0014965136f, 0.22532563f, -0.12056489f, 0.07143174f, -0.044414263f, 0.021914342f, -0.0073340535f, 0.053543277f, 0.25081947f, -0.15562735f, -0.19093421f, 0.12921846f, 0.046630763f, -0.13899867f, -0.21703759f, -0.11682002f, 0.21685706f},
+  {-0.1662505f, -0.10261822f, -0.16717783f, 0.19779082f, -0.2116272f, -0.014318169f, -0.3440509f, 0.16420935f, -0.17223535f, 0.00047045175f, 0.2297732f, 0.0188549f, -0.053012684f, -0.1292468f, -0.023059137f, 0.072585225f, 0.33922532f, 0.29285106f, 0.007967328f, -0.000728611f, 0.021965882f, -0.29441294f, 0.014056365f, 0.24158753f, -0.10289012f, 0.09828528f, -0.064429894f, 0.0017833165f, -0.23494047f, 0.047959566f, 0.20417216f, -0.025740935f},
+  {0.059548043f, 0.1680916f, 0.11523489f, 0.12336808f, -0.036879852f, -0.15866691f, 0.18901348f, 0.13754608f, 0.017979493f, 0.14757612f, 0.05059156f, 0.10116045f, -0.4198193f, 0.10265713f, -0.11433719f, 0.20816252f, 0.09653069f, -0.0036036165f, -0.19786187f, -0.17023888f, -0.458185f, -0.20096827f, -0.2797257f, 0.25548068f, 0.1164543f, -0.09620854f, -0.10642712f, -0.24186864f, -0.046631433f, 0.18973365f, 0.051942147f, 0.09458635f},
+  {0.23300135f, 0.18997082f, -0.10977677f, 0.29389268f, -0.15413222f, 0.09143144f, -0.09058595f, 0.17946832f, 0.10528598f, 0.09852327f, 0.17704558f, -0.08039872f, -0.3241699f, -0.11210539f, -0.14418335f, 0.13596517f, -0.12889427f, 0.2894806f, 0.040703278f, -0.018769674f, -0.14798155f, 0.17990768f, 0.18264803f, 0.050785225f, 0.08884005f, 0.016352542f, -0.01993708f, -0.008356952f, -0.080708936f, -0.13266495f, -0.14508225f, -0.11865112f},
+  {-0.29074025f, -0.15982568f, 0.15245368f, 0.21532606f, 0.24519664f, -0.08160142f, -0.0011511457f, -0.04973048f, -0.060553677f, -0.36469978f, 0.13183644f, -0.09556779f, -0.0659472f, 0.04179266f, -0.08999543f, -0.16987075f, 0.1438354f, -0.06976031f, -0.000000000000000000000000000000000000000098989f, -0.0075827125f, -0.289322f, 0.011835405f, 0.19696632f, -0.06111154f, 0.012564928f, -0.26327705f, -0.15977094f, -0.28892615f, 0.051096343f, -0.036532935f, -0.117569186f, 0.26405814f},
+  {0.092223205f, 0.08988761f, -0.17328897f, 0.13081895f, 0.02219756f, -0.06295006f, -0.14579877f, 0.09959122f, -0.024218302f, -0.29616457f, 0.10491744f, -0.0041536964f, 0.05590454f, 0.08061807f, 0.19036776f, -0.2708929f, 0.009054731f, -0.16116063f, -0.0012050067f, -0.2961503f, 0.11141533f, -0.26300782f, -0.019663045f, -0.09006431f, -0.14361413f, -0.503038f, 0.14617516f, 0.12528172f, 0.18587625f, 0.08913164f, -0.3121363f, 0.19468991f},
+  {-0.046622947f, 0.22116902f, -0.20106636f, -0.00483415f, -0.14735836f, -0.12496088f, 0.19997346f, 0.013022906f, -0.085223205f, -0.12867992f, -0.021728037f, 0.14750224f, 0.19814004f, 0.18262906f, 0.1803877f, -0.08289153f, 0.055416696f, 0.042480204f, -0.10220552f, 0.1777684f, -0.2296191f, 0.253128f, -0.049033225f, 0.14441699f, 0.119905606f, -0.13494965f, 0.06039706f, 0.020926354f, -0.23637214f, 0.046758235f, -0.0947752f, 0.2038792f},
+  {-0.016704373f, 0.110763036f, -0.26068023f, -0.1060208f, 0.13274063f, -0.22384584f, -0.19955358f, -0.23068379f, 0.22434708f, -0.015290584f, -0.043644752f, -0.13454866f, -0.09595906f, 0.10514998f, 0.12318984f, -0.15374802f, -0.17376536f, -0.47514486f, 0.05202751f, 0.1505237f, -0.11648635f, -0.27120602f, -0.24082704f, 0.24559295f, -0.019046044f, 0.16729456f, -0.033299357f, -0.0f, -0.1765891f, -0.13016257f, 0.043520384f, 0.15845382f},
+  {0.09139821f, 0.049127527f, -0.1394251f, 0.23410608f, 0.18222539f, -0.14359556f, 0.281201f, 0.11166808f, 0.041162282f, 0.09430326f, 0.18124422f, 0.07764881f, -0.21667248f, -0.11956131f, 0.26214892f, -0.12634906f, -0.113109f, 0.08449648f, -0.036654405f, 0.039839596f, 0.21215676f, -0.14036256f, -0.24824418f, -0.14165512f, 0.2197826f, 0.017168723f, -0.08761149f, 0.060283784f, 0.128979f, 0.07571463f, 0.25307217f, -0.12355967f},
+  {0.0864728f, -0.022726007f, 0.091751195f, 0.12647678f, 0.11566287f, 0.08943083f, -0.14042445f, -0.017159456f, 0.25496987f, 0.175077f, -0.22952834f, -0.17880629f, -0.11404496f, 0.10728802f, 0.1408794f, -0.17578529f, 0.019919787f, 0.009647631f, 0.08384272f, 0.045890793f, 0.0143883955f, 0.012606791f, -0.1373219f, 0.012251797f, 0.13730715f, 0.14382695f, 0.024661928f, 0.11295899f, -0.19530469f, 0.04246882f, -0.23339884f, -0.032030594f},
+  {0.12454009f, 0.24901141f, -0.18488958f, -0.10867685f, 0.14920841f, -0.0074775466f, 0.0022310545f, 0.10727588f, 0.21052933f, -0.104524404f, -0.069155045f, 0.1359496f, 0.014801793f, -0.32731065f, 0.19101238f, -0.23159793f, 0.19782081f, -0.16367099f, 0.16012959f, 0.034966867f, -0.34945017f, 0.083529964f, -0.0661847f, 0.18402784f, 0.2816171f, -0.110490374f, -0.08101863f, 0.053954568f, 0.1750617f, -0.027677879f, -0.038040187f, -0.0062245145f},
+  {0.12301371f, -0.22134762f, 0.009054775f, 0.16335607f, 0.19989835f, -0.18682598f, 0.1402985f, -0.030753834f, 0.12736742f, -0.13032088f, 0.12398162f, 0.022775574f, -0.013643604f, -0.052937828f, 0.26491743f, 0.20762147f, -0.10762186f, 0.21542077f, 0.0f, -0.39178362f, -0.46150663f, -0.14483199f, 0.08227014f, 0.17159943f, 0.15947399f, -0.02742991f, -0.09462968f, -0.34407213f, -0.045553636f, 0.04898263f, -0.269177f, -0.03735133f},
+  {0.1355587f, 0.19810969f, 0.4006195f, 0.10265405f, 0.23328678f, -0.2227556f, 0.23686084f, 0.19339317f, -0.19326054f, 0.045438882f, 0.09438956f, -0.06521622f, 0.024530984f, -0.033101913f, -0.10376732f, 0.061322168f, -0.24288256f, -0.123067565f, 0.0000000000000000000000000000000000001938471f, 0.30261338f, -0.19980587f, -0.011474937f, -0.13044938f, 0.36395714f, -0.09727269f, 0.15777883f, 0.23308933f, 0.05366581f, -0.22603689f, 0.09538083f, 0.0838046f, -0.08748155f},
+  {-0.18567626f, -0.26468638f, 0.07083253f, 0.06955317f, -0.08065976f, 0.1804276f, 0.09948536f, -0.21939793f, 0.13907295f, -0.33679226f, 0.09880678f, 0.08714985f, 0.2308853f, -0.11757724f, -0.17168806f, -0.15553409f, -0.13546737f, -0.020032696f, -0.000000000000000000000000000000000000000000015f, 0.07579798f, -0.488564f, 0.18165118f, -0.03565135f, 0.1189542f, -0.14081173f, 0.025098486f, -0.19916356f, -0.27577725f, 0.26037878f, -0.03453782f, 0.032211702f, 0.035191737f},
+  {-0.07794523f, 0.24501306f, -0.1276649f, 0.12831159f, 0.2835963f, -0.012708375f, 0.2607413f, -0.1821082f, -0.05845072f, -0.20136625f, 0.16995549f, 0.238624f, -0.1511579f, 0.01887749f, -0.09987969f, 0.07486502f, -0.046595998f, 0.30711418f, 0.030488549f, -0.19037645f, -0.18578933f, -0.15920153f, -0.1860328f, -0.08002764f, 0.22606309f, 0.014121765f, 0.037267987f, -0.23567836f, 0.11449963f, 0.08632867f, -0.20114844f, 0.09836377f},
+  {0.044376124f, -0.16878368f, 0.09028901f, -0.060718417f, -0.08811152f, 0.1966978f, 0.32581124f, 0.12679625f, -0.016339935f, -0.024633832f, -0.04986137f, 0.031081324f, -0.20445064f, -0.023551326f, 0.22244756f, -0.028159548f, -0.26112428f, 0.060455453f, 0.0f, 0.13047455f, -0.17986253f, -0.015284529f, 0.106042385f, 0.11802157f, -0.13455714f, 0.20276813f, 0.20593666f, 0.13311791f, -0.113024734f, -0.053568795f, 0.40237665f, 0.16148038f},
+  {-0.16863254f, -0.18521518f, 0.116817236f, -0.004940429f, 0.073499426f, -0.024159357f, -0.11696092f, 0.21600313f, 0.20690002f, -0.10726354f, 0.06949653f, 0.23143417f, -0.0920942f, -0.0055240015f, -0.10337621f, 0.14790353f, 0.04074889f, 0.0070517357f, 0.0f, -0.12092485f, 0.13862588f, 0.11617065f, -0.1451605f, 0.14988017f, 0.16229475f, -0.114736654f, 0.19963329f, 0.15047482f, -0.08298604f, 0.1524097f, -0.034063805f, -0.26766253f},
+  {-0.15205728f, 0.21480884f, 0.10950595f, -0.15124275f, -0.012197389f, 0.046536326f, -0.2065853f, 0.21280876f, 0.13647984f, -0.16921699f, 0.25086296f, -0.062842175f, 0.23299983f, 0.045964982f, 0.09638327f, -0.15607817f, 0.17095906f, -0.12387029f, -0.15367895f, -0.21442157f, 0.016556578f, 0.016411593f, 0.11722266f, 0.20999618f, -0.17052083f, 0.16327664f, -0.24605022f, 0.11604448f, 0.14733942f, 0.016710978f, 0.1396732f, -0.09612014f},
+  {-0.09500738f, 0.13237587f, -0.096998475f, -0.014228598f, -0.1412544f, 0.10464934f, -0.121575326f, -0.21464077f, -0.07473347f, 0.093985364f, -0.23754768f, -0.09352452f, -0.20697387f, -0.038546655f, -0.054459043f, 0.053235125f, 0.11446267f, 0.26717308f, -0.073141284f, 0.16967335f, 0.12400852f, 0.1844434f, 0.0364319f, -0.2729981f, 0.077932216f, 0.38440666f, 0.12009225f, -0.1857076f, -0.18946357f, 0.2626983f, 0.10341118f, 0.31669006f},
+  {-0.12847629f, 0.080513135f, 0.099005595f, -0.0680559f, -0.09148892f, -0.14789213f, -0.15639217f, 0.02308334f, 0.1414908f, 0.06262804f, 0.13057685f, 0.14133424f, 0.24095386f, 0.107703574f, -0.12770183f, 0.15195034f, 0.09392845f, 0.04070791f, -0.1821474f, 0.064264104f, -0.0530747f, 0.22428899f, -0.021212956f, -0.0612071f, 0.26964498f, -0.29216242f, -0.051738158f, -0.30011868f, 0.111373335f, 0.2091013f, 0.054237206f, 0.18239504f},
+  {-0.08009429f, 0.20273308f, 0.18646348f, 0.103405915f, -0.22577065f, 0.22697854f, 0.20514049f, -0.049202554f, 0.16829889f, -0.019345777f, 0.13600822f, -0.14026715f, 0.13480422f, 0.051255155f, -0.06625693f, -0.07750561f, -0.2915896f, -0.019223254f, -0.0f, -0.028663568f, -0.13708802f, -0.0073597236f, 0.1362999f, -0.1788979f, 0.26877722f, 0.19392164f, 0.12852299f, 0.0073084836f, 0.2648986f, -0.15031135f, -0.10673447f, -0.2090587f},
+  {0.10506048f, -0.18321727f, -0.016758762f, 0.2677134f, 0.19936134f, -0.06700824f, -0.17330049f, 0.11409786f, -0.06337499f, -0.15259084f, -0.11086383f, 0.1506148f, 0.09875464f, 0.12012134f, 0.23668821f, 0.11555225f, -0.026593309f, 0.096270576f, -0.0f, -0.15183872f, 0.16041204f, 0.05648215f, 0.16684589f, -0.0052564177f, 0.101504795f, -0.042861804f, 0.05884081f, 0.17654052f, -0.16151462f, 0.0096366685f, 0.010290727f, -0.04807713f},
+  {-0.05544783f, 0.11344993f, 0.18834852f, 0.102930106f, 0.15934578f, 0.026224779f, 0.15065987f, -0.09021694f, -0.08913796f, -0.06305828f, 0.02391044f, -0.24662262f, -0.081288084f, -0.14051926f, 0.27280858f, -0.04508044f, -0.031609166f, -0.03683951f, 0.035389718f, -0.09435156f, -0.24717395f, 0.004324912f, -0.2961752f, -0.21077162f, -0.09730821f, -0.11549418f, -0.23681425f, -0.16229662f, 0.12535726f, 0.117570415f, -0.014884453f, -0.0341794f},
+  {0.20177671f, 0.0022088015f, -0.1726543f, 0.089449614f, -0.12825601f, -0.11841763f, 0.083833605f, 0.22124802f, -0.04055925f, 0.08821596f, 0.2846945f, -0.19311103f, -0.1706628f, -0.10572754f, 0.009658681f, 0.008232372f, 0.14834729f, 0.14014423f, 0.033430777f, -0.1259858f, 0.15379389f, 0.14320578f, 0.1260951f, -0.16907093f, 0.12359013f, -0.25529188f, -0.132267f, -0.29861197f, -0.014487591f, 0.12120815f, -0.21140407f, -0.054003704f},
+  {-0.01210512f, -0.02206721f, -0.16196778f, -0.03682717f, 0.14824931f, -0.21564803f, -0.14685744f, -0.042214543f, 0.21959138f, 0.060091857f, 0.17702f, 0.02264382f, -0.013004126f, -0.26685145f, 0.12576811f, 0.23321258f, 0.025598545f, 0.26818934f, 0.081414625f, -0.2994547f, 0.2525616f, -0.20015588f, -0.02631094f, -0.11648765f, -0.20257881f, -0.65642035f, -0.10873392f, -0.025498353f, -0.0038759182f, -0.20882893f, -0.17289498f, 0.16325524f},
+  {-0.020553403f, 0.14982393f, 0.1703279f, 0.12263312f, 0.12742144f, -0.08084805f, 0.12497491f, -0.04997652f, -0.16094053f, 0.1933071f, -0.03303022f, 0.1519871f, 0.15949184f, 0.1662096f, 0.22203118f, 0.009692502f, -0.12194476f, 0.08954343f, 0.0f, 0.053488642f, 0.0885334f, 0.11170101f, -0.052584633f, -0.16228953f, 0.014537822f, -0.095533155f, 0.22092599f, -0.10913978f, -0.1709081f, -0.27454504f, 0.12281513f, 0.01825884f},
+  {-0.055314124f, -0.21763885f, -0.02351394f, 0.06219847f, 0.084496506f, 0.057118695f, -0.13001522f, -0.06210277f, 0.2651529f, -0.07662863f, 0.094228536f, -0.20433326f, -0.014455318f, -0.26698393f, 0.02455683f, 0.23310918f, -0.029326051f, -0.01200259f, 0.0000000000000000000000000000000000000444945f, -0.07870284f, -0.27621216f, -0.24865247f, 0.11708179f, -0.01803787f, -0.16260605f, 0.22469836f, -0.094862364f, -0.000000000000000000000000000000000000000246114f, -0.08861081f, 0.2463042f, 0.102118425f, 0.18311217f},
+  {0.2318729f, -0.13176255f, 0.2886168f, 0.08797859f, -0.06009919f, -0.05022539f, -0.047062952f, -0.18080588f, 0.07017481f, -0.04763602f, 0.06967269f, 0.22141925f, -0.060034066f, -0.05137884f, -0.1399762f, -0.117520325f, -0.175076f, 0.054429155f, 0.0f, 0.24721749f, -0.38550085f, -0.026228383f, 0.11173637f, -0.19483891f, -0.0496904f, 0.040532056f, 0.016926179f, 0.019304564f, 0.1896114f, 0.07828901f, 0.080867f, 0.092113435f},
+  {0.027538365f, -0.17429134f, -0.013276579f, -0.18932435f, -0.0283292f, 0.022992285f, -0.12776393f, 0.20619921f, 0.26499522f, -0.06941586f, -0.021750953f, 0.14872393f, -0.18251987f, 0.1756215f, -0.16787963f, 0.13071108f, -0.14712583f, 0.20117097f, 0.000000000000000000000000000000000000000150344f, 0.064691804f, -0.3659877f, 0.39929694f, 0.044367187f, 0.16050296f, 0.11735849f, -0.07132723f, -0.073731616f, -0.13884646f, 0.19048993f, -0.025508527f, 0.052646995f, 0.023328412f},
+  {0.034752402f, 0.20341463f, 0.24655867f, 0.07081027f, 0.18361337f, 0.13669921f, 0.07325008f, 0.2552592f, -0.13650422f, -0.19517976f, 0.19508295f, -0.04923443f, 0.17711726f, 0.17043424f, -0.17695531f, 0.1970929f, -0.045056533f, -0.051203985f, 0.03964113f, 0.25044164f, -0.20942384f, 0.0437265f, 0.080382094f, 0.121792614f, 0.15169145f, -0.19616157f, -0.13529311f, 0.032089096f, 0.12544337f, -0.17195228f, -0.122542396f, 0.25465226f},
+  {-0.20710976f, 0.17954987f, 0.07053978f, 0.18195494f, -0.24767819f, -0.17291325f, 0.10315094f, 0.106573276f, 0.02948813f, -0.31170303f, 0.072620794f, 0.21136373f, 0.0703512f, 0.21971872f, 0.21507505f, -0.14484002f, -0.2979795f, 0.04200928f, 0.000000000000000000000000000000000000000000552f, 0.044034265f, 0.13911648f, -0.19067317f, -0.103429206f, 0.0036232385f, 0.15906283f, -0.031536765f, -0.19301057f, 0.22923885f, 0.11193005f, -0.038993046f, -0.09647505f, 0.23215428f},
+  {0.14263064f, 0.031488586f, -0.24727818f, -0.14507863f, -0.17322059f, 0.0076166904f, -0.17656352f, -0.12701485f, 0.15597887f, 0.038121104f, -0.042729374f, 0.2931945f, -0.13123262f, 0.08319353f, -0.14136098f, -0.09782439f, 0.35830006f, -0.0801413f, 0.0f, -0.3940972f, -0.16238092f, 0.17679597f, -0.049177878f, -0.10271384f, 0.0869343f, -0.11672046f, -0.24895723f, 0.09181378f, -0.08756421f, 0.2054745f, 0.19254914f, 0.20199925f},
+  {0.075668946f, -0.04131781f, -0.09480685f, 0.08978019f, -0.16646032f, 0.025383983f, -0.122680634f, -0.15871555f, 0.018376227f, -0.05261361f, -0.12003279f, -0.049913302f, -0.22657537f, 0.11958272f, -0.26271498f, -0.12703298f, 0.09540563f, -0.37004328f, -0.0f, 0.06945795f, -0.04933912f, 0.11995873f, -0.12517744f, -0.17180386f, -0.13507296f, -0.20806628f, 0.20942728f, -0.114017025f, 0.157075f, 0.1940775f, 0.11773806f, 0.221668f},
+  {-0.09280809f, 0.20910347f, -0.18240766f, 0.0967758f, -0.04373816f, -0.040942512f, 0.024027776f, 0.045196503f, -0.26762217f, -0.2350977f, 0.085793704f, 0.10056188f, 0.38919035f, 0.13343342f, 0.15104508f, 0.082980305f, -0.123891026f, -0.23894994f, 0.09487697f, 0.026042286f, -0.10109237f, -0.06465613f, 0.20394148f, 0.013124342f, -0.046068992f, 0.084456615f, -0.1605459f, 0.03769369f, -0.08799365f, -0.17755133f, 0.21027337f, -0.005681547f},
+  {0.1926367f, 0.16892284f, -0.036611933f, 0.024120305f, -0.0049840007f, 0.11467202f, -0.17584991f, 0.15116695f, 0.025041534f, -0.026652658f, -0.21810357f, 0.099266335f, 0.13343306f, -0.12042531f, 0.07219559f, -0.01754639f, 0.1155987f, 0.039105248f, 0.0f, -0.12564439f, -0.030259779f, -0.189435f, -0.14269832f, 0.035655286f, -0.16712996f, 0.18725187f, -0.16556557f, -0.05576412f, -0.067288205f, -0.34227452f, -0.08634671f, -0.10131946f},
+  {-0.05012942f, -0.032421187f, -0.08787102f, 0.10797491f, -0.23392038f, -0.048158083f, 0.22414587f, 0.0021627836f, 0.04427512f, -0.20162815f, 0.16397695f, 0.1369825f, -0.008045824f, 0.21800958f, -0.16583522f, -0.24587712f, 0.114371575f, 0.15301827f, -0.18068764f, -0.11608477f, -0.17785099f, -0.10712679f, 0.052991733f, 0.019023f, -0.053078555f, -0.1125713f, -0.18283212f, -0.10825705f, 0.036306318f, 0.20729242f, 0.18856445f, -0.21183729f},
+  {0.22155489f, 0.15268584f, 0.105085105f, -0.046846647f, -0.054720726f, -0.13974464f, -0.18936044f, -0.0017956813f, -0.22011065f, 0.12763593f, 0.12177426f, -0.0012341621f, -0.26269734f, 0.21892163f, 0.2393915f, 0.15401006f, 0.2261809f, 0.31940567f, 0.18879698f, -0.288323f, 0.028749794f, -0.17814285f, -0.241819f, -0.1515376f, 0.034248948f, 0.4805196f, 0.12495601f, -0.22554223f, 0.09444499f, 0.073170654f, 0.08351956f, 0.08487765f},
+  {0.024850106f, -0.035737686f, 0.33631864f, -0.18852296f, 0.084722094f, 0.13148499f, 0.17810082f, -0.1142673f, -0.16898616f, -0.2025289f, 0.06382596f, 0.00838062f, -0.18950883f, 0.24625915f, 0.09445951f, -0.009244307f, -0.04242718f, 0.21140942f, 0.000000000000000000000000000000000000000000502f, -0.027771542f, -0.16434117f, 0.020422498f, 0.05501905f, 0.035205986f, -0.27509654f, -0.0024144803f, 0.014203722f, -0.29146793f, -0.25577796f, 0.18420196f, 0.27246624f, 0.07529948f},
+  {0.17446345f, -0.14346775f, 0.10998039f, -0.10664944f, 0.16989732f, 0.27957714f, 0.011156731f, 0.16846773f, 0.042059135f, -0.12830576f, 0.049123812f, 0.06155122f, -0.25800356f, 0.03060646f, 0.24765827f, -0.17470358f, 0.13116197f, 0.17193426f, 0.12374056f, 0.14412113f, 0.0138417445f, 0.17957665f, 0.101487435f, -0.118286684f, 0.037633456f, 0.074418396f, -0.17708412f, 0.049938604f, 0.060283046f, -0.09175129f, -0.049450953f, 0.19905595f},
+  {0.05008012f, -0.27099663f, -0.20748268f, -0.0901663f, 0.1409668f, -0.18069582f, 0.049972154f, -0.18818396f, -0.21639025f, 0.1426417f, 0.13947357f, -0.10756333f, -0.136951f, -0.20092928f, -0.04305779f, 0.054183345f, -0.39933717f, 0.013037421f, -0.0f, 0.18477872f, 0.35058182f, -0.43745434f, 0.03732727f, -0.09143193f, -0.061357893f, -0.11053946f, 0.20506507f, 0.2303854f, 0.014459617f, 0.016649738f, 0.08973808f, 0.036722373f},
+  {0.022030558f, -0.035021804f, 0.029968014f, -0.17889428f, -0.14084387f, 0.17264397f, -0.16029662f, -0.027797466f, -0.23117054f, -0.39707312f, -0.17770304f, -0.17262593f, 0.09623192f, -0.14010435f, 0.25464466f, 0.042425316f, -0.080768526f, -0.010489158f, -0.0030809778f, 0.17470175f, -0.09195521f, -0.17502329f, 0.14577891f, 0.17154601f, 0.24571003f, -0.091941744f, 0.11507378f, -0.023514187f, -0.041481353f, -0.123649746f, -0.07531134f, -0.08966043f}
+};
+
+float B2[32] = {
+  -0.098838985f, 0.22700746f, -0.06628524f, -0.22825308f,
+  -0.15745352f, 0.18120849f, 0.10139322f, 0.034826156f,
+  0.17638019f, 0.18363823f, -0.09095633f, 0.098975495f,
+  0.12958796f, 0.052495062f, -0.12537877f, 0.22002509f,
+  -0.022061206f, -0.09021248f, -0.05099916f, -0.20184514f,
+  -0.2479748f, 0.1013003f, -0.30348358f, 0.0043953746f,
+  0.08109521f, -0.25445458f, 0.1725194f, -0.2359403f,
+  -0.14034146f, -0.06831027f, -0.12820217f, -0.26946554f
+};
+
+float W3[32][2] = {
+  {0.12346716f, 0.35147482f},
+  {-0.26378044f, 0.16131237f},
+  {0.17460167f, 0.29835784f},
+  {-0.13117088f, -0.22141078f},
+  {-0.16599922f, 0.16175662f},
+  {0.25832772f, -0.20435329f},
+  {-0.21009776f, 0.3799732f},
+  {0.13062201f, 0.4409982f},
+  {0.19588087f, -0.17095925f},
+  {0.043461833f, 0.36992976f},
+  {-0.37134603f, 0.054207236f},
+  {0.22716612f, -0.23008233f},
+  {0.24661165f, 0.074176855f},
+  {0.36194167f, -0.37264112f},
+  {-0.25329643f, 0.062204774f},
+  {-0.108660765f, 0.19558129f},
+  {0.2293849f, -0.38478446f},
+  {0.114189036f, 0.14427878f},
+  {-0.012032601f, 0.2599113f},
+  {0.35951975f, -0.20000313f},
+  {0.21800844f, -0.13389038f},
+  {0.4137451f, -0.062119465f},
+  {0.20343362f, 0.2902116f},
+  {-0.19750166f, 0.24833249f},
+  {-0.30294833f, -0.04584283f},
+  {-0.31334692f, 0.48853f},
+  {0.26766327f, 0.20201318f},
+  {0.25692207f, -0.07970759f},
+  {0.3518884f, -0.0098942965f},
+  {-0.10899361f, -0.2605324f},
+  {0.31144097f, 0.21017718f},
+  {-0.0962503f, -0.4258691f}
+};
+
+float B3[2] = {0.25046822f, -0.3618065f};
+
+// ===== 상태 해시 (gateway/edge_twin.py state_hash와 같은 값) =====
+#include <stdint.h>
+#include <string.h>
+#define MLP_HASH_PRIME 0x01000193UL
+
+static inline uint32_t mlp_hash_floats(uint32_t h, const float *v, int n) {
+  for (int i = 0; i < n; i++) {
+    uint32_t w;
+    memcpy(&w, &v[i], sizeof w);
+    if ((w & 0x7F800000UL) == 0x7F800000UL && (w & 0x007FFFFFUL)) w = 0x7FC00000UL;  // NaN
+    h = h * MLP_HASH_PRIME + w;
+  }
+  return h;
+}
+
+// W1, B1, W2, B2, W3, B3 + window (float[n_window]) 순서. SEND 시 forward()에 쓴 상태로 호출.
+uint32_t mlp_state_hash(const float *window, int n_window) {
+  uint32_t h = 0;
+  h = mlp_hash_floats(h, &W1[0][0], sizeof(W1) / sizeof(float));
+  h = mlp_hash_floats(h, B1, sizeof(B1) / sizeof(float));
+  h = mlp_hash_floats(h, &W2[0][0], sizeof(W2) / sizeof(float));
+  h = mlp_hash_floats(h, B2, sizeof(B2) / sizeof(float));
+  h = mlp_hash_floats(h, &W3[0][0], sizeof(W3) / sizeof(float));
+  h = mlp_hash_floats(h, B3, sizeof(B3) / sizeof(float));
+  return mlp_hash_floats(h, window, n_window);
+}
+
+// ===== 가중치 delta 적용 (gateway/weight_delta.py apply_delta와 같은 연산) =====
+#define MLP_DELTA_MAX 8192
+#define MLP_DELTA_HEADER 38
+#define MLP_DELTA_VERSION 1
+
+static inline int mlp_b64_value(char c) {
+  if (c >= 'A' && c <= 'Z') return c - 'A';
+  if (c >= 'a' && c <= 'z') return c - 'a' + 26;
+  if (c >= '0' && c <= '9') return c - '0' + 52;
+  if (c == '+') return 62;
+  if (c == '/') return 63;
+  return -1;
+}
+
+// base64 문자열 → dst (최대 max 바이트). 디코드한 바이트 수, 형식 오류·넘침이면 -1.
+int mlp_b64_decode(const char *src, uint8_t *dst, int max) {
+  int n = 0, len = strlen(src);
+  if (len % 4) return -1;
+  for (int i = 0; i < len; i += 4) {
+    int v[4], pad = 0;
+    for (int k = 0; k < 4; k++) {
+      if (src[i + k] == '=' && i + 4 == len && k >= 2) { v[k] = 0; pad++; continue; }
+      if (pad || (v[k] = mlp_b64_value(src[i + k])) < 0) return -1;
+    }
+    uint32_t w = ((uint32_t)v[0] << 18) | ((uint32_t)v[1] << 12) | ((uint32_t)v[2] << 6) | (uint32_t)v[3];
+    if (n + 3 - pad > max) return -1;
+    dst[n++] = (uint8_t)(w >> 16);
+    if (pad < 2) dst[n++] = (uint8_t)(w >> 8);
+    if (pad < 1) dst[n++] = (uint8_t)w;
+  }
+  return n;
+}
+
+static inline uint32_t mlp_le32(const uint8_t *p) {
+  return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) | ((uint32_t)p[3] << 24);
+}
+
+// delta 항목 하나 (index gap varint + int8). 다음 위치, 형식 오류면 -1.
+static int mlp_delta_entry(const uint8_t *blob, int pos, int n, int *gap, int8_t *q) {
+  int g = 0;
+  for (int shift = 0;; shift += 7) {
+    if (pos >= n || shift > 14) return -1;
+    uint8_t b = blob[pos++];
+    g |= (int)(b & 0x7F) << shift;
+    if (!(b & 0x80)) break;
+  }
+  if (pos >= n) return -1;
+  *gap = g;
+  *q = (int8_t)blob[pos];
+  return pos + 1;
+}
+
+// blob을 W1..B3에 적용. 0: 적용 후 mlp_state_hash(window) == target 해시,
+// -1: 형식 오류 (가중치 그대로), -2: 적용했지만 해시 불일치 (재부팅 필요).
+int mlp_apply_delta(const uint8_t *blob, int n, const float *window, int n_window) {
+  float *params[6] = {&W1[0][0], B1, &W2[0][0], B2, &W3[0][0], B3};
+  const int sizes[6] = {(int)(sizeof(W1) / sizeof(float)), (int)(sizeof(B1) / sizeof(float)),
+                        (int)(sizeof(W2) / sizeof(float)), (int)(sizeof(B2) / sizeof(float)),
+                        (int)(sizeof(W3) / sizeof(float)), (int)(sizeof(B3) / sizeof(float))};
+  int n_params = 0;
+  for (int a = 0; a < 6; a++) n_params += sizes[a];
+  if (n < MLP_DELTA_HEADER || blob[0] != 'W' || blob[1] != 'D' || blob[2] != MLP_DELTA_VERSION) return -1;
+  if (mlp_le32(blob + 4) != MLP_MODEL_CHECKSUM) return -1;
+  uint32_t target = mlp_le32(blob + 8);
+  int count = blob[12] | (blob[13] << 8);
+  float scales[6];
+  memcpy(scales, blob + 14, sizeof scales);
+
+  // 1차: 형식·범위 검사만 (오류면 가중치를 건드리지 않음)
+  int pos = MLP_DELTA_HEADER, idx = -1, gap;
+  int8_t q;
+  for (int e = 0; e < count; e++) {
+    if ((pos = mlp_delta_entry(blob, pos, n, &gap, &q)) < 0) return -1;
+    idx += gap + 1;
+    if (idx >= n_params) return -1;
+  }
+  if (pos != n) return -1;
+
+  // 2차: W[idx] = W[idx] + (float)q * scale (index 오름차순이므로 배열 a는 앞으로만 이동)
+  pos = MLP_DELTA_HEADER;
+  idx = -1;
+  int a = 0, off = 0;
+  for (int e = 0; e < count; e++) {
+    pos = mlp_delta_entry(blob, pos, n, &gap, &q);
+    idx += gap + 1;
+    while (idx >= off + sizes[a]) off += sizes[a++];
+    volatile float step = (float)q * scales[a];  // FMA 축약 방지 (곱 반올림 후 덧셈)
+    params[a][idx - off] = params[a][idx - off] + step;
+  }
+  return mlp_state_hash(window, n_window) == target ? 0 : -2;
+}
+
+// ===== int8 양자화 모델 (gateway/quantized_mlp.py QuantizedMLP와 같은 정수 연산) =====
+#include <stdint.h>
+#include <math.h>
+#define MLP_Q_N_IN 12
+#define MLP_Q_N_H1 64
+#define MLP_Q_N_H2 32
+#define MLP_Q_N_OUT 2
+
+float Q_SCALES[3] = {0.026674502f, 0.036720075f, 0.038572f};
+
+float Q_X_MEAN[12] = {
+  11.950084f, 34.80134f, 0.5186181f, 11.951279f,
+  34.797153f, 0.5187227f, 11.952606f, 34.791897f,
+  0.5188226f, 11.953801f, 34.78652f, 0.5189265f
+};
+
+float Q_IN_MUL[12] = {
+  7.218777f, 1.9468675f, 130.34045f, 7.21905f,
+  1.9469488f, 130.34743f, 7.2195477f, 1.9471754f,
+  130.3506f, 7.220173f, 1.94745f, 130.35022f
+};
+
+int8_t Q_W1[12][64] = {
+  {-5, 40, 31, 35, -24, -39, -51, 44, 26, 22, -31, 54, 58, -35, -39, -35, -22, 6, -22, -21, 12, -50, -35, -2, -25, 55, -42, 13, -7, -47, 5, -52, -31, 66, 51, 4, -8, -44, 30, -15, -69, -4, -38, 47, -14, 32, 6, -20, 15, -46, 49, 61, 74, 51, 27, 56, -57, -73, -55, -6, -4, -11, 67, -20},
+  {0, 0, -27, 16, -66, 49, 36, -33, -86, 42, 13, 31, 25, -51, -35, -69, 30, 15, -22, -59, -17, -22, 32, 21, 56, -6, -38, 37, 53, -3, 19, 0, -12, -7, -33, -40, -52, 7, -24, -5, 40, -14, -12, 36, -36, -43, -12, -29, 45, 39, 25, 41, 32, -43, 46, -10, 36, 40, -33, -44, -49, -13, 44, 51},
+  {-58, -13, -8, -56, -39, -27, 55, -28, 14, 24, -28, 63, 62, -25, 5, -32, -24, -71, 25, 4, -33, -42, 44, -26, -38, 11, 36, -33, 21, 41, -32, 41, -22, 10, 4, 8, -86, 39, -27, -45, -78, 4, 9, -68, 2, -8, 13, -42, 63, -15, 79, -43, -21, -22, 67, 43, -19, 5, 33, 22, 16, -64, -37, 59},
+  {48, 5, -8, -25, 24, 43, 56, 43, 2, -42, -43, 45, 18, -45, -64, 11, -47, -57, -26, 24, 30, -31, 31, -14, -16, 51, 15, 42, 14, 5, -68, -17, -22, -26, 65, -30, 38, 8, 35, 14, 21, -2, -47, -2, -16, -38, 50, -43, 57, 62, 35, -19, -50, 35, 1, 47, 57, 37, -25, -5, 38, -31, -29, 1},
+  {85, 32, 22, -59, 18, 71, -46, 16, 55, 32, 27, 34, -16, -16, 30, 46, 44, 51, 11, 4, 22, 20, 42, 44, 50, -9, -5, -43, 25, -71, -14, 1, -36, 25, -25, -40, 50, -26, -49, -9, 20, -56, 18, -52, -56, -11, 23, 20, 21, 59, 16, -26, 46, -9, -23, -81, -61, 45, 34, 28, -21, -40, -35, -16},
+  {13, 20, 16, -27, 49, 53, -1, -6, 14, -34, -30, 30, -50, -31, -39, -59, 37, 20, 18, -65, 14, 1, -51, -2, -14, 13, 9, -60, -28, 26, 6, 48, 22, -44, -61, 21, -83, 8, 49, 8, -27, 15, -18, -1, 61, -4, 38, 55, -19, -54, -42, -73, -37, 50, -47, -32, 52, -73, 19, -3, -44, 5, 32, 45},
+  {28, 41, -3, -30, 23, 36, 73, 0, -34, 48, -25, 63, 34, 8, 17, 26, -38, 29, -14, 61, -26, 59, -3, -37, 73, -27, -29, 57, 43, 0, 19, -16, -24, -21, 31, 30, 16, 27, -50, 17, -39, 5, -22, 33, -8, -40, -23, 31, 19, -45, -43, 18, -59, 22, 18, -75, -55, 57, -13, -12, 37, 51, 57, 25},
+  {13, -46, 40, 15, -26, 50, -48, 4, -62, -4, -66, -52, -44, 30, 40, 8, 56, -9, -6, 37, -52, 56, -49, 45, -72, 62, -3, 62, -37, -11, 60, 0, 31, 31, -2, 28, 30, 38, -80, -40, 42, 61, 0, 6, -20, -74, -7, -15, 2, -63, 62, 60, 38, -10, -25, 44, 17, -47, 50, 49, 49, 30, 28, -9},
+  {70, 45, -75, -70, -28, 35, 62, -32, 0, -19, 58, 32, 41, 5, -8, -28, -61, 56, 49, 51, 71, 0, 12, 47, 33, -27, -11, -46, 52, 35, -30, 27, 17, -23, -43, 14, 7, 32, -5, 47, -8, 16, 49, 9, -57, -53, 44, 17, 27, -46, -66, -70, -4, 17, 6, -20, 46, -29, 1, 56, -26, 11, 51, 47},
+  {-29, 78, -18, -66, -17, 59, 12, -49, 31, -78, -49, -31, -69, -38, -90, 26, -58, -13, 72, 25, -14, -14, -64, -93, -58, -48, -57, -40, -50, -31, -53, -40, 23, -13, -127, 3, 50, -98, 63, 67, -61, -57, 41, 59, -33, -56, -53, -19, 36, -45, 40, 58, -55, -73, 10, 34, -10, -18, -33, -14, 21, -18, -47, -34},
+  {-92, -62, -36, -7, -103, 57, 5, 63, -23, 14, -70, -12, 22, 29, -6, -62, -23, -13, 22, 41, -14, 74, 43, -34, -52, -30, -41, -64, -82, -50, -59, 67, -82, 17, 4, 107, -53, -31, 92, 34, 48, -44, -52, 46, 43, 11, 20, -28, 41, -38, -13, 8, 17, -57, -84, 9, -23, 26, -57, 5, -1, -58, -17, -32},
+  {-45, 53, -54, 20, -52, 15, 25, -22, -1, -31, -44, 45, 60, 62, -51, 18, 48, -35, -55, 24, 15, 32, -61, 35, -38, -53, -42, 53, 16, 20, -16, 53, -8, 27, -10, -39, -4, -25, 33, 2, -59, 50, -7, 4, 42, 18, -26, 60, 44, -30, -48, 16, 16, 12, 63, 25, -50, -37, -17, 48, -72, -25, 42, 25}
+};
+
+int32_t Q_B1[64] = {
+  -1385, 1627, -3339, 263,
+  -574, -1099, 897, -1371,
+  -1553, 1036, 966, 481,
+  1728, 539, -1306, -893,
+  -802, 2862, 1458, -490,
+  1239, 2210, -1593, 537,
+  -491, 560, -3059, 1494,
+  1344, 770, 759, 2455,
+  329, -2086, 1280, 2352,
+  -439, 2028, 1702, 1445,
+  137, -2038, 2633, 1456,
+  -2158, 2576, 3125, 1349,
+  948, -933, -1915, -305,
+  2658, -1154, -274, -613,
+  709, 1706, -565, -1130,
+  642, -371, -14, -792
+};
+
+int32_t Q_M1[2] = {1703532544, 39};
+
+int8_t Q_W2[64][32] = {
+  {-47, -46, -34, 42, 18, -7, 11, -22, -41, -20, -12, 63, -49, -1, -35, 33, 18, -1, -3, 6, 17, 28, -24, -32, -14, -14, -16, -50, 21, 24, -16, 29},
+  {-12, 5, -32, -27, 32, 45, -5, -27, 12, -3, -55, -23, 15, 19, -42, -45, -22, -2, 0, -55, 28, -37, 11, -39, -30, -52, 15, 30, 35, 1, 25, -28},
+  {-10, 56, -41, -6, -2, -66, -54, 30, -48, 16, 49, 11, -97, -51, 34, 3, -8, -17, 2, -37, -2, 10, 34, -11, 44, 41, 51, 0, -38, -17, -36, 7},
+  {2, -25, -46, 54, 45, 6, -29, -17, -39, 35, -36, -17, -14, -1, 19, 29, -31, -64, -26, 45, 8, 7, -7, 12, -27, 46, -37, -13, 4, -13, -25, 37},
+  {-45, -8, -47, 7, -15, -4, -25, -31, -6, 2, 23, 65, 30, -17, -31, -25, 17, -49, 0, -17, 24, 29, -36, -38, 28, 6, 20, -13, -23, 58, 30, 32},
+  {-16, 10, 0, -61, 40, -36, 46, 5, -29, 9, 32, 21, 38, 11, 15, 37, -32, 6, -12, 56, 43, -29, 26, 40, -25, -5, 42, -35, 21, -16, 54, 42},
+  {42, 5, 36, 24, -8, 30, -23, 11, -23, -77, -27, 19, -26, 16, -31, -14, -2, -8, 0, -12, 26, 19, -31, -48, 44, -72, 29, -4, 41, 31, 49, -21},
+  {36, -6, 9, 10, 50, 41, 49, 5, -13, 32, -22, -37, -41, -50, -3, 1, -107, -77, 0, -35, -45, 38, -17, 67, 1, -13, -8, 26, 35, -4, 19, -13},
+  {18, -35, 46, 40, -1, 15, -29, -36, -43, -3, 25, 2, -24, 62, 53, 17, 64, -55, 0, 43, 58, -15, 24, -31, -32, -19, 23, 7, -17, 43, 12, 11},
+  {39, 48, 44, 51, 19, 0, -41, -4, -17, -43, 26, 0, -54, -35, 28, -37, 31, 1, -3, 2, 22, -14, 20, 9, -16, 38, 39, 10, 26, 9, 26, 32},
+  {5, 20, 0, 29, -29, 38, 31, -47, 30, -40, -8, 23, -29, 28, 35, 0, -42, -48, 7, 49, 16, -17, 0, 6, 39, -31, 19, 27, 40, -8, 13, 56},
+  {-36, 49, 19, -45, -17, 10, -27, 5, -29, 25, -31, 36, 32, 40, 31, -35, 17, -59, 0, -9, -1, 11, 9, -11, -13, 68, -13, -10, -36, 39, 13, -20},
+  {-40, 30, 19, 1, 49, -45, 15, 37, -12, 13, 20, -27, 26, -19, 52, -21, -39, -25, 0, -20, 33, -20, 34, -22, 52, -13, 21, 25, 18, 16, -48, -19},
+  {23, 15, 18, -3, -35, -37, 22, 9, -23, -23, -37, 5, 2, 25, -14, 0, -56, 7, -11, 2, 26, -10, 3, 39, 32, -19, -3, -33, -28, 58, -4, 9},
+  {9, 25, 1, -39, -10, -3, -43, -6, -48, -44, -3, -38, 0, 8, 40, -25, -32, -51, 8, 23, -68, 21, -45, 9, 25, 52, 17, 0, -20, 35, -38, 40},
+  {15, 26, -11, 24, 3, 36, -64, -30, -14, -31, 41, -21, 50, -9, -36, 27, 34, 45, 2, 31, -22, 48, 61, 18, -32, 46, -35, -44, -22, 24, 38, 30},
+  {19, -5, -17, -5, 49, -45, 32, 10, -9, -29, 2, 33, 38, -12, -17, 7, 35, -39, 7, 14, 30, -17, 19, 40, -19, -25, 37, -28, 27, -18, -16, 38},
+  {-2, 7, 2, -3, -26, -13, 50, -14, 18, -16, 27, -32, 53, -7, -19, -38, -37, 3, -16, 47, -2, -27, 8, 27, -18, -31, -53, 8, 12, -24, 47, 25},
+  {38, 26, -9, -60, -25, -30, 13, 55, -19, -21, -43, 62, -3, 14, -55, -65, 36, 51, 0, 80, 12, 40, -14, -1, -12, -3, -10, -63, -8, 9, -5, 3},
+  {13, -37, 27, -26, 37, -43, 25, 28, 29, 38, 32, 16, 34, 7, -55, 55, 8, -46, -14, 12, 0, 19, -37, 30, 40, -2, 57, -9, 34, 15, 26, 29},
+  {46, -8, -15, 4, 22, 36, 39, -9, 36, -51, 9, -19, -30, -10, 0, 24, -7, -9, -22, -8, -14, -41, 4, 60, 19, -20, -10, 34, -2, 9, -41, 20},
+  {-8, -1, 20, -28, 18, 15, 38, 31, 36, -42, -23, -49, 13, 30, -17, 49, -50, 48, -14, -29, 1, -40, -21, -11, 37, 9, -23, 3, 13, -37, 0, -42},
+  {-27, 26, -20, 35, 28, -45, -12, -17, 33, -30, 40, 12, -79, -12, 59, 20, 37, 40, 0, -61, 1, -24, 40, 48, -7, -14, 46, 0, 22, -20, 30, -40},
+  {7, -2, 6, -22, 24, 35, -28, -32, -47, 10, 14, 2, -21, -15, 15, 0, 44, -23, 14, -9, 4, -1, 10, 49, -30, -37, 25, 9, -27, -42, -23, 42},
+  {-32, -20, -32, 38, -41, -3, -67, 32, -33, 0, 44, 4, -10, -25, -4, 14, 66, 57, 2, 0, 4, -57, 3, 47, -20, 19, -12, 0, -45, 9, 40, -5},
+  {12, 33, 22, 24, -7, -31, 37, 27, 3, 29, 10, 20, -81, 20, -22, 40, 19, -1, -38, -33, -89, -39, -54, 49, 23, -19, -21, -47, -9, 37, 10, 18},
+  {45, 37, -21, 57, -30, 18, -18, 35, 20, 19, 34, -16, -63, -22, -28, 26, -25, 56, 8, -4, -29, 35, 35, 10, 17, 3, -4, -2, -16, -26, -28, -23},
+  {-56, -31, 29, 42, 47, -16, 0, -10, -12, -71, 26, -18, -13, 8, -17, -33, 28, -13, 0, -1, -56, 2, 38, -12, 2, -51, -31, -56, 10, -7, -23, 51},
+  {18, 17, -34, 25, 4, -12, -28, 19, -5, -57, 20, -1, 11, 16, 37, -52, 2, -31, 0, -57, 22, -51, -4, -17, -28, -97, 28, 24, 36, 17, -60, 38},
+  {-9, 43, -39, -1, -29, -24, 39, 3, -16, -25, -4, 29, 38, 35, 35, -16, 11, 8, -20, 34, -44, 49, -9, 28, 23, -26, 12, 4, -46, 9, -18, 39},
+  {-3, 21, -50, -21, 26, -43, -39, -45, 43, -3, -8, -26, -19, 20, 24, -30, -34, -92, 10, 29, -23, -52, -47, 48, -4, 32, -6, 0, -34, -25, 8, 31},
+  {18, 10, -27, 45, 35, -28, 54, 22, 8, 18, 35, 15, -42, -23, 51, -24, -22, 16, -7, 8, 41, -27, -48, -27, 43, 3, -17, 12, 25, 15, 49, -24},
+  {17, -4, 18, 24, 22, 17, -27, -3, 49, 34, -44, -35, -22, 21, 27, -34, 4, 2, 16, 9, 3, 2, -27, 2, 27, 28, 5, 22, -38, 8, -45, -6},
+  {24, 48, -36, -21, 29, -1, 0, 21, 41, -20, -13, 26, 3, -63, 37, -45, 38, -32, 31, 7, -68, 16, -13, 36, 54, -21, -16, 10, 34, -5, -7, -1},
+  {24, -43, 2, 32, 39, -36, 27, -6, 25, -25, 24, 4, -3, -10, 51, 40, -21, 42, 0, -76, -89, -28, 16, 33, 31, -5, -18, -67, -9, 9, -52, -7},
+  {26, 38, 78, 20, 45, -43, 46, 37, -37, 9, 18, -13, 5, -6, -20, 12, -47, -24, 0, 59, -39, -2, -25, 70, -19, 31, 45, 10, -44, 18, 16, -17},
+  {-36, -51, 14, 13, -16, 35, 19, -42, 27, -65, 19, 17, 45, -23, -33, -30, -26, -4, 0, 15, -95, 35, -7, 23, -27, 5, -39, -53, 50, -7, 6, 7},
+  {-15, 47, -25, 25, 55, -2, 50, -35, -11, -39, 33, 46, -29, 4, -19, 14, -9, 59, 6, -37, -36, -31, -36, -15, 44, 3, 7, -46, 22, 17, -39, 19},
+  {9, -33, 17, -12, -17, 38, 63, 25, -3, -5, -10, 6, -40, -5, 43, -5, -51, 12, 0, 25, -35, -3, 21, 23, -26, 39, 40, 26, -22, -10, 78, 31},
+  {-33, -36, 23, -1, 14, -5, -23, 42, 40, -21, 13, 45, -18, -1, -20, 29, 8, 1, 0, -23, 27, 22, -28, 29, 31, -22, 39, 29, -16, 29, -7, -52},
+  {-29, 42, 21, -29, -2, 9, -40, 41, 26, -33, 49, -12, 45, 9, 19, -30, 33, -24, -30, -41, 3, 3, 23, 41, -33, 32, -48, 22, 29, 3, 27, -19},
+  {-18, 26, -19, -3, -27, 20, -24, -42, -14, 18, -46, -18, -40, -7, -11, 10, 22, 52, -14, 33, 24, 36, 7, -53, 15, 74, 23, -36, -37, 51, 20, 61},
+  {-25, 16, 19, -13, -18, -29, -30, 4, 27, 12, 25, 27, 47, 21, -25, 29, 18, 8, -35, 12, -10, 43, -4, -12, 52, -57, -10, -58, 22, 40, 10, 35},
+  {-15, 39, 36, 20, -44, 44, 40, -10, 33, -4, 26, -27, 26, 10, -13, -15, -56, -4, 0, -6, -27, -1, 26, -35, 52, 38, 25, 1, 51, -29, -21, -40},
+  {20, -35, -3, 52, 39, -13, -34, 22, -12, -30, -21, 29, 19, 23, 46, 22, -5, 19, 0, -29, 31, 11, 32, -1, 20, -8, 11, 34, -31, 2, 2, -9},
+  {-11, 22, 36, 20, 31, 5, 29, -17, -17, -12, 5, -48, -16, -27, 53, -9, -6, -7, 7, -18, -48, 1, -57, -41, -19, -22, -46, -31, 24, 23, -3, -7},
+  {39, 0, -33, 17, -25, -23, 16, 43, -8, 17, 55, -37, -33, -20, 2, 2, 29, 27, 6, -24, 30, 28, 24, -33, 24, -49, -26, -58, -3, 23, -41, -10},
+  {-2, -4, -31, -7, 29, -42, -28, -8, 42, 12, 34, 4, -3, -52, 24, 45, 5, 52, 16, -58, 49, -39, -5, -23, -39, -127, -21, -5, -1, -40, -33, 32},
+  {-4, 29, 33, 24, 25, -16, 24, -10, -31, 37, -6, 29, 31, 32, 43, 2, -24, 17, 0, 10, 17, 22, -10, -31, 3, -18, 43, -21, -33, -53, 24, 4},
+  {-11, -42, -5, 12, 16, 11, -25, -12, 51, -15, 18, -40, -3, -52, 5, 45, -6, -2, 0, -15, -53, -48, 23, -3, -31, 43, -18, 0, -17, 48, 20, 35},
+  {45, -25, 56, 17, -12, -10, -9, -35, 14, -9, 13, 43, -12, -10, -27, -23, -34, 11, 0, 48, -75, -5, 22, -38, -10, 8, 3, 4, 37, 15, 16, 18},
+  {5, -34, -3, -37, -5, 4, -25, 40, 51, -13, -4, 29, -35, 34, -32, 25, -28, 39, 0, 13, -71, 77, 9, 31, 23, -14, -14, -27, 37, -5, 10, 5},
+  {7, 39, 48, 14, 36, 26, 14, 49, -26, -38, 38, -10, 34, 33, -34, 38, -9, -10, 8, 48, -41, 8, 16, 24, 29, -38, -26, 6, 24, -33, -24, 49},
+  {-40, 35, 14, 35, -48, -33, 20, 21, 6, -60, 14, 41, 14, 43, 42, -28, -58, 8, 0, 9, 27, -37, -20, 1, 31, -6, -37, 44, 22, -8, -19, 45},
+  {28, 6, -48, -28, -34, 1, -34, -25, 30, 7, -8, 57, -25, 16, -27, -19, 69, -16, 0, -76, -31, 34, -10, -20, 17, -23, -48, 18, -17, 40, 37, 39},
+  {15, -8, -18, 17, -32, 5, -24, -31, 4, -10, -23, -10, -44, 23, -51, -25, 18, -72, 0, 13, -10, 23, -24, -33, -26, -40, 41, -22, 30, 38, 23, 43},
+  {-18, 40, -35, 19, -8, -8, 5, 9, -52, -45, 17, 19, 75, 26, 29, 16, -24, -46, 18, 5, -20, -13, 39, 3, -9, 16, -31, 7, -17, -34, 41, -1},
+  {37, 33, -7, 5, -1, 22, -34, 29, 5, -5, -42, 19, 26, -23, 14, -3, 22, 8, 0, -24, -6, -37, -28, 7, -32, 36, -32, -11, -13, -66, -17, -20},
+  {-10, -6, -17, 21, -45, -9, 43, 0, 9, -39, 32, 27, -2, 42, -32, -48, 22, 30, -35, -22, -34, -21, 10, 4, -10, -22, -35, -21, 7, 40, 36, -41},
+  {43, 30, 20, -9, -11, -27, -37, 0, -43, 25, 24, 0, -51, 42, 46, 30, 44, 62, 37, -56, 6, -34, -47, -29, 7, 93, 24, -44, 18, 14, 16, 16},
+  {5, -7, 65, -36, 16, 25, 34, -22, -33, -39, 12, 2, -37, 48, 18, -2, -8, 41, 0, -5, -32, 4, 11, 7, -53, 0, 3, -56, -49, 36, 53, 15},
+  {34, -28, 21, -21, 33, 54, 2, 33, 8, -25, 10, 12, -50, 6, 48, -34, 25, 33, 24, 28, 3, 35, 20, -23, 7, 14, -34, 10, 12, -18, -10, 39},
+  {10, -52, -40, -17, 27, -35, 10, -36, -42, 28, 27, -21, -26, -39, -8, 10, -77, 3, 0, 36, 68, -85, 7, -18, -12, -21, 40, 45, 3, 3, 17, 7},
+  {4, -7, 6, -35, -27, 33, -31, -5, -45, -77, -34, -33, 19, -27, 49, 8, -16, -2, -1, 34, -18, -34, 28, 33, 48, -18, 22, -5, -8, -24, -15, -17}
+};
+
+int32_t Q_B2[32] = {
+  -521, 1196, -349, -1203,
+  -830, 955, 534, 183,
+  929, 968, -479, 521,
+  683, 277, -661, 1159,
+  -116, -475, -269, -1063,
+  -1307, 534, -1599, 23,
+  427, -1341, 909, -1243,
+  -739, -360, -675, -1420
+};
+
+int32_t Q_M2[2] = {1352538240, 38};
+
+int8_t Q_W3[32][2] = {
+  {32, 91},
+  {-69, 42},
+  {45, 78},
+  {-34, -58},
+  {-43, 42},
+  {67, -53},
+  {-55, 99},
+  {34, 115},
+  {51, -44},
+  {11, 96},
+  {-97, 14},
+  {59, -60},
+  {64, 19},
+  {94, -97},
+  {-66, 16},
+  {-28, 51},
+  {60, -100},
+  {30, 38},
+  {-3, 68},
+  {93, -52},
+  {57, -35},
+  {108, -16},
+  {53, 75},
+  {-51, 65},
+  {-79, -12},
+  {-81, 127},
+  {70, 53},
+  {67, -21},
+  {91, -3},
+  {-28, -68},
+  {81, 55},
+  {-25, -111}
+};
+
+int32_t Q_B3[2] = {1688, -2438};
+
+float Q_OUT_MUL[1] = {0.00014837465f};
+
+float Q_Y_MEAN[2] = {11.954996f, 34.779583f};
+
+float Q_Y_STD[2] = {5.191553f, 19.243732f};
+
+static inline int32_t mlp_q_requant(int32_t acc, const int32_t *m_shift) {
+  if (acc <= 0) return 0;
+  int64_t q = ((int64_t)acc * m_shift[0] + ((int64_t)1 << (m_shift[1] - 1))) >> m_shift[1];
+  return q > 127 ? 127 : (int32_t)q;
+}
+
+// window: 원 단위 입력 [MLP_Q_N_IN], pred: 원 단위 예측 [MLP_Q_N_OUT]. 중간값은 mlp_q_* 전역에 남김.
+int8_t  mlp_q_in[MLP_Q_N_IN];
+int32_t mlp_q_acc1[MLP_Q_N_H1], mlp_q_acc2[MLP_Q_N_H2], mlp_q_acc3[MLP_Q_N_OUT];
+int8_t  mlp_q_h1[MLP_Q_N_H1], mlp_q_h2[MLP_Q_N_H2];
+float   mlp_q_out_scaled[MLP_Q_N_OUT];
+
+void mlp_q_forward(const float *window, float *pred) {
+  for (int i = 0; i < MLP_Q_N_IN; i++) {
+    float v = rintf((window[i] - Q_X_MEAN[i]) * Q_IN_MUL[i]);
+    mlp_q_in[i] = (int8_t)(v > 127.0f ? 127 : (v < -127.0f ? -127 : (int)v));
+  }
+  for (int j = 0; j < MLP_Q_N_H1; j++) {
+    int32_t acc = Q_B1[j];
+    for (int i = 0; i < MLP_Q_N_IN; i++) acc += (int32_t)mlp_q_in[i] * Q_W1[i][j];
+    mlp_q_acc1[j] = acc;
+    mlp_q_h1[j] = (int8_t)mlp_q_requant(acc, Q_M1);
+  }
+  for (int j = 0; j < MLP_Q_N_H2; j++) {
+    int32_t acc = Q_B2[j];
+    for (int i = 0; i < MLP_Q_N_H1; i++) acc += (int32_t)mlp_q_h1[i] * Q_W2[i][j];
+    mlp_q_acc2[j] = acc;
+    mlp_q_h2[j] = (int8_t)mlp_q_requant(acc, Q_M2);
+  }
+  for (int j = 0; j < MLP_Q_N_OUT; j++) {
+    int32_t acc = Q_B3[j];
+    for (int i = 0; i < MLP_Q_N_H2; i++) acc += (int32_t)mlp_q_h2[i] * Q_W3[i][j];
+    mlp_q_acc3[j] = acc;
+    volatile float out = (float)acc * Q_OUT_MUL[0];  // volatile: a*b+c가 FMA로 합쳐지지 않게
+    volatile float scaled = out * Q_Y_STD[j];
+    mlp_q_out_scaled[j] = out;
+    pred[j] = scaled + Q_Y_MEAN[j];
+  }
+}
+
+// online update 후 float 가중치(W, B) → int8 층 재양자화. s_o <= 0이면 마지막 층 (multiplier 없음).
+float mlp_q_quantize_layer(const float *w, const float *b, int n_in, int n_out, float s_a, float s_o,
+                           int8_t *qw, int32_t *qb, int32_t *m_shift) {
+  float amax = 0.0f;
+  for (int i = 0; i < n_in * n_out; i++) { float a = fabsf(w[i]); if (a > amax) amax = a; }
+  float s_w = amax > 0.0f ? amax / 127.0f : 1.0f;
+  for (int i = 0; i < n_in * n_out; i++) {
+    float v = rintf(w[i] / s_w);
+    qw[i] = (int8_t)(v != v ? 0 : (v > 127.0f ? 127 : (v < -127.0f ? -127 : (int)v)));
+  }
+  float s_acc = s_a * s_w;
+  for (int j = 0; j < n_out; j++) {
+    float v = rintf(b[j] / s_acc);
+    qb[j] = v != v ? 0 : (v > 1073741824.0f ? 1073741824 : (v < -1073741824.0f ? -1073741824 : (int32_t)v));
+  }
+  if (s_o > 0.0f) {
+    // 가중치가 발산해 비율이 범위 밖이면 포화 (quantize_layer()와 같음)
+    float r = s_acc / s_o;
+    if (!isfinite(r)) {
+      m_shift[0] = 2147483647;
+      m_shift[1] = 1;
+    } else {
+      int e;
+      float f = frexpf(r, &e);
+      m_shift[0] = (int32_t)(f * 2147483648.0f);
+      m_shift[1] = 31 - e < 1 ? 1 : (31 - e > 62 ? 62 : 31 - e);
+    }
+  }
+  return s_acc;
+}
+
+void mlp_q_requantize(const float *w1, const float *b1, const float *w2, const float *b2,
+                      const float *w3, const float *b3) {
+  mlp_q_quantize_layer(w1, b1, MLP_Q_N_IN, MLP_Q_N_H1, Q_SCALES[0], Q_SCALES[1], &Q_W1[0][0], Q_B1, Q_M1);
+  mlp_q_quantize_layer(w2, b2, MLP_Q_N_H1, MLP_Q_N_H2, Q_SCALES[1], Q_SCALES[2], &Q_W2[0][0], Q_B2, Q_M2);
+  Q_OUT_MUL[0] = mlp_q_quantize_layer(w3, b3, MLP_Q_N_H2, MLP_Q_N_OUT, Q_SCALES[2], 0.0f,
+                                      &Q_W3[0][0], Q_B3, NULL);
+}
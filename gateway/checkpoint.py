@@ -0,0 +1,172 @@
+"""
+게이트웨이 온라인 학습 가중치 체크포인트 (crash-safe, RX 경로 밖에서 저장).
+
+online_update()로 적응한 W1..B3와 window_buf를 주기적으로/종료 시 저장하고, 재시작 시 복원해서
+게이트웨이 모델이 엣지의 적응된 모델과 다시 어긋나는(불필요한 전송이 몰리는) 구간을 없앤다.
+
+- 파일 형식: model_file 형식 그대로 (MODEL_ARRAYS + window_buf + base_checksum + saved_at + n_updates).
+  write_model_file()이 임시 파일 → fsync → os.replace 로 원자적 교체하므로 저장 중 죽어도
+  직전 체크포인트가 남고, 읽을 때는 memory-map + CRC 검증.
+- 이중 버퍼: capture()는 이벤트 루프 스레드에서 가중치를 미리 할당한 버퍼 2개 중 쓰기 중이 아닌 쪽으로
+  np.copyto 만 하고 (수십 µs), 파일 쓰기·fsync는 백그라운드 스레드가 담당.
+- base_checksum: 체크포인트를 만든 사전학습 모델 파일의 CRC. Pre_train.py로 모델을 다시 학습해
+  checksum이 바뀌면 옛 체크포인트는 무시하고 새 사전학습 모델로 시작한다.
+"""
+import os
+import threading
+import time
+
+import numpy as np
+
+from gateway_MLP_Logic import GatewayMLP, N_FEATURES
+from model_file import MODEL_ARRAYS, ModelFileError, read_model_file, write_model_file
+
+CHECKPOINT_INTERVAL_S = 300
+
+
+def _fsync_dir(path):
+    # os.replace 결과(디렉터리 엔트리)까지 디스크에 반영 (POSIX)
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def model_checksum(model_path):
+    """모델 파일 헤더의 데이터 CRC32 (Checkpointer의 base_checksum)."""
+    return read_model_file(model_path, verify=False)[0]["checksum"]
+
+
+def load_model(model_path, checkpoint_path=None, verbose=True, model_cls=GatewayMLP, **kwargs):
+    """사전학습 모델 파일 + (있으면) 체크포인트로 model_cls(GatewayMLP 또는 하위 클래스) 생성.
+
+    반환: (model, 복원 여부). 체크포인트가 없거나 손상됐거나 다른 사전학습 모델에서 만들어졌으면
+    model_path만 사용. 체크포인트에는 float 가중치만 있으므로 EXTRA_ARRAYS(q_scales 등)는 model_path 값을 쓴다.
+    kwargs는 model_cls.from_file()에 그대로 전달.
+    """
+    base = model_cls.from_file(model_path, verbose=verbose, **kwargs)
+    base_checksum = model_checksum(model_path)
+    if not checkpoint_path or not os.path.isfile(checkpoint_path):
+        return base, False
+    try:
+        meta, arrays = read_model_file(checkpoint_path)
+        saved_crc = int(arrays["base_checksum"].view("<u4")[0])
+        if saved_crc != base_checksum:
+            print(f"Checkpoint ignored: made from model 0x{saved_crc:08X}, "
+                  f"current model is 0x{base_checksum:08X}")
+            return base, False
+        if arrays["window_buf"].shape != base.window_buf.shape or meta["n_features"] != N_FEATURES:
+            raise ModelFileError(f"window {arrays['window_buf'].shape} != {base.window_buf.shape}")
+        kwargs.setdefault("copy", False)
+        extra = {name: getattr(base, name) for name in model_cls.EXTRA_ARRAYS}
+        model = model_cls(**{name: arrays[name] for name in MODEL_ARRAYS}, **extra, verbose=verbose, **kwargs)
+        np.copyto(model.window_buf, arrays["window_buf"])
+        if not model.weights_finite():
+            raise ModelFileError("non-finite weights (online SGD diverged)")
+    except (OSError, KeyError, ModelFileError) as e:
+        print(f"Checkpoint ignored ({checkpoint_path}): {e}")
+        return base, False
+    age = time.time() - int(arrays["saved_at"][0])
+    print(f"Checkpoint restored: {checkpoint_path} ({int(arrays['n_updates'][0])} captures, "
+          f"saved {age / 60:.1f} min ago)")
+    return model, True
+
+
+class Checkpointer:
+    """model(GatewayMLP)의 가중치 + window_buf를 path에 주기적으로 저장.
+
+    capture()/maybe_capture()는 모델을 갱신하는 스레드(이벤트 루프)에서만 호출할 것.
+    base_checksum: 사전학습 모델 파일 CRC (load_model()의 호환성 검사용).
+    """
+
+    def __init__(self, model, path, base_checksum, interval_s=CHECKPOINT_INTERVAL_S, clock=time.monotonic,
+                 verbose=True):
+        self.model = model
+        self.path = path
+        self.interval_s = interval_s
+        self.clock = clock
+        self.verbose = verbose
+        self.window_size = model.window_buf.shape[0]
+        # superseded: writer가 가져가기 전에 더 새 capture로 덮어쓴 스냅샷 수
+        self.counters = {"captured": 0, "written": 0, "superseded": 0, "failed": 0}
+
+        names = MODEL_ARRAYS + ("window_buf",)
+        self._buffers = [{name: np.zeros_like(getattr(model, name)) for name in names} for _ in range(2)]
+        for buf in self._buffers:
+            buf["base_checksum"] = np.array([base_checksum], dtype="<u4").view("<i4")
+            buf["saved_at"] = np.zeros(1, dtype="<i4")
+            buf["n_updates"] = np.zeros(1, dtype="<i4")
+        self._names = names
+        self._pending = None
+        self._writing = None
+        self._closing = False
+        self._cond = threading.Condition()
+        self._next_at = clock() + interval_s
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._thread = threading.Thread(target=self._run, name="checkpoint", daemon=True)
+        self._thread.start()
+
+    def maybe_capture(self):
+        """마지막 capture 후 interval_s가 지났으면 capture(). RX/EST 처리 끝에 호출."""
+        if self.clock() >= self._next_at:
+            self.capture()
+
+    def capture(self):
+        """현재 가중치·윈도우를 쓰기 중이 아닌 버퍼로 복사하고 writer 스레드에 넘김 (파일 I/O 없음)."""
+        m = self.model
+        with self._cond:
+            buf = self._buffers[1] if self._writing is self._buffers[0] else self._buffers[0]
+            if self._pending is not None:
+                self.counters["superseded"] += 1
+            for name in self._names:
+                np.copyto(buf[name], getattr(m, name))
+            self.counters["captured"] += 1
+            buf["saved_at"][0] = int(time.time())
+            buf["n_updates"][0] = self.counters["captured"]
+            self._pending = buf
+            self._cond.notify()
+        self._next_at = self.clock() + self.interval_s
+
+    def stats(self):
+        with self._cond:
+            return dict(self.counters)
+
+    def close(self, timeout=10.0, final=True):
+        """final=True면 마지막 상태를 capture 한 뒤, 대기 중인 체크포인트를 모두 쓰고 스레드 종료."""
+        if final:
+            self.capture()
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._pending is None:
+                    if self._closing:
+                        return
+                    self._cond.wait()
+                buf = self._writing = self._pending
+                self._pending = None
+            try:
+                write_model_file(self.path, buf, self.window_size, N_FEATURES)
+                _fsync_dir(self.path)
+            except OSError as e:
+                print(f"Checkpoint write failed ({self.path}): {e}")
+                with self._cond:
+                    self.counters["failed"] += 1
+                    self._writing = None
+                continue
+            with self._cond:
+                self.counters["written"] += 1
+                self._writing = None
+            if self.verbose:
+                print(f"Checkpoint saved: {self.path}")
@@ -0,0 +1,212 @@
+"""
+엣지 MLP_edge_sensor.ino와 비트 단위로 같은 결과를 내는 게이트웨이 모델 (EdgeTwinMLP) + 상태 해시.
+
+GatewayMLP는 numpy/BLAS로 계산하므로 float32 누적 순서가 엣지 C 루프와 다르고, online_update()는
+예측을 갱신 전 가중치로 다시 계산한다. 같은 입력이어도 마지막 비트가 달라지고, 온라인 학습이 쌓이면
+게이트웨이 추정값이 엣지 예측에서 멀어진다 → 엣지는 게이트웨이가 이미 알고 있는 값을 보내거나,
+게이트웨이는 엣지가 보내지 않은 스텝에서 틀린 값을 추정한다.
+
+EdgeTwinMLP는 forward()/update_model()의 C 루프를 연산 순서 그대로 float32로 재현한다.
+  - 출력 뉴런 j마다 sum = B[j]에서 시작해 i = 0, 1, ...로 sum += x[i] * W[i][j]
+    (곱은 한 번에, 누적은 axis 0 cumsum: 각 원소의 곱·덧셈 순서와 반올림이 C와 같음)
+  - update_model: W3 갱신 → 갱신된 W3로 h2_delta → W2 갱신 → 갱신된 W2로 h1_delta → W1 갱신,
+    lr * delta * x는 (lr * delta) * x 순서, out_err는 forward()의 pred_scaled 그대로 사용
+  - C 쪽은 #pragma GCC optimize("fp-contract=off")로 a*b+c가 FMA로 합쳐지지 않게 컴파일한다.
+
+상태 해시 (state_hash, mlp_model.h의 mlp_state_hash()와 같음):
+  W1, B1, W2, B2, W3, B3, window를 C 메모리 순서대로 float32 비트(uint32)로 읽어 (NaN은 CANONICAL_NAN)
+  h = h * HASH_PRIME + word (mod 2^32, 초기값 0)인 다항식 rolling hash.
+  원소 k 하나가 d만큼 바뀌면 해시는 d * PRIME^(n-1-k)만큼 바뀌므로 (PRIME 홀수) 원소 하나의 변화는 항상 검출된다.
+엣지는 SEND 때 forward()에 쓴 상태의 해시를 LoRa로 보내고, 게이트웨이는 같은 스텝의 자기 상태 해시와 비교한다.
+"""
+import numpy as np
+
+from gateway_MLP_Logic import GatewayMLP
+
+HASH_PRIME = 0x01000193
+STATE_ARRAYS = ("w1", "b1", "w2", "b2", "w3", "b3", "window_buf")
+# 발산한 가중치의 NaN은 부호·payload가 연산 순서/CPU마다 달라 해시에서는 하나의 비트 패턴으로 본다
+CANONICAL_NAN = 0x7FC00000
+
+# 엣지 time_n_of()와 같은 고정 UTC-8
+_TZ_OFFSET_S = 28800
+
+_hash_powers = {}
+
+
+def _powers(n):
+    # PRIME^(n-1), ..., PRIME^0 (mod 2^32), 길이별 캐시
+    p = _hash_powers.get(n)
+    if p is None:
+        p = np.empty(n, dtype=np.uint64)
+        acc = 1
+        for k in range(n - 1, -1, -1):
+            p[k] = acc
+            acc = (acc * HASH_PRIME) & 0xFFFFFFFF
+        _hash_powers[n] = p
+    return p
+
+
+def state_hash(arrays):
+    """float32 배열들 (C 메모리 순서로 이어 붙임) → 32비트 다항식 해시."""
+    values = np.concatenate([np.ascontiguousarray(a, dtype=np.float32).reshape(-1) for a in arrays])
+    words = np.where(np.isnan(values), np.uint32(CANONICAL_NAN), values.view(np.uint32)).astype(np.uint64)
+    return int(np.sum((words * _powers(len(words))) & 0xFFFFFFFF) & 0xFFFFFFFF)
+
+
+def edge_time_n(unix_s):
+    """엣지 time_n_of()와 같은 float32 time_n (UTC-8 하루 중 초 / 86400). float32 값을 float로 반환."""
+    local_sec = (int(unix_s) - _TZ_OFFSET_S) % 86400
+    return float(np.float32(local_sec) / np.float32(86400.0))
+
+
+def c_relu(x):
+    # relu(x) = x > 0 ? x : 0.0f (-0.0도 +0.0으로; np.maximum은 -0.0을 그대로 둘 수 있음)
+    return np.where(x > 0, x, np.float32(0.0))
+
+
+def c_accumulate(init, terms):
+    """acc = init; for i: acc += terms[i] — C 루프와 같은 float32 순차 누적.
+
+    cumsum(accumulate)은 행 순서대로 한 번씩 더하므로 (np.sum의 pairwise 합과 달리) C 루프와 비트 단위로 같다.
+    """
+    return np.cumsum(np.concatenate([init[None], terms]), axis=0)[-1]
+
+
+def c_dense(x, w, b):
+    """sum = b[j]; for i: sum += x[i] * w[i][j]."""
+    return c_accumulate(b, x[:, None] * w)
+
+
+class EdgeTwinMLP(GatewayMLP):
+    """MLP_edge_sensor.ino forward()/update_model()과 비트 단위로 같은 GatewayMLP.
+
+    predict_batch()는 GatewayMLP(BLAS) 그대로 (배치 평가용, 엣지와 비트 일치 대상 아님).
+    """
+
+    def __init__(self, w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std, verbose=True, copy=True,
+                 inplace=False):
+        # C 루프 순서로 계산하므로 BLAS inplace 스크래치는 쓰지 않음
+        super().__init__(w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std, inplace=False, verbose=verbose,
+                         copy=copy)
+        self.last_pred_scaled = np.zeros(self.w3.shape[1], dtype=np.float32)
+
+    def forward_c(self, x_scaled):
+        pre_h1 = c_dense(x_scaled, self.w1, self.b1)
+        hidden1 = c_relu(pre_h1)
+        pre_h2 = c_dense(hidden1, self.w2, self.b2)
+        hidden2 = c_relu(pre_h2)
+        return pre_h1, hidden1, pre_h2, hidden2, c_dense(hidden2, self.w3, self.b3)
+
+    def predict(self):
+        self.last_in_scaled = (self.window_buf.reshape(-1) - self.x_mean) / self.x_std
+        (self.last_pre_h1, self.last_hidden1, self.last_pre_h2, self.last_hidden2,
+         self.last_pred_scaled) = self.forward_c(self.last_in_scaled)
+        final_pred = self.last_pred_scaled * self.y_std + self.y_mean
+        self.last_pred_t, self.last_pred_h = float(final_pred[0]), float(final_pred[1])
+        return final_pred
+
+    def _forecast_step(self):
+        """forward_c()와 같은 C 순서 forward (엣지 SKIP 스텝과 비트 단위로 같음), 버퍼는 forecast() 호출마다 한 번 할당.
+
+        층마다 terms[0] = b, terms[1:] = x[i] * W[i][j] (np.multiply out=) → np.cumsum(terms, axis=0, out=acc)의
+        마지막 행 = c_dense(). relu는 c_relu()처럼 x > 0이 아니면 +0.0 (NaN, -0.0 포함).
+        """
+        f32 = np.float32
+        x_mean, x_std, y_mean, y_std = self.x_mean, self.x_std, self.y_mean, self.y_std
+        layers = []
+        for w, b in ((self.w1, self.b1), (self.w2, self.b2), (self.w3, self.b3)):
+            n_in, n_out = w.shape
+            terms = np.empty((n_in + 1, n_out), dtype=f32)
+            terms[0] = b  # forecast 중에는 가중치가 바뀌지 않음
+            acc = np.empty_like(terms)
+            layers.append((w, terms, terms[1:], acc, acc[-1]))
+        x = np.empty(self.w1.shape[0], dtype=f32)
+        h1 = np.empty(self.w1.shape[1], dtype=f32)
+        h2 = np.empty(self.w2.shape[1], dtype=f32)
+        mask1 = np.empty(h1.shape, dtype=bool)
+        mask2 = np.empty(h2.shape, dtype=bool)
+        (w1, t1, p1, a1, s1), (w2, t2, p2, a2, s2), (w3, t3, p3, a3, s3) = layers
+        x_col, h1_col, h2_col = x[:, None], h1[:, None], h2[:, None]
+
+        def relu(pre, mask, out):
+            np.greater(pre, 0, out=mask)
+            out.fill(0)
+            np.copyto(out, pre, where=mask)
+
+        def step(window, out):
+            np.subtract(window, x_mean, out=x)
+            np.divide(x, x_std, out=x)
+            np.multiply(x_col, w1, out=p1)
+            np.cumsum(t1, axis=0, out=a1)
+            relu(s1, mask1, h1)
+            np.multiply(h1_col, w2, out=p2)
+            np.cumsum(t2, axis=0, out=a2)
+            relu(s2, mask2, h2)
+            np.multiply(h2_col, w3, out=p3)
+            np.cumsum(t3, axis=0, out=a3)
+            np.multiply(s3, y_std, out=out)
+            np.add(out, y_mean, out=out)
+        return step
+
+    def online_update(self, actual_t, actual_h, lr=0.05):
+        """update_model()과 같은 순서. actual_*은 엣지가 보낸 10진 값 (float32로 읽음)."""
+        lr = np.float32(lr)
+        target = np.array([actual_t, actual_h], dtype=np.float32)
+        out_err = (target - self.y_mean) / self.y_std - self.last_pred_scaled
+
+        # --- Output Layer (W3, B3) ---
+        self.w3 += np.outer(self.last_hidden2, lr * out_err)
+        self.b3 += lr * out_err
+
+        # --- Hidden Layer 2 (W2, B2) — 갱신된 W3로 역전파 ---
+        h2_delta = c_accumulate(np.zeros(self.w3.shape[0], dtype=np.float32), out_err[:, None] * self.w3.T)
+        h2_delta *= (self.last_pre_h2 > 0).astype(np.float32)
+        self.w2 += np.outer(self.last_hidden1, lr * h2_delta)
+        self.b2 += lr * h2_delta
+
+        # --- Hidden Layer 1 (W1, B1) — 갱신된 W2로 역전파 ---
+        h1_delta = c_accumulate(np.zeros(self.w2.shape[0], dtype=np.float32), h2_delta[:, None] * self.w2.T)
+        h1_delta *= (self.last_pre_h1 > 0).astype(np.float32)
+        self.w1 += np.outer(self.last_in_scaled, lr * h1_delta)
+        self.b1 += lr * h1_delta
+
+        if self.verbose:
+            print(f"[Sync] Weights Updated (LR={lr})")
+
+    def state_hash(self):
+        """mlp_state_hash(window_buf)와 같은 값 (가중치 + 윈도우)."""
+        return state_hash([getattr(self, name) for name in STATE_ARRAYS])
+
+
+def twin_c_lines():
+    """write_c_header(extra=...)에 넘길 상태 해시 함수 (EdgeTwinMLP.state_hash와 같은 값)."""
+    return [
+        "",
+        "// ===== 상태 해시 (gateway/edge_twin.py state_hash와 같은 값) =====",
+        "#include <stdint.h>",
+        "#include <string.h>",
+        f"#define MLP_HASH_PRIME 0x{HASH_PRIME:08X}UL",
+        "",
+        "static inline uint32_t mlp_hash_floats(uint32_t h, const float *v, int n) {",
+        "  for (int i = 0; i < n; i++) {",
+        "    uint32_t w;",
+        "    memcpy(&w, &v[i], sizeof w);",
+        f"    if ((w & 0x7F800000UL) == 0x7F800000UL && (w & 0x007FFFFFUL)) w = 0x{CANONICAL_NAN:08X}UL;  // NaN",
+        "    h = h * MLP_HASH_PRIME + w;",
+        "  }",
+        "  return h;",
+        "}",
+        "",
+        "// W1, B1, W2, B2, W3, B3 + window (float[n_window]) 순서. SEND 시 forward()에 쓴 상태로 호출.",
+        "uint32_t mlp_state_hash(const float *window, int n_window) {",
+        "  uint32_t h = 0;",
+        "  h = mlp_hash_floats(h, &W1[0][0], sizeof(W1) / sizeof(float));",
+        "  h = mlp_hash_floats(h, B1, sizeof(B1) / sizeof(float));",
+        "  h = mlp_hash_floats(h, &W2[0][0], sizeof(W2) / sizeof(float));",
+        "  h = mlp_hash_floats(h, B2, sizeof(B2) / sizeof(float));",
+        "  h = mlp_hash_floats(h, &W3[0][0], sizeof(W3) / sizeof(float));",
+        "  h = mlp_hash_floats(h, B3, sizeof(B3) / sizeof(float));",
+        "  return mlp_hash_floats(h, window, n_window);",
+        "}",
+    ]
@@ -1,5 +1,7 @@
 import numpy as np
 
+from model_file import MODEL_ARRAYS, ModelFileError, read_model_file
+
 WINDOW_SIZE = 4
 N_FEATURES = 3  # temp, hum, time_n
 
@@ -7,24 +9,32 @@ N_FEATURES = 3  # temp, hum, time_n
 class GatewayMLP:
     """12-64-32-2 Rolling Window MLP (ReLU, 2 hidden layers)."""
 
-    def __init__(self, w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std):
-        self.w1 = np.array(w1, dtype=np.float32)  # 12 x 64
-        self.b1 = np.array(b1, dtype=np.float32)   # 64
-        self.w2 = np.array(w2, dtype=np.float32)  # 64 x 32
-        self.b2 = np.array(b2, dtype=np.float32)   # 32
-        self.w3 = np.array(w3, dtype=np.float32)  # 32 x 2
-        self.b3 = np.array(b3, dtype=np.float32)   # 2
+    # from_file()이 MODEL_ARRAYS 외에 모델 파일에서 읽어 생성자에 넘길 배열 (하위 클래스용)
+    EXTRA_ARRAYS = ()
 
-        self.x_mean = np.array(x_mean, dtype=np.float32)
-        self.x_std = np.array(x_std, dtype=np.float32)
-        self.y_mean = np.array(y_mean, dtype=np.float32)
-        self.y_std = np.array(y_std, dtype=np.float32)
+    def __init__(self, w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std, inplace=False, verbose=True,
+                 copy=True):
+        # copy=False: float32 배열이면 복사 없이 그대로 사용 (from_file의 memory-map view 등)
+        as_f32 = np.array if copy else np.asarray
+        self.w1 = as_f32(w1, dtype=np.float32)  # 12 x 64
+        self.b1 = as_f32(b1, dtype=np.float32)   # 64
+        self.w2 = as_f32(w2, dtype=np.float32)  # 64 x 32
+        self.b2 = as_f32(b2, dtype=np.float32)   # 32
+        self.w3 = as_f32(w3, dtype=np.float32)  # 32 x 2
+        self.b3 = as_f32(b3, dtype=np.float32)   # 2
+
+        self.x_mean = as_f32(x_mean, dtype=np.float32)
+        self.x_std = as_f32(x_std, dtype=np.float32)
+        self.y_mean = as_f32(y_mean, dtype=np.float32)
+        self.y_std = as_f32(y_std, dtype=np.float32)
 
-        self.window_buf = np.zeros((WINDOW_SIZE, N_FEATURES), dtype=np.float32)
-        for w in range(WINDOW_SIZE):
+        # 윈도우 길이는 입력 스케일러 길이로 결정 (기본 4 x 3, 스윕 모델은 다른 길이 가능)
+        window_size = len(self.x_mean) // N_FEATURES
+        self.window_buf = np.zeros((window_size, N_FEATURES), dtype=np.float32)
+        for w in range(window_size):
             self.window_buf[w] = [y_mean[0], y_mean[1], 0.5]
 
-        self.last_in_scaled = np.zeros(WINDOW_SIZE * N_FEATURES, dtype=np.float32)
+        self.last_in_scaled = np.zeros(window_size * N_FEATURES, dtype=np.float32)
         self.last_hidden1 = np.zeros(self.w1.shape[1], dtype=np.float32)
         self.last_hidden2 = np.zeros(self.w2.shape[1], dtype=np.float32)
         # backprop에서 ReLU 미분을 위해 pre-activation 값 저장
@@ -34,31 +44,226 @@ class GatewayMLP:
         self.last_pred_t = y_mean[0]
         self.last_pred_h = y_mean[1]
 
+        self.verbose = verbose
+        # inplace=True: 스크래치 버퍼를 여기서 한 번만 할당하고 predict/online_update/shift_window를
+        # out= ufunc로 수행 (호출당 배열 할당 0, 전부 float32). predict()는 내부 버퍼를 반환하므로
+        # 값을 보관하려면 호출 측에서 복사할 것.
+        self.inplace = inplace
+        if inplace:
+            self._init_scratch()
+
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Pre_train.py가 저장한 모델 파일(model_file 형식)을 memory-map 해서 생성 (복사 없음)."""
+        meta, arrays = read_model_file(path)
+        if (meta["n_features"] != N_FEATURES
+                or meta["window_size"] * N_FEATURES != arrays["x_mean"].size):
+            raise ModelFileError(f"{path}: window {meta['window_size']}x{meta['n_features']} "
+                                 f"does not match input size {arrays['x_mean'].size}")
+        missing = [name for name in cls.EXTRA_ARRAYS if name not in arrays]
+        if missing:
+            raise ModelFileError(f"{path}: missing {', '.join(missing)} (Pre_train.py로 다시 생성)")
+        kwargs.setdefault("copy", False)
+        return cls(**{name: arrays[name] for name in MODEL_ARRAYS + cls.EXTRA_ARRAYS}, **kwargs)
+
+    def _init_scratch(self):
+        n_in, n_h1 = self.w1.shape
+        n_h2, n_out = self.w3.shape
+        f32 = np.float32
+        self._zero = np.zeros((), dtype=f32)
+        self._lr = np.zeros((), dtype=f32)
+        self._flat_window = self.window_buf.reshape(-1)  # view
+        # shift_window: 겹치는 slice 대입(buf[:-1] = buf[1:])은 numpy가 임시 배열을 만들므로 스크래치를 거쳐 복사
+        self._window_head = self.window_buf[:-1]
+        self._window_tail = self.window_buf[1:]
+        self._window_last = self.window_buf[-1]
+        self._shift_tmp = np.zeros_like(self._window_tail)
+        self._out_scaled = np.zeros(n_out, dtype=f32)
+        self._final_pred = np.zeros(n_out, dtype=f32)
+        self._target = np.zeros(n_out, dtype=f32)
+        self._out_error = np.zeros(n_out, dtype=f32)
+        self._lr_out_error = np.zeros(n_out, dtype=f32)
+        self._h2_error = np.zeros(n_h2, dtype=f32)
+        self._lr_h2_error = np.zeros(n_h2, dtype=f32)
+        self._h1_error = np.zeros(n_h1, dtype=f32)
+        self._lr_h1_error = np.zeros(n_h1, dtype=f32)
+        self._d_relu_h2 = np.zeros(n_h2, dtype=f32)
+        self._d_relu_h1 = np.zeros(n_h1, dtype=f32)
+        self._delta_w3 = np.zeros_like(self.w3)
+        self._delta_w2 = np.zeros_like(self.w2)
+        self._delta_w1 = np.zeros_like(self.w1)
+        # rank-1 갱신용 (n,1) x (1,m) view: np.dot(col, row, out=)은 임시 배열 없이 outer 계산
+        self._in_col = self.last_in_scaled[:, None]
+        self._h1_col = self.last_hidden1[:, None]
+        self._h2_col = self.last_hidden2[:, None]
+        self._lr_out_row = self._lr_out_error[None, :]
+        self._lr_h2_row = self._lr_h2_error[None, :]
+        self._lr_h1_row = self._lr_h1_error[None, :]
+
     @staticmethod
     def relu(x):
         return np.maximum(0, x)
 
+    def forward(self, x_scaled):
+        """스케일된 입력 (B, 12) 또는 (12,) → (pre_h1, hidden1, pre_h2, hidden2, out_scaled)."""
+        pre_h1 = np.dot(x_scaled, self.w1) + self.b1
+        hidden1 = self.relu(pre_h1)
+
+        pre_h2 = np.dot(hidden1, self.w2) + self.b2
+        hidden2 = self.relu(pre_h2)
+
+        out_scaled = np.dot(hidden2, self.w3) + self.b3
+        return pre_h1, hidden1, pre_h2, hidden2, out_scaled
+
+    def backward(self, x_scaled, cache, out_error):
+        """미니배치 기울기: loss = mean(0.5 * ||target_scaled - out_scaled||^2).
+
+        cache는 forward() 반환값, out_error = target_scaled - out_scaled (online_update와 같은 정의).
+        반환: 파라미터 이름 → 기울기 dict (w -= lr * grad 로 하강). online_update()와 달리
+        모든 층이 갱신 전 가중치 기준으로 계산된다.
+        """
+        pre_h1, hidden1, pre_h2, hidden2, _ = cache
+        x_scaled, hidden1, hidden2, out_error = (np.atleast_2d(a) for a in (x_scaled, hidden1, hidden2, out_error))
+        g_out = -out_error / len(out_error)
+
+        # --- Output layer (W3, B3) ---
+        grads = {"w3": hidden2.T @ g_out, "b3": g_out.sum(axis=0)}
+
+        # --- Hidden Layer 2 (W2, B2) — ReLU derivative ---
+        g_h2 = (g_out @ self.w3.T) * (np.atleast_2d(pre_h2) > 0)
+        grads["w2"], grads["b2"] = hidden1.T @ g_h2, g_h2.sum(axis=0)
+
+        # --- Hidden Layer 1 (W1, B1) — ReLU derivative ---
+        g_h1 = (g_h2 @ self.w2.T) * (np.atleast_2d(pre_h1) > 0)
+        grads["w1"], grads["b1"] = x_scaled.T @ g_h1, g_h1.sum(axis=0)
+        return grads
+
     def predict(self):
+        if self.inplace:
+            return self._predict_inplace()
         flat_input = self.window_buf.flatten()
         self.last_in_scaled = (flat_input - self.x_mean) / self.x_std
 
-        self.last_pre_h1 = np.dot(self.last_in_scaled, self.w1) + self.b1
-        self.last_hidden1 = self.relu(self.last_pre_h1)
-
-        self.last_pre_h2 = np.dot(self.last_hidden1, self.w2) + self.b2
-        self.last_hidden2 = self.relu(self.last_pre_h2)
-
-        out_scaled = np.dot(self.last_hidden2, self.w3) + self.b3
+        self.last_pre_h1, self.last_hidden1, self.last_pre_h2, self.last_hidden2, out_scaled = \
+            self.forward(self.last_in_scaled)
         final_pred = (out_scaled * self.y_std) + self.y_mean
 
         self.last_pred_t, self.last_pred_h = float(final_pred[0]), float(final_pred[1])
         return final_pred
 
+    def predict_batch(self, X):
+        """원 단위 윈도우 배치 (n, 12) → 원 단위 예측 (n, 2). 모델 상태(윈도우·활성값)는 건드리지 않음."""
+        x_scaled = ((np.asarray(X) - self.x_mean) / self.x_std).astype(np.float32)
+        return self.forward(x_scaled)[-1] * self.y_std + self.y_mean
+
+    def _predict_inplace(self):
+        np.subtract(self._flat_window, self.x_mean, out=self.last_in_scaled)
+        np.divide(self.last_in_scaled, self.x_std, out=self.last_in_scaled)
+
+        np.dot(self.last_in_scaled, self.w1, out=self.last_pre_h1)
+        np.add(self.last_pre_h1, self.b1, out=self.last_pre_h1)
+        np.maximum(self.last_pre_h1, self._zero, out=self.last_hidden1)
+
+        np.dot(self.last_hidden1, self.w2, out=self.last_pre_h2)
+        np.add(self.last_pre_h2, self.b2, out=self.last_pre_h2)
+        np.maximum(self.last_pre_h2, self._zero, out=self.last_hidden2)
+
+        np.dot(self.last_hidden2, self.w3, out=self._out_scaled)
+        np.add(self._out_scaled, self.b3, out=self._out_scaled)
+        np.multiply(self._out_scaled, self.y_std, out=self._final_pred)
+        np.add(self._final_pred, self.y_mean, out=self._final_pred)
+
+        # item(): numpy 스칼라 객체 없이 바로 Python float
+        self.last_pred_t, self.last_pred_h = self._final_pred.item(0), self._final_pred.item(1)
+        return self._final_pred
+
     def shift_window(self, new_t, new_h, new_tn):
+        if self.inplace:
+            self._shift_tmp[...] = self._window_tail
+            self._window_head[...] = self._shift_tmp
+            last = self._window_last
+            last[0] = new_t
+            last[1] = new_h
+            last[2] = new_tn
+            return
         self.window_buf[:-1] = self.window_buf[1:]
         self.window_buf[-1] = [new_t, new_h, new_tn]
 
+    def forecast(self, k, time_n_schedule, commit=False):
+        """EST tick k회 (shift_window(직전 예측, time_n) → predict())를 한 번에 계산. 반환: (k, 2) [pred_t, pred_h].
+
+        time_n_schedule: 스텝별 time_n (길이 k, 스칼라면 모든 스텝 같은 값). 첫 스텝은 last_pred_t/h를 밀어 넣는다.
+        윈도우 이력을 (window + k + 1, 3) 버퍼 하나에 이어 쓰고 스텝마다 그 view로 forward하므로 윈도우 복사와
+        스텝당 배열 할당이 없다. 값은 predict()/shift_window() 반복과 비트 단위로 같다 (하위 클래스는 _forecast_step).
+        commit=False면 모델 상태는 그대로, True면 k회 tick 한 뒤의 상태(window_buf, last_*)로 둔다 (EST tick, 공백 catch-up).
+        """
+        k = int(k)
+        n_win = len(self.window_buf)
+        hist = np.empty((n_win + k + 1, N_FEATURES), dtype=np.float32)
+        hist[:n_win] = self.window_buf
+        hist[n_win, 0] = self.last_pred_t
+        hist[n_win, 1] = self.last_pred_h
+        hist[n_win:n_win + k, 2] = time_n_schedule
+        flat = hist.reshape(-1)
+        size = n_win * N_FEATURES
+        # commit: 마지막 스텝은 윈도우를 옮겨 predict()로 계산 (last_* 활성값까지 채움, forward 추가 없음)
+        n_steps = k - 1 if commit and k else k
+        step = self._forecast_step()
+        for i in range(n_steps):
+            start = (i + 1) * N_FEATURES
+            step(flat[start:start + size], hist[n_win + 1 + i, :2])
+        if n_steps < k:
+            np.copyto(self.window_buf, hist[k:k + n_win])
+            hist[n_win + k, :2] = self.predict()
+        return hist[n_win + 1:, :2].copy()
+
+    def _forecast_step(self):
+        """forecast()의 한 스텝 step(window, out): 원 단위 윈도우 (12,) → out (2,)에 원 단위 예측.
+
+        스크래치는 forecast() 호출마다 새로 만든다 (inplace 버퍼와 공유하지 않으므로 predict()와 섞여도 안전).
+        """
+        f32 = np.float32
+        x = np.empty(self.w1.shape[0], dtype=f32)
+        h1 = np.empty(self.w1.shape[1], dtype=f32)
+        h2 = np.empty(self.w2.shape[1], dtype=f32)
+        o = np.empty(self.w3.shape[1], dtype=f32)
+        zero = np.zeros((), dtype=f32)
+        w1, b1, w2, b2, w3, b3 = self.w1, self.b1, self.w2, self.b2, self.w3, self.b3
+        x_mean, x_std, y_mean, y_std = self.x_mean, self.x_std, self.y_mean, self.y_std
+
+        def step(window, out):
+            np.subtract(window, x_mean, out=x)
+            np.divide(x, x_std, out=x)
+            np.dot(x, w1, out=h1)
+            np.add(h1, b1, out=h1)
+            np.maximum(h1, zero, out=h1)
+            np.dot(h1, w2, out=h2)
+            np.add(h2, b2, out=h2)
+            np.maximum(h2, zero, out=h2)
+            np.dot(h2, w3, out=o)
+            np.add(o, b3, out=o)
+            np.multiply(o, y_std, out=out)
+            np.add(out, y_mean, out=out)
+        return step
+
+    def weights_finite(self):
+        """W1..B3가 모두 유한한지. 온라인 SGD 발산(NaN/inf) 검사 (엣지 weights_finite()와 같은 판정)."""
+        return all(np.isfinite(getattr(self, name)).all() for name in ("w1", "b1", "w2", "b2", "w3", "b3"))
+
+    def reset(self, arrays):
+        """엣지 재부팅과 같은 상태로: arrays(모델 파일 배열 등)의 가중치 + 초기 윈도우 + predict()."""
+        for name in ("w1", "b1", "w2", "b2", "w3", "b3"):
+            np.copyto(getattr(self, name), arrays[name])
+        for w in range(len(self.window_buf)):
+            self.window_buf[w] = [self.y_mean[0], self.y_mean[1], 0.5]
+        return self.predict()
+
     def online_update(self, actual_t, actual_h, lr=0.05):
+        if self.inplace:
+            self._online_update_inplace(actual_t, actual_h, lr)
+            if self.verbose:
+                print(f"[Sync] Weights Updated (LR={lr})")
+            return
         target_scaled = (np.array([actual_t, actual_h]) - self.y_mean) / self.y_std
         current_pred_scaled = np.dot(self.last_hidden2, self.w3) + self.b3
         out_error = target_scaled - current_pred_scaled
@@ -82,4 +287,270 @@ class GatewayMLP:
         self.w1 += delta_w1
         self.b1 += lr * h1_error
 
-        print(f"[Sync] Weights Updated (LR={lr})")
+        if self.verbose:
+            print(f"[Sync] Weights Updated (LR={lr})")
+
+    def _online_update_inplace(self, actual_t, actual_h, lr):
+        # online_update()와 같은 규칙. lr은 error 벡터 쪽에 먼저 곱한다 (lr * outer(a, e) == outer(a, lr * e)).
+        self._lr.fill(lr)
+        target = self._target
+        target[0] = actual_t
+        target[1] = actual_h
+        np.subtract(target, self.y_mean, out=target)
+        np.divide(target, self.y_std, out=target)
+
+        np.dot(self.last_hidden2, self.w3, out=self._out_scaled)
+        np.add(self._out_scaled, self.b3, out=self._out_scaled)
+        np.subtract(target, self._out_scaled, out=self._out_error)
+
+        # --- Output layer (W3, B3) ---
+        np.multiply(self._out_error, self._lr, out=self._lr_out_error)
+        np.dot(self._h2_col, self._lr_out_row, out=self._delta_w3)
+        np.add(self.w3, self._delta_w3, out=self.w3)
+        np.add(self.b3, self._lr_out_error, out=self.b3)
+
+        # --- Hidden Layer 2 (W2, B2) — ReLU derivative (relu 출력 부호 = pre-activation > 0) ---
+        np.sign(self.last_hidden2, out=self._d_relu_h2)
+        np.dot(self.w3, self._out_error, out=self._h2_error)
+        np.multiply(self._h2_error, self._d_relu_h2, out=self._h2_error)
+        np.multiply(self._h2_error, self._lr, out=self._lr_h2_error)
+        np.dot(self._h1_col, self._lr_h2_row, out=self._delta_w2)
+        np.add(self.w2, self._delta_w2, out=self.w2)
+        np.add(self.b2, self._lr_h2_error, out=self.b2)
+
+        # --- Hidden Layer 1 (W1, B1) — ReLU derivative ---
+        np.sign(self.last_hidden1, out=self._d_relu_h1)
+        np.dot(self.w2, self._h2_error, out=self._h1_error)
+        np.multiply(self._h1_error, self._d_relu_h1, out=self._h1_error)
+        np.multiply(self._h1_error, self._lr, out=self._lr_h1_error)
+        np.dot(self._in_col, self._lr_h1_row, out=self._delta_w1)
+        np.add(self.w1, self._delta_w1, out=self.w1)
+        np.add(self.b1, self._lr_h1_error, out=self.b1)
+
+
+class GatewayMLPPool:
+    """여러 엣지 노드용 12-64-32-2 MLP 묶음.
+
+    노드별 가중치·윈도우를 (N, ...) 3-D 텐서로 쌓아 두고, 60초 EST tick마다
+    전체 노드의 predict()/shift_window()를 한 번의 batched matmul로 처리한다.
+    노드는 node_id로 식별하며, 추가 시 사전학습 가중치로 초기화된다.
+    """
+
+    def __init__(self, w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std, capacity=16):
+        # 사전학습 가중치 (새 노드 초기값)
+        self.init_w1 = np.array(w1, dtype=np.float32)
+        self.init_b1 = np.array(b1, dtype=np.float32)
+        self.init_w2 = np.array(w2, dtype=np.float32)
+        self.init_b2 = np.array(b2, dtype=np.float32)
+        self.init_w3 = np.array(w3, dtype=np.float32)
+        self.init_b3 = np.array(b3, dtype=np.float32)
+
+        # 스케일러는 사전학습 시 한 번 정해지므로 노드 간 공유
+        self.x_mean = np.array(x_mean, dtype=np.float32)
+        self.x_std = np.array(x_std, dtype=np.float32)
+        self.y_mean = np.array(y_mean, dtype=np.float32)
+        self.y_std = np.array(y_std, dtype=np.float32)
+        # 윈도우 길이는 GatewayMLP처럼 입력 스케일러 길이로 결정 (스윕 모델은 4가 아닐 수 있음)
+        self.window_size = len(self.x_mean) // N_FEATURES
+
+        self.node_ids = []
+        self._index = {}
+        self._alloc(max(int(capacity), 1))
+
+    @classmethod
+    def from_model(cls, model, node_ids=(), capacity=16):
+        """단일 GatewayMLP의 (현재) 가중치를 초기값으로 하는 풀 생성 (윈도우 길이도 model과 같음)."""
+        pool = cls(model.w1, model.b1, model.w2, model.b2, model.w3, model.b3,
+                   model.x_mean, model.x_std, model.y_mean, model.y_std,
+                   capacity=max(capacity, len(node_ids)))
+        for node_id in node_ids:
+            pool.add_node(node_id)
+        return pool
+
+    def _alloc(self, capacity):
+        n_in, n_h1 = self.init_w1.shape
+        n_h2, n_out = self.init_w3.shape
+        old = getattr(self, "w1", None)
+        shapes = {
+            "w1": (n_in, n_h1), "b1": (n_h1,),
+            "w2": (n_h1, n_h2), "b2": (n_h2,),
+            "w3": (n_h2, n_out), "b3": (n_out,),
+            "window_buf": (self.window_size, N_FEATURES),
+            "last_in_scaled": (n_in,),
+            "last_pre_h1": (n_h1,), "last_hidden1": (n_h1,),
+            "last_pre_h2": (n_h2,), "last_hidden2": (n_h2,),
+            "last_pred": (n_out,),
+        }
+        for name, shape in shapes.items():
+            buf = np.zeros((capacity,) + shape, dtype=np.float32)
+            if old is not None:
+                n = len(self.node_ids)
+                buf[:n] = getattr(self, name)[:n]
+            setattr(self, name, buf)
+        self.capacity = capacity
+
+    def __len__(self):
+        return len(self.node_ids)
+
+    def __contains__(self, node_id):
+        return node_id in self._index
+
+    def node_index(self, node_id):
+        return self._index[node_id]
+
+    def add_node(self, node_id):
+        """노드 추가 (사전학습 가중치 + 초기 윈도우). 이미 있으면 기존 인덱스 반환."""
+        if node_id in self._index:
+            return self._index[node_id]
+        n = len(self.node_ids)
+        if n == self.capacity:
+            self._alloc(self.capacity * 2)
+        self.w1[n] = self.init_w1
+        self.b1[n] = self.init_b1
+        self.w2[n] = self.init_w2
+        self.b2[n] = self.init_b2
+        self.w3[n] = self.init_w3
+        self.b3[n] = self.init_b3
+        self.window_buf[n] = [self.y_mean[0], self.y_mean[1], 0.5]
+        self.last_pred[n] = self.y_mean
+        self.node_ids.append(node_id)
+        self._index[node_id] = n
+        return n
+
+    def _sel(self, idx):
+        # idx=None → 전체 노드 (view, 복사 없음), 아니면 인덱스 배열 (fancy indexing)
+        if idx is None:
+            return slice(0, len(self.node_ids))
+        return np.atleast_1d(np.asarray(idx, dtype=np.intp))
+
+    def predict(self, idx=None):
+        """선택 노드(기본: 전체) 예측. 반환: (n, 2) [pred_t, pred_h]."""
+        sel = self._sel(idx)
+        x = self.window_buf[sel].reshape(-1, self.window_size * N_FEATURES)
+        in_scaled = (x - self.x_mean) / self.x_std
+
+        # (n, 1, in) @ (n, in, out) → (n, 1, out): 노드별 가중치로 batched matmul
+        pre_h1 = np.matmul(in_scaled[:, None, :], self.w1[sel])[:, 0, :] + self.b1[sel]
+        hidden1 = np.maximum(pre_h1, 0)
+        pre_h2 = np.matmul(hidden1[:, None, :], self.w2[sel])[:, 0, :] + self.b2[sel]
+        hidden2 = np.maximum(pre_h2, 0)
+        out_scaled = np.matmul(hidden2[:, None, :], self.w3[sel])[:, 0, :] + self.b3[sel]
+        final_pred = (out_scaled * self.y_std) + self.y_mean
+
+        self.last_in_scaled[sel] = in_scaled
+        self.last_pre_h1[sel] = pre_h1
+        self.last_hidden1[sel] = hidden1
+        self.last_pre_h2[sel] = pre_h2
+        self.last_hidden2[sel] = hidden2
+        self.last_pred[sel] = final_pred
+        return final_pred
+
+    def shift_window(self, new_t, new_h, new_tn, idx=None):
+        """선택 노드 윈도우를 한 칸 밀고 새 값 추가. 값은 스칼라 또는 노드별 배열."""
+        sel = self._sel(idx)
+        win = self.window_buf[sel]
+        win[:, :-1] = win[:, 1:].copy()
+        win[:, -1, 0] = new_t
+        win[:, -1, 1] = new_h
+        win[:, -1, 2] = new_tn
+        if not isinstance(sel, slice):
+            self.window_buf[sel] = win
+
+    def tick(self, time_n):
+        """60초 EST tick: 전체 노드를 직전 예측값으로 shift 후 다시 predict."""
+        n = len(self.node_ids)
+        self.shift_window(self.last_pred[:n, 0], self.last_pred[:n, 1], time_n)
+        return self.predict()
+
+    def forecast(self, k, time_n_schedule, idx=None, commit=False):
+        """선택 노드(기본: 전체)의 tick() k회를 한 번에 (GatewayMLP.forecast의 노드 batched 버전). 반환: (n, k, 2).
+
+        time_n_schedule: (k,) 모든 노드 공통 또는 (n, k) 노드별 (스칼라도 가능).
+        노드별 윈도우 이력 (n, window + k + 1, 3)에서 스텝마다 view로 batched matmul (out= 스크래치, 스텝당 할당 없음).
+        commit=True면 k회 tick 한 뒤의 윈도우·활성값으로 둔다.
+        """
+        k = int(k)
+        sel = self._sel(idx)
+        win = self.window_buf[sel]
+        n = len(win)
+        n_win = self.window_size
+        hist = np.empty((n, n_win + k + 1, N_FEATURES), dtype=np.float32)
+        hist[:, :n_win] = win
+        hist[:, n_win, :2] = self.last_pred[sel]
+        hist[:, n_win:n_win + k, 2] = time_n_schedule
+
+        f32 = np.float32
+        w1, w2, w3 = self.w1[sel], self.w2[sel], self.w3[sel]
+        b1, b2, b3 = self.b1[sel][:, None, :], self.b2[sel][:, None, :], self.b3[sel][:, None, :]
+        x = np.empty((n, 1, w1.shape[1]), dtype=f32)
+        h1 = np.empty((n, 1, w1.shape[2]), dtype=f32)
+        h2 = np.empty((n, 1, w2.shape[2]), dtype=f32)
+        o = np.empty((n, 1, w3.shape[2]), dtype=f32)
+        zero = np.zeros((), dtype=f32)
+        n_steps = k - 1 if commit and k else k
+        for i in range(n_steps):
+            # (n, window, 3) view → (n, 1, 12): 노드마다 연속 구간이라 복사 없이 reshape
+            window = hist[:, i + 1:i + 1 + n_win].reshape(n, 1, -1)
+            np.subtract(window, self.x_mean, out=x)
+            np.divide(x, self.x_std, out=x)
+            np.matmul(x, w1, out=h1)
+            np.add(h1, b1, out=h1)
+            np.maximum(h1, zero, out=h1)
+            np.matmul(h1, w2, out=h2)
+            np.add(h2, b2, out=h2)
+            np.maximum(h2, zero, out=h2)
+            np.matmul(h2, w3, out=o)
+            np.add(o, b3, out=o)
+            out = hist[:, n_win + 1 + i, :2]
+            np.multiply(o[:, 0, :], self.y_std, out=out)
+            np.add(out, self.y_mean, out=out)
+        if n_steps < k:
+            self.window_buf[sel] = hist[:, k:k + n_win]
+            hist[:, n_win + k, :2] = self.predict(idx)
+        return hist[:, n_win + 1:, :2].copy()
+
+    def online_update(self, actual_t, actual_h, lr=0.05, idx=None):
+        """GatewayMLP.online_update()와 동일한 SGD 규칙을 선택 노드에 일괄 적용.
+
+        직전 predict()의 활성값을 사용하므로 predict → online_update 순서를 지킬 것.
+        lr은 스칼라 또는 노드별 배열.
+        """
+        sel = self._sel(idx)
+        n_sel = len(self.node_ids) if isinstance(sel, slice) else len(sel)
+        lr = np.broadcast_to(np.asarray(lr, dtype=np.float32), (n_sel,))[:, None]
+
+        target = np.empty((n_sel, 2), dtype=np.float32)
+        target[:, 0] = actual_t
+        target[:, 1] = actual_h
+        target_scaled = (target - self.y_mean) / self.y_std
+
+        hidden2 = self.last_hidden2[sel]
+        hidden1 = self.last_hidden1[sel]
+        w3 = self.w3[sel]
+        w2 = self.w2[sel]
+        w1 = self.w1[sel]
+        b3 = self.b3[sel]
+        b2 = self.b2[sel]
+        b1 = self.b1[sel]
+
+        current_pred_scaled = np.matmul(hidden2[:, None, :], w3)[:, 0, :] + b3
+        out_error = target_scaled - current_pred_scaled
+
+        # --- Output layer (W3, B3) ---
+        w3 += lr[:, :, None] * (hidden2[:, :, None] * out_error[:, None, :])
+        b3 += lr * out_error
+
+        # --- Hidden Layer 2 (W2, B2) — ReLU derivative (갱신된 W3 사용, 단일 모델과 동일) ---
+        h2_error = np.matmul(w3, out_error[:, :, None])[:, :, 0] * (self.last_pre_h2[sel] > 0)
+        w2 += lr[:, :, None] * (hidden1[:, :, None] * h2_error[:, None, :])
+        b2 += lr * h2_error
+
+        # --- Hidden Layer 1 (W1, B1) — ReLU derivative ---
+        h1_error = np.matmul(w2, h2_error[:, :, None])[:, :, 0] * (self.last_pre_h1[sel] > 0)
+        w1 += lr[:, :, None] * (self.last_in_scaled[sel][:, :, None] * h1_error[:, None, :])
+        b1 += lr * h1_error
+
+        if not isinstance(sel, slice):
+            self.w1[sel], self.b1[sel] = w1, b1
+            self.w2[sel], self.b2[sel] = w2, b2
+            self.w3[sel], self.b3[sel] = w3, b3
@@ -26,14 +26,26 @@ void loop() {
   int packetSize = LoRa.parsePacket();
 
   if (packetSize) {
-    String received = "";
-    while (LoRa.available()) {
-      received += (char)LoRa.read();
+    uint8_t buf[256];
+    int n = 0;
+    while (LoRa.available() && n < (int)sizeof(buf)) {
+      buf[n++] = LoRa.read();
     }
-    
+
     // 라즈베리 파이(Python)가 읽을 수 있도록 시리얼 출력
-    // 형식: "Received: [온도],[습도]"
-    Serial.println("Received: " + received);
+    // 바이너리 프레임(0xA5로 시작, common/wire_format.py) → "Received: F:<hex>", 텍스트 → "Received: [온도],[습도]"
+    if (n > 0 && buf[0] == 0xA5) {
+      Serial.print("Received: F:");
+      for (int i = 0; i < n; i++) {
+        if (buf[i] < 0x10) Serial.print('0');
+        Serial.print(buf[i], HEX);
+      }
+      Serial.println();
+    } else {
+      String received = "";
+      for (int i = 0; i < n; i++) received += (char)buf[i];
+      Serial.println("Received: " + received);
+    }
 
     // 2. 라즈베리 파이로부터 Unix Timestamp 수신 대기
     // 파이썬 gateway.py가 데이터를 확인하고 즉시 시간을 시리얼로 쏴줍니다.
@@ -0,0 +1,513 @@
+"""
+게이트웨이 이벤트 루프 (selectors 기반).
+
+기존 gateway.py 루프는 ser.in_waiting 폴링 후 매번 time.sleep(1)을 해서 RX와
+타임스탬프 응답(ack)에 최대 1초 지연이 붙었다. 여기서는
+  - 시리얼 fd가 읽기 가능해질 때만 깨어나 줄 단위로 처리 (폴링·sleep 없음)
+  - EST tick은 time.monotonic() 타이머 (마지막 RX/EST로부터 EST_INTERVAL_S 후)
+  - RX 시 ack를 먼저 쓰고, 모델 갱신·로그는 그 다음
+  - MQTT publish는 MqttPublisher(mqtt_publisher.py)의 링 버퍼에 넣고 바로 반환 (전송은 전송 스레드,
+    브로커 지연/재연결이 루프를 막지 않음)
+  - 단계별 지연(시리얼 읽기·decode·parse·twin 확인·ack·online_update·predict·publish)을 StageMetrics에 기록
+  - 엣지 payload는 READING 프레임('F:<hex>', common/wire_format.py) 또는 텍스트 CSV. 프레임 seq 간격으로 놓친 uplink 집계
+  - 여러 스텝 추정은 model.forecast() 한 번: 늦게 깨어나 놓친 EST tick, 재시작 공백(catch_up), twin n_skip 재생,
+    /api/forecast (forecast_route, HTTP 스레드 요청은 call_in_loop로 루프 스레드에서 실행)
+시리얼 fd를 selector에 등록하므로 POSIX(/dev/ttyUSB*, pty) 전용.
+
+엣지 twin (twin_base가 주어지고 엣지가 'ts,t,h,n_skip,hash' 페이로드를 보낼 때, model은 EdgeTwinMLP):
+  - 엣지는 SKIP 스텝의 윈도우 time_n을 직전 SEND 시각 + EDGE_STEP_S * k로 정하고, EST도 같은 값을 쓴다
+  - RX 시 직전 RX 직후 윈도우에서 엣지가 보고한 n_skip 스텝을 다시 굴려 엣지 forward()와 같은 상태를 만들고
+    (EST tick 수가 엣지 스텝 수와 달라도 무관) 상태 해시를 비교한다
+  - 불일치면 ack를 '<unix>,R'로 보내 엣지를 재부팅시키고, 엣지의 부팅 ping('0.0,0.0')에서
+    게이트웨이도 사전학습 가중치 + 초기 윈도우로 되돌린다 → 양쪽이 같은 상태에서 다시 시작
+  해시 비교가 ack보다 먼저이므로 ack는 n_skip회 predict만큼 늦어진다 (twin predict 약 0.05 ms/회).
+
+가중치 delta push (delta_topk > 0, weight_delta.py):
+  - 부팅 ping에서 사전학습 상태로 되돌리는 대신, 온라인 학습한 가중치와 사전학습 가중치의 차이
+    (상위 delta_topk개, int8)를 ack '<unix>,D<조각 수>'로 알리고 twin은 엣지가 적용 후 가질 상태로 둔다
+  - 엣지 'D,<seq>' 요청마다 조각 한 줄을 응답, 'D,end,<해시>'로 적용 결과 확인
+  - 확인되지 않은 push가 DELTA_MAX_ATTEMPTS회 이어지면 (조각 유실, 구형 펌웨어 등) 사전학습 상태로 되돌린다
+
+온라인 SGD 발산: online_update 뒤 가중치에 NaN/inf가 있으면 사전학습 가중치(twin_base, 없으면 시작 시 가중치)와
+초기 윈도우로 되돌린다. 엣지도 update_model() 뒤 같은 검사로 재부팅하므로 (twin은 같은 RX에서 같은 가중치)
+부팅 ping 뒤 양쪽이 같은 상태에서 다시 시작한다.
+"""
+import json
+import os
+import queue
+import selectors
+import threading
+import time
+from datetime import datetime, timezone, timedelta
+
+import numpy as np
+
+from common.wire_format import FRAME_PREFIX, Reading, decode_reading, from_line
+from edge_twin import edge_time_n
+from stage_metrics import StageMetrics, now_ns
+from weight_delta import make_push, parse_delta_request
+
+LV_TIMEZONE = timezone(timedelta(hours=-8))
+
+BETA_TEMP = 0.5
+BETA_HUM = 3.0
+EST_INTERVAL_S = 60
+ONLINE_LR = 0.01
+# MLP_edge_sensor.ino STEP_S (루프 주기): SKIP 스텝 윈도우 time_n의 간격
+EDGE_STEP_S = 60
+# 엣지 확인('D,end,<해시>' 일치) 없이 연속으로 delta push를 시도하는 최대 횟수
+DELTA_MAX_ATTEMPTS = 2
+# /api/forecast 기본 스텝 수, forecast·catch-up 최대 스텝 수 (EST 60초 기준 1시간 / 하루)
+FORECAST_DEFAULT_STEPS = 60
+FORECAST_MAX_STEPS = 1440
+
+
+def parse_rx_line(line):
+    """'Received: F:<hex>' (READING 프레임, common/wire_format.py) 또는 텍스트 'Received: ts,t,h,n_skip,hash'
+    (구형: 'ts,t,h', 't,h') → Reading. 텍스트에 없는 필드(node, seq, ts, twin)는 None.
+
+    'Received:'가 없는 줄은 None. 형식 오류는 ValueError(FrameError 포함)/IndexError.
+    """
+    if "Received:" not in line:
+        return None
+    payload = line.split("Received: ")[1].strip()
+    if payload.startswith(FRAME_PREFIX):
+        return decode_reading(from_line(payload))
+    parts = payload.split(",")
+    if len(parts) >= 5:
+        return Reading(None, None, int(parts[0]), float(parts[1]), float(parts[2]), int(parts[3]), int(parts[4], 16))
+    if len(parts) >= 3:
+        return Reading(None, None, int(parts[0]), float(parts[1]), float(parts[2]), None, None)
+    return Reading(None, None, None, float(parts[0]), float(parts[1]), None, None)
+
+
+def local_time_n(now=None):
+    """(LV 현지 datetime, time_n 0~1)."""
+    now_lv = now or datetime.now(LV_TIMEZONE)
+    return now_lv, ((now_lv.hour * 3600) + (now_lv.minute * 60) + now_lv.second) / 86400.0
+
+
+class GatewayRuntime:
+    """시리얼 RX · EST tick 이벤트 루프.
+
+    model: GatewayMLP, ser: pyserial Serial (fileno() 필요),
+    publish: publish(payload_dict, qos) — 호출 즉시 반환해야 함 (MqttPublisher.publish 등).
+    metrics: StageMetrics (None이면 새로 생성, self.metrics로 조회).
+    checkpoint: Checkpointer — RX/EST 처리 후 maybe_capture() 호출 (가중치 복사만, 파일 쓰기는 별도 스레드).
+    twin_base: 사전학습 모델 배열 (read_model_file) — 주어지면 엣지 twin 동기화 (model은 EdgeTwinMLP).
+    delta_topk: 0보다 크면 엣지 부팅 때 가중치 delta push (base_checksum: 모델 파일 checksum = MLP_MODEL_CHECKSUM).
+    """
+
+    def __init__(self, model, ser, publish, est_interval=EST_INTERVAL_S, lr=ONLINE_LR, verbose=True,
+                 clock=time.monotonic, metrics=None, checkpoint=None, twin_base=None,
+                 delta_topk=0, base_checksum=0):
+        self.model = model
+        self.ser = ser
+        self.publish = publish
+        self.est_interval = est_interval
+        self.lr = lr
+        self.verbose = verbose
+        self.clock = clock
+        self.checkpoint = checkpoint
+        self.metrics = metrics if metrics is not None else StageMetrics()
+        h = self.metrics.histogram
+        self._h_serial_read = h("serial_read")
+        self._h_decode = h("decode")
+        self._h_parse = h("parse")
+        self._h_ack = h("ack_write")
+        self._h_twin_check = h("twin_check")
+        self._h_online_update = h("online_update")
+        self._h_predict = h("predict")
+        self._h_publish = h("publish")
+        self._h_rx_total = h("rx_total")
+        self._h_est_total = h("est_total")
+        self._h_checkpoint = h("checkpoint")
+        self.metrics.gauge("total_tx", lambda: self.total_tx_count, "Edge transmissions received")
+        self.metrics.gauge("rx_lost", lambda: self.rx_lost, "Edge frames missed (sequence gaps)")
+        self.metrics.gauge("model_diverged", lambda: self.model_diverged, "Model resets after online SGD divergence")
+        self.metrics.gauge("est_catch_up", lambda: self.est_catch_up, "EST ticks computed late (gap catch-up)")
+        self.metrics.gauge("twin_checked", lambda: self.twin_counters["checked"], "RX state hashes compared")
+        self.metrics.gauge("twin_mismatch", lambda: self.twin_counters["mismatch"], "RX state hash mismatches")
+        self.metrics.gauge("twin_reset", lambda: self.twin_counters["reset"], "Twin resets on edge boot")
+        self.metrics.gauge("delta_push", lambda: self.twin_counters["delta_push"], "Weight delta pushes offered")
+        self.metrics.gauge("delta_ok", lambda: self.twin_counters["delta_ok"], "Weight delta pushes confirmed")
+        self.metrics.gauge("delta_fail", lambda: self.twin_counters["delta_fail"], "Weight delta pushes failed")
+
+        self.twin_base = twin_base
+        self.twin_counters = {"checked": 0, "mismatch": 0, "reset": 0, "delta_push": 0, "delta_ok": 0,
+                              "delta_fail": 0}
+        self.delta_topk = delta_topk
+        self.base_checksum = base_checksum
+        self._push = None
+        self._push_attempts = 0
+        # 직전 RX(또는 엣지 부팅) 직후의 윈도우 · 그 스텝의 엣지 unix 초 · 그 뒤 EST 수
+        self._anchor_window = None
+        self._anchor_unix = None
+        self._est_steps = 0
+
+        self.total_tx_count = 0
+        self.rx_lost = 0
+        self.est_catch_up = 0
+        self.model_diverged = 0
+        # 발산 시 되돌릴 가중치
+        self._reset_arrays = twin_base if twin_base is not None else {
+            name: np.array(getattr(model, name)) for name in ("w1", "b1", "w2", "b2", "w3", "b3")}
+        self._last_seq = {}
+        self._calls = queue.SimpleQueue()
+        self._rx_buf = bytearray()
+        self._next_est = None
+        self._stopping = False
+        self._wake_r, self._wake_w = os.pipe()
+        os.set_blocking(self._wake_r, False)
+
+        model.predict()
+
+    def stop(self):
+        """다른 스레드/시그널 핸들러에서 호출 가능. run()이 현재 이벤트 처리 후 반환."""
+        self._stopping = True
+        os.write(self._wake_w, b"\0")
+
+    def run(self):
+        sel = selectors.DefaultSelector()
+        sel.register(self.ser.fileno(), selectors.EVENT_READ, self._on_serial_readable)
+        sel.register(self._wake_r, selectors.EVENT_READ, None)
+        self._next_est = self.clock() + self.est_interval
+        try:
+            while not self._stopping:
+                timeout = max(self._next_est - self.clock(), 0.0)
+                for key, _ in sel.select(timeout):
+                    if key.data is None:
+                        os.read(self._wake_r, 64)
+                        self._run_calls()
+                    else:
+                        key.data()
+                if not self._stopping and self.clock() >= self._next_est:
+                    self._on_est()
+        finally:
+            sel.close()
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+    def call_in_loop(self, fn, timeout=5.0):
+        """다른 스레드(HTTP 핸들러 등)에서 fn()을 이벤트 루프 스레드에서 실행하고 결과 반환.
+
+        모델은 루프 스레드만 갱신하므로 읽기도 여기서 해야 online_update/shift_window 도중 값을 보지 않는다.
+        루프가 timeout 안에 실행하지 못하면 TimeoutError, fn의 예외는 그대로 다시 발생.
+        """
+        done = threading.Event()
+        result = {}
+        self._calls.put((fn, result, done))
+        os.write(self._wake_w, b"\0")
+        if not done.wait(timeout):
+            raise TimeoutError("gateway event loop did not respond")
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def _run_calls(self):
+        while True:
+            try:
+                fn, result, done = self._calls.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                result["value"] = fn()
+            except Exception as e:
+                result["error"] = e
+            done.set()
+
+    def _ack(self, flag=""):
+        """타임스탬프 응답. flag가 있으면 '<unix>,<flag>' ('R': 엣지 재부팅 요청, 'D<n>': delta push). 보낸 unix 초 반환."""
+        now = int(time.time())
+        self.ser.write(f"{now},{flag}\n".encode() if flag else f"{now}\n".encode())
+        return now
+
+    def _on_boot(self):
+        """엣지 부팅 ping: twin을 엣지가 가질 상태로 두고 ack flag 반환 ('D<n>' 또는 '')."""
+        self._push = None
+        if self.delta_topk > 0 and self._push_attempts < DELTA_MAX_ATTEMPTS and self.model.weights_finite():
+            self._push = make_push(self.model, self.twin_base, self.base_checksum, self.delta_topk)
+        else:
+            self.model.reset(self.twin_base)
+        if self._push is None:
+            self._push_attempts = 0
+            return ""
+        self._push_attempts += 1
+        self.twin_counters["delta_push"] += 1
+        return f"D{len(self._push.lines)}"
+
+    def _on_delta(self, request):
+        """엣지 delta 요청/보고. 조각 요청이면 그 줄을 응답 (ack 대신)."""
+        kind, value = request
+        push = self._push
+        if push is None:
+            return
+        if kind == "chunk":
+            if 0 <= value < len(push.lines):
+                self.ser.write(f"{push.lines[value]}\n".encode())
+            return
+        self._push = None
+        if value == push.target_hash:
+            self.twin_counters["delta_ok"] += 1
+            self._push_attempts = 0
+        else:
+            self.twin_counters["delta_fail"] += 1
+            if value is None:
+                # 엣지는 적용하지 않음 (사전학습 상태 그대로, 해시가 다르면 엣지가 재부팅 → 다음 ping에서 다시)
+                self.model.reset(self.twin_base)
+        if self.verbose:
+            print(f"[Delta] {'applied' if value == push.target_hash else 'FAILED'} "
+                  f"({push.n_entries} weights, {push.blob_bytes} B, {len(push.lines)} chunks)")
+
+    def _set_anchor(self, unix_s):
+        self._anchor_window = self.model.window_buf.copy()
+        self._anchor_unix = unix_s
+        self._est_steps = 0
+
+    def _twin_check(self, n_skip, edge_hash):
+        """직전 anchor에서 n_skip 스텝을 엣지와 같은 time_n으로 다시 굴린 뒤 상태 해시 비교."""
+        m = self.model
+        if self._anchor_window is not None and self._est_steps != n_skip:
+            np.copyto(m.window_buf, self._anchor_window)
+            m.predict()
+            m.forecast(n_skip, [edge_time_n(self._anchor_unix + EDGE_STEP_S * k) for k in range(1, n_skip + 1)],
+                       commit=True)
+        self.twin_counters["checked"] += 1
+        if m.state_hash() == edge_hash:
+            return True
+        self.twin_counters["mismatch"] += 1
+        return False
+
+    def _est_schedule(self, k, last_unix):
+        """last_unix 다음 EST tick k회의 (unix 초 리스트, time_n 리스트).
+
+        엣지 anchor가 있으면 엣지 SKIP 스텝 시각 (anchor + EDGE_STEP_S * (EST 수 + j), last_unix 무시),
+        없으면 last_unix + est_interval * j의 현지 time_n.
+        """
+        if self._anchor_unix is not None:
+            unix = [self._anchor_unix + EDGE_STEP_S * (self._est_steps + j) for j in range(1, k + 1)]
+            return unix, [edge_time_n(u) for u in unix]
+        unix = [last_unix + self.est_interval * j for j in range(1, k + 1)]
+        return unix, [local_time_n(datetime.fromtimestamp(u, LV_TIMEZONE))[1] for u in unix]
+
+    def catch_up(self, since_unix):
+        """since_unix(모델 윈도우가 마지막으로 진행한 시각, 예: 체크포인트 저장 시각) 이후 놓친 EST tick을
+        forecast 한 번으로 진행. run() 전(또는 루프 스레드)에서 호출. 반환: 진행한 tick 수.
+
+        공백이 FORECAST_MAX_STEPS tick보다 길면 마지막 FORECAST_MAX_STEPS tick만 진행한다.
+        """
+        n = int((time.time() - since_unix) // self.est_interval)
+        if n <= 0:
+            return 0
+        k = min(n, FORECAST_MAX_STEPS)
+        _, schedule = self._est_schedule(k, since_unix + self.est_interval * (n - k))
+        if self._anchor_unix is not None:
+            self._est_steps += k
+        self.model.forecast(k, schedule, commit=True)
+        self.est_catch_up += k
+        return k
+
+    def forecast(self, k=FORECAST_DEFAULT_STEPS):
+        """다음 EST tick k회(최대 FORECAST_MAX_STEPS)의 추정값 리스트. 모델 상태는 그대로 (루프 스레드에서 호출)."""
+        k = min(max(int(k), 1), FORECAST_MAX_STEPS)
+        now = time.time()
+        # 다음 tick 시각: 루프 시계(monotonic) 기준 남은 시간을 벽시계로 환산
+        wait = self.est_interval if self._next_est is None else max(self._next_est - self.clock(), 0.0)
+        unix, schedule = self._est_schedule(k, now + wait - self.est_interval)
+        preds = self.model.forecast(k, schedule)
+        # 발산(NaN)은 JSON null
+        return [{
+            "timestamp": datetime.fromtimestamp(u, LV_TIMEZONE).strftime("%Y-%m-%d %H:%M:%S"),
+            "time_n": round(tn, 4),
+            "pred_t": None if t != t else round(float(t), 2),
+            "pred_h": None if h != h else round(float(h), 2),
+        } for u, tn, (t, h) in zip(unix, schedule, preds)]
+
+    def forecast_route(self, query):
+        """MetricsServer route: GET /api/forecast?k=<스텝 수> → JSON {interval_s, points: [...]}."""
+        try:
+            k = int(query.get("k", FORECAST_DEFAULT_STEPS))
+        except ValueError:
+            return 400, "text/plain", b"k must be an integer\n"
+        points = self.call_in_loop(lambda: self.forecast(k))
+        body = json.dumps({"interval_s": self.est_interval, "points": points})
+        return 200, "application/json", (body + "\n").encode()
+
+    def _on_serial_readable(self):
+        t0 = now_ns()
+        self._rx_buf += self.ser.read(self.ser.in_waiting or 1)
+        self._h_serial_read.since(t0)
+        while True:
+            t0 = now_ns()
+            end = self._rx_buf.find(b"\n")
+            if end < 0:
+                return
+            line = self._rx_buf[:end].decode("utf-8", errors="ignore").strip()
+            del self._rx_buf[:end + 1]
+            self._h_decode.since(t0)
+            self._on_line(line, t0)
+
+    def _count_lost(self, rx):
+        # 엣지는 재부팅하면 seq 0부터, 중복·역순(gap >= 2^15)은 무시
+        last = self._last_seq.get(rx.node)
+        self._last_seq[rx.node] = rx.seq
+        if last is not None and rx.seq != 0:
+            gap = (rx.seq - last - 1) & 0xFFFF
+            if gap < 0x8000:
+                self.rx_lost += gap
+
+    def _on_line(self, line, t_start=None):
+        """t_start: 이 줄의 decode 시작 시각 (now_ns) — rx_total 기준."""
+        t0 = now_ns()
+        t_start = t_start or t0
+        try:
+            gateway_receive_ms = int(time.time() * 1000)
+            delta = parse_delta_request(line) if self.twin_base is not None else None
+            if delta is not None:
+                self._on_delta(delta)
+                return
+            rx = parse_rx_line(line)
+            if rx is None:
+                return
+            edge_timestamp_ms, actual_t, actual_h = rx.timestamp_ms, rx.t, rx.h
+            twin = (rx.n_skip, rx.state_hash) if self.twin_base is not None and rx.state_hash is not None else None
+        except Exception as e:
+            print(f"Error parsing: {e}")
+            return
+        if rx.seq is not None:
+            self._count_lost(rx)
+        t0 = self._h_parse.since(t0)
+
+        # twin: 엣지 상태와 같은지 먼저 확인해 결과(재부팅 요청·delta push)를 ack에 실음
+        in_sync = True
+        flag = ""
+        is_ping = actual_t == 0.0 and actual_h == 0.0
+        if twin is not None and edge_timestamp_ms is not None:
+            in_sync = self._twin_check(*twin)
+            flag = "" if in_sync else "R"
+            t0 = self._h_twin_check.since(t0)
+        elif is_ping and self.twin_base is not None:
+            # 엣지 부팅 (사전학습 가중치 + init_window, delta push면 적용 후 상태)
+            flag = self._on_boot()
+            t0 = self._h_twin_check.since(t0)
+        # 엣지는 ack(타임스탬프)를 1초만 기다리므로 나머지 모델 처리보다 먼저 응답
+        ack_unix = self._ack(flag)
+        self._h_ack.since(t0)
+        now_lv, time_n = local_time_n()
+
+        if is_ping:
+            if self.twin_base is not None:
+                # SKIP time_n 기준 = 이 ack 시각
+                self._set_anchor(ack_unix)
+                self.twin_counters["reset"] += 1
+            if self.verbose:
+                push = f" + weight delta ({self._push.n_entries} weights, {flag[1:]} chunks)" if self._push else ""
+                print(f"[{now_lv.strftime('%H:%M:%S')}] Sync Ping - Only Time Sent{push}")
+            return
+
+        m = self.model
+        pred_t, pred_h = m.last_pred_t, m.last_pred_h
+        self.total_tx_count += 1
+        err_t = abs(actual_t - pred_t)
+        err_h = abs(actual_h - pred_h)
+        transmission_delay_ms = None if edge_timestamp_ms is None else gateway_receive_ms - edge_timestamp_ms
+
+        if self.verbose:
+            frame = "" if rx.seq is None else f", node {rx.node} seq {rx.seq}, lost {self.rx_lost}"
+            print(f"\n[{now_lv.strftime('%H:%M:%S')}] Data RX! (TX Count: {self.total_tx_count}{frame})")
+            print(f"   Actual: {actual_t:.2f}C / {actual_h:.2f}% | Pred: {pred_t:.2f}C / {pred_h:.2f}%")
+            if transmission_delay_ms is not None:
+                print(f"   Transmission delay: {transmission_delay_ms} ms")
+            if twin is not None:
+                print(f"   Twin: {'in sync' if in_sync else 'STATE HASH MISMATCH → edge resync'} "
+                      f"(n_skip={twin[0]}, hash={twin[1]:08x})")
+
+        is_aoii = (err_t >= BETA_TEMP or err_h >= BETA_HUM)
+        payload_out = {
+            "event": "RX",
+            "timestamp": now_lv.strftime("%Y-%m-%d %H:%M:%S"),
+            "time_n": round(time_n, 4),
+            "actual_t": round(actual_t, 2),
+            "actual_h": round(actual_h, 2),
+            "pred_t": round(pred_t, 2),
+            "pred_h": round(pred_h, 2),
+            "error_t": round(err_t, 2),
+            "error_h": round(err_h, 2),
+            "total_tx": self.total_tx_count,
+        }
+        if transmission_delay_ms is not None:
+            payload_out["transmission_delay_ms"] = transmission_delay_ms
+        t0 = now_ns()
+        self.publish(payload_out, qos=1 if is_aoii else 0)
+        t0 = self._h_publish.since(t0)
+
+        if twin is not None and not in_sync:
+            # 엣지는 갱신 없이 재부팅 → 부팅 ping에서 reset
+            self._h_rx_total.since(t_start)
+            self._next_est = self.clock() + self.est_interval
+            return
+        m.online_update(actual_t, actual_h, lr=self.lr)
+        t0 = self._h_online_update.since(t0)
+        if not m.weights_finite():
+            # 발산: 사전학습 상태로 (twin이면 엣지도 이 갱신 뒤 재부팅 → 부팅 ping에서 anchor 다시 설정)
+            m.reset(self._reset_arrays)
+            self._anchor_window = self._anchor_unix = None
+            self.model_diverged += 1
+            if self.verbose:
+                print(f"[{now_lv.strftime('%H:%M:%S')}] Online SGD diverged (NaN/inf weights) → pretrained weights")
+            self._h_rx_total.since(t_start)
+            self._next_est = self.clock() + self.est_interval
+            return
+        if twin is not None:
+            # 엣지와 같은 time_n (엣지 시계 기준 루프 시작 시각)
+            edge_unix = edge_timestamp_ms // 1000
+            m.shift_window(pred_t, pred_h, edge_time_n(edge_unix))
+            m.predict()
+            self._set_anchor(edge_unix)
+        else:
+            m.shift_window(pred_t, pred_h, time_n)
+            m.predict()
+        self._h_predict.since(t0)
+        self._h_rx_total.since(t_start)
+        self._next_est = self.clock() + self.est_interval
+        self._maybe_checkpoint()
+
+    def _maybe_checkpoint(self):
+        if self.checkpoint is not None:
+            t0 = now_ns()
+            self.checkpoint.maybe_capture()
+            self._h_checkpoint.since(t0)
+
+    def _on_est(self):
+        t_start = now_ns()
+        now_lv, _ = local_time_n()
+        # 루프가 늦게 깨어났으면 (시스템 일시정지, 긴 처리 등) 놓친 tick까지 한 번에
+        n_ticks = min(1 + max(int((self.clock() - self._next_est) // self.est_interval), 0), FORECAST_MAX_STEPS)
+        # anchor가 있으면 엣지 SKIP 스텝과 같은 time_n
+        _, schedule = self._est_schedule(n_ticks, time.time() - self.est_interval * n_ticks)
+        if self._anchor_unix is not None:
+            self._est_steps += n_ticks
+        time_n = schedule[-1]
+        m = self.model
+        t0 = now_ns()
+        m.forecast(n_ticks, schedule, commit=True)
+        self._h_predict.since(t0)
+        if n_ticks > 1:
+            self.est_catch_up += n_ticks - 1
+            if self.verbose:
+                print(f"[{now_lv.strftime('%H:%M:%S')}] EST catch-up: {n_ticks} ticks")
+        self.publish({
+            "event": "EST",
+            "timestamp": now_lv.strftime("%Y-%m-%d %H:%M:%S"),
+            "time_n": round(time_n, 4),
+            "actual_t": None,
+            "actual_h": None,
+            "pred_t": round(m.last_pred_t, 2),
+            "pred_h": round(m.last_pred_h, 2),
+            "error_t": None,
+            "error_h": None,
+            "total_tx": self.total_tx_count,
+        }, qos=0)
+        self._h_est_total.since(t_start)
+        self._next_est = self.clock() + self.est_interval
+        self._maybe_checkpoint()
@@ -0,0 +1,153 @@
+"""
+GatewayMLP용 순수 NumPy 학습기.
+
+GatewayMLP.forward()/backward()로 미니배치 SGD/Adam + early stopping 학습을 하고,
+simulate_online()은 GatewayMLP.online_update()를 그대로 사용해 엣지·게이트웨이의
+온라인 SGD를 데이터셋 위에서 재현한다. 사전학습과 온라인 갱신이 같은 코드 경로를 쓰며
+scikit-learn이 필요 없다.
+"""
+import numpy as np
+
+from gateway_MLP_Logic import GatewayMLP
+
+PARAM_NAMES = ("w1", "b1", "w2", "b2", "w3", "b3")
+
+
+def fit_scaler(a):
+    """StandardScaler와 같은 (mean, std). 분산 0인 열은 std=1."""
+    mean = a.mean(axis=0)
+    std = a.std(axis=0)
+    std[std == 0.0] = 1.0
+    return mean, std
+
+
+def create_model(X, y, h1_size, h2_size, seed=42, **kwargs):
+    """데이터로 스케일러를 정하고 Glorot uniform(ReLU, sklearn MLPRegressor와 같은 범위)으로 초기화한 모델."""
+    rng = np.random.default_rng(seed)
+    sizes = [X.shape[1], h1_size, h2_size, y.shape[1]]
+    params = []
+    for fan_in, fan_out in zip(sizes[:-1], sizes[1:]):
+        bound = np.sqrt(6.0 / (fan_in + fan_out))
+        params += [rng.uniform(-bound, bound, (fan_in, fan_out)), rng.uniform(-bound, bound, fan_out)]
+    x_mean, x_std = fit_scaler(X)
+    y_mean, y_std = fit_scaler(y)
+    kwargs.setdefault("verbose", False)
+    return GatewayMLP(*params, x_mean, x_std, y_mean, y_std, **kwargs)
+
+
+class MLPTrainer:
+    """GatewayMLP 가중치를 제자리에서 학습 (미니배치 SGD/Adam, early stopping).
+
+    설정 기본값은 Pre_train.py의 MLPRegressor(adam, batch 200, alpha 1e-4, 검증 10%,
+    n_iter_no_change 50)와 같다.
+    """
+
+    def __init__(self, model, optimizer="adam", learning_rate=0.001, batch_size=200, max_epochs=10000,
+                 early_stopping=True, validation_fraction=0.1, n_iter_no_change=50, tol=1e-4, alpha=1e-4,
+                 beta_1=0.9, beta_2=0.999, epsilon=1e-8, seed=42):
+        if optimizer not in ("adam", "sgd"):
+            raise ValueError(f"unknown optimizer: {optimizer}")
+        self.model = model
+        self.optimizer = optimizer
+        self.learning_rate = learning_rate
+        self.batch_size = batch_size
+        self.max_epochs = max_epochs
+        self.early_stopping = early_stopping
+        self.validation_fraction = validation_fraction
+        self.n_iter_no_change = n_iter_no_change
+        self.tol = tol
+        self.alpha = alpha
+        self.beta_1, self.beta_2, self.epsilon = beta_1, beta_2, epsilon
+        self.rng = np.random.default_rng(seed)
+        self.n_iter_ = 0
+        self.loss_curve_ = []
+        self.validation_curve_ = []
+
+    def scale(self, X, y=None):
+        m = self.model
+        X_scaled = ((X - m.x_mean) / m.x_std).astype(np.float32)
+        if y is None:
+            return X_scaled
+        return X_scaled, ((y - m.y_mean) / m.y_std).astype(np.float32)
+
+    def _loss(self, X_scaled, y_scaled):
+        out = self.model.forward(X_scaled)[-1]
+        return 0.5 * float(np.mean(np.sum((y_scaled - out) ** 2, axis=1)))
+
+    def fit(self, X, y):
+        """X: (n, n_in) 원 단위 윈도우, y: (n, 2) 원 단위 타깃. 모델 가중치를 갱신하고 self 반환."""
+        m = self.model
+        X_scaled, y_scaled = self.scale(X, y)
+        idx = self.rng.permutation(len(X_scaled))
+        if self.early_stopping:
+            n_val = max(int(len(idx) * self.validation_fraction), 1)
+            val_idx, idx = idx[:n_val], idx[n_val:]
+            X_val, y_val = X_scaled[val_idx], y_scaled[val_idx]
+        X_train, y_train = X_scaled[idx], y_scaled[idx]
+        batch_size = min(self.batch_size, len(X_train))
+
+        moments = {name: (np.zeros_like(getattr(m, name)), np.zeros_like(getattr(m, name))) for name in PARAM_NAMES}
+        step = 0
+        best_score, best_params, no_improve = np.inf, None, 0
+
+        for epoch in range(self.max_epochs):
+            order = self.rng.permutation(len(X_train))
+            epoch_loss = 0.0
+            for start in range(0, len(order), batch_size):
+                b = order[start:start + batch_size]
+                xb, yb = X_train[b], y_train[b]
+                cache = m.forward(xb)
+                out_error = yb - cache[-1]
+                epoch_loss += 0.5 * float(np.sum(out_error ** 2))
+                grads = m.backward(xb, cache, out_error)
+                step += 1
+                for name in PARAM_NAMES:
+                    param = getattr(m, name)
+                    g = grads[name]
+                    if self.alpha and name[0] == "w":
+                        g = g + self.alpha * param / len(b)
+                    if self.optimizer == "adam":
+                        m1, m2 = moments[name]
+                        m1 *= self.beta_1
+                        m1 += (1 - self.beta_1) * g
+                        m2 *= self.beta_2
+                        m2 += (1 - self.beta_2) * g * g
+                        lr_t = self.learning_rate * np.sqrt(1 - self.beta_2 ** step) / (1 - self.beta_1 ** step)
+                        param -= (lr_t * m1 / (np.sqrt(m2) + self.epsilon)).astype(np.float32)
+                    else:
+                        param -= (self.learning_rate * g).astype(np.float32)
+
+            self.n_iter_ = epoch + 1
+            self.loss_curve_.append(epoch_loss / len(X_train))
+            score = self._loss(X_val, y_val) if self.early_stopping else self.loss_curve_[-1]
+            self.validation_curve_.append(score)
+            if score < best_score - self.tol:
+                best_score, no_improve = score, 0
+                if self.early_stopping:
+                    best_params = {name: getattr(m, name).copy() for name in PARAM_NAMES}
+            else:
+                no_improve += 1
+                if no_improve >= self.n_iter_no_change:
+                    break
+
+        if best_params is not None:
+            for name in PARAM_NAMES:
+                getattr(m, name)[...] = best_params[name]
+        self.best_score_ = best_score
+        return self
+
+    def simulate_online(self, X, y, lr=0.01, send_mask=None):
+        """데이터셋을 시간 순으로 돌며 엣지/게이트웨이와 같은 온라인 SGD(online_update)를 적용.
+
+        각 스텝: window_buf ← X[i] → predict() → (send_mask[i]이면) online_update(y[i]).
+        반환: 갱신 전 예측의 절대 오차 (n, 2) (prequential error).
+        """
+        m = self.model
+        errors = np.empty((len(X), 2))
+        for i in range(len(X)):
+            m.window_buf[...] = X[i].reshape(m.window_buf.shape)
+            pred = m.predict()
+            errors[i] = np.abs(y[i] - pred)
+            if send_mask is None or send_mask[i]:
+                m.online_update(float(y[i, 0]), float(y[i, 1]), lr=lr)
+        return errors
@@ -0,0 +1,154 @@
+"""
+MLP 모델 바이너리 아티팩트 (.bin) 읽기/쓰기 + 엣지용 C 헤더 생성.
+
+Pre_train.py가 학습 결과를 이 형식으로 저장하고, 게이트웨이는 GatewayMLP.from_file()로
+파일을 memory-map 해서 float 리터럴 파싱 없이 바로 사용한다.
+
+파일 구조 (little-endian):
+  [고정 헤더 32B]  magic(8s) version(H) window_size(H) n_features(H) n_arrays(H)
+                   header_size(I) data_size(I) checksum(I, 데이터 영역 CRC32) reserved(I)
+  [배열 테이블]    배열마다 52B: name(16s) dtype(H) ndim(H) dims(4I) offset(I, 데이터 영역 기준) nbytes(I) pad(8x)
+  [데이터 영역]    DATA_ALIGN 정렬된 연속 blob (C order)
+"""
+import os
+import struct
+import zlib
+
+import numpy as np
+
+MAGIC = b"AOIIMLP\0"
+FORMAT_VERSION = 1
+DATA_ALIGN = 64
+
+# 사전학습 모델을 구성하는 배열 (순서 = 파일 내 저장 순서)
+MODEL_ARRAYS = ("x_mean", "x_std", "y_mean", "y_std", "w1", "b1", "w2", "b2", "w3", "b3")
+
+_HEADER = struct.Struct("<8sHHHHIIII")
+_ENTRY = struct.Struct("<16sHH4III8x")
+
+# dtype 코드 (파일 포맷 고정값)
+_DTYPES = {1: np.dtype("<f4"), 2: np.dtype("<i1"), 3: np.dtype("<i2"), 4: np.dtype("<i4")}
+_DTYPE_CODES = {dt: code for code, dt in _DTYPES.items()}
+
+
+class ModelFileError(ValueError):
+    """모델 파일 형식/버전/체크섬 오류."""
+
+
+def _align(n, a=DATA_ALIGN):
+    return (n + a - 1) // a * a
+
+
+def write_model_file(path, arrays, window_size, n_features):
+    """arrays(dict name → array)를 모델 파일로 저장. 임시 파일에 쓴 뒤 rename (원자적 교체)."""
+    entries = []
+    blobs = []
+    offset = 0
+    for name, arr in arrays.items():
+        arr = np.ascontiguousarray(arr)
+        if arr.dtype.kind == "f":
+            arr = arr.astype("<f4", copy=False)
+        dtype = arr.dtype.newbyteorder("<")
+        if dtype not in _DTYPE_CODES:
+            raise ModelFileError(f"unsupported dtype for {name}: {arr.dtype}")
+        if arr.ndim > 4 or len(name.encode("ascii")) > 16:
+            raise ModelFileError(f"unsupported array: {name} {arr.shape}")
+        offset = _align(offset, 16)
+        dims = list(arr.shape) + [0] * (4 - arr.ndim)
+        entries.append(_ENTRY.pack(name.encode("ascii"), _DTYPE_CODES[dtype], arr.ndim, *dims, offset, arr.nbytes))
+        blobs.append((offset, arr.astype(dtype, copy=False).tobytes()))
+        offset += arr.nbytes
+
+    data = bytearray(offset)
+    for off, blob in blobs:
+        data[off:off + len(blob)] = blob
+
+    header_size = _align(_HEADER.size + _ENTRY.size * len(entries))
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, window_size, n_features, len(entries),
+                          header_size, len(data), zlib.crc32(data), 0)
+    table = b"".join(entries)
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(table)
+        f.write(b"\0" * (header_size - len(header) - len(table)))
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_model_file(path, verify=True):
+    """모델 파일을 memory-map 해서 (meta, arrays) 반환.
+
+    arrays의 각 값은 파일을 가리키는 view (복사 없음). copy-on-write 매핑이므로
+    online_update 등으로 값을 바꿔도 파일은 변하지 않는다.
+    """
+    mm = np.memmap(path, dtype=np.uint8, mode="c")
+    if len(mm) < _HEADER.size:
+        raise ModelFileError(f"{path}: file too short")
+    magic, version, window_size, n_features, n_arrays, header_size, data_size, checksum, _ = \
+        _HEADER.unpack_from(mm, 0)
+    if magic != MAGIC:
+        raise ModelFileError(f"{path}: not a model file (magic={magic!r})")
+    if version != FORMAT_VERSION:
+        raise ModelFileError(f"{path}: unsupported format version {version}")
+    data = mm[header_size:header_size + data_size]
+    if len(data) != data_size:
+        raise ModelFileError(f"{path}: truncated data section")
+    if verify and zlib.crc32(data) != checksum:
+        raise ModelFileError(f"{path}: checksum mismatch")
+
+    arrays = {}
+    for i in range(n_arrays):
+        name, code, ndim, d0, d1, d2, d3, offset, nbytes = _ENTRY.unpack_from(mm, _HEADER.size + i * _ENTRY.size)
+        shape = (d0, d1, d2, d3)[:ndim]
+        arrays[name.rstrip(b"\0").decode("ascii")] = data[offset:offset + nbytes].view(_DTYPES[code]).reshape(shape)
+
+    meta = {"version": version, "window_size": window_size, "n_features": n_features, "checksum": checksum}
+    return meta, arrays
+
+
+def _f32_literal(v):
+    # float32 값을 그대로 복원하는 가장 짧은 10진 표기 (C 컴파일러가 같은 float로 읽음).
+    # 소수 6자리 반올림이면 엣지 초기 가중치가 게이트웨이 모델 파일과 달라 처음부터 어긋난다.
+    return np.format_float_positional(np.float32(v), unique=True, trim="0") + "f"
+
+
+def _c_array(name, arr, ctype="float", fmt=_f32_literal, one_line=False, pad=""):
+    """Pre_train.py가 출력하던 것과 같은 배치로 C 배열 선언 생성."""
+    arr = np.asarray(arr)
+    dims = "".join(f"[{d}]" for d in arr.shape)
+    if one_line:
+        return f"{ctype} {name}{dims}{pad} = {{{', '.join(fmt(v) for v in arr.ravel())}}};"
+    if arr.ndim == 2:
+        rows = [f"  {{{', '.join(fmt(v) for v in row)}}}" for row in arr]
+        return f"{ctype} {name}{dims} = {{\n" + ",\n".join(rows) + "\n};"
+    if arr.size > 4:
+        rows = [f"  {', '.join(fmt(v) for v in arr[i:i + 4])}" for i in range(0, arr.size, 4)]
+        return f"{ctype} {name}{dims} = {{\n" + ",\n".join(rows) + "\n};"
+    return f"{ctype} {name}{dims} = {{{', '.join(fmt(v) for v in arr)}}};"
+
+
+def write_c_header(path, arrays, checksum=None, extra=None):
+    """엣지 스케치용 가중치 헤더 생성 (MLP_edge_sensor*.ino에서 #include). extra: 끝에 덧붙일 줄 목록."""
+    lines = [
+        "// 자동 생성 파일 — Pre_train.py 실행 시 갱신됨. 직접 수정하지 말 것.",
+        "#pragma once",
+        "",
+    ]
+    if checksum is not None:
+        lines += [f"#define MLP_MODEL_CHECKSUM 0x{checksum:08X}UL", ""]
+    lines += [
+        "// Scalers",
+        _c_array("x_mean", arrays["x_mean"], one_line=True),
+        _c_array("x_std", arrays["x_std"], one_line=True, pad=" "),
+        _c_array("y_mean", arrays["y_mean"], one_line=True),
+        _c_array("y_std", arrays["y_std"], one_line=True, pad=" "),
+    ]
+    for name in ("w1", "b1", "w2", "b2", "w3", "b3"):
+        lines += ["", _c_array(name.upper(), arrays[name])]
+    lines += extra or []
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
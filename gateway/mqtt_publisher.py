@@ -0,0 +1,247 @@
+"""
+게이트웨이 MQTT 발행기: 메모리 링 버퍼 + 백그라운드 전송 스레드 + 디스크 spool.
+
+publish()는 dict를 링 버퍼에 넣고 바로 반환한다 (json 직렬화·전송은 전송 스레드).
+spool이 있으면 브로커가 끊겨 있거나 링 버퍼가 spill_at(기본 64)개 이상 밀려 있을 때
+새 메시지를 append-only spool 파일(한 줄 = "qos<TAB>json")에 바로 기록한다 → 단절 중
+메시지는 메모리에 쌓이지 않고 디스크에 남는다 (프로세스가 죽어도 유실은 링 버퍼의 최대 spill_at개).
+재연결 시 링 버퍼 → spool 순서로 재전송한다. spool이 없으면 capacity까지 링 버퍼만 쓴다.
+
+순서 보장 규칙:
+  - 링 버퍼의 메시지는 항상 spool의 메시지보다 오래된 것
+  - spool에 미전송분이 남아 있는 동안은 새 메시지도 spool 끝에 추가
+  - 전송 실패한 메시지는 링 버퍼 맨 앞으로 되돌림
+spool의 재전송 위치는 '<spool>.pos'에 저장되어 재시작 후에도 이어서 재전송하며,
+close() 시 남은 링 버퍼 내용도 spool 앞쪽에 기록한다.
+
+재연결은 paho 네트워크 루프(loop_start + connect_async)가 담당하고, 여기서는
+client.is_connected()로 상태만 확인한다 (전송 스레드에서 reconnect()를 호출하지 않음).
+
+metrics(StageMetrics)를 넘기면 전송 스레드의 json 직렬화·client.publish 지연과
+링 버퍼·spool 대기량을 함께 기록한다.
+"""
+import collections
+import json
+import os
+import threading
+
+from stage_metrics import StageMetrics, now_ns
+
+RING_CAPACITY = 1024
+SPILL_AT = 64  # spool 모드: 링 버퍼에 이만큼 밀려 있으면 새 메시지는 spool로
+SPOOL_MAX_BYTES = 64 * 1024 * 1024
+RETRY_INTERVAL_S = 1.0
+REPLAY_BATCH = 256
+
+
+class MqttPublisher:
+    """client: paho Client (publish(), is_connected()). spool_path=None이면 spool 없이 링 버퍼만 사용."""
+
+    def __init__(self, client, topic, capacity=RING_CAPACITY, spool_path=None, spool_max_bytes=SPOOL_MAX_BYTES,
+                 retry_interval=RETRY_INTERVAL_S, verbose=True, metrics=None, spill_at=SPILL_AT):
+        self.client = client
+        self.topic = topic
+        self.capacity = capacity
+        self.spill_at = min(spill_at, capacity)
+        self.spool_path = spool_path
+        self.spool_max_bytes = spool_max_bytes
+        self.retry_interval = retry_interval
+        self.verbose = verbose
+        metrics = metrics if metrics is not None else StageMetrics()
+        self._h_json = metrics.histogram("json_encode")
+        self._h_send = metrics.histogram("mqtt_publish")
+        metrics.gauge("mqtt_ring", lambda: len(self._ring), "Messages waiting in the MQTT ring buffer")
+        metrics.gauge("mqtt_spool_bytes", lambda: self.stats()["spool_bytes"], "Unsent bytes in the MQTT spool")
+
+        self.counters = {"queued": 0, "sent": 0, "spilled": 0, "replayed": 0, "dropped": 0}
+        self._ring = collections.deque()
+        self._cond = threading.Condition()
+        self._closing = False
+        self._abort = False
+        self._was_connected = None
+
+        self._spool = None
+        self._spool_pos = 0
+        if spool_path:
+            os.makedirs(os.path.dirname(os.path.abspath(spool_path)), exist_ok=True)
+            self._spool = open(spool_path, "ab")
+            self._spool_pos = self._load_spool_pos()
+            if self._spool_pending():
+                print(f"MQTT spool: {self._spool.tell() - self._spool_pos} bytes pending from {spool_path}")
+
+        self._thread = threading.Thread(target=self._run, name="mqtt-publisher", daemon=True)
+        self._thread.start()
+
+    # ----------------------------------------------------------- producer
+    def publish(self, payload, qos=0):
+        """payload(dict)를 전송 대기열에 추가. 블로킹 없음 (spool 모드에서는 파일 append 1회)."""
+        with self._cond:
+            if self._closing:
+                self.counters["dropped"] += 1
+                return
+            if self._spool is None:
+                if len(self._ring) >= self.capacity:
+                    # spool 없음: 가장 오래된 메시지를 버리고 최신 메시지 유지
+                    self._ring.popleft()
+                    self.counters["dropped"] += 1
+            elif (self._spool_pending() or len(self._ring) >= self.spill_at
+                  or not self.client.is_connected()):
+                self._spool_append([(payload, qos)])
+                self._cond.notify()
+                return
+            self._ring.append((payload, qos))
+            self.counters["queued"] += 1
+            self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            stats = dict(self.counters)
+            stats["ring"] = len(self._ring)
+            stats["spool_bytes"] = self._spool.tell() - self._spool_pos if self._spool_pending() else 0
+        return stats
+
+    def close(self, timeout=5.0):
+        """연결되어 있으면 남은 메시지를 timeout 안에 전송, 못 보낸 링 버퍼 내용은 spool에 보존."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
+        with self._cond:
+            self._abort = True
+            if self._ring and self._spool is not None:
+                self._prepend_ring_to_spool()
+            elif self._ring:
+                self.counters["dropped"] += len(self._ring)
+                self._ring.clear()
+            if self._spool is not None:
+                self._spool.close()
+
+    # ----------------------------------------------------------- spool
+    def _spool_pending(self):
+        return self._spool is not None and not self._spool.closed and self._spool.tell() > self._spool_pos
+
+    def _load_spool_pos(self):
+        try:
+            with open(self.spool_path + ".pos") as f:
+                pos = int(f.read().strip() or 0)
+        except (OSError, ValueError):
+            return 0
+        return min(pos, self._spool.tell())
+
+    def _save_spool_pos(self):
+        with open(self.spool_path + ".pos", "w") as f:
+            f.write(str(self._spool_pos))
+
+    def _encode(self, items):
+        return b"".join(f"{qos}\t{json.dumps(payload)}\n".encode() for payload, qos in items)
+
+    def _spool_append(self, items):
+        # self._cond 보유 상태에서 호출
+        data = self._encode(items)
+        if self._spool.tell() - self._spool_pos + len(data) > self.spool_max_bytes:
+            self.counters["dropped"] += len(items)
+            return
+        self._spool.write(data)
+        self._spool.flush()
+        self.counters["spilled"] += len(items)
+
+    def _prepend_ring_to_spool(self):
+        # 종료 시에만: 링 버퍼(더 오래된 메시지) + spool 미전송분으로 spool 재작성
+        with open(self.spool_path, "rb") as f:
+            f.seek(self._spool_pos)
+            rest = f.read()
+        self._spool.close()
+        tmp_path = self.spool_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(self._encode(self._ring))
+            f.write(rest)
+        os.replace(tmp_path, self.spool_path)
+        self.counters["spilled"] += len(self._ring)
+        self._ring.clear()
+        self._spool = open(self.spool_path, "ab")
+        self._spool_pos = 0
+        self._save_spool_pos()
+
+    def _replay_spool(self):
+        """spool 미전송분을 순서대로 전송. 실패 시 그 위치에서 멈춤."""
+        with open(self.spool_path, "rb") as f:
+            f.seek(self._spool_pos)
+            lines = [f.readline() for _ in range(REPLAY_BATCH)]
+        pos = self._spool_pos
+        ok = True
+        for line in lines:
+            if not line.endswith(b"\n"):
+                break  # 파일 끝 (또는 기록 중인 줄)
+            qos, _, text = line.decode("utf-8", errors="replace").partition("\t")
+            if not self._send_text(text.rstrip("\n"), int(qos)):
+                ok = False
+                break
+            pos += len(line)
+            self.counters["replayed"] += 1
+        with self._cond:
+            self._spool_pos = pos
+            if self._spool.tell() <= pos:
+                # 전부 재전송 → spool 비우기
+                self._spool.truncate(0)
+                self._spool.seek(0)
+                self._spool_pos = 0
+                if self.verbose:
+                    print(f"MQTT spool drained (replayed total {self.counters['replayed']})")
+            self._save_spool_pos()
+        return ok
+
+    # ----------------------------------------------------------- sender
+    def _connected(self):
+        connected = bool(self.client.is_connected())
+        if connected != self._was_connected and self._was_connected is not None and self.verbose:
+            print("MQTT reconnected — flushing queue" if connected else "MQTT disconnected — queueing messages")
+        self._was_connected = connected
+        return connected
+
+    def _send_text(self, text, qos):
+        if not self.client.is_connected():
+            return False
+        try:
+            info = self.client.publish(self.topic, text, qos=qos)
+        except Exception as e:
+            print(f"   MQTT publish error: {e}")
+            return False
+        return info.rc == 0
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while True:
+                    if self._abort:
+                        return
+                    connected = self._connected()
+                    if connected and (self._ring or self._spool_pending()):
+                        break
+                    if self._closing:
+                        return
+                    self._cond.wait(self.retry_interval)
+                item = self._ring.popleft() if self._ring else None
+
+            if item is None:
+                if not self._replay_spool():
+                    with self._cond:
+                        self._cond.wait(self.retry_interval)
+                continue
+
+            payload, qos = item
+            t0 = now_ns()
+            try:
+                text = json.dumps(payload)
+            except (TypeError, ValueError) as e:
+                print(f"   MQTT payload error: {e}")
+                with self._cond:
+                    self.counters["dropped"] += 1
+                continue
+            t0 = self._h_json.since(t0)
+            if self._send_text(text, qos):
+                self._h_send.since(t0)
+                self.counters["sent"] += 1
+            else:
+                with self._cond:
+                    self._ring.appendleft(item)
+                    self._cond.wait(self.retry_interval)
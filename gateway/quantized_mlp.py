@@ -0,0 +1,313 @@
+"""
+GatewayMLP int8 변형: 층별 대칭 int8 가중치 + int32 누적 + 고정소수점 재양자화.
+
+엣지(mlp_model.h의 mlp_q_forward)와 같은 정수 연산을 하므로 양자화 가중치와 입력 윈도우가 같으면
+입력 int8, 은닉 int8, 출력 누적 int32가 비트 단위로 같다. float 연산은 입력 양자화와 출력 역양자화 두 곳뿐이고,
+둘 다 곱셈·덧셈을 각각 float32로 반올림한다 (C 쪽은 FMA 축약을 막으려고 volatile 중간값 사용).
+
+양자화 규칙 (q_scales = [s_in, s_h1, s_h2]: Pre_train.py가 학습 데이터 활성값 범위로 보정해 모델 파일에 저장)
+  입력    q_in = clip(rint((x - x_mean) * in_mul), -127, 127)       in_mul = 1 / (x_std * s_in)
+  가중치  s_w = max|W| / 127,  q_w = rint(W / s_w)                   층별 대칭 int8
+  bias    q_b = rint(b / (s_a * s_w))                                int32, s_a = 그 층 입력의 scale
+  은닉    acc = q_a · q_w + q_b → ReLU → q_h = min((acc * m + 2^(sh-1)) >> sh, 127)
+          m / 2^sh = s_a * s_w / s_h  (frexp로 구한 31비트 정수 multiplier, 64비트 곱)
+  출력    pred = (acc3 * out_mul) * y_std + y_mean                    out_mul = s_h2 * s_w3
+
+online_update(): float 가중치(w1..b3)를 엣지 update_model()과 같은 순서(EdgeTwinMLP)로 갱신하고
+requantize()로 int 가중치를 다시 만든다 (활성값 scale은 보정값 그대로). MLP_INT8 엣지도 같은 순서로
+갱신 후 mlp_q_requantize()를 하므로 온라인 학습 후에도 정수 경로가 같다.
+갱신 후 float 가중치가 발산(NaN/inf)했으면 재양자화하지 않는다 → 호출 쪽이 reset()으로 되돌린다.
+체크포인트는 float 가중치를 저장하므로 복원 후에도 같은 규칙.
+"""
+import math
+
+import numpy as np
+
+from edge_twin import EdgeTwinMLP
+from model_file import _c_array, _f32_literal
+
+Q_MAX = 127
+B_MAX = 2 ** 30  # int32 bias 포화 범위 (누적 여유)
+
+
+def calibrate(model, X, percentile=100.0):
+    """원 단위 윈도우 X (n, 12)를 float 모델에 통과시켜 입력·은닉 활성값 scale [s_in, s_h1, s_h2] 계산.
+
+    percentile < 100이면 그 분위수를 범위로 써서 이상치 몇 개가 scale을 키우지 않게 한다 (넘는 값은 포화).
+    """
+    x_scaled = ((np.asarray(X) - model.x_mean) / model.x_std).astype(np.float32)
+    _, hidden1, _, hidden2, _ = model.forward(x_scaled)
+    scales = []
+    for a in (x_scaled, hidden1, hidden2):
+        amax = float(np.percentile(np.abs(a), percentile))
+        scales.append(max(amax, 1e-6) / Q_MAX)
+    return np.array(scales, dtype=np.float32)
+
+
+def _saturate(v, lim):
+    # C 쪽과 같은 포화: NaN → 0, ±inf·범위 밖 → ±lim (발산한 가중치에서도 두 쪽이 같은 정수)
+    return np.clip(np.nan_to_num(v, nan=0.0, posinf=lim, neginf=-lim), -lim, lim)
+
+
+def quantize_layer(w, b, s_a, s_o=None):
+    """float32 층 (W, b) → (q_w int8, q_b int32, [m, shift] 또는 None, s_acc).
+
+    s_a: 입력 활성값 scale, s_o: 출력 활성값 scale (마지막 층은 None → 재양자화 없음).
+    연산 순서·정밀도는 mlp_model.h의 mlp_q_quantize_layer()와 같다 (전부 float32).
+    """
+    w = np.asarray(w, dtype=np.float32)
+    b = np.asarray(b, dtype=np.float32)
+    amax = np.abs(w).max(initial=np.float32(0.0), where=~np.isnan(w))  # C 루프처럼 NaN은 건너뜀
+    s_w = amax / np.float32(Q_MAX) if amax > 0 else np.float32(1.0)
+    q_w = _saturate(np.rint(w / s_w), Q_MAX).astype(np.int8)
+    s_acc = np.float32(s_a) * s_w
+    q_b = _saturate(np.rint(b / s_acc), B_MAX).astype(np.int32)
+    if s_o is None:
+        return q_w, q_b, None, s_acc
+    # 온라인 학습으로 가중치가 발산하면 비율이 범위를 벗어남 → shift를 [1, 62]로, inf/NaN은 최대 multiplier로
+    # 포화 (은닉 출력이 127 또는 0으로 포화, C mlp_q_quantize_layer()와 같음)
+    ratio = float(s_acc / np.float32(s_o))
+    if not math.isfinite(ratio):
+        return q_w, q_b, np.array([2 ** 31 - 1, 1], dtype=np.int32), s_acc
+    frac, exp = math.frexp(ratio)
+    shift = min(max(31 - exp, 1), 62)
+    return q_w, q_b, np.array([int(frac * (1 << 31)), shift], dtype=np.int32), s_acc
+
+
+def _int_matmul(q, w_f64):
+    # 정수 입력 · 정수값 float64 가중치 → int32 (누적이 2^53보다 훨씬 작아 반올림 없음)
+    return (q.astype(np.float64) @ w_f64).astype(np.int32)
+
+
+def _requantize(acc, m_shift):
+    # ReLU 후 고정소수점 곱 + 반올림 shift (acc >= 0 이므로 C의 >>와 같음)
+    m, rounding, shift = m_shift
+    q = np.maximum(acc, 0).astype(np.int64)
+    q *= m
+    q += rounding
+    q >>= shift
+    return np.minimum(q, Q_MAX).astype(np.int32)
+
+
+def _fixed_point(m_shift):
+    # [m, shift] → forward_q에서 바로 쓰는 int64 스칼라 (m, 반올림 상수, shift)
+    m, shift = int(m_shift[0]), int(m_shift[1])
+    return np.int64(m), np.int64(1 << (shift - 1)), np.int64(shift)
+
+
+class QuantizedMLP(EdgeTwinMLP):
+    """int8 추론 + float 가중치 online_update (갱신 후 재양자화). predict()/predict_batch()는 정수 경로."""
+
+    EXTRA_ARRAYS = ("q_scales",)
+
+    def __init__(self, w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std, q_scales, verbose=True, copy=True,
+                 inplace=False):
+        # 정수 경로는 자체 버퍼를 쓰므로 float inplace 스크래치는 만들지 않음
+        super().__init__(w1, b1, w2, b2, w3, b3, x_mean, x_std, y_mean, y_std, inplace=False, verbose=verbose,
+                         copy=copy)
+        self.q_scales = np.array(q_scales, dtype=np.float32)
+        s_in = self.q_scales[0]
+        self.in_mul = (np.float32(1.0) / (self.x_std * s_in)).astype(np.float32)
+        self.n_requantize = 0
+        self.requantize()
+
+    def requantize(self):
+        """현재 float 가중치로 int8 가중치·bias·multiplier 재계산 (활성값 scale 고정)."""
+        s_in, s_h1, s_h2 = self.q_scales
+        self.q_w1, self.q_b1, self.q_m1, _ = quantize_layer(self.w1, self.b1, s_in, s_h1)
+        self.q_w2, self.q_b2, self.q_m2, _ = quantize_layer(self.w2, self.b2, s_h1, s_h2)
+        self.q_w3, self.q_b3, _, self.s_acc3 = quantize_layer(self.w3, self.b3, s_h2)
+        self._fp1, self._fp2 = _fixed_point(self.q_m1), _fixed_point(self.q_m2)
+        self.out_mul = self.s_acc3
+        # matmul용 float64 사본: numpy 정수 matmul은 BLAS를 안 쓰므로 느리다. int8 곱의 합(|acc| < 2^31)은
+        # float64(53비트 가수)로 정확히 표현되므로 BLAS float64 matmul 결과가 정수 누적과 같다.
+        self._w1_f64 = self.q_w1.astype(np.float64)
+        self._w2_f64 = self.q_w2.astype(np.float64)
+        self._w3_f64 = self.q_w3.astype(np.float64)
+        self.n_requantize += 1
+
+    def quantize_input(self, x):
+        """원 단위 입력 (..., 12) → int8 범위 int32."""
+        q = np.subtract(np.asarray(x, dtype=np.float32), self.x_mean)
+        q *= self.in_mul
+        np.rint(q, out=q)
+        np.minimum(q, Q_MAX, out=q)
+        np.maximum(q, -Q_MAX, out=q)
+        return q.astype(np.int32)
+
+    def forward_q(self, q_in):
+        """q_in (..., 12) → (acc1, q_h1, acc2, q_h2, acc3). 전부 int32 (엣지 mlp_q_forward와 비트 단위 동일)."""
+        acc1 = _int_matmul(q_in, self._w1_f64) + self.q_b1
+        q_h1 = _requantize(acc1, self._fp1)
+        acc2 = _int_matmul(q_h1, self._w2_f64) + self.q_b2
+        q_h2 = _requantize(acc2, self._fp2)
+        acc3 = _int_matmul(q_h2, self._w3_f64) + self.q_b3
+        return acc1, q_h1, acc2, q_h2, acc3
+
+    def _dequantize_output(self, acc3):
+        out_scaled = acc3.astype(np.float32) * self.out_mul
+        return out_scaled, out_scaled * self.y_std + self.y_mean
+
+    def predict(self):
+        q_in = self.quantize_input(self.window_buf.reshape(-1))
+        acc1, q_h1, acc2, q_h2, acc3 = self.forward_q(q_in)
+        self.last_pred_scaled, final_pred = self._dequantize_output(acc3)
+        # float 활성값(last_*)은 online_update 때만 필요하므로 정수 값만 보관 (SKIP/EST 예측은 변환 생략)
+        self._last_q = (q_in, acc1, q_h1, acc2)
+        self._last_h2 = q_h2
+        self.last_pred_t, self.last_pred_h = float(final_pred[0]), float(final_pred[1])
+        return final_pred
+
+    def predict_batch(self, X):
+        """원 단위 윈도우 배치 (n, 12) → 원 단위 예측 (n, 2). 모델 상태는 건드리지 않음."""
+        return self._dequantize_output(self.forward_q(self.quantize_input(X))[-1])[1]
+
+    def _forecast_step(self):
+        # predict()와 같은 정수 경로 (EdgeTwinMLP의 float C 순서 forward가 아님)
+        def step(window, out):
+            out[:] = self.predict_batch(window)
+        return step
+
+    def _dequantize_activations(self):
+        # online_update(float SGD)가 쓰는 활성값: 직전 predict()의 정수 값을 scale로 되돌린 값
+        q_in, acc1, q_h1, acc2 = self._last_q
+        s_in, s_h1, s_h2 = self.q_scales
+        self.last_in_scaled = q_in.astype(np.float32) * s_in
+        # pre-activation은 ReLU 미분 부호만 쓰므로 엣지처럼 누적값 그대로 (scale이 inf/NaN이어도 부호 유지)
+        self.last_pre_h1 = acc1.astype(np.float32)
+        self.last_hidden1 = q_h1.astype(np.float32) * s_h1
+        self.last_pre_h2 = acc2.astype(np.float32)
+        self.last_hidden2 = self._last_h2.astype(np.float32) * s_h2
+
+    def online_update(self, actual_t, actual_h, lr=0.05):
+        self._dequantize_activations()
+        super().online_update(actual_t, actual_h, lr)
+        # 발산(NaN/inf)한 float 가중치는 재양자화하지 않음 (rint(NaN) → 정의되지 않은 int8).
+        # 엣지도 이때는 mlp_q_requantize() 없이 재부팅하고, 호출 쪽은 reset()으로 사전학습 가중치로 돌아간다.
+        if self.weights_finite():
+            self.requantize()
+
+    def reset(self, arrays):
+        super().reset(arrays)
+        self.requantize()
+        return self.predict()
+
+    def quantized_arrays(self):
+        """엣지 헤더용 배열 (이름 → 값). 스케일러도 float32 값 그대로 (10진 반올림 없이) 내보낸다."""
+        return {
+            "Q_SCALES": self.q_scales, "Q_X_MEAN": self.x_mean, "Q_IN_MUL": self.in_mul,
+            "Q_W1": self.q_w1, "Q_B1": self.q_b1, "Q_M1": self.q_m1,
+            "Q_W2": self.q_w2, "Q_B2": self.q_b2, "Q_M2": self.q_m2,
+            "Q_W3": self.q_w3, "Q_B3": self.q_b3,
+            "Q_OUT_MUL": np.atleast_1d(self.out_mul), "Q_Y_MEAN": self.y_mean, "Q_Y_STD": self.y_std,
+        }
+
+
+_C_TYPES = {"i": ("int32_t", lambda v: str(int(v))), "f": ("float", _f32_literal)}
+
+# 엣지 쪽 정수 추론·재양자화 (QuantizedMLP.forward_q / quantize_layer와 같은 연산 순서)
+_C_FUNCTIONS = r"""
+static inline int32_t mlp_q_requant(int32_t acc, const int32_t *m_shift) {
+  if (acc <= 0) return 0;
+  int64_t q = ((int64_t)acc * m_shift[0] + ((int64_t)1 << (m_shift[1] - 1))) >> m_shift[1];
+  return q > 127 ? 127 : (int32_t)q;
+}
+
+// window: 원 단위 입력 [MLP_Q_N_IN], pred: 원 단위 예측 [MLP_Q_N_OUT]. 중간값은 mlp_q_* 전역에 남김.
+int8_t  mlp_q_in[MLP_Q_N_IN];
+int32_t mlp_q_acc1[MLP_Q_N_H1], mlp_q_acc2[MLP_Q_N_H2], mlp_q_acc3[MLP_Q_N_OUT];
+int8_t  mlp_q_h1[MLP_Q_N_H1], mlp_q_h2[MLP_Q_N_H2];
+float   mlp_q_out_scaled[MLP_Q_N_OUT];
+
+void mlp_q_forward(const float *window, float *pred) {
+  for (int i = 0; i < MLP_Q_N_IN; i++) {
+    float v = rintf((window[i] - Q_X_MEAN[i]) * Q_IN_MUL[i]);
+    mlp_q_in[i] = (int8_t)(v > 127.0f ? 127 : (v < -127.0f ? -127 : (int)v));
+  }
+  for (int j = 0; j < MLP_Q_N_H1; j++) {
+    int32_t acc = Q_B1[j];
+    for (int i = 0; i < MLP_Q_N_IN; i++) acc += (int32_t)mlp_q_in[i] * Q_W1[i][j];
+    mlp_q_acc1[j] = acc;
+    mlp_q_h1[j] = (int8_t)mlp_q_requant(acc, Q_M1);
+  }
+  for (int j = 0; j < MLP_Q_N_H2; j++) {
+    int32_t acc = Q_B2[j];
+    for (int i = 0; i < MLP_Q_N_H1; i++) acc += (int32_t)mlp_q_h1[i] * Q_W2[i][j];
+    mlp_q_acc2[j] = acc;
+    mlp_q_h2[j] = (int8_t)mlp_q_requant(acc, Q_M2);
+  }
+  for (int j = 0; j < MLP_Q_N_OUT; j++) {
+    int32_t acc = Q_B3[j];
+    for (int i = 0; i < MLP_Q_N_H2; i++) acc += (int32_t)mlp_q_h2[i] * Q_W3[i][j];
+    mlp_q_acc3[j] = acc;
+    volatile float out = (float)acc * Q_OUT_MUL[0];  // volatile: a*b+c가 FMA로 합쳐지지 않게
+    volatile float scaled = out * Q_Y_STD[j];
+    mlp_q_out_scaled[j] = out;
+    pred[j] = scaled + Q_Y_MEAN[j];
+  }
+}
+
+// online update 후 float 가중치(W, B) → int8 층 재양자화. s_o <= 0이면 마지막 층 (multiplier 없음).
+float mlp_q_quantize_layer(const float *w, const float *b, int n_in, int n_out, float s_a, float s_o,
+                           int8_t *qw, int32_t *qb, int32_t *m_shift) {
+  float amax = 0.0f;
+  for (int i = 0; i < n_in * n_out; i++) { float a = fabsf(w[i]); if (a > amax) amax = a; }
+  float s_w = amax > 0.0f ? amax / 127.0f : 1.0f;
+  for (int i = 0; i < n_in * n_out; i++) {
+    float v = rintf(w[i] / s_w);
+    qw[i] = (int8_t)(v != v ? 0 : (v > 127.0f ? 127 : (v < -127.0f ? -127 : (int)v)));
+  }
+  float s_acc = s_a * s_w;
+  for (int j = 0; j < n_out; j++) {
+    float v = rintf(b[j] / s_acc);
+    qb[j] = v != v ? 0 : (v > 1073741824.0f ? 1073741824 : (v < -1073741824.0f ? -1073741824 : (int32_t)v));
+  }
+  if (s_o > 0.0f) {
+    // 가중치가 발산해 비율이 범위 밖이면 포화 (quantize_layer()와 같음)
+    float r = s_acc / s_o;
+    if (!isfinite(r)) {
+      m_shift[0] = 2147483647;
+      m_shift[1] = 1;
+    } else {
+      int e;
+      float f = frexpf(r, &e);
+      m_shift[0] = (int32_t)(f * 2147483648.0f);
+      m_shift[1] = 31 - e < 1 ? 1 : (31 - e > 62 ? 62 : 31 - e);
+    }
+  }
+  return s_acc;
+}
+
+void mlp_q_requantize(const float *w1, const float *b1, const float *w2, const float *b2,
+                      const float *w3, const float *b3) {
+  mlp_q_quantize_layer(w1, b1, MLP_Q_N_IN, MLP_Q_N_H1, Q_SCALES[0], Q_SCALES[1], &Q_W1[0][0], Q_B1, Q_M1);
+  mlp_q_quantize_layer(w2, b2, MLP_Q_N_H1, MLP_Q_N_H2, Q_SCALES[1], Q_SCALES[2], &Q_W2[0][0], Q_B2, Q_M2);
+  Q_OUT_MUL[0] = mlp_q_quantize_layer(w3, b3, MLP_Q_N_H2, MLP_Q_N_OUT, Q_SCALES[2], 0.0f,
+                                      &Q_W3[0][0], Q_B3, NULL);
+}
+"""
+
+
+def quantized_c_lines(model):
+    """write_c_header(extra=...)에 넘길 int8 모델 섹션 (배열 + mlp_q_forward/mlp_q_requantize)."""
+    arrays = model.quantized_arrays()
+    n_in, n_h1 = model.q_w1.shape
+    n_h2, n_out = model.q_w3.shape
+    lines = [
+        "",
+        "// ===== int8 양자화 모델 (gateway/quantized_mlp.py QuantizedMLP와 같은 정수 연산) =====",
+        "#include <stdint.h>",
+        "#include <math.h>",
+        f"#define MLP_Q_N_IN {n_in}",
+        f"#define MLP_Q_N_H1 {n_h1}",
+        f"#define MLP_Q_N_H2 {n_h2}",
+        f"#define MLP_Q_N_OUT {n_out}",
+    ]
+    for name, arr in arrays.items():
+        arr = np.asarray(arr)
+        if arr.dtype == np.int8:
+            ctype, fmt = "int8_t", lambda v: str(int(v))
+        else:
+            ctype, fmt = _C_TYPES[arr.dtype.kind]
+        lines += ["", _c_array(name, arr, ctype=ctype, fmt=fmt)]
+    return lines + _C_FUNCTIONS.rstrip("\n").split("\n")
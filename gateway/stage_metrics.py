@@ -0,0 +1,221 @@
+"""
+게이트웨이 hot path 단계별 지연 계측 (HDR 스타일 log-linear 히스토그램).
+
+사용:
+    metrics = StageMetrics()
+    h_predict = metrics.histogram("predict")     # 초기화 시 1회
+    t0 = now_ns()
+    model.predict()
+    h_predict.record(now_ns() - t0)              # span 1개 ≈ perf_counter_ns 1회 + 정수 연산 몇 개
+
+버킷: 2^SUB_BITS ns 미만은 1 ns 단위, 그 이상은 2배 구간마다 2^(SUB_BITS-1)개 (상대 오차 ≤ 1/32).
+값 기록은 단일 스레드(각 단계를 실행하는 스레드)에서, 조회(snapshot/dump/HTTP)는 다른 스레드에서
+해도 된다 — 조회 중 기록된 값 몇 개가 count/합계와 어긋날 수 있는 정도의 근사.
+
+노출:
+  - MetricsServer: 로컬 HTTP /metrics (Prometheus text format, summary + max)
+  - dump(): 사람이 읽는 표 (gateway.py에서 SIGUSR1 시 출력)
+"""
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit, parse_qs
+
+now_ns = time.perf_counter_ns
+
+SUB_BITS = 6
+MAX_EXP = 40  # 2^(40+SUB_BITS) ns ≈ 19시간 이상은 마지막 버킷
+N_BUCKETS = (MAX_EXP + 2) << (SUB_BITS - 1)
+QUANTILES = (0.5, 0.9, 0.99)
+
+
+def bucket_index(ns):
+    e = ns.bit_length() - SUB_BITS
+    if e <= 0:
+        return ns
+    return (e << (SUB_BITS - 1)) + (ns >> e)
+
+
+def bucket_bounds(i):
+    """버킷 i에 들어가는 값의 [하한, 상한] (ns)."""
+    if i < (1 << SUB_BITS):
+        return i, i
+    e = (i >> (SUB_BITS - 1)) - 1
+    m = i - (e << (SUB_BITS - 1))
+    return m << e, ((m + 1) << e) - 1
+
+
+class LatencyHistogram:
+    __slots__ = ("name", "counts", "count", "total_ns", "max_ns")
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = [0] * N_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def record(self, ns):
+        e = ns.bit_length() - SUB_BITS
+        i = ns if e <= 0 else (e << (SUB_BITS - 1)) + (ns >> e)
+        if i >= N_BUCKETS:
+            i = N_BUCKETS - 1
+        self.counts[i] += 1
+        self.count += 1
+        self.total_ns += ns
+        if ns > self.max_ns:
+            self.max_ns = ns
+
+    def since(self, t0_ns):
+        """t0_ns(now_ns() 값)부터 지금까지를 기록하고 현재 시각 반환 (연속 단계 계측용)."""
+        t1 = now_ns()
+        self.record(t1 - t0_ns)
+        return t1
+
+    def reset(self):
+        self.counts = [0] * N_BUCKETS
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    def snapshot(self, quantiles=QUANTILES):
+        """{count, sum_ns, max_ns, mean_ns, quantiles: {q: ns}} — 분위수는 버킷 상한 (max로 제한)."""
+        counts = list(self.counts)
+        n = sum(counts)
+        out = {"count": n, "sum_ns": self.total_ns, "max_ns": self.max_ns,
+               "mean_ns": self.total_ns / n if n else 0.0, "quantiles": {}}
+        if not n:
+            out["quantiles"] = {q: 0 for q in quantiles}
+            return out
+        targets = sorted(quantiles)
+        seen = 0
+        k = 0
+        for i, c in enumerate(counts):
+            if not c:
+                continue
+            seen += c
+            while k < len(targets) and seen >= targets[k] * n:
+                out["quantiles"][targets[k]] = min(bucket_bounds(i)[1], self.max_ns)
+                k += 1
+            if k == len(targets):
+                break
+        return out
+
+
+class StageMetrics:
+    """단계 이름 → LatencyHistogram. 등록 순서대로 출력."""
+
+    def __init__(self, prefix="gateway"):
+        self.prefix = prefix
+        self._hists = {}
+        self._gauges = {}
+        self._lock = threading.Lock()
+        self.started_at = time.time()
+
+    def histogram(self, name):
+        with self._lock:
+            h = self._hists.get(name)
+            if h is None:
+                h = self._hists[name] = LatencyHistogram(name)
+            return h
+
+    def gauge(self, name, fn, help_text=""):
+        """조회 시점에 fn()을 호출해 값을 내보내는 gauge (예: TX 수, 발행 대기열 길이)."""
+        with self._lock:
+            self._gauges[name] = (fn, help_text)
+
+    def reset(self):
+        with self._lock:
+            for h in self._hists.values():
+                h.reset()
+
+    def snapshot(self):
+        with self._lock:
+            hists = list(self._hists.values())
+        return {h.name: h.snapshot() for h in hists}
+
+    def _gauge_values(self):
+        with self._lock:
+            gauges = list(self._gauges.items())
+        out = []
+        for name, (fn, help_text) in gauges:
+            try:
+                out.append((name, float(fn()), help_text))
+            except Exception:
+                continue
+        return out
+
+    def dump(self):
+        """사람이 읽는 단계별 지연 표 (µs)."""
+        lines = [f"{'stage':<16}{'count':>10}{'p50':>10}{'p90':>10}{'p99':>10}{'max':>10}{'mean':>10}   (µs)"]
+        for name, s in self.snapshot().items():
+            q = s["quantiles"]
+            lines.append(f"{name:<16}{s['count']:>10}{q[0.5] / 1e3:>10.1f}{q[0.9] / 1e3:>10.1f}"
+                         f"{q[0.99] / 1e3:>10.1f}{s['max_ns'] / 1e3:>10.1f}{s['mean_ns'] / 1e3:>10.1f}")
+        for name, value, _ in self._gauge_values():
+            lines.append(f"{name} = {value:g}")
+        return "\n".join(lines)
+
+    def prometheus_text(self):
+        p = self.prefix
+        out = [f"# HELP {p}_stage_seconds Gateway hot-path stage latency",
+               f"# TYPE {p}_stage_seconds summary"]
+        snaps = self.snapshot()
+        for name, s in snaps.items():
+            for q, ns in s["quantiles"].items():
+                out.append(f'{p}_stage_seconds{{stage="{name}",quantile="{q}"}} {ns / 1e9:.9f}')
+            out.append(f'{p}_stage_seconds_sum{{stage="{name}"}} {s["sum_ns"] / 1e9:.9f}')
+            out.append(f'{p}_stage_seconds_count{{stage="{name}"}} {s["count"]}')
+        out.append(f"# HELP {p}_stage_max_seconds Maximum stage latency since start")
+        out.append(f"# TYPE {p}_stage_max_seconds gauge")
+        for name, s in snaps.items():
+            out.append(f'{p}_stage_max_seconds{{stage="{name}"}} {s["max_ns"] / 1e9:.9f}')
+        for name, value, help_text in self._gauge_values():
+            out.append(f"# HELP {p}_{name} {help_text or name}")
+            out.append(f"# TYPE {p}_{name} gauge")
+            out.append(f"{p}_{name} {value:g}")
+        return "\n".join(out) + "\n"
+
+
+class MetricsServer:
+    """로컬 HTTP 서버 (데몬 스레드). GET /metrics → Prometheus text.
+
+    routes: {path: fn(query_dict) → (status, content_type, body_bytes)} 로 다른 엔드포인트 추가 가능.
+    """
+
+    def __init__(self, metrics, host="127.0.0.1", port=9106, routes=None):
+        self.metrics = metrics
+        self.routes = dict(routes or {})
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                parts = urlsplit(self.path)
+                if parts.path == "/metrics":
+                    status, ctype, body = 200, "text/plain; version=0.0.4", server.metrics.prometheus_text().encode()
+                elif parts.path in server.routes:
+                    query = {k: v[-1] for k, v in parse_qs(parts.query).items()}
+                    try:
+                        status, ctype, body = server.routes[parts.path](query)
+                    except Exception as e:
+                        status, ctype, body = 500, "text/plain", f"error: {e}\n".encode()
+                else:
+                    status, ctype, body = 404, "text/plain", b"not found\n"
+                self.send_response(status)
+                self.send_header("Content-Type", ctype)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer((host, port), Handler)
+        self._httpd.daemon_threads = True
+        self.address = self._httpd.server_address
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="gateway-metrics", daemon=True)
+        self._thread.start()
+
+    def close(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
@@ -0,0 +1,345 @@
+"""
+게이트웨이 → 엣지 가중치 delta push (엣지 재부팅 후 온라인 학습 상태 복원).
+
+엣지는 재부팅하면 헤더(mlp_model.h) 사전학습 가중치로 돌아가므로 그때까지의 온라인 학습을 잃고,
+twin 해시 불일치(R) 복구도 양쪽을 사전학습 상태로 되돌리는 방식이었다. 여기서는 부팅 ping 때
+게이트웨이 twin 가중치와 사전학습 가중치(엣지가 확실히 가진 checkpoint)의 차이를 압축해 LoRa로 내려보낸다.
+
+delta 형식 (little-endian, 최대 DELTA_MAX_BYTES):
+  헤더  magic 'WD' | version u8 | 예약 u8 | base checksum u32 (MLP_MODEL_CHECKSUM) | target 상태 해시 u32
+        | 항목 수 u16 | 배열별 scale float32 x6 (W1, B1, W2, B2, W3, B3)
+  항목  index gap (LEB128 varint, 직전 index + 1 기준) | q int8
+  적용  W[idx] = W[idx] + (float)q * scale[배열]  (float32, 곱·덧셈 각각 반올림 — 엣지 mlp_apply_delta()와 같음)
+  - |delta| 상위 topk개만 보내고 (top-k sparsification), 배열별 대칭 int8 (scale = max|d| / 127)
+  - target 해시 = 복원 가중치 + init_window()의 mlp_state_hash(): 엣지가 적용 후 직접 확인
+게이트웨이는 자기 가중치 대신 복원 가중치(엣지가 만들 값과 비트 단위로 같음)를 쓰므로 twin이 유지된다.
+
+전송: gateway_edge.ino는 LoRa 패킷 하나마다 시리얼 응답 한 줄을 그대로 LoRa로 돌려주므로
+  엣지 'D,<seq>' 요청 → 게이트웨이 'D<seq>:<base64 조각>' 한 줄 (LoRa payload LORA_MAX_PAYLOAD 이하)
+  마지막에 엣지 'D,end,<해시 hex>' (적용 성공·실패 보고) 또는 'D,end,-' (수신 실패, 적용 안 함)
+"""
+import base64
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+from edge_twin import STATE_ARRAYS
+
+PARAM_ARRAYS = STATE_ARRAYS[:-1]  # w1, b1, w2, b2, w3, b3
+DELTA_MAGIC = b"WD"
+DELTA_VERSION = 1
+_HEADER = struct.Struct("<2sBBIIH6f")
+DELTA_MAX_BYTES = 8192  # 엣지 수신 버퍼 (mlp_model.h MLP_DELTA_MAX), 전체 int8 delta(약 6 KB)도 들어감
+Q_MAX = 127
+
+LORA_MAX_PAYLOAD = 255
+# 'D<seq>:' (seq 3자리까지 5바이트) + base64 4문자/3바이트 → 조각당 186바이트 = 253문자
+CHUNK_BYTES = (LORA_MAX_PAYLOAD - 5) // 4 * 3
+
+DeltaPush = namedtuple("DeltaPush", "lines target_hash n_entries blob_bytes")
+
+
+class DeltaError(ValueError):
+    """delta blob 형식 오류 (magic/version/base checksum/길이)."""
+
+
+def flat_params(arrays):
+    """W1..B3 (dict 또는 model 속성) → C 메모리 순서로 이어 붙인 float32 벡터 (복사)."""
+    get = arrays.__getitem__ if isinstance(arrays, dict) else lambda name: getattr(arrays, name)
+    return np.concatenate([np.asarray(get(name), dtype=np.float32).reshape(-1) for name in PARAM_ARRAYS])
+
+
+def unflatten(flat, like):
+    """flat_params()의 역: like(dict)와 같은 모양의 배열 dict."""
+    out, off = {}, 0
+    for name in PARAM_ARRAYS:
+        shape = np.shape(like[name])
+        n = int(np.prod(shape))
+        out[name] = flat[off:off + n].reshape(shape)
+        off += n
+    return out
+
+
+def _offsets(like):
+    return np.cumsum([0] + [np.size(like[name]) for name in PARAM_ARRAYS])
+
+
+def _entry_bytes(idx):
+    # gap varint (7비트씩) + int8 — 파라미터 수 < 2^14이므로 gap은 1~2바이트
+    gaps = np.diff(idx, prepend=-1) - 1
+    return int(idx.size + np.sum(1 + (gaps >= 0x80)))
+
+
+def select_delta(current, base, topk):
+    """(idx 오름차순 int64, q int8, 배열별 scale float32[6]) — |current - base| 상위 topk개.
+
+    blob이 DELTA_MAX_BYTES를 넘으면 k를 줄인다. q가 0이 되는 항목은 뺀다.
+    """
+    offsets = _offsets(base)
+    d = flat_params(current) - flat_params(base)
+    if not np.all(np.isfinite(d)):
+        raise ValueError("non-finite weight delta (online SGD diverged)")
+    nz = np.flatnonzero(d)
+    order = nz[np.argsort(-np.abs(d[nz]), kind="stable")]
+    k = min(int(topk), nz.size)
+    while True:
+        idx = np.sort(order[:k])
+        size = _HEADER.size + _entry_bytes(idx)
+        if size <= DELTA_MAX_BYTES:
+            break
+        k = k * (DELTA_MAX_BYTES - _HEADER.size) // (size - _HEADER.size)
+    layer = np.searchsorted(offsets, idx, side="right") - 1
+    scales = np.zeros(len(PARAM_ARRAYS), dtype=np.float32)
+    for a in range(len(PARAM_ARRAYS)):
+        sel = np.abs(d[idx[layer == a]])
+        if sel.size:
+            scales[a] = sel.max() / np.float32(Q_MAX)
+    q = np.rint(d[idx] / scales[layer]).astype(np.int8)
+    keep = q != 0
+    return idx[keep], q[keep], scales
+
+
+def apply_entries(base_flat, idx, q, scales, offsets):
+    """base_flat + (float)q * scale (float32, 새 배열). idx는 중복 없음."""
+    out = np.array(base_flat, dtype=np.float32)
+    layer = np.searchsorted(offsets, idx, side="right") - 1
+    out[idx] = out[idx] + q.astype(np.float32) * scales[layer]
+    return out
+
+
+def pack_delta(idx, q, scales, base_checksum, target_hash):
+    out = bytearray(_HEADER.pack(DELTA_MAGIC, DELTA_VERSION, 0, base_checksum, target_hash, len(idx), *scales))
+    prev = -1
+    for i, v in zip(idx.tolist(), q.tolist()):
+        gap = i - prev - 1
+        while gap >= 0x80:
+            out.append(0x80 | (gap & 0x7F))
+            gap >>= 7
+        out.append(gap)
+        out += struct.pack("<b", v)
+        prev = i
+    return bytes(out)
+
+
+def parse_delta(blob, base_checksum=None, n_params=None):
+    """blob → (target_hash, idx, q, scales). 형식 오류는 DeltaError (mlp_apply_delta()의 검사와 같음)."""
+    if len(blob) < _HEADER.size:
+        raise DeltaError(f"delta too short ({len(blob)} bytes)")
+    magic, version, _, checksum, target_hash, n, *scales = _HEADER.unpack_from(blob)
+    if magic != DELTA_MAGIC or version != DELTA_VERSION:
+        raise DeltaError(f"bad delta magic/version {magic!r}/{version}")
+    if base_checksum is not None and checksum != base_checksum:
+        raise DeltaError(f"delta base checksum {checksum:08x} != model {base_checksum:08x}")
+    idx = np.empty(n, dtype=np.int64)
+    q = np.empty(n, dtype=np.int8)
+    pos, prev = _HEADER.size, -1
+    for e in range(n):
+        gap, shift = 0, 0
+        while True:
+            if pos >= len(blob) or shift > 14:
+                raise DeltaError("truncated delta entry")
+            byte = blob[pos]
+            pos += 1
+            gap |= (byte & 0x7F) << shift
+            shift += 7
+            if not byte & 0x80:
+                break
+        if pos >= len(blob):
+            raise DeltaError("truncated delta entry")
+        prev += gap + 1
+        if n_params is not None and prev >= n_params:
+            raise DeltaError(f"delta index {prev} out of range")
+        idx[e] = prev
+        q[e] = struct.unpack_from("<b", blob, pos)[0]
+        pos += 1
+    if pos != len(blob):
+        raise DeltaError(f"{len(blob) - pos} trailing bytes")
+    return target_hash, idx, q, np.array(scales, dtype=np.float32)
+
+
+def apply_delta(base, blob, base_checksum=None):
+    """사전학습 배열 dict + blob → (복원 배열 dict, target 해시)."""
+    offsets = _offsets(base)
+    target_hash, idx, q, scales = parse_delta(blob, base_checksum, int(offsets[-1]))
+    return unflatten(apply_entries(flat_params(base), idx, q, scales, offsets), base), target_hash
+
+
+def chunk_lines(blob, chunk_bytes=CHUNK_BYTES):
+    """blob → 'D<seq>:<base64>' 줄 목록 (각 줄 LoRa 패킷 하나)."""
+    return [f"D{seq}:{base64.b64encode(blob[off:off + chunk_bytes]).decode()}"
+            for seq, off in enumerate(range(0, len(blob), chunk_bytes))]
+
+
+def make_push(model, base, base_checksum, topk):
+    """부팅 ping 때 호출: model(EdgeTwinMLP)을 엣지가 delta 적용 후 가질 상태(복원 가중치 + init_window)로 두고 DeltaPush 반환.
+
+    보낼 차이가 없거나 가중치가 발산(NaN/inf)했으면 model을 사전학습 상태로 두고 None.
+    """
+    if topk <= 0 or not model.weights_finite():
+        model.reset(base)
+        return None
+    idx, q, scales = select_delta(model, base, topk)
+    if idx.size == 0:
+        model.reset(base)
+        return None
+    model.reset(unflatten(apply_entries(flat_params(base), idx, q, scales, _offsets(base)), base))
+    target_hash = model.state_hash()
+    blob = pack_delta(idx, q, scales, base_checksum, target_hash)
+    return DeltaPush(chunk_lines(blob), target_hash, int(idx.size), len(blob))
+
+
+def parse_delta_request(line):
+    """'Received: D,<seq>' → ('chunk', seq), 'Received: D,end,<hex|->' → ('end', 해시 또는 None). 아니면 None."""
+    if "Received: D," not in line:
+        return None
+    parts = line.split("Received: ")[1].strip().split(",")
+    if parts[1] == "end":
+        return "end", (None if parts[2] == "-" else int(parts[2], 16))
+    return "chunk", int(parts[1])
+
+
+class EdgeDeltaSimulator:
+    """엣지 fetch_delta() / mlp_apply_delta()의 Python 쌍둥이.
+
+    model: 부팅 직후 엣지와 같은 EdgeTwinMLP (사전학습 가중치 + init_window), base: 사전학습 배열 dict.
+    receive()로 게이트웨이 줄을 받고, finish()가 적용 후 엣지가 보낼 보고 줄을 반환한다.
+    """
+
+    def __init__(self, model, base, base_checksum, n_chunks):
+        self.model = model
+        self.base = base
+        self.base_checksum = base_checksum
+        self.n_chunks = n_chunks
+        self.blob = bytearray()
+        self.seq = 0
+
+    def request(self):
+        """다음 요청 payload ('D,<seq>'). 모두 받았으면 None."""
+        return None if self.seq >= self.n_chunks else f"D,{self.seq}"
+
+    def receive(self, line):
+        """응답 줄 하나. prefix·base64가 맞으면 이어 붙이고 True (틀리면 같은 seq를 다시 요청)."""
+        prefix = f"D{self.seq}:"
+        if not line.startswith(prefix):
+            return False
+        try:
+            chunk = base64.b64decode(line[len(prefix):], validate=True)
+        except ValueError:
+            return False
+        if len(self.blob) + len(chunk) > DELTA_MAX_BYTES:
+            return False
+        self.blob += chunk
+        self.seq += 1
+        return True
+
+    def finish(self):
+        """delta 적용 → 'D,end,<해시 hex>'. 형식 오류면 적용하지 않고 'D,end,-'."""
+        try:
+            arrays, _ = apply_delta(self.base, bytes(self.blob), self.base_checksum)
+        except DeltaError:
+            return "D,end,-"
+        for name in PARAM_ARRAYS:
+            np.copyto(getattr(self.model, name), arrays[name])
+        if hasattr(self.model, "requantize"):
+            self.model.requantize()
+        self.model.predict()
+        return f"D,end,{self.model.state_hash():08x}"
+
+
+def delta_c_lines():
+    """write_c_header(extra=...)에 넘길 base64 decode + delta 적용 함수 (apply_delta와 같은 연산)."""
+    return [
+        "",
+        "// ===== 가중치 delta 적용 (gateway/weight_delta.py apply_delta와 같은 연산) =====",
+        f"#define MLP_DELTA_MAX {DELTA_MAX_BYTES}",
+        f"#define MLP_DELTA_HEADER {_HEADER.size}",
+        f"#define MLP_DELTA_VERSION {DELTA_VERSION}",
+        "",
+        "static inline int mlp_b64_value(char c) {",
+        "  if (c >= 'A' && c <= 'Z') return c - 'A';",
+        "  if (c >= 'a' && c <= 'z') return c - 'a' + 26;",
+        "  if (c >= '0' && c <= '9') return c - '0' + 52;",
+        "  if (c == '+') return 62;",
+        "  if (c == '/') return 63;",
+        "  return -1;",
+        "}",
+        "",
+        "// base64 문자열 → dst (최대 max 바이트). 디코드한 바이트 수, 형식 오류·넘침이면 -1.",
+        "int mlp_b64_decode(const char *src, uint8_t *dst, int max) {",
+        "  int n = 0, len = strlen(src);",
+        "  if (len % 4) return -1;",
+        "  for (int i = 0; i < len; i += 4) {",
+        "    int v[4], pad = 0;",
+        "    for (int k = 0; k < 4; k++) {",
+        "      if (src[i + k] == '=' && i + 4 == len && k >= 2) { v[k] = 0; pad++; continue; }",
+        "      if (pad || (v[k] = mlp_b64_value(src[i + k])) < 0) return -1;",
+        "    }",
+        "    uint32_t w = ((uint32_t)v[0] << 18) | ((uint32_t)v[1] << 12) | ((uint32_t)v[2] << 6) | (uint32_t)v[3];",
+        "    if (n + 3 - pad > max) return -1;",
+        "    dst[n++] = (uint8_t)(w >> 16);",
+        "    if (pad < 2) dst[n++] = (uint8_t)(w >> 8);",
+        "    if (pad < 1) dst[n++] = (uint8_t)w;",
+        "  }",
+        "  return n;",
+        "}",
+        "",
+        "static inline uint32_t mlp_le32(const uint8_t *p) {",
+        "  return (uint32_t)p[0] | ((uint32_t)p[1] << 8) | ((uint32_t)p[2] << 16) | ((uint32_t)p[3] << 24);",
+        "}",
+        "",
+        "// delta 항목 하나 (index gap varint + int8). 다음 위치, 형식 오류면 -1.",
+        "static int mlp_delta_entry(const uint8_t *blob, int pos, int n, int *gap, int8_t *q) {",
+        "  int g = 0;",
+        "  for (int shift = 0;; shift += 7) {",
+        "    if (pos >= n || shift > 14) return -1;",
+        "    uint8_t b = blob[pos++];",
+        "    g |= (int)(b & 0x7F) << shift;",
+        "    if (!(b & 0x80)) break;",
+        "  }",
+        "  if (pos >= n) return -1;",
+        "  *gap = g;",
+        "  *q = (int8_t)blob[pos];",
+        "  return pos + 1;",
+        "}",
+        "",
+        "// blob을 W1..B3에 적용. 0: 적용 후 mlp_state_hash(window) == target 해시,",
+        "// -1: 형식 오류 (가중치 그대로), -2: 적용했지만 해시 불일치 (재부팅 필요).",
+        "int mlp_apply_delta(const uint8_t *blob, int n, const float *window, int n_window) {",
+        "  float *params[6] = {&W1[0][0], B1, &W2[0][0], B2, &W3[0][0], B3};",
+        "  const int sizes[6] = {(int)(sizeof(W1) / sizeof(float)), (int)(sizeof(B1) / sizeof(float)),",
+        "                        (int)(sizeof(W2) / sizeof(float)), (int)(sizeof(B2) / sizeof(float)),",
+        "                        (int)(sizeof(W3) / sizeof(float)), (int)(sizeof(B3) / sizeof(float))};",
+        "  int n_params = 0;",
+        "  for (int a = 0; a < 6; a++) n_params += sizes[a];",
+        "  if (n < MLP_DELTA_HEADER || blob[0] != 'W' || blob[1] != 'D' || blob[2] != MLP_DELTA_VERSION) return -1;",
+        "  if (mlp_le32(blob + 4) != MLP_MODEL_CHECKSUM) return -1;",
+        "  uint32_t target = mlp_le32(blob + 8);",
+        "  int count = blob[12] | (blob[13] << 8);",
+        "  float scales[6];",
+        "  memcpy(scales, blob + 14, sizeof scales);",
+        "",
+        "  // 1차: 형식·범위 검사만 (오류면 가중치를 건드리지 않음)",
+        "  int pos = MLP_DELTA_HEADER, idx = -1, gap;",
+        "  int8_t q;",
+        "  for (int e = 0; e < count; e++) {",
+        "    if ((pos = mlp_delta_entry(blob, pos, n, &gap, &q)) < 0) return -1;",
+        "    idx += gap + 1;",
+        "    if (idx >= n_params) return -1;",
+        "  }",
+        "  if (pos != n) return -1;",
+        "",
+        "  // 2차: W[idx] = W[idx] + (float)q * scale (index 오름차순이므로 배열 a는 앞으로만 이동)",
+        "  pos = MLP_DELTA_HEADER;",
+        "  idx = -1;",
+        "  int a = 0, off = 0;",
+        "  for (int e = 0; e < count; e++) {",
+        "    pos = mlp_delta_entry(blob, pos, n, &gap, &q);",
+        "    idx += gap + 1;",
+        "    while (idx >= off + sizes[a]) off += sizes[a++];",
+        "    volatile float step = (float)q * scales[a];  // FMA 축약 방지 (곱 반올림 후 덧셈)",
+        "    params[a][idx - off] = params[a][idx - off] + step;",
+        "  }",
+        "  return mlp_state_hash(window, n_window) == target ? 0 : -2;",
+        "}",
+    ]
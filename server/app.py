@@ -1,11 +1,12 @@
 #!/usr/bin/env python3
 """
-모니터링: Flask 대시보드 + Prometheus /metrics.
-실행: python server/app.py  →  http://127.0.0.1:5001  /  Prometheus는 http://127.0.0.1:5001/metrics 스크래핑 (기본 5001, macOS AirPlay 회피)
+모니터링: Flask 대시보드 (MySQL 조회).
+실행: python server/app.py  →  http://127.0.0.1:5001 (기본 5001, macOS AirPlay 회피)
+Prometheus 메트릭은 DB와 무관하게 server/metrics_exporter.py가 MQTT 스트림에서 직접 노출 (MONITORING.md).
 """
 import os
 import sys
-from datetime import datetime, timezone
+from datetime import datetime, timedelta
 
 ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT)
@@ -22,53 +23,11 @@ if os.path.isfile(_env_path):
                 if _k.startswith("MYSQL_"):
                     os.environ[_k] = _v
 
-from flask import Flask, render_template_string, jsonify, request, Response
-from server.db import get_recent, get_stats
-
-try:
-    from prometheus_client import Counter, Gauge, generate_latest, CONTENT_TYPE_LATEST
-    PROMETHEUS_AVAILABLE = True
-except ImportError:
-    PROMETHEUS_AVAILABLE = False
+from flask import Flask, render_template_string, jsonify, request
+from server.db import get_recent, get_series, get_stats
 
 app = Flask(__name__)
 
-# Prometheus 메트릭 (스크래핑 시 DB 값으로 갱신)
-if PROMETHEUS_AVAILABLE:
-    METRIC_READINGS_TOTAL = Gauge("aoii_readings_total", "Total number of readings received")
-    METRIC_MAE_TEMP = Gauge("aoii_mae_temp", "Mean absolute error (temperature)")
-    METRIC_MAE_HUMIDITY = Gauge("aoii_mae_humidity", "Mean absolute error (humidity)")
-    METRIC_AVG_TEMP = Gauge("aoii_avg_temp_celsius", "Average actual temperature")
-    METRIC_AVG_HUMIDITY = Gauge("aoii_avg_humidity_percent", "Average actual humidity")
-    METRIC_LAST_RECEIVED = Gauge("aoii_last_received_timestamp_seconds", "Unix timestamp of last reading")
-
-
-def _update_prometheus_metrics():
-    if not PROMETHEUS_AVAILABLE:
-        return
-    try:
-        s = get_stats()
-        METRIC_READINGS_TOTAL.set(s["total"])
-        if s["total"] > 0:
-            METRIC_MAE_TEMP.set(s["mae_temp"])
-            METRIC_MAE_HUMIDITY.set(s["mae_humidity"])
-            METRIC_AVG_TEMP.set(s["avg_temp"])
-            METRIC_AVG_HUMIDITY.set(s["avg_humidity"])
-            if s.get("last_at"):
-                try:
-                    if isinstance(s["last_at"], str):
-                        dt = datetime.fromisoformat(s["last_at"].replace("Z", "+00:00"))
-                    else:
-                        dt = s["last_at"]
-                    if dt.tzinfo is None:
-                        dt = dt.replace(tzinfo=timezone.utc)
-                    METRIC_LAST_RECEIVED.set(dt.timestamp())
-                except Exception:
-                    pass
-    except Exception:
-        pass  # DB 등 오류 시 메트릭만 갱신 생략, 500 내지 않음
-
-
 HTML = """
 <!DOCTYPE html>
 <html lang="ko">
@@ -91,7 +50,6 @@ HTML = """
 </head>
 <body>
   <h1>Edge–Gateway 모니터링</h1>
-  <p><a href="/metrics">Prometheus /metrics</a></p>
   <div class="cards">
     <div class="card"><div class="label">총 수신 횟수</div><div class="val" id="total">-</div></div>
     <div class="card"><div class="label">평균 온도 (°C)</div><div class="val" id="avg_temp">-</div></div>
@@ -100,8 +58,19 @@ HTML = """
     <div class="card"><div class="label">MAE (습도)</div><div class="val" id="mae_humidity">-</div></div>
   </div>
   <div class="meta">첫 수신: <span id="first_at">-</span> &nbsp;|&nbsp; 마지막: <span id="last_at">-</span></div>
+  <div class="meta">
+    차트 범위:
+    <select id="range" onchange="lastId = null; refresh()">
+      <option value="">최근 200건</option>
+      <option value="86400">1일</option>
+      <option value="604800">7일</option>
+      <option value="2592000">30일</option>
+    </select>
+  </div>
   <div id="chartWrap"><canvas id="chart"></canvas></div>
   <script>
+    const CHART_POINTS = 200;
+    let lastId = null;  // 차트에 마지막으로 붙인 readings.id (null = 전체 다시 받기)
     function refresh() {
       fetch('/api/stats').then(r=>r.json()).then(s=>{
         document.getElementById('total').textContent = s.total;
@@ -113,13 +82,43 @@ HTML = """
         document.getElementById('first_at').textContent = s.first_at || '-';
         document.getElementById('last_at').textContent = s.last_at || '-';
       });
-      fetch('/api/recent?limit=200').then(r=>r.json()).then(data=>{
-        const labels = data.map(d=> d.created_at ? d.created_at.replace('T',' ').slice(0,19) : '');
-        window.chartObj.data.labels = labels;
-        window.chartObj.data.datasets[0].data = data.map(d=> d.actual_temp);
-        window.chartObj.data.datasets[1].data = data.map(d=> d.pred_temp);
-        window.chartObj.data.datasets[2].data = data.map(d=> d.actual_humidity);
-        window.chartObj.data.datasets[3].data = data.map(d=> d.pred_humidity);
+      const range = document.getElementById('range').value;
+      if (range) { refreshSeries(Number(range)); return; }
+      // 실시간: 처음 한 번만 최근 CHART_POINTS건을 받고, 이후에는 lastId 이후 새 행만 받아 뒤에 붙임
+      const url = lastId === null ? `/api/recent?limit=${CHART_POINTS}` : `/api/recent?after_id=${lastId}&limit=${CHART_POINTS}`;
+      fetch(url).then(r=>r.json()).then(data=>{
+        if (lastId === null) resetChart();
+        if (data.length === 0) return;
+        const chart = window.chartObj;
+        for (const d of data) {
+          chart.data.labels.push(d.created_at ? d.created_at.replace('T',' ').slice(0,19) : '');
+          chart.data.datasets[0].data.push(d.actual_temp);
+          chart.data.datasets[1].data.push(d.pred_temp);
+          chart.data.datasets[2].data.push(d.actual_humidity);
+          chart.data.datasets[3].data.push(d.pred_humidity);
+        }
+        const excess = chart.data.labels.length - CHART_POINTS;
+        if (excess > 0) {
+          chart.data.labels.splice(0, excess);
+          chart.data.datasets.forEach(ds => ds.data.splice(0, excess));
+        }
+        lastId = data[data.length - 1].id;
+        chart.update();
+      });
+    }
+    function resetChart() {
+      window.chartObj.data.labels = [];
+      window.chartObj.data.datasets.forEach(ds => { ds.data = []; });
+    }
+    // 장기 구간: 서버에서 시간 버킷 평균으로 집계된 시계열 (점 개수 = 차트 폭 정도로 고정)
+    function refreshSeries(seconds) {
+      const points = Math.min(1000, document.getElementById('chartWrap').clientWidth);
+      fetch(`/api/series?seconds=${seconds}&points=${points}`).then(r=>r.json()).then(s=>{
+        window.chartObj.data.labels = s.t.map(t=> t.replace('T',' ').slice(0,16));
+        window.chartObj.data.datasets[0].data = s.actual_temp.avg;
+        window.chartObj.data.datasets[1].data = s.pred_temp.avg;
+        window.chartObj.data.datasets[2].data = s.actual_humidity.avg;
+        window.chartObj.data.datasets[3].data = s.pred_humidity.avg;
         window.chartObj.update();
       });
     }
@@ -163,23 +162,38 @@ def api_stats():
 
 @app.route("/api/recent")
 def api_recent():
+    """최근 데이터. ?after_id=N: id > N인 새 행만 (증분), ?since=ISO: 해당 시각 이후."""
     limit = int(request.args.get("limit", 500))
-    return jsonify(get_recent(limit=limit))
+    after_id = request.args.get("after_id", type=int)
+    return jsonify(get_recent(limit=limit, since_iso=request.args.get("since"), after_id=after_id))
+
+
+def _parse_time(value):
+    # created_at은 로컬 시간(naive)으로 저장되므로 타임존 정보는 로컬 시간으로 변환 후 제거
+    dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if dt.tzinfo is not None:
+        dt = dt.astimezone().replace(tzinfo=None)
+    return dt
 
 
-@app.route("/metrics")
-def metrics():
-    """Prometheus가 스크래핑하는 엔드포인트. DB 통계를 메트릭으로 노출."""
-    if not PROMETHEUS_AVAILABLE:
-        return "prometheus_client not installed. pip install prometheus_client", 500
+@app.route("/api/series")
+def api_series():
+    """시간 버킷 집계 시계열. ?from=&to= (ISO) 또는 ?seconds= (to=now 기준), &points= (기본 500)."""
     try:
-        _update_prometheus_metrics()
-        return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)
-    except Exception:
-        return Response(generate_latest(), mimetype=CONTENT_TYPE_LATEST)  # 오류 시에도 200 + 기존 메트릭
+        end = _parse_time(request.args["to"]) if "to" in request.args else datetime.now()
+        if "from" in request.args:
+            start = _parse_time(request.args["from"])
+        else:
+            start = end - timedelta(seconds=float(request.args.get("seconds", 86400)))
+        points = int(request.args.get("points", 500))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+    if start >= end:
+        return jsonify({"error": "from must be earlier than to"}), 400
+    return jsonify(get_series(start, end, points))
 
 
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 5001))
-    print(f"대시보드: http://127.0.0.1:{port}  |  Prometheus: http://127.0.0.1:{port}/metrics")
+    print(f"대시보드: http://127.0.0.1:{port}")
     app.run(host="0.0.0.0", port=port, debug=False)
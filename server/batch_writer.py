@@ -0,0 +1,111 @@
+# server/batch_writer.py
+"""행 단위 입력을 모아 일괄 저장하는 writer 스레드 (MQTT/시리얼 콜백에서 DB 대기 제거).
+
+submit()은 큐에 넣고 바로 반환. writer 스레드가 batch_size행이 모이거나 가장 오래된 행이
+flush_interval_ms 동안 기다렸을 때 write_fn(rows)를 호출하고, 실패 시 지수 백오프로 재시도한다.
+재시도 중에도 submit()은 막히지 않으며 대기 행은 max_pending개까지 보관 (초과 시 오래된 행부터 폐기).
+"""
+import collections
+import threading
+import time
+
+BATCH_SIZE = 500
+FLUSH_INTERVAL_MS = 200
+MAX_RETRIES = 5
+BASE_DELAY = 1.0  # 1s, 2s, 4s, 8s (마지막 시도 실패 시 해당 batch 폐기)
+MAX_PENDING = 100_000
+
+
+class BatchWriter:
+    def __init__(self, write_fn, batch_size=BATCH_SIZE, flush_interval_ms=FLUSH_INTERVAL_MS, max_retries=MAX_RETRIES,
+                 base_delay=BASE_DELAY, max_pending=MAX_PENDING, name="batch_writer", verbose=True):
+        self.write_fn = write_fn
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_pending = max_pending
+        self.name = name
+        self.verbose = verbose
+
+        self.counters = {"submitted": 0, "written": 0, "batches": 0, "retries": 0, "failed": 0, "dropped": 0}
+        self._rows = collections.deque()
+        self._first_at = None  # 대기 중 가장 오래된 행의 도착 시각 (monotonic)
+        self._cond = threading.Condition()
+        self._closing = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, row):
+        with self._cond:
+            if len(self._rows) >= self.max_pending:
+                self._rows.popleft()
+                self.counters["dropped"] += 1
+            if not self._rows:
+                self._first_at = time.monotonic()
+            self._rows.append(row)
+            self.counters["submitted"] += 1
+            if len(self._rows) >= self.batch_size:
+                self._cond.notify()
+
+    def stats(self):
+        with self._cond:
+            return dict(self.counters, pending=len(self._rows))
+
+    def close(self, timeout=30.0):
+        """대기 중인 행을 모두 flush 한 뒤 스레드 종료."""
+        with self._cond:
+            self._closing = True
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    def _next_batch(self):
+        with self._cond:
+            while True:
+                if len(self._rows) >= self.batch_size:
+                    break
+                if self._rows:
+                    wait = self._first_at + self.flush_interval - time.monotonic()
+                    if wait <= 0 or self._closing:
+                        break
+                elif self._closing:
+                    return None
+                else:
+                    wait = None
+                self._cond.wait(wait)
+            n = min(len(self._rows), self.batch_size)
+            batch = [self._rows.popleft() for _ in range(n)]
+            self._first_at = time.monotonic() if self._rows else None
+            return batch
+
+    def _write_with_retry(self, batch):
+        for attempt in range(self.max_retries):
+            try:
+                self.write_fn(batch)
+            except Exception as e:
+                if attempt == self.max_retries - 1:
+                    print(f"{self.name}: insert FAILED after {self.max_retries} tries, "
+                          f"dropping {len(batch)} rows: {e}")
+                    with self._cond:
+                        self.counters["failed"] += len(batch)
+                    return
+                delay = self.base_delay * (2 ** attempt)
+                print(f"{self.name}: insert retry {attempt + 1}/{self.max_retries} in {delay:.1f}s "
+                      f"({len(batch)} rows): {e}")
+                with self._cond:
+                    self.counters["retries"] += 1
+                time.sleep(delay)
+                continue
+            with self._cond:
+                self.counters["written"] += len(batch)
+                self.counters["batches"] += 1
+            if self.verbose:
+                print(f"{self.name}: saved {len(batch)} rows")
+            return
+
+    def _run(self):
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            self._write_with_retry(batch)
@@ -1,7 +1,9 @@
 # server/db.py
 """MySQL: 엣지 수신 데이터 및 게이트웨이 예측 저장. AoII/모니터링용."""
+import math
 import os
-from datetime import datetime
+import queue
+from datetime import datetime, timedelta
 from contextlib import contextmanager
 
 try:
@@ -22,15 +24,49 @@ def _config():
     }
 
 
+# 연결 풀: 사용이 끝난 연결을 닫지 않고 보관했다가 재사용 (최대 MYSQL_POOL_SIZE개 보관)
+_pool = queue.LifoQueue()
+
+
+def _pool_size():
+    return int(os.environ.get("MYSQL_POOL_SIZE", "4"))
+
+
+def _checkout():
+    while True:
+        try:
+            conn = _pool.get_nowait()
+        except queue.Empty:
+            return pymysql.connect(**_config())
+        try:
+            conn.ping(reconnect=True)  # 서버가 끊은 idle 연결 복구
+            return conn
+        except Exception:
+            _close_quietly(conn)
+
+
+def _close_quietly(conn):
+    try:
+        conn.close()
+    except Exception:
+        pass
+
+
 @contextmanager
 def get_connection():
+    """풀에서 연결을 빌려 사용. 정상 종료 시 commit 후 반납, 예외 시 연결 폐기 (미커밋분은 서버가 롤백)."""
     if not pymysql:
         raise RuntimeError("PyMySQL not installed. Run: pip install pymysql")
-    conn = pymysql.connect(**_config())
+    conn = _checkout()
     try:
         yield conn
         conn.commit()
-    finally:
+    except BaseException:
+        _close_quietly(conn)
+        raise
+    if _pool.qsize() < _pool_size():
+        _pool.put(conn)
+    else:
         conn.close()
 
 
@@ -55,6 +91,8 @@ def _add_edge_log_columns_if_missing(conn):
         ("inference_time_us", "BIGINT UNSIGNED NULL"),
         ("free_heap", "INT UNSIGNED NULL"),
         ("total_heap", "INT UNSIGNED NULL"),
+        ("node_id", "VARCHAR(32) NULL"),
+        ("variant", "VARCHAR(16) NULL"),
     ]
     with conn.cursor() as cur:
         cur.execute(
@@ -102,12 +140,81 @@ def init_db():
                     inference_time_us BIGINT UNSIGNED NULL,
                     free_heap INT UNSIGNED NULL,
                     total_heap INT UNSIGNED NULL,
+                    node_id VARCHAR(32) NULL,
+                    variant VARCHAR(16) NULL,
                     INDEX idx_created_at (created_at),
                     INDEX idx_triggered (triggered),
                     INDEX idx_status (status)
                 ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
             """)
             _add_edge_log_columns_if_missing(conn)
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS readings_summary (
+                    id TINYINT PRIMARY KEY,
+                    total BIGINT NOT NULL,
+                    sum_temp DOUBLE NOT NULL,
+                    sum_humidity DOUBLE NOT NULL,
+                    sum_abs_err_temp DOUBLE NOT NULL,
+                    sum_abs_err_humidity DOUBLE NOT NULL,
+                    first_at DATETIME(6) NULL,
+                    last_at DATETIME(6) NULL
+                ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+            """)
+            # 요약 행이 없으면(테이블 신규 생성) 기존 readings로 1회 채움
+            cur.execute("INSERT IGNORE INTO readings_summary " + _SUMMARY_FROM_READINGS_SQL)
+            for table, _, fmt in ROLLUPS:
+                cols = ",\n".join(f"{c} DOUBLE NOT NULL" for c in _ROLLUP_VALUE_COLS)
+                cur.execute(f"""
+                    CREATE TABLE IF NOT EXISTS {table} (
+                        bucket_start DATETIME NOT NULL PRIMARY KEY,
+                        n INT NOT NULL,
+                        {cols}
+                    ) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4
+                """)
+                cur.execute(f"SELECT 1 FROM {table} LIMIT 1")
+                if cur.fetchone() is None:
+                    cur.execute(f"INSERT INTO {table} " + _rollup_from_readings_sql(fmt))
+
+
+_INSERT_EDGE_LOG_SQL = """INSERT INTO edge_log
+   (created_at, actual_temp, actual_humidity, pred_temp, pred_humidity,
+    error_temp, error_humidity, triggered, status, inference_time_us, free_heap, total_heap, node_id, variant)
+   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)"""
+
+
+def edge_log_row(
+    actual_temp,
+    actual_humidity,
+    pred_temp,
+    pred_humidity,
+    error_temp,
+    triggered,
+    error_humidity=None,
+    status=None,
+    inference_time_us=None,
+    free_heap=None,
+    total_heap=None,
+    created_at=None,
+    node_id=None,
+    variant=None,
+):
+    """edge_log INSERT 파라미터 튜플. created_at 기본값: 지금 (로컬 시간). node_id/variant: fleet 로거용."""
+    return (
+        created_at or datetime.now(),
+        actual_temp,
+        actual_humidity,
+        pred_temp,
+        pred_humidity,
+        error_temp,
+        error_humidity if error_humidity is not None else 0.0,
+        1 if triggered else 0,
+        status,
+        inference_time_us,
+        free_heap,
+        total_heap,
+        node_id,
+        variant,
+    )
 
 
 def insert_edge_log(
@@ -124,62 +231,185 @@ def insert_edge_log(
     total_heap=None,
 ):
     """엣지 시리얼 로그용: SEND/SKIP 전부 저장. triggered: 1=SEND, 0=SKIP. 성능 지표(μs, heap) 선택."""
-    created_at = datetime.now()
+    insert_edge_logs([edge_log_row(actual_temp, actual_humidity, pred_temp, pred_humidity, error_temp, triggered,
+                                   error_humidity, status, inference_time_us, free_heap, total_heap)])
+
+
+def insert_edge_logs(rows):
+    """edge_log_row() 튜플 여러 건을 한 번에 저장 (executemany → multi-row INSERT, commit 1회)."""
+    if not rows:
+        return 0
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """INSERT INTO edge_log
-                   (created_at, actual_temp, actual_humidity, pred_temp, pred_humidity,
-                    error_temp, error_humidity, triggered, status, inference_time_us, free_heap, total_heap)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
-                (
-                    created_at,
-                    actual_temp,
-                    actual_humidity,
-                    pred_temp,
-                    pred_humidity,
-                    error_temp,
-                    error_humidity if error_humidity is not None else 0.0,
-                    1 if triggered else 0,
-                    status,
-                    inference_time_us,
-                    free_heap,
-                    total_heap,
-                ),
-            )
+            cur.executemany(_INSERT_EDGE_LOG_SQL, rows)
+    return len(rows)
+
+
+_INSERT_READING_SQL = """INSERT INTO readings
+   (created_at, actual_temp, actual_humidity, pred_temp, pred_humidity, error_temp, error_humidity, transmission_delay_ms)
+   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)"""
+
+
+def reading_row(actual_temp, actual_humidity, pred_temp, pred_humidity, transmission_delay_ms=None, created_at=None):
+    """readings INSERT 파라미터 튜플. created_at 기본값: 지금 (로컬 시간)."""
+    return (
+        created_at or datetime.now(),
+        actual_temp,
+        actual_humidity,
+        pred_temp,
+        pred_humidity,
+        actual_temp - pred_temp,
+        actual_humidity - pred_humidity,
+        transmission_delay_ms,
+    )
 
 
 def insert_reading(actual_temp, actual_humidity, pred_temp, pred_humidity, transmission_delay_ms=None):
     """수신된 한 건 + 그 시점 게이트웨이 예측값 저장. transmission_delay_ms: 엣지→게이트웨이 전송 지연(ms)."""
-    created_at = datetime.now()
-    error_temp = actual_temp - pred_temp
-    error_humidity = actual_humidity - pred_humidity
+    insert_readings([reading_row(actual_temp, actual_humidity, pred_temp, pred_humidity, transmission_delay_ms)])
+
+
+# readings 누적 집계 (단일 행, id=1): insert_readings()가 같은 트랜잭션에서 갱신 → get_stats()는 1행 조회
+_UPSERT_SUMMARY_SQL = """INSERT INTO readings_summary
+   (id, total, sum_temp, sum_humidity, sum_abs_err_temp, sum_abs_err_humidity, first_at, last_at)
+   VALUES (1, %s, %s, %s, %s, %s, %s, %s)
+   ON DUPLICATE KEY UPDATE
+     total = total + VALUES(total),
+     sum_temp = sum_temp + VALUES(sum_temp),
+     sum_humidity = sum_humidity + VALUES(sum_humidity),
+     sum_abs_err_temp = sum_abs_err_temp + VALUES(sum_abs_err_temp),
+     sum_abs_err_humidity = sum_abs_err_humidity + VALUES(sum_abs_err_humidity),
+     first_at = LEAST(COALESCE(first_at, VALUES(first_at)), VALUES(first_at)),
+     last_at = GREATEST(COALESCE(last_at, VALUES(last_at)), VALUES(last_at))"""
+
+_SUMMARY_FROM_READINGS_SQL = """SELECT 1, COUNT(*), COALESCE(SUM(actual_temp), 0), COALESCE(SUM(actual_humidity), 0),
+          COALESCE(SUM(ABS(error_temp)), 0), COALESCE(SUM(ABS(error_humidity)), 0),
+          MIN(created_at), MAX(created_at)
+   FROM readings"""
+
+
+def _summary_delta(rows):
+    """reading_row 튜플들 → readings_summary 증분 (total, 합계들, first_at, last_at)."""
+    return (
+        len(rows),
+        sum(r[1] for r in rows),
+        sum(r[2] for r in rows),
+        sum(abs(r[5]) for r in rows),
+        sum(abs(r[6]) for r in rows),
+        min(r[0] for r in rows),
+        max(r[0] for r in rows),
+    )
+
+
+# 시간 버킷 rollup (장기 차트용): (테이블, 버킷 초, MySQL DATE_FORMAT 절삭 형식)
+SERIES_COLUMNS = ("actual_temp", "actual_humidity", "pred_temp", "pred_humidity")
+ROLLUPS = (
+    ("readings_rollup_1h", 3600, "%Y-%m-%d %H:00:00"),
+    ("readings_rollup_1m", 60, "%Y-%m-%d %H:%i:00"),
+)
+_ROLLUP_VALUE_COLS = tuple(f"{agg}_{c}" for agg in ("sum", "min", "max") for c in SERIES_COLUMNS)
+
+
+def _upsert_rollup_sql(table):
+    cols = ", ".join(_ROLLUP_VALUE_COLS)
+    updates = ["n = n + VALUES(n)"]
+    for col in _ROLLUP_VALUE_COLS:
+        if col.startswith("sum_"):
+            updates.append(f"{col} = {col} + VALUES({col})")
+        else:
+            fn = "LEAST" if col.startswith("min_") else "GREATEST"
+            updates.append(f"{col} = {fn}({col}, VALUES({col}))")
+    return (f"INSERT INTO {table} (bucket_start, n, {cols}) VALUES ({', '.join(['%s'] * (2 + len(_ROLLUP_VALUE_COLS)))})"
+            f" ON DUPLICATE KEY UPDATE {', '.join(updates)}")
+
+
+def _rollup_from_readings_sql(fmt):
+    aggs = ", ".join(f"{agg.upper()}({c})" for agg in ("sum", "min", "max") for c in SERIES_COLUMNS)
+    return (f"SELECT DATE_FORMAT(created_at, '{fmt}') AS b, COUNT(*), {aggs} "
+            f"FROM readings GROUP BY b")
+
+
+def _floor_time(dt, seconds):
+    return dt.replace(microsecond=0) - timedelta(seconds=(dt.hour * 3600 + dt.minute * 60 + dt.second) % seconds)
+
+
+def _rollup_rows(rows, seconds):
+    """reading_row 튜플들 → 버킷별 (bucket_start, n, sum_*, min_*, max_*) 튜플."""
+    k = len(SERIES_COLUMNS)
+    buckets = {}
+    for r in rows:
+        key = _floor_time(r[0], seconds)
+        vals = r[1:1 + k]
+        b = buckets.get(key)
+        if b is None:
+            buckets[key] = [1, *vals, *vals, *vals]
+            continue
+        b[0] += 1
+        for i, v in enumerate(vals):
+            b[1 + i] += v
+            b[1 + k + i] = min(b[1 + k + i], v)
+            b[1 + 2 * k + i] = max(b[1 + 2 * k + i], v)
+    return [(key, *b) for key, b in buckets.items()]
+
+
+def insert_readings(rows):
+    """reading_row() 튜플 여러 건을 한 번에 저장 (executemany → multi-row INSERT, commit 1회).
+
+    같은 트랜잭션에서 readings_summary 누적 집계와 분/시간 rollup도 갱신한다.
+    """
+    if not rows:
+        return 0
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute(
-                """INSERT INTO readings
-                   (created_at, actual_temp, actual_humidity, pred_temp, pred_humidity, error_temp, error_humidity, transmission_delay_ms)
-                   VALUES (%s, %s, %s, %s, %s, %s, %s, %s)""",
-                (created_at, actual_temp, actual_humidity, pred_temp, pred_humidity, error_temp, error_humidity, transmission_delay_ms),
-            )
+            cur.executemany(_INSERT_READING_SQL, rows)
+            cur.execute(_UPSERT_SUMMARY_SQL, _summary_delta(rows))
+            for table, seconds, _ in ROLLUPS:
+                cur.executemany(_upsert_rollup_sql(table), _rollup_rows(rows, seconds))
+    return len(rows)
 
 
-def get_recent(limit=500, since_iso=None):
-    """모니터링/차트용 최근 데이터 (시간순)."""
+def rebuild_summary():
+    """readings 전체를 다시 집계해 readings_summary를 교체 (백필/불일치 복구용, 전체 스캔)."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            if since_iso:
+            cur.execute("REPLACE INTO readings_summary " + _SUMMARY_FROM_READINGS_SQL)
+            cur.execute("SELECT total FROM readings_summary WHERE id = 1")
+            return cur.fetchone()["total"]
+
+
+def rebuild_rollups():
+    """분/시간 rollup 테이블을 readings에서 다시 계산. 반환: 테이블 → 버킷 수."""
+    counts = {}
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            for table, _, fmt in ROLLUPS:
+                cur.execute(f"DELETE FROM {table}")
+                counts[table] = cur.execute(f"INSERT INTO {table} " + _rollup_from_readings_sql(fmt))
+    return counts
+
+
+def get_recent(limit=500, since_iso=None, after_id=None):
+    """모니터링/차트용 최근 데이터 (시간순).
+
+    after_id: 해당 id 이후(id > after_id)에 저장된 행만 오래된 순으로 최대 limit개 (증분 조회, PK 범위 스캔).
+    """
+    columns = """id, created_at, actual_temp, actual_humidity,
+                 pred_temp, pred_humidity, error_temp, error_humidity"""
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            if after_id is not None:
+                cur.execute(
+                    f"SELECT {columns} FROM readings WHERE id > %s ORDER BY id LIMIT %s",
+                    (after_id, limit),
+                )
+            elif since_iso:
                 cur.execute(
-                    """SELECT id, created_at, actual_temp, actual_humidity,
-                              pred_temp, pred_humidity, error_temp, error_humidity
-                       FROM readings WHERE created_at >= %s ORDER BY created_at DESC LIMIT %s""",
+                    f"SELECT {columns} FROM readings WHERE created_at >= %s ORDER BY created_at DESC LIMIT %s",
                     (since_iso, limit),
                 )
             else:
                 cur.execute(
-                    """SELECT id, created_at, actual_temp, actual_humidity,
-                              pred_temp, pred_humidity, error_temp, error_humidity
-                       FROM readings ORDER BY created_at DESC LIMIT %s""",
+                    f"SELECT {columns} FROM readings ORDER BY created_at DESC LIMIT %s",
                     (limit,),
                 )
             rows = cur.fetchall()
@@ -190,34 +420,69 @@ def get_recent(limit=500, since_iso=None):
         if hasattr(d.get("created_at"), "isoformat"):
             d["created_at"] = d["created_at"].isoformat()
         out.append(d)
-    return list(reversed(out))
+    return out if after_id is not None else list(reversed(out))
+
+
+SERIES_MAX_POINTS = 5000
+
+
+def get_series(start, end, points=500):
+    """[start, end) 구간을 최대 points개 시간 버킷으로 집계 (버킷별 avg/min/max).
+
+    버킷 폭 = ceil(구간 / points)초. 폭이 1시간 이상이면 시간 rollup, 1분 이상이면 분 rollup,
+    그보다 짧으면 readings 원본을 읽으므로 조회 행 수는 구간 길이와 무관하게 points에 비례한다.
+    반환: 컬럼형 dict {t, n, <series>: {avg, min, max}, bucket_s, source}.
+    """
+    points = max(1, min(int(points), SERIES_MAX_POINTS))
+    span = max((end - start).total_seconds(), 1.0)
+    width = max(math.ceil(span / points), 1)
+    source, table = "raw", None
+    for tbl, seconds, _ in ROLLUPS:
+        if width >= seconds:
+            source, table = f"{seconds // 60}m" if seconds < 3600 else f"{seconds // 3600}h", tbl
+            width = math.ceil(width / seconds) * seconds
+            start = _floor_time(start, seconds)
+            break
+
+    if table is None:
+        time_col, from_sql = "created_at", "readings"
+        n_sql = "COUNT(*)"
+        aggs = [f"AVG({c}) AS avg_{c}, MIN({c}) AS min_{c}, MAX({c}) AS max_{c}" for c in SERIES_COLUMNS]
+    else:
+        time_col, from_sql = "bucket_start", table
+        n_sql = "SUM(n)"
+        aggs = [f"SUM(sum_{c}) / SUM(n) AS avg_{c}, MIN(min_{c}) AS min_{c}, MAX(max_{c}) AS max_{c}"
+                for c in SERIES_COLUMNS]
+    sql = (f"SELECT FLOOR(TIMESTAMPDIFF(SECOND, %s, {time_col}) / %s) AS b, {n_sql} AS n, {', '.join(aggs)} "
+           f"FROM {from_sql} WHERE {time_col} >= %s AND {time_col} < %s GROUP BY b ORDER BY b")
+    with get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute(sql, (start, width, start, end))
+            rows = cur.fetchall()
+
+    out = {"from": start.isoformat(), "to": end.isoformat(), "bucket_s": width, "source": source,
+           "t": [(start + timedelta(seconds=int(r["b"]) * width)).isoformat() for r in rows],
+           "n": [int(r["n"]) for r in rows]}
+    for c in SERIES_COLUMNS:
+        out[c] = {agg: [round(float(r[f"{agg}_{c}"]), 3) for r in rows] for agg in ("avg", "min", "max")}
+    return out
 
 
 def get_stats():
-    """대시보드용 요약 통계."""
+    """대시보드용 요약 통계 (readings_summary 1행 조회, 전체 스캔 없음)."""
     with get_connection() as conn:
         with conn.cursor() as cur:
-            cur.execute("SELECT COUNT(*) AS total FROM readings")
-            total = cur.fetchone()["total"]
-            if total == 0:
-                return {"total": 0}
-            cur.execute(
-                """SELECT
-                     AVG(actual_temp) AS avg_temp,
-                     AVG(actual_humidity) AS avg_humidity,
-                     AVG(ABS(error_temp)) AS mae_temp,
-                     AVG(ABS(error_humidity)) AS mae_humidity,
-                     MIN(created_at) AS first_at,
-                     MAX(created_at) AS last_at
-                   FROM readings"""
-            )
+            cur.execute("SELECT * FROM readings_summary WHERE id = 1")
             row = cur.fetchone()
+    total = row["total"] if row else 0
+    if total == 0:
+        return {"total": 0}
     return {
         "total": total,
-        "avg_temp": round(float(row["avg_temp"]), 2),
-        "avg_humidity": round(float(row["avg_humidity"]), 2),
-        "mae_temp": round(float(row["mae_temp"]), 4),
-        "mae_humidity": round(float(row["mae_humidity"]), 4),
+        "avg_temp": round(row["sum_temp"] / total, 2),
+        "avg_humidity": round(row["sum_humidity"] / total, 2),
+        "mae_temp": round(row["sum_abs_err_temp"] / total, 4),
+        "mae_humidity": round(row["sum_abs_err_humidity"] / total, 4),
         "first_at": row["first_at"].isoformat() if hasattr(row["first_at"], "isoformat") else row["first_at"],
         "last_at": row["last_at"].isoformat() if hasattr(row["last_at"], "isoformat") else row["last_at"],
     }
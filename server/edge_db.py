@@ -0,0 +1,41 @@
+# server/edge_db.py
+"""시리얼 로거 → MySQL edge_log 일괄 저장 (.env EDGE_DB=1일 때).
+
+insert_edge_log()는 호출마다 연결을 빌려 1행 INSERT + commit 한다. 노드 여러 대가 매 주기 보내면
+연결·commit 비용이 대부분이므로, 로거는 행을 BatchWriter에 넣기만 하고 writer 스레드가
+EDGE_DB_BATCH_SIZE행 또는 EDGE_DB_FLUSH_MS 중 먼저 도달할 때 insert_edge_logs()로 일괄 저장한다.
+writer 스레드 하나만 DB를 쓰므로 풀(LIFO)의 같은 연결을 계속 재사용하고, 실패 시 지수 백오프로 재시도.
+"""
+import os
+from datetime import datetime
+
+from server.batch_writer import BatchWriter
+from server.db import edge_log_row, init_db, insert_edge_logs
+
+EDGE_DB_BATCH_SIZE = int(os.environ.get("EDGE_DB_BATCH_SIZE", "200"))
+EDGE_DB_FLUSH_MS = int(os.environ.get("EDGE_DB_FLUSH_MS", "1000"))
+
+
+def enabled():
+    return os.environ.get("EDGE_DB", "0").strip().lower() in ("1", "true", "yes", "on")
+
+
+def open_writer(verbose=False):
+    """edge_log 테이블 준비 후 BatchWriter 반환. DB가 아직 없어도 로거는 계속 (batch 단위로 재시도)."""
+    try:
+        init_db()
+        print(f"edge_db: MySQL edge_log 저장 (batch {EDGE_DB_BATCH_SIZE}행 / {EDGE_DB_FLUSH_MS} ms)")
+    except Exception as e:
+        print(f"edge_db: DB init warning: {e}")
+    return BatchWriter(insert_edge_logs, batch_size=EDGE_DB_BATCH_SIZE, flush_interval_ms=EDGE_DB_FLUSH_MS,
+                       name="edge_db", verbose=verbose)
+
+
+def parsed_row(parsed, received_at, node_id=None, variant=None):
+    """parse_edge_line() 결과 + 수신 시각(unix 초) → edge_log_row 튜플. SKIP이 아니면 triggered=1."""
+    (actual_t, actual_h, pred_t, pred_h, error_t, error_h,
+     status, inference_time_us, free_heap, total_heap) = parsed
+    return edge_log_row(actual_t, actual_h, pred_t, pred_h, error_t, status != "SKIP",
+                        error_humidity=error_h, status=status, inference_time_us=inference_time_us,
+                        free_heap=free_heap, total_heap=total_heap,
+                        created_at=datetime.fromtimestamp(received_at), node_id=node_id, variant=variant)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# server/metrics_exporter.py
+"""Prometheus exporter: aoii/readings MQTT 스트림 → 메모리 내 Counter/Histogram/Gauge.
+
+메시지가 도착할 때마다 메트릭을 갱신하고, /metrics 스크래핑은 메모리 값만 직렬화한다 (DB 조회 없음).
+실행: python server/metrics_exporter.py  →  http://127.0.0.1:9105/metrics (.env METRICS_PORT로 변경)
+Prometheus 설정: monitoring/prometheus.yml
+"""
+import os
+import sys
+import json
+import time
+
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _project_root)
+
+# .env 로드
+_env_path = os.path.join(_project_root, ".env")
+if os.path.isfile(_env_path):
+    with open(_env_path, "r", encoding="utf-8") as _f:
+        for _line in _f:
+            _line = _line.strip()
+            if _line and not _line.startswith("#") and "=" in _line:
+                _k, _v = _line.split("=", 1)
+                _k, _v = _k.strip(), _v.strip()
+                if _k.startswith("MQTT_") or _k.startswith("METRICS_"):
+                    os.environ[_k] = _v
+
+import paho.mqtt.client as mqtt
+from prometheus_client import Counter, Gauge, Histogram, start_http_server
+
+MQTT_BROKER = os.environ.get("MQTT_BROKER", "localhost")
+MQTT_PORT = int(os.environ.get("MQTT_PORT", "1883"))
+MQTT_TOPIC = "aoii/readings"
+METRICS_PORT = int(os.environ.get("METRICS_PORT", "9105"))
+
+# 버킷: 게이트웨이 AoII 임계값(BETA_TEMP 0.5°C, BETA_HUM 3%)이 경계에 오도록
+ERROR_TEMP_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0)
+ERROR_HUM_BUCKETS = (0.25, 0.5, 1.0, 2.0, 3.0, 5.0, 10.0, 20.0)
+DELAY_MS_BUCKETS = (50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+MESSAGES = Counter("aoii_messages", "MQTT messages received from the gateway", ["event", "qos"])
+READINGS = Counter("aoii_readings", "RX readings received (edge transmissions)")
+PARSE_ERRORS = Counter("aoii_message_parse_errors", "Messages that could not be parsed")
+ERROR_TEMP = Histogram("aoii_error_temp_abs_celsius", "Gateway prediction |error| at RX (temperature)",
+                       buckets=ERROR_TEMP_BUCKETS)
+ERROR_HUMIDITY = Histogram("aoii_error_humidity_abs_percent", "Gateway prediction |error| at RX (humidity)",
+                           buckets=ERROR_HUM_BUCKETS)
+TRANSMISSION_DELAY = Histogram("aoii_transmission_delay_ms", "Edge to gateway transmission delay (ms)",
+                               buckets=DELAY_MS_BUCKETS)
+LAST_RECEIVED = Gauge("aoii_last_received_timestamp_seconds", "Unix timestamp of last reading")
+SINCE_LAST_RX = Gauge("aoii_seconds_since_last_rx", "Seconds since last RX reading (NaN before the first)")
+TEMPERATURE = Gauge("aoii_temperature_celsius", "Latest temperature", ["source"])
+HUMIDITY = Gauge("aoii_humidity_percent", "Latest humidity", ["source"])
+GATEWAY_TOTAL_TX = Gauge("aoii_gateway_total_tx", "total_tx counter reported by the gateway")
+
+_last_rx = None
+
+
+def _seconds_since_last_rx():
+    return time.time() - _last_rx if _last_rx is not None else float("nan")
+
+
+SINCE_LAST_RX.set_function(_seconds_since_last_rx)
+
+
+def observe(data, qos=0):
+    """aoii/readings payload(dict) 1건을 메트릭에 반영."""
+    global _last_rx
+    event = data.get("event", "unknown")
+    MESSAGES.labels(event=event, qos=str(qos)).inc()
+    if data.get("total_tx") is not None:
+        GATEWAY_TOTAL_TX.set(data["total_tx"])
+    if data.get("pred_t") is not None:
+        TEMPERATURE.labels(source="pred").set(data["pred_t"])
+        HUMIDITY.labels(source="pred").set(data["pred_h"])
+    if event != "RX":
+        return
+
+    READINGS.inc()
+    _last_rx = time.time()
+    LAST_RECEIVED.set(_last_rx)
+    TEMPERATURE.labels(source="actual").set(data["actual_t"])
+    HUMIDITY.labels(source="actual").set(data["actual_h"])
+    if data.get("error_t") is not None:
+        ERROR_TEMP.observe(abs(data["error_t"]))
+    if data.get("error_h") is not None:
+        ERROR_HUMIDITY.observe(abs(data["error_h"]))
+    if data.get("transmission_delay_ms") is not None:
+        TRANSMISSION_DELAY.observe(data["transmission_delay_ms"])
+
+
+def on_connect(client, userdata, flags, rc):
+    if rc == 0:
+        print("metrics_exporter: MQTT connected.")
+        # QoS 1 구독: 게이트웨이가 발행한 QoS(0/1)가 그대로 전달되어 qos 라벨로 구분 가능
+        client.subscribe(MQTT_TOPIC, qos=1)
+    else:
+        print(f"metrics_exporter: MQTT connect failed rc={rc}")
+
+
+def on_message(client, userdata, msg):
+    try:
+        observe(json.loads(msg.payload.decode("utf-8")), msg.qos)
+    except Exception as e:
+        PARSE_ERRORS.inc()
+        print(f"metrics_exporter: on_message error: {e}")
+
+
+def main():
+    start_http_server(METRICS_PORT)
+    print(f"metrics_exporter: http://127.0.0.1:{METRICS_PORT}/metrics")
+    client = mqtt.Client()
+    client.on_connect = on_connect
+    client.on_message = on_message
+    client.reconnect_delay_set(min_delay=1, max_delay=30)
+    client.connect_async(MQTT_BROKER, MQTT_PORT, 60)
+    try:
+        client.loop_forever(retry_first_connection=True)
+    except KeyboardInterrupt:
+        print("metrics_exporter: stopped")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,8 +1,10 @@
 # server/mqtt_to_csv.py
-"""MQTT 구독: aoii/readings 수신 시 RX/EST 모두 experiment_log_online.csv에 한 줄씩 추가."""
+"""MQTT 구독: aoii/readings 수신 시 RX 이벤트를 experiment_log_online.csv에 한 줄씩 추가.
+
+파일은 LogWriter가 한 번 열어 두고 행을 버퍼링해 최대 1초마다 flush (메시지마다 open/stat 하지 않음).
+"""
 import os
 import sys
-import csv
 import json
 
 # 프로젝트 루트 (실행 위치를 루트로 맞추고 CSV는 루트에 생성)
@@ -24,19 +26,14 @@ if os.path.isfile(_env_path):
 
 import paho.mqtt.client as mqtt
 
+from common.log_writer import LogWriter, ONLINE_LOG_COLUMNS
+
 MQTT_BROKER = os.environ.get("MQTT_BROKER", "localhost")
 MQTT_PORT = int(os.environ.get("MQTT_PORT", "1883"))
 MQTT_TOPIC = "aoii/readings"
 CSV_FILENAME = "experiment_log_online.csv"
-
-# CSV 헤더 (transmission_delay_ms: 엣지→게이트웨이 전송 지연 ms)
-HEADER = ["Timestamp", "Time_n", "Event", "Actual_T", "Actual_H", "Pred_T", "Pred_H", "Error_T", "Error_H", "Total_TX", "Transmission_Delay_Ms"]
-
-
-def ensure_csv():
-    if not os.path.exists(CSV_FILENAME):
-        with open(CSV_FILENAME, mode="w", newline="") as f:
-            csv.writer(f).writerow(HEADER)
+# 컬럼: ONLINE_LOG_COLUMNS (Transmission_Delay_Ms: 엣지→게이트웨이 전송 지연 ms).
+# CSV_FILENAME을 *.rec로 바꾸면 고정 레코드 바이너리 로그 (common/log_writer.py read_log()로 읽기)
 
 
 def row_from_payload(data):
@@ -73,25 +70,29 @@ def on_message(client, userdata, msg):
         event = data.get("event", "")
         if event != "RX":
             return
-        ensure_csv()
-        with open(CSV_FILENAME, mode="a", newline="") as f:
-            csv.writer(f).writerow(row_from_payload(data))
+        userdata.append(row_from_payload(data))
         print(f"mqtt_to_csv: appended 1 row (event={event})")
     except Exception as e:
         print(f"mqtt_to_csv: on_message error: {e}")
 
 
 def main():
-    ensure_csv()
-    client = mqtt.Client()
+    log = LogWriter(CSV_FILENAME, ONLINE_LOG_COLUMNS)
+    client = mqtt.Client(userdata=log)
     client.on_connect = on_connect
     client.on_message = on_message
     try:
         client.connect(MQTT_BROKER, MQTT_PORT, 60)
     except Exception as e:
         print(f"MQTT connect error: {e}")
+        log.close()
         sys.exit(1)
-    client.loop_forever()
+    try:
+        client.loop_forever()
+    except KeyboardInterrupt:
+        print("mqtt_to_csv: stopped")
+    finally:
+        log.close()
 
 
 if __name__ == "__main__":
@@ -1,9 +1,12 @@
 # server/mqtt_to_mysql.py
-"""MQTT 구독: aoii/readings 수신 시 RX 이벤트만 MySQL readings 테이블에 저장. insert 실패 시 지수 백오프 재시도."""
+"""MQTT 구독: aoii/readings 수신 시 RX 이벤트만 MySQL readings 테이블에 저장.
+
+on_message는 행을 BatchWriter에 넣기만 하고, writer 스레드가 INGEST_BATCH_SIZE행 또는
+INGEST_FLUSH_MS마다 executemany로 일괄 저장 (풀 연결 재사용, 실패 시 writer 스레드에서 지수 백오프 재시도).
+"""
 import os
 import sys
 import json
-import time
 
 # 프로젝트 루트 추가 (db import 및 .env 로드)
 _project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -19,37 +22,42 @@ if os.path.isfile(_env_path):
             if _line and not _line.startswith("#") and "=" in _line:
                 _k, _v = _line.split("=", 1)
                 _k, _v = _k.strip(), _v.strip()
-                if _k.startswith("MYSQL_") or _k.startswith("MQTT_"):
+                if _k.startswith("MYSQL_") or _k.startswith("MQTT_") or _k.startswith("INGEST_"):
                     os.environ[_k] = _v
 
 import paho.mqtt.client as mqtt
-from server.db import init_db, insert_reading
+from server.db import init_db, insert_readings, reading_row
+from server.batch_writer import BatchWriter
 
 MQTT_BROKER = os.environ.get("MQTT_BROKER", "localhost")
 MQTT_PORT = int(os.environ.get("MQTT_PORT", "1883"))
 MQTT_TOPIC = "aoii/readings"
 
-# insert 재시도: 최대 횟수, 지수 백오프 초 단위
+# 일괄 저장: N행 또는 T ms 중 먼저 도달하는 쪽에서 flush
+INGEST_BATCH_SIZE = int(os.environ.get("INGEST_BATCH_SIZE", "500"))
+INGEST_FLUSH_MS = int(os.environ.get("INGEST_FLUSH_MS", "200"))
+
+# insert 재시도: 최대 횟수, 지수 백오프 초 단위 (writer 스레드에서 수행)
 INSERT_MAX_RETRIES = 5
-INSERT_BASE_DELAY = 1.0  # 1s, 2s, 4s, 8s, 16s
-
-
-def insert_reading_with_retry(actual_t, actual_h, pred_t, pred_h):
-    """MySQL insert 실패 시 지수 백오프 재시도. 전부 실패 시 로그 후 예외 전파."""
-    last_err = None
-    for attempt in range(INSERT_MAX_RETRIES):
-        try:
-            insert_reading(actual_t, actual_h, pred_t, pred_h)
-            return
-        except Exception as e:
-            last_err = e
-            if attempt < INSERT_MAX_RETRIES - 1:
-                delay = INSERT_BASE_DELAY * (2 ** attempt)
-                print(f"mqtt_to_mysql: insert retry {attempt + 1}/{INSERT_MAX_RETRIES} in {delay:.1f}s: {e}")
-                time.sleep(delay)
-            else:
-                print(f"mqtt_to_mysql: insert FAILED after {INSERT_MAX_RETRIES} retries: {last_err}")
-                raise last_err
+INSERT_BASE_DELAY = 1.0  # 1s, 2s, 4s, 8s
+
+
+def make_writer(verbose=True):
+    return BatchWriter(insert_readings, batch_size=INGEST_BATCH_SIZE, flush_interval_ms=INGEST_FLUSH_MS,
+                       max_retries=INSERT_MAX_RETRIES, base_delay=INSERT_BASE_DELAY,
+                       name="mqtt_to_mysql", verbose=verbose)
+
+
+def parse_reading(payload):
+    """MQTT payload(bytes) → reading_row 튜플. RX 이벤트가 아니면 None."""
+    data = json.loads(payload.decode("utf-8"))
+    if data.get("event") != "RX":
+        return None
+    transmission_delay_ms = data.get("transmission_delay_ms")
+    if transmission_delay_ms is not None:
+        transmission_delay_ms = int(transmission_delay_ms)
+    return reading_row(float(data["actual_t"]), float(data["actual_h"]), float(data["pred_t"]),
+                       float(data["pred_h"]), transmission_delay_ms=transmission_delay_ms)
 
 
 def on_connect(client, userdata, flags, rc):
@@ -62,21 +70,9 @@ def on_connect(client, userdata, flags, rc):
 
 def on_message(client, userdata, msg):
     try:
-        data = json.loads(msg.payload.decode("utf-8"))
-        if data.get("event") != "RX":
-            return
-        actual_t = float(data["actual_t"])
-        actual_h = float(data["actual_h"])
-        pred_t = float(data["pred_t"])
-        pred_h = float(data["pred_h"])
-        insert_reading_with_retry(actual_t, actual_h, pred_t, pred_h)
-        print(f"mqtt_to_mysql: saved 1 reading (T={actual_t:.2f}, H={actual_h:.2f})")
-        transmission_delay_ms = data.get("transmission_delay_ms")
-        if transmission_delay_ms is not None:
-            transmission_delay_ms = int(transmission_delay_ms)
-        insert_reading(actual_t, actual_h, pred_t, pred_h, transmission_delay_ms=transmission_delay_ms)
-        delay_str = f", delay={transmission_delay_ms}ms" if transmission_delay_ms is not None else ""
-        print(f"mqtt_to_mysql: saved 1 reading (T={actual_t:.2f}, H={actual_h:.2f}{delay_str})")
+        row = parse_reading(msg.payload)
+        if row is not None:
+            userdata.submit(row)
     except Exception as e:
         print(f"mqtt_to_mysql: on_message error: {e}")
 
@@ -88,7 +84,8 @@ def main():
     except Exception as e:
         print(f"DB init warning: {e}")
 
-    client = mqtt.Client()
+    writer = make_writer()
+    client = mqtt.Client(userdata=writer)
     client.on_connect = on_connect
     client.on_message = on_message
     try:
@@ -96,7 +93,13 @@ def main():
     except Exception as e:
         print(f"MQTT connect error: {e}")
         sys.exit(1)
-    client.loop_forever()
+    try:
+        client.loop_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        writer.close()
+        print(f"mqtt_to_mysql: stopped {writer.stats()}")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# server/rebuild_rollups.py
+"""readings 집계 테이블 백필/재구축.
+
+insert_readings()가 저장 시점에 갱신하는 집계(readings_summary, 분/시간 rollup)를 readings 원본에서 다시 계산한다.
+기존 데이터를 처음 이관할 때, 또는 수동으로 readings를 수정·삭제해 집계가 어긋났을 때 실행.
+실행: python server/rebuild_rollups.py
+"""
+import os
+import sys
+import time
+
+_project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, _project_root)
+
+_env_path = os.path.join(_project_root, ".env")
+if os.path.isfile(_env_path):
+    with open(_env_path, "r", encoding="utf-8") as _f:
+        for _line in _f:
+            _line = _line.strip()
+            if _line and not _line.startswith("#") and "=" in _line:
+                _k, _v = _line.split("=", 1)
+                _k, _v = _k.strip(), _v.strip()
+                if _k.startswith("MYSQL_"):
+                    os.environ[_k] = _v
+
+from server.db import init_db, rebuild_summary, rebuild_rollups, get_stats
+
+
+def main():
+    init_db()
+    t0 = time.perf_counter()
+    total = rebuild_summary()
+    print(f"readings_summary rebuilt: {total} readings ({time.perf_counter() - t0:.2f} s)")
+    t0 = time.perf_counter()
+    for table, n in rebuild_rollups().items():
+        print(f"{table} rebuilt: {n} buckets")
+    print(f"rollups: {time.perf_counter() - t0:.2f} s")
+    print(get_stats())
+
+
+if __name__ == "__main__":
+    main()